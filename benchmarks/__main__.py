@@ -0,0 +1,80 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Command-line entry point of the benchmarks: ``python -m benchmarks --help``."""
+
+import argparse
+import contextlib
+import json
+
+from ansys.sound.core import OperatorEmulator
+from ansys.sound.core.server_helpers import connect_to_or_start_server
+
+from ._cases import CASES
+from ._runner import format_results, run_benchmarks
+
+
+def main():
+    """Parse the command-line arguments, run the benchmarks, and print the results."""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="Run the PyAnsys Sound benchmarks."
+    )
+    parser.add_argument(
+        "--subpackage", nargs="+", choices=list(CASES), help="Subpackages to benchmark."
+    )
+    parser.add_argument("--case", nargs="+", help="Cases to run, for example 'Stft'.")
+    parser.add_argument("--duration", nargs="+", type=float, help="Signal durations in s.")
+    parser.add_argument("--channels", nargs="+", type=int, help="Numbers of channels.")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of measurements per case.")
+    parser.add_argument("--output", help="Path of a JSON file where to save the results.")
+    parser.add_argument(
+        "--emulate-operators",
+        action="store_true",
+        help=(
+            "Replace the lightweight DPF Sound operators with their NumPy emulations, to measure "
+            "the overhead of the PyAnsys Sound classes."
+        ),
+    )
+    arguments = parser.parse_args()
+
+    # Keep a reference to the licensing context, so that the license is checked out only once.
+    server, license_context = connect_to_or_start_server(use_license_context=True)
+
+    # The benchmark cases instantiate the processing classes, so they get emulated operators.
+    emulator = OperatorEmulator() if arguments.emulate_operators else contextlib.nullcontext()
+    with emulator:
+        results = run_benchmarks(
+            arguments.subpackage,
+            arguments.case,
+            arguments.duration,
+            arguments.channels,
+            arguments.repeat,
+        )
+    print(format_results(results))
+
+    if arguments.output is not None:
+        with open(arguments.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,368 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Synthetic inputs and benchmark cases for the PyAnsys Sound processing classes."""
+
+from functools import cached_property
+import inspect
+import os
+import tempfile
+from typing import Callable
+import wave
+
+from ansys.dpf.core import Field
+import numpy as np
+
+from ansys.sound.core._pyansys_sound import PyAnsysSound, _create_signal_field
+from ansys.sound.core.order_analysis import IsolateOrders, OrderLevels, RpmOrderRepresentation
+from ansys.sound.core.psychoacoustics import (
+    FluctuationStrength,
+    IndicatorBundle,
+    IndicatorOverTime,
+    LoudnessANSI_S3_4,
+    LoudnessISO532_1_Stationary,
+    LoudnessISO532_1_TimeVarying,
+    LoudnessISO532_2,
+    LoudnessISO532_2_Batch,
+    ProminenceRatio,
+    ProminenceRatioForOrdersOverTime,
+    ProminenceRatioOverTime,
+    Roughness,
+    RoughnessECMA418_2,
+    Sharpness,
+    SharpnessDIN45692,
+    SharpnessDIN45692OverTime,
+    SharpnessOverTime,
+    SpectralCentroid,
+    SpectralDescriptorsOverTime,
+    TonalityAures,
+    TonalityDIN45681,
+    TonalityECMA418_2,
+    TonalityISO1996_2,
+    TonalityISO1996_2_OverTime,
+    TonalityISOTS20065,
+    TonalityRoughnessECMA418_2,
+    ToneToNoiseRatio,
+    ToneToNoiseRatioForOrdersOverTime,
+    ToneToNoiseRatioOverTime,
+)
+from ansys.sound.core.signal_utilities import (
+    ApplyGain,
+    CreateSignalField,
+    CropSignal,
+    LoadWav,
+    LoadWavLocal,
+    Resample,
+    SumSignals,
+    WriteWav,
+    ZeroPad,
+)
+from ansys.sound.core.sound_composer import SoundComposer, SourceAudio, Track
+from ansys.sound.core.spectral_processing import PowerSpectralDensity
+from ansys.sound.core.spectrogram_processing import Istft, Stft
+from ansys.sound.core.standard_levels import (
+    LevelOverTime,
+    OctaveLevelsFromPSD,
+    OctaveLevelsFromSignal,
+    OneThirdOctaveLevelsFromPSD,
+    OneThirdOctaveLevelsFromSignal,
+    OverallLevel,
+    OverallLevelFromPSD,
+)
+from ansys.sound.core.xtract import (
+    Xtract,
+    XtractDenoiser,
+    XtractDenoiserBatch,
+    XtractDenoiserParameters,
+    XtractTonal,
+    XtractTonalParameters,
+    XtractTransient,
+    XtractTransientParameters,
+)
+
+SAMPLING_FREQUENCY = 44100.0
+
+# Signal durations in s, and numbers of channels, of the synthetic inputs.
+DURATIONS = (1.0, 10.0, 60.0)
+CHANNEL_COUNTS = (1, 4)
+
+# Orders of the synthetic harmonic signal, and RPM range of its run-up.
+ORDERS = (2.0, 4.0, 6.0)
+RPM_RANGE = (1000.0, 4000.0)
+
+
+class SyntheticInputs:
+    """Synthetic inputs of the processing classes, for a given duration and number of channels.
+
+    Each channel is a run-up, made of the harmonics of a rotating machine whose speed increases
+    linearly, mixed with a pink-like noise. The inputs derived from the signals (PSDs, STFT, and
+    WAV file) are computed on first access.
+    """
+
+    def __init__(self, duration: float, channel_count: int, seed: int = 0):
+        """Class instantiation takes the following parameters.
+
+        Parameters
+        ----------
+        duration : float
+            Signal duration in s.
+        channel_count : int
+            Number of channels.
+        seed : int, default: 0
+            Seed of the random noise.
+        """
+        self.duration = duration
+        self.channel_count = channel_count
+        self.sample_count = int(round(duration * SAMPLING_FREQUENCY))
+
+        time = np.arange(self.sample_count) / SAMPLING_FREQUENCY
+        rpm = np.linspace(*RPM_RANGE, self.sample_count)
+        phase = 2 * np.pi * np.cumsum(rpm / 60.0) / SAMPLING_FREQUENCY
+        generator = np.random.default_rng(seed)
+
+        self.data = []
+        for channel in range(self.channel_count):
+            harmonics = sum(np.sin(order * phase + channel) / order for order in ORDERS)
+            noise = np.cumsum(generator.standard_normal(self.sample_count)) * 1e-3
+            noise -= np.convolve(noise, np.ones(64) / 64, mode="same")
+            self.data.append(0.1 * harmonics + noise + 0.01 * np.sin(2 * np.pi * 440.0 * time))
+
+        self.signals = [_create_signal_field(data, SAMPLING_FREQUENCY) for data in self.data]
+        self.rpm_profile = _create_signal_field(rpm, SAMPLING_FREQUENCY, unit="rpm")
+
+    @property
+    def total_sample_count(self) -> int:
+        """Number of samples of all channels."""
+        return self.sample_count * self.channel_count
+
+    @cached_property
+    def psds(self) -> list[Field]:
+        """Power spectral densities of the signals."""
+        psds = []
+        for signal in self.signals:
+            psd = PowerSpectralDensity(signal, fft_size=8192, window_length=8192)
+            psd.process()
+            psds.append(psd.get_output())
+        return psds
+
+    @cached_property
+    def stfts(self) -> list:
+        """Short-time Fourier transforms of the signals."""
+        stfts = []
+        for signal in self.signals:
+            stft = Stft(signal)
+            stft.process()
+            stfts.append(stft.get_output())
+        return stfts
+
+    @cached_property
+    def noise_psd(self) -> Field:
+        """Noise PSD used by the Xtract classes."""
+        return XtractDenoiserParameters().create_noise_psd_from_white_noise_level(
+            40.0, SAMPLING_FREQUENCY
+        )
+
+    @cached_property
+    def wav_path(self) -> str:
+        """Path to a 16-bit WAV file containing the signals."""
+        path = os.path.join(
+            tempfile.gettempdir(),
+            f"pyansys_sound_benchmark_{self.sample_count}_{self.channel_count}.wav",
+        )
+        samples = np.stack(self.data, axis=1)
+        samples = np.round(samples / np.max(np.abs(samples)) * 32767).astype("<i2")
+        with wave.open(path, "wb") as file:
+            file.setnchannels(self.channel_count)
+            file.setsampwidth(2)
+            file.setframerate(int(SAMPLING_FREQUENCY))
+            file.writeframes(samples.tobytes())
+        return path
+
+    @cached_property
+    def output_wav_path(self) -> str:
+        """Path of the WAV file written by the WriteWav benchmark."""
+        return os.path.join(tempfile.gettempdir(), "pyansys_sound_benchmark_output.wav")
+
+
+def _per_signal(factory: Callable) -> Callable[[SyntheticInputs], list[PyAnsysSound]]:
+    """Create one instance per channel, from a factory taking the channel signal."""
+    return lambda inputs: [factory(signal) for signal in inputs.signals]
+
+
+def _per_psd(factory: Callable) -> Callable[[SyntheticInputs], list[PyAnsysSound]]:
+    """Create one instance per channel, from a factory taking the channel PSD."""
+    return lambda inputs: [factory(psd) for psd in inputs.psds]
+
+
+def _per_signal_with_rpm(factory: Callable) -> Callable[[SyntheticInputs], list[PyAnsysSound]]:
+    """Create one instance per channel, from a factory taking the channel signal and RPM."""
+    return lambda inputs: [factory(signal, inputs.rpm_profile) for signal in inputs.signals]
+
+
+def _create_sound_composer(inputs: SyntheticInputs) -> list[PyAnsysSound]:
+    """Create a sound composer with one audio track per channel."""
+    sound_composer = SoundComposer()
+    for signal in inputs.signals:
+        source = SourceAudio()
+        source.source_audio_data = signal
+        sound_composer.add_track(Track(gain=-6.0, source=source))
+    return [sound_composer]
+
+
+def _create_xtract(inputs: SyntheticInputs) -> list[PyAnsysSound]:
+    """Create one Xtract instance per channel."""
+    return [
+        Xtract(
+            signal,
+            XtractDenoiserParameters(inputs.noise_psd),
+            XtractTonalParameters(),
+            XtractTransientParameters(),
+        )
+        for signal in inputs.signals
+    ]
+
+
+# Benchmark cases, per subpackage. Each case creates the instances to process (usually, one per
+# channel) from the synthetic inputs.
+CASES = {
+    "signal_utilities": {
+        "LoadWav": lambda inputs: [LoadWav(inputs.wav_path)],
+        "LoadWavLocal": lambda inputs: [LoadWavLocal(inputs.wav_path)],
+        "WriteWav": lambda inputs: [WriteWav(inputs.signals, inputs.output_wav_path)],
+        "Resample": _per_signal(lambda signal: Resample(signal, 48000.0)),
+        "ZeroPad": _per_signal(lambda signal: ZeroPad(signal, 1.0)),
+        "ApplyGain": _per_signal(lambda signal: ApplyGain(signal, 6.0)),
+        "SumSignals": lambda inputs: [SumSignals(inputs.signals)],
+        "CropSignal": _per_signal(lambda signal: CropSignal(signal, 0.1, 0.9)),
+        "CreateSignalField": lambda inputs: [
+            CreateSignalField(data, SAMPLING_FREQUENCY) for data in inputs.data
+        ],
+    },
+    "standard_levels": {
+        "OverallLevel": _per_signal(OverallLevel),
+        "LevelOverTime": _per_signal(LevelOverTime),
+        "OctaveLevelsFromSignal": _per_signal(OctaveLevelsFromSignal),
+        "OneThirdOctaveLevelsFromSignal": _per_signal(OneThirdOctaveLevelsFromSignal),
+        "OverallLevelFromPSD": _per_psd(OverallLevelFromPSD),
+        "OctaveLevelsFromPSD": _per_psd(OctaveLevelsFromPSD),
+        "OneThirdOctaveLevelsFromPSD": _per_psd(OneThirdOctaveLevelsFromPSD),
+    },
+    "spectrogram_processing": {
+        "Stft": _per_signal(Stft),
+        "Istft": lambda inputs: [Istft(stft) for stft in inputs.stfts],
+    },
+    "order_analysis": {
+        "RpmOrderRepresentation": _per_signal_with_rpm(RpmOrderRepresentation),
+        "IsolateOrders": _per_signal_with_rpm(
+            lambda signal, rpm: IsolateOrders(signal, rpm, list(ORDERS))
+        ),
+        "OrderLevels": _per_signal_with_rpm(
+            lambda signal, rpm: OrderLevels(signal, rpm, list(ORDERS))
+        ),
+    },
+    "psychoacoustics": {
+        "LoudnessISO532_1_Stationary": _per_signal(LoudnessISO532_1_Stationary),
+        "LoudnessISO532_1_TimeVarying": _per_signal(LoudnessISO532_1_TimeVarying),
+        "LoudnessISO532_2": _per_signal(LoudnessISO532_2),
+        "LoudnessANSI_S3_4": _per_signal(LoudnessANSI_S3_4),
+        "ProminenceRatio": _per_psd(ProminenceRatio),
+        "ToneToNoiseRatio": _per_psd(ToneToNoiseRatio),
+        "Sharpness": _per_signal(Sharpness),
+        "SharpnessDIN45692": _per_signal(SharpnessDIN45692),
+        "SharpnessOverTime": _per_signal(SharpnessOverTime),
+        "SharpnessDIN45692OverTime": _per_signal(SharpnessDIN45692OverTime),
+        "Roughness": _per_signal(Roughness),
+        "RoughnessECMA418_2": _per_signal(RoughnessECMA418_2),
+        "FluctuationStrength": _per_signal(FluctuationStrength),
+        "SpectralCentroid": _per_signal(SpectralCentroid),
+        "TonalityAures": _per_signal(TonalityAures),
+        "TonalityDIN45681": _per_signal(TonalityDIN45681),
+        "TonalityECMA418_2": _per_signal(
+            lambda signal: TonalityECMA418_2(signal, field_type="Free", edition="3rd")
+        ),
+        "TonalityRoughnessECMA418_2": _per_signal(TonalityRoughnessECMA418_2),
+        "IndicatorBundle": _per_signal(
+            lambda signal: IndicatorBundle(signal, compute_over_time=True)
+        ),
+        "TonalityISO1996_2": _per_signal(TonalityISO1996_2),
+        "TonalityISO1996_2_OverTime": _per_signal(TonalityISO1996_2_OverTime),
+        "TonalityISOTS20065": _per_signal(TonalityISOTS20065),
+        "ProminenceRatioForOrdersOverTime": _per_signal_with_rpm(
+            lambda signal, rpm: ProminenceRatioForOrdersOverTime(signal, rpm, list(ORDERS))
+        ),
+        "ToneToNoiseRatioForOrdersOverTime": _per_signal_with_rpm(
+            lambda signal, rpm: ToneToNoiseRatioForOrdersOverTime(signal, rpm, list(ORDERS))
+        ),
+        "ProminenceRatioOverTime": _per_signal(
+            lambda signal: ProminenceRatioOverTime(signal, window_length=0.5)
+        ),
+        "ToneToNoiseRatioOverTime": _per_signal(
+            lambda signal: ToneToNoiseRatioOverTime(signal, window_length=0.5)
+        ),
+        "SpectralDescriptorsOverTime": _per_signal(SpectralDescriptorsOverTime),
+        "LoudnessISO532_2_Batch": lambda inputs: [LoudnessISO532_2_Batch(list(inputs.signals))],
+        "IndicatorOverTime": _per_signal(
+            lambda signal: IndicatorOverTime(signal, SpectralCentroid, window_length=0.5)
+        ),
+    },
+    "xtract": {
+        "XtractDenoiser": lambda inputs: [
+            XtractDenoiser(signal, XtractDenoiserParameters(inputs.noise_psd))
+            for signal in inputs.signals
+        ],
+        "XtractDenoiserBatch": lambda inputs: [
+            XtractDenoiserBatch(inputs.signals, XtractDenoiserParameters(inputs.noise_psd))
+        ],
+        "XtractTonal": _per_signal(lambda signal: XtractTonal(signal, XtractTonalParameters())),
+        "XtractTransient": _per_signal(
+            lambda signal: XtractTransient(signal, XtractTransientParameters())
+        ),
+        "Xtract": _create_xtract,
+    },
+    "sound_composer": {
+        "SoundComposer": _create_sound_composer,
+    },
+}
+
+
+def get_numpy_getters(instance: PyAnsysSound) -> list[str]:
+    """Get the names of the NumPy getters of an instance.
+
+    The NumPy getters are the ``get_*_as_nparray()`` methods that take no arguments.
+
+    Parameters
+    ----------
+    instance : PyAnsysSound
+        Instance of a processing class.
+
+    Returns
+    -------
+    list[str]
+        Names of the NumPy getters.
+    """
+    getters = []
+    for name, method in inspect.getmembers(instance, inspect.ismethod):
+        if name.startswith("get_") and name.endswith("as_nparray"):
+            parameters = inspect.signature(method).parameters.values()
+            if all(parameter.default is not inspect.Parameter.empty for parameter in parameters):
+                getters.append(name)
+    return getters
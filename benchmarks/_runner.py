@@ -0,0 +1,168 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Run the benchmark cases without airspeed velocity."""
+
+import time
+import tracemalloc
+
+from ansys.tools.common.exceptions import VersionError
+
+from ._cases import CASES, CHANNEL_COUNTS, DURATIONS, SyntheticInputs, get_numpy_getters
+
+
+def measure_case(
+    subpackage: str, case: str, inputs: SyntheticInputs, repeat: int = 3
+) -> dict[str, float | str | None]:
+    """Measure the processing and NumPy getter times of a benchmark case.
+
+    Parameters
+    ----------
+    subpackage : str
+        Subpackage of the case.
+    case : str
+        Name of the case.
+    inputs : SyntheticInputs
+        Synthetic inputs.
+    repeat : int, default: 3
+        Number of measurements. The fastest one is kept.
+
+    Returns
+    -------
+    dict[str, float | str | None]
+        Results, with the following keys: ``"subpackage"``, ``"case"``, ``"duration"`` (signal
+        duration in s), ``"channels"``, ``"process_time"`` and ``"getters_time"`` (in s),
+        ``"throughput"`` (processed samples per second), ``"peak_memory"`` (peak memory allocated
+        on the client side, in bytes), and ``"skipped"`` (reason why the case was skipped, or
+        ``None``).
+    """
+    result = {
+        "subpackage": subpackage,
+        "case": case,
+        "duration": inputs.duration,
+        "channels": inputs.channel_count,
+        "process_time": None,
+        "getters_time": None,
+        "throughput": None,
+        "peak_memory": None,
+        "skipped": None,
+    }
+
+    try:
+        instances = CASES[subpackage][case](inputs)
+    except VersionError as error:
+        # The class is not available with the DPF Sound plugin version of the server.
+        result["skipped"] = str(error)
+        return result
+
+    process_times = []
+    getters_times = []
+    tracemalloc.start()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for instance in instances:
+                instance.process()
+            process_times.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            for instance in instances:
+                for getter in get_numpy_getters(instance):
+                    getattr(instance, getter)()
+            getters_times.append(time.perf_counter() - start)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    result["process_time"] = min(process_times)
+    result["getters_time"] = min(getters_times)
+    result["throughput"] = inputs.total_sample_count / result["process_time"]
+    result["peak_memory"] = peak_memory
+    return result
+
+
+def run_benchmarks(
+    subpackages: list[str] = None,
+    cases: list[str] = None,
+    durations: list[float] = None,
+    channel_counts: list[int] = None,
+    repeat: int = 3,
+) -> list[dict[str, float | str | None]]:
+    """Run the benchmark cases for all combinations of signal durations and channel counts.
+
+    Parameters
+    ----------
+    subpackages : list[str], default: None
+        Subpackages to benchmark. If ``None``, all subpackages are benchmarked.
+    cases : list[str], default: None
+        Cases to run. If ``None``, all cases of the selected subpackages are run.
+    durations : list[float], default: None
+        Signal durations in s. If ``None``, the default durations are used.
+    channel_counts : list[int], default: None
+        Numbers of channels. If ``None``, the default numbers of channels are used.
+    repeat : int, default: 3
+        Number of measurements per case. The fastest one is kept.
+
+    Returns
+    -------
+    list[dict[str, float | str | None]]
+        Results of each case, as returned by :func:`measure_case`.
+    """
+    results = []
+    for duration in durations or DURATIONS:
+        for channel_count in channel_counts or CHANNEL_COUNTS:
+            inputs = SyntheticInputs(duration, channel_count)
+            for subpackage in subpackages or CASES:
+                for case in CASES[subpackage]:
+                    if cases is None or case in cases:
+                        results.append(measure_case(subpackage, case, inputs, repeat))
+    return results
+
+
+def format_results(results: list[dict[str, float | str | None]]) -> str:
+    """Format benchmark results as a text table.
+
+    Parameters
+    ----------
+    results : list[dict[str, float | str | None]]
+        Results, as returned by :func:`run_benchmarks`.
+
+    Returns
+    -------
+    str
+        Text table.
+    """
+    lines = [
+        f"{'Case':<36}{'Duration':>10}{'Channels':>10}{'Process':>12}{'Getters':>12}"
+        f"{'Samples/s':>14}{'Peak mem.':>12}"
+    ]
+    for result in results:
+        prefix = f"{result['case']:<36}{result['duration']:>9.1f}s{result['channels']:>10}"
+        if result["skipped"] is not None:
+            lines.append(f"{prefix}  skipped: {result['skipped']}")
+        else:
+            lines.append(
+                f"{prefix}{result['process_time'] * 1e3:>10.1f}ms"
+                f"{result['getters_time'] * 1e3:>10.1f}ms{result['throughput']:>14.3g}"
+                f"{result['peak_memory'] / 2**20:>10.1f}MB"
+            )
+    return "\n".join(lines)
@@ -0,0 +1,177 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmarks of the PyAnsys Sound processing classes, in the airspeed velocity format.
+
+For each class, the benchmarks measure the duration of ``process()`` and of the NumPy getters,
+the processing throughput in samples per second, and the peak memory, for synthetic signals of
+increasing duration and number of channels. The import time of the package is measured too.
+"""
+
+from functools import lru_cache
+import time
+import tracemalloc
+
+from ansys.tools.common.exceptions import VersionError
+
+from ansys.sound.core.server_helpers import connect_to_or_start_server
+
+from ._cases import CASES, CHANNEL_COUNTS, DURATIONS, SyntheticInputs, get_numpy_getters
+
+
+@lru_cache(maxsize=None)
+def _connect():
+    """Connect to the DPF server, once per process."""
+    return connect_to_or_start_server(use_license_context=True)
+
+
+@lru_cache(maxsize=1)
+def _get_inputs(duration: float, channel_count: int) -> SyntheticInputs:
+    """Get the synthetic inputs, reusing them between the benchmarks of a process."""
+    return SyntheticInputs(duration, channel_count)
+
+
+class Import:
+    """Benchmarks of the import time of the package, each in a fresh interpreter."""
+
+    def timeraw_import_package(self) -> str:
+        """Measure the import time of the package, which loads its subpackages lazily."""
+        return "import ansys.sound.core"
+
+    def timeraw_import_subpackages(self) -> str:
+        """Measure the import time of the processing subpackages."""
+        return (
+            "import ansys.sound.core.psychoacoustics, ansys.sound.core.sound_composer, "
+            "ansys.sound.core.xtract"
+        )
+
+
+class _ProcessingBenchmarks:
+    """Benchmarks of the processing classes of a subpackage."""
+
+    subpackage = None
+    param_names = ["case", "duration", "channels"]
+    timeout = 1200.0
+
+    def setup(self, case: str, duration: float, channels: int):
+        """Create and process the instances of the case once."""
+        _connect()
+        self.inputs = _get_inputs(duration, channels)
+        try:
+            self.instances = CASES[self.subpackage][case](self.inputs)
+        except VersionError:
+            # Unavailable with the DPF Sound plugin version of the server: asv skips the case.
+            raise NotImplementedError
+        self.process()
+
+    def process(self):
+        """Process all instances of the case."""
+        for instance in self.instances:
+            instance.process()
+
+    def call_numpy_getters(self):
+        """Call the NumPy getters of all instances of the case."""
+        for instance in self.instances:
+            for getter in get_numpy_getters(instance):
+                getattr(instance, getter)()
+
+    def time_process(self, case: str, duration: float, channels: int):
+        """Measure the processing time."""
+        self.process()
+
+    def time_numpy_getters(self, case: str, duration: float, channels: int):
+        """Measure the time of the NumPy getters."""
+        self.call_numpy_getters()
+
+    def peakmem_process(self, case: str, duration: float, channels: int):
+        """Measure the peak memory of the client process, during processing."""
+        self.process()
+        self.call_numpy_getters()
+
+    def track_throughput(self, case: str, duration: float, channels: int) -> float:
+        """Measure the number of processed samples per second."""
+        start = time.perf_counter()
+        self.process()
+        return self.inputs.total_sample_count / (time.perf_counter() - start)
+
+    track_throughput.unit = "samples/s"
+
+    def track_python_peak_memory(self, case: str, duration: float, channels: int) -> int:
+        """Measure the peak memory allocated in Python, during processing and conversions."""
+        tracemalloc.start()
+        try:
+            self.process()
+            self.call_numpy_getters()
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    track_python_peak_memory.unit = "bytes"
+
+
+class SignalUtilities(_ProcessingBenchmarks):
+    """Benchmarks of the signal utilities classes."""
+
+    subpackage = "signal_utilities"
+    params = (list(CASES[subpackage]), list(DURATIONS), list(CHANNEL_COUNTS))
+
+
+class StandardLevels(_ProcessingBenchmarks):
+    """Benchmarks of the standard levels classes."""
+
+    subpackage = "standard_levels"
+    params = (list(CASES[subpackage]), list(DURATIONS), list(CHANNEL_COUNTS))
+
+
+class SpectrogramProcessing(_ProcessingBenchmarks):
+    """Benchmarks of the spectrogram processing classes."""
+
+    subpackage = "spectrogram_processing"
+    params = (list(CASES[subpackage]), list(DURATIONS), list(CHANNEL_COUNTS))
+
+
+class OrderAnalysis(_ProcessingBenchmarks):
+    """Benchmarks of the order analysis classes."""
+
+    subpackage = "order_analysis"
+    params = (list(CASES[subpackage]), list(DURATIONS), list(CHANNEL_COUNTS))
+
+
+class Psychoacoustics(_ProcessingBenchmarks):
+    """Benchmarks of the psychoacoustics classes."""
+
+    subpackage = "psychoacoustics"
+    params = (list(CASES[subpackage]), list(DURATIONS), list(CHANNEL_COUNTS))
+
+
+class Xtract(_ProcessingBenchmarks):
+    """Benchmarks of the Xtract classes."""
+
+    subpackage = "xtract"
+    params = (list(CASES[subpackage]), list(DURATIONS), list(CHANNEL_COUNTS))
+
+
+class SoundComposer(_ProcessingBenchmarks):
+    """Benchmarks of the sound composer classes."""
+
+    subpackage = "sound_composer"
+    params = (list(CASES[subpackage]), list(DURATIONS), list(CHANNEL_COUNTS))
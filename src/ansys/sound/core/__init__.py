@@ -30,24 +30,42 @@ import importlib.metadata as importlib_metadata
 __version__ = importlib_metadata.version(__name__.replace(".", "-"))
 """PyAnsys Sound version."""
 
-from . import (
-    examples_helpers,
-    order_analysis,
-    psychoacoustics,
-    server_helpers,
-    signal_utilities,
-    sound_composer,
-    sound_power,
-    spectral_processing,
-    spectrogram_processing,
-    xtract,
+import importlib
+
+# Sub-packages and attributes are loaded lazily, on first access (PEP 562), so that importing the
+# package does not import the DPF client and all processing classes up front.
+_SUBPACKAGES = (
+    "examples_helpers",
+    "order_analysis",
+    "pipeline",
+    "psychoacoustics",
+    "server_helpers",
+    "signal_processing",
+    "signal_utilities",
+    "sound_composer",
+    "sound_power",
+    "spectral_processing",
+    "spectrogram_processing",
+    "standard_levels",
+    "xtract",
 )
-from ._pyansys_sound import REFERENCE_ACOUSTIC_PRESSURE_IN_AIR
+_LAZY_ATTRIBUTES = {
+    "REFERENCE_ACOUSTIC_PRESSURE_IN_AIR": "._pyansys_sound",
+    "OperatorEmulator": "._operator_emulator",
+    "Profiler": "._profiler",
+    "get_numpy_precision": "._pyansys_sound",
+    "set_numpy_precision": "._pyansys_sound",
+}
 
 __all__ = (
     "REFERENCE_ACOUSTIC_PRESSURE_IN_AIR",
+    "OperatorEmulator",
+    "Profiler",
+    "get_numpy_precision",
+    "set_numpy_precision",
     "examples_helpers",
     "order_analysis",
+    "pipeline",
     "psychoacoustics",
     "server_helpers",
     "signal_utilities",
@@ -57,3 +75,22 @@ __all__ = (
     "spectrogram_processing",
     "xtract",
 )
+
+
+def __getattr__(name: str):
+    """Load sub-packages and attributes on first access."""
+    if name in _SUBPACKAGES:
+        value = importlib.import_module(f".{name}", __name__)
+    elif name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Cache the loaded object, so that this function is not called again for this name.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the package attributes, including those not loaded yet."""
+    return sorted(set(globals()) | set(_SUBPACKAGES) | set(_LAZY_ATTRIBUTES))
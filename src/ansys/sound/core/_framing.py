@@ -0,0 +1,44 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Framing helpers shared by the processing classes and the operator emulator."""
+
+
+def _get_hop_size(frame_length: int, overlap: float) -> int:
+    """Get the number of samples between two successive frames.
+
+    The hop size is the frame length times one minus the overlap, rounded to the nearest integer,
+    with a minimum of one sample.
+
+    Parameters
+    ----------
+    frame_length : int
+        Number of samples of a frame.
+    overlap : float
+        Overlap between two successive frames, from 0 to 1.
+
+    Returns
+    -------
+    int
+        Number of samples between the starts of two successive frames.
+    """
+    return max(1, int(round(frame_length * (1.0 - overlap))))
@@ -0,0 +1,1048 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""NumPy emulation of lightweight DPF Sound operators, in the client process."""
+
+from abc import ABC, abstractmethod
+import struct
+import threading
+from typing import Any, NamedTuple
+import warnings
+import weakref
+
+from ansys.dpf.core import (
+    DataSources,
+    Field,
+    FieldsContainer,
+    Operator,
+    TimeFreqSupport,
+    fields_factory,
+    locations,
+)
+import numpy as np
+
+from ._framing import _get_hop_size
+from ._profiler import _profile_call
+
+# Operator emulator currently active, if any.
+_active_emulator = None
+_activation_lock = threading.Lock()
+
+# Emulated operator classes, indexed by DPF Sound operator name.
+_EMULATED_OPERATORS = {}
+
+# File paths of the data sources created with `_create_data_sources()`, kept on the Python side for
+# the emulated operators, which cannot read them from the data sources through the public DPF API.
+_data_sources_paths = weakref.WeakKeyDictionary()
+
+# Nominal center frequencies in Hz of the octave and one-third-octave bands, and exponents of
+# their exact (base-10) center frequencies: 1000 * 10^(exponent / 10).
+OCTAVE_NOMINAL_FREQUENCIES = (
+    31.5,
+    63.0,
+    125.0,
+    250.0,
+    500.0,
+    1000.0,
+    2000.0,
+    4000.0,
+    8000.0,
+    16000.0,
+)
+OCTAVE_EXPONENTS = tuple(range(-15, 13, 3))
+ONE_THIRD_OCTAVE_NOMINAL_FREQUENCIES = (
+    25.0, 31.5, 40.0, 50.0, 63.0, 80.0, 100.0, 125.0, 160.0, 200.0, 250.0, 315.0, 400.0, 500.0,
+    630.0, 800.0, 1000.0, 1250.0, 1600.0, 2000.0, 2500.0, 3150.0, 4000.0, 5000.0, 6300.0, 8000.0,
+    10000.0, 12500.0, 16000.0,
+)  # fmt: skip
+ONE_THIRD_OCTAVE_EXPONENTS = tuple(range(-16, 13))
+
+# Time constants in s of the standard time weightings, indexed by the values of the time
+# weighting input of the level-over-time operator (see DICT_TIME_WEIGHTING in LevelOverTime).
+TIME_CONSTANTS = {0: 1.0, 1: 0.125, 2: 0.035}
+IMPULSE_DECAY_TIME_CONSTANT = 1.5
+CUSTOM_TIME_WEIGHTING = 3
+
+# Frequency weightings, indexed by the values of the frequency weighting input of the level
+# operators (see DICT_FREQUENCY_WEIGHTING in the standard levels).
+FREQUENCY_WEIGHTINGS = {1: "A", 2: "B", 3: "C"}
+
+
+def _emulation_error(message: str) -> Exception:
+    """Create the exception raised by the operator emulation."""
+    # Imported here, because the PyAnsys Sound base classes depend on this module.
+    from ansys.sound.core._pyansys_sound import PyAnsysSoundException
+
+    return PyAnsysSoundException(message)
+
+
+# NumPy reference implementations
+# ------------------------------------------------------------------------------
+
+
+def _next_power_of_2(value: int) -> int:
+    """Get the smallest power of 2 greater than or equal to a value."""
+    return 1 << (max(int(value), 1) - 1).bit_length()
+
+
+def _get_cosine_window(length: int, coefficients: tuple[float, ...]) -> np.ndarray:
+    """Create a symmetric generalized cosine window."""
+    if length == 1:
+        return np.ones(1)
+
+    phase = 2.0 * np.pi * np.arange(length) / (length - 1)
+    return sum((-1) ** k * c * np.cos(k * phase) for k, c in enumerate(coefficients))
+
+
+def _get_window(window_type: str, length: int) -> np.ndarray:
+    """Create an analysis window.
+
+    Parameters
+    ----------
+    window_type : str
+        Window type, as used by the STFT, PSD, and level-over-time operators.
+    length : int
+        Number of points of the window.
+
+    Returns
+    -------
+    numpy.ndarray
+        Window.
+    """
+    match window_type.upper():
+        case "RECTANGULAR":
+            return np.ones(length)
+        case "HANN":
+            return np.hanning(length)
+        case "HAMMING":
+            return np.hamming(length)
+        case "BLACKMAN":
+            return np.blackman(length)
+        case "BLACKMANHARRIS" | "BLACKMAN-HARRIS":
+            return _get_cosine_window(length, (0.35875, 0.48829, 0.14128, 0.01168))
+        case "FLATTOP":
+            return _get_cosine_window(
+                length, (0.21557895, 0.41663158, 0.277263158, 0.083578947, 0.006947368)
+            )
+        case "TRIANGULAR" | "BARTLETT":
+            return np.bartlett(length)
+        case "GAUSS":
+            half_length = max((length - 1) / 2.0, 0.5)
+            return np.exp(-0.5 * ((np.arange(length) - half_length) / (0.4 * half_length)) ** 2)
+        case _:
+            raise _emulation_error(f"Window type '{window_type}' is not supported.")
+
+
+def _get_frequency_weighting(frequencies: np.ndarray, weighting: str) -> np.ndarray:
+    """Compute the A, B, or C frequency weighting, as defined in IEC 61672-1.
+
+    Parameters
+    ----------
+    frequencies : numpy.ndarray
+        Frequencies in Hz.
+    weighting : str
+        Frequency weighting: ``"A"``, ``"B"``, or ``"C"``.
+
+    Returns
+    -------
+    numpy.ndarray
+        Frequency weighting gains in dB (``-inf`` at 0 Hz).
+    """
+    squared_frequencies = np.asarray(frequencies, dtype=np.float64) ** 2
+    low_pole = squared_frequencies + 20.6**2
+    high_pole = squared_frequencies + 12194.0**2
+
+    match weighting:
+        case "A":
+            gain = (
+                12194.0**2
+                * squared_frequencies**2
+                / (
+                    low_pole
+                    * np.sqrt((squared_frequencies + 107.7**2) * (squared_frequencies + 737.9**2))
+                    * high_pole
+                )
+            )
+            offset = 2.0
+        case "B":
+            gain = (
+                12194.0**2
+                * squared_frequencies**1.5
+                / (low_pole * np.sqrt(squared_frequencies + 158.5**2) * high_pole)
+            )
+            offset = 0.17
+        case "C":
+            gain = 12194.0**2 * squared_frequencies / (low_pole * high_pole)
+            offset = 0.06
+        case _:
+            raise _emulation_error(f"Frequency weighting '{weighting}' is not supported.")
+
+    with np.errstate(divide="ignore"):
+        return 20.0 * np.log10(gain) + offset
+
+
+def _apply_frequency_weighting(
+    data: np.ndarray, sampling_frequency: float, weighting: str
+) -> np.ndarray:
+    """Apply a frequency weighting to a signal, in the frequency domain."""
+    spectrum = np.fft.rfft(data)
+    frequencies = np.fft.rfftfreq(data.size, 1.0 / sampling_frequency)
+    spectrum *= 10.0 ** (_get_frequency_weighting(frequencies, weighting) / 20.0)
+    return np.fft.irfft(spectrum, data.size)
+
+
+def _filter_signal(data: np.ndarray, b: np.ndarray, a: np.ndarray) -> np.ndarray:
+    """Filter a signal with a rational transfer function, as fast convolution.
+
+    For a recursive filter (more than one denominator coefficient), the impulse response is
+    implicitly truncated to the signal duration, so the result only differs from a direct-form
+    implementation by the part of the impulse response lasting longer than the signal.
+
+    Parameters
+    ----------
+    data : numpy.ndarray
+        Signal.
+    b : numpy.ndarray
+        Numerator coefficients.
+    a : numpy.ndarray
+        Denominator coefficients.
+
+    Returns
+    -------
+    numpy.ndarray
+        Filtered signal.
+    """
+    if len(a) == 0 or a[0] == 0.0:
+        raise _emulation_error("The first denominator coefficient must not be zero.")
+
+    if len(a) == 1:
+        fft_size = _next_power_of_2(data.size + len(b) - 1)
+        transfer_function = np.fft.rfft(b, fft_size) / a[0]
+    else:
+        # Twice the signal length, so that the circular convolution only wraps around the part of
+        # the impulse response beyond the signal duration.
+        fft_size = _next_power_of_2(2 * data.size + max(len(a), len(b)))
+        transfer_function = np.fft.rfft(b, fft_size) / np.fft.rfft(a, fft_size)
+
+    return np.fft.irfft(np.fft.rfft(data, fft_size) * transfer_function, fft_size)[: data.size]
+
+
+def _get_frames(data: np.ndarray, frame_length: int, hop_size: int) -> np.ndarray:
+    """Split a signal into overlapping frames, zero-padding the end of the last frame.
+
+    Returns
+    -------
+    numpy.ndarray
+        Frames, as a read-only view with shape (frame count, frame length).
+    """
+    frame_count = 1 + max(0, int(np.ceil((data.size - frame_length) / hop_size)))
+    padded_data = np.zeros((frame_count - 1) * hop_size + frame_length)
+    padded_data[: data.size] = data
+    return np.lib.stride_tricks.sliding_window_view(padded_data, frame_length)[::hop_size]
+
+
+def _compute_stft(
+    data: np.ndarray, fft_size: int, window_type: str, overlap: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """Compute the short-time Fourier transform of a signal.
+
+    Returns
+    -------
+    numpy.ndarray
+        Complex spectra, with shape (frame count, FFT size).
+    numpy.ndarray
+        Index of the first sample of each frame.
+    """
+    hop_size = _get_hop_size(fft_size, overlap)
+    frames = _get_frames(data, fft_size, hop_size) * _get_window(window_type, fft_size)
+    return np.fft.fft(frames, axis=1), np.arange(frames.shape[0]) * hop_size
+
+
+def _compute_power_spectral_density(
+    data: np.ndarray,
+    sampling_frequency: float,
+    window_type: str,
+    window_length: int,
+    fft_size: int,
+    overlap: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Compute the one-sided power spectral density of a signal, with Welch's method.
+
+    Returns
+    -------
+    numpy.ndarray
+        Power spectral density.
+    numpy.ndarray
+        Frequencies in Hz.
+    """
+    window = _get_window(window_type, window_length)
+    frames = _get_frames(data, window_length, _get_hop_size(window_length, overlap)) * window
+    psd = np.mean(np.abs(np.fft.rfft(frames, fft_size, axis=1)) ** 2, axis=0)
+    psd /= sampling_frequency * np.sum(window**2)
+
+    # One-sided spectrum: double all bins but 0 Hz and, for even FFT sizes, the Nyquist frequency.
+    psd[1 : (fft_size + 1) // 2] *= 2.0
+    return psd, np.fft.rfftfreq(fft_size, 1.0 / sampling_frequency)
+
+
+def _compute_periodogram(
+    data: np.ndarray, sampling_frequency: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """Compute the one-sided power per frequency bin of a signal, over its whole duration.
+
+    Returns
+    -------
+    numpy.ndarray
+        Power per frequency bin, summing to the mean square of the signal.
+    numpy.ndarray
+        Frequencies in Hz.
+    """
+    powers = np.abs(np.fft.rfft(data)) ** 2 / data.size**2
+    powers[1 : (data.size + 1) // 2] *= 2.0
+    return powers, np.fft.rfftfreq(data.size, 1.0 / sampling_frequency)
+
+
+def _compute_band_powers(
+    bin_powers: np.ndarray, frequencies: np.ndarray, bands_per_octave: int, use_filter_bank: bool
+) -> tuple[np.ndarray, np.ndarray]:
+    """Compute octave or one-third-octave band powers from the power per frequency bin.
+
+    Parameters
+    ----------
+    bin_powers : numpy.ndarray
+        Power per frequency bin.
+    frequencies : numpy.ndarray
+        Frequencies in Hz of the bins, evenly spaced.
+    bands_per_octave : int
+        1 for octave bands, 3 for one-third-octave bands.
+    use_filter_bank : bool
+        Whether to weight the bins with the magnitude response of a third-order Butterworth
+        band-pass filter per band (as in ANSI S1.11-1986), rather than summing the bins (and bin
+        fractions) within each band.
+
+    Returns
+    -------
+    numpy.ndarray
+        Band powers, for the bands below the highest frequency.
+    numpy.ndarray
+        Nominal center frequencies in Hz of the bands.
+    """
+    if bands_per_octave == 1:
+        exponents, nominal_frequencies = OCTAVE_EXPONENTS, OCTAVE_NOMINAL_FREQUENCIES
+    else:
+        exponents, nominal_frequencies = (
+            ONE_THIRD_OCTAVE_EXPONENTS,
+            ONE_THIRD_OCTAVE_NOMINAL_FREQUENCIES,
+        )
+    center_frequencies = 1000.0 * 10.0 ** (np.array(exponents) / 10.0)
+    edge_ratio = 10.0 ** (3.0 / (20.0 * bands_per_octave))
+    band_count = np.count_nonzero(center_frequencies * edge_ratio <= frequencies[-1])
+    center_frequencies = center_frequencies[:band_count]
+
+    if use_filter_bank:
+        relative_bandwidth = edge_ratio - 1.0 / edge_ratio
+        powers = np.empty(band_count)
+        with np.errstate(divide="ignore", over="ignore"):
+            for i, center_frequency in enumerate(center_frequencies):
+                detuning = (frequencies / center_frequency - center_frequency / frequencies) / (
+                    relative_bandwidth
+                )
+                powers[i] = np.dot(bin_powers, 1.0 / (1.0 + detuning**6))
+    else:
+        # Integrate the power, assumed uniform within each bin, between the band edges.
+        bin_width = frequencies[1] - frequencies[0]
+        bin_edges = np.append(frequencies - bin_width / 2.0, frequencies[-1] + bin_width / 2.0)
+        cumulative_powers = np.concatenate(([0.0], np.cumsum(bin_powers)))
+        powers = np.interp(
+            center_frequencies * edge_ratio, bin_edges, cumulative_powers
+        ) - np.interp(center_frequencies / edge_ratio, bin_edges, cumulative_powers)
+
+    return powers, np.array(nominal_frequencies[:band_count])
+
+
+def _compute_exponential_average(
+    squared_data: np.ndarray, sampling_frequency: float, time_constant: float, block_size: int
+) -> np.ndarray:
+    """Compute the exponential average of a squared signal, at the end of each block of samples.
+
+    The contribution of each block is computed as one dot product, so that the recursion only
+    runs over the blocks.
+
+    Returns
+    -------
+    numpy.ndarray
+        Exponential average at the end of each block. The last block is zero-padded.
+    """
+    decay = np.exp(-1.0 / (sampling_frequency * time_constant))
+    block_count = max(1, int(np.ceil(squared_data.size / block_size)))
+    blocks = np.zeros(block_count * block_size)
+    blocks[: squared_data.size] = squared_data
+
+    weights = (1.0 - decay) * decay ** np.arange(block_size - 1, -1, -1)
+    block_contributions = blocks.reshape(block_count, block_size) @ weights
+    block_decay = decay**block_size
+
+    averages = np.empty(block_count)
+    average = 0.0
+    for i, contribution in enumerate(block_contributions):
+        average = block_decay * average + contribution
+        averages[i] = average
+    return averages
+
+
+def _compute_mean_squares_over_time(
+    data: np.ndarray,
+    sampling_frequency: float,
+    time_weighting: int,
+    time_step: float,
+    window_size: float,
+    analysis_window: str,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Compute the time-weighted mean square of a signal over time.
+
+    With the impulse time weighting, the 1.5-s decay of the detector is applied once per time
+    step, rather than once per sample.
+
+    Returns
+    -------
+    numpy.ndarray
+        Mean squares.
+    numpy.ndarray
+        Times in s.
+    """
+    squared_data = data**2
+    step = max(1, int(round(time_step * sampling_frequency)))
+
+    if time_weighting == CUSTOM_TIME_WEIGHTING:
+        window_length = max(1, int(round(window_size * sampling_frequency)))
+        window = _get_window(analysis_window, window_length)
+        mean_squares = _get_frames(squared_data, window_length, step) @ (
+            window**2 / np.sum(window**2)
+        )
+        times = (np.arange(mean_squares.size) * step + window_length / 2.0) / sampling_frequency
+        return mean_squares, times
+
+    if time_weighting not in TIME_CONSTANTS:
+        raise _emulation_error(f"Time weighting {time_weighting} is not supported.")
+
+    mean_squares = _compute_exponential_average(
+        squared_data, sampling_frequency, TIME_CONSTANTS[time_weighting], step
+    )
+    if time_weighting == 2:
+        # Impulse: 35-ms rise, and peak detector with slow decay.
+        step_decay = np.exp(-step / (sampling_frequency * IMPULSE_DECAY_TIME_CONSTANT))
+        for i in range(1, mean_squares.size):
+            mean_squares[i] = max(mean_squares[i], step_decay * mean_squares[i - 1])
+
+    times = np.arange(1, mean_squares.size + 1) * step / sampling_frequency
+    return mean_squares, times
+
+
+# DPF data conversions
+# ------------------------------------------------------------------------------
+
+
+def _get_unit(field: Field) -> str:
+    """Get the unit of a field, as a string."""
+    unit = field.unit
+    return unit if isinstance(unit, str) else unit[1]
+
+
+def _get_signal_data(signal: Field) -> tuple[np.ndarray, float]:
+    """Get the samples and the sampling frequency of a signal."""
+    times = signal.time_freq_support.time_frequencies.data
+    return np.asarray(signal.data, dtype=np.float64), 1.0 / (times[1] - times[0])
+
+
+def _create_support(values: np.ndarray, unit: str) -> TimeFreqSupport:
+    """Create a time or frequency support."""
+    field_support = fields_factory.create_scalar_field(num_entities=1, location=locations.time_freq)
+    field_support.append(np.ascontiguousarray(values, dtype=np.float64), 1)
+    field_support.unit = unit
+    support = TimeFreqSupport()
+    support.time_frequencies = field_support
+    return support
+
+
+def _create_field(
+    data: np.ndarray, support: TimeFreqSupport, unit: str = "", name: str = ""
+) -> Field:
+    """Create a field with a time or frequency support."""
+    field = fields_factory.create_scalar_field(num_entities=1, location=locations.time_freq)
+    field.append(np.ascontiguousarray(data, dtype=np.float64), 1)
+    field.unit = unit
+    field.name = name
+    field.time_freq_support = support
+    return field
+
+
+def _create_data_sources(path: str, key: str, server: Any = None) -> DataSources:
+    """Create a data sources object with a single file path.
+
+    The path is recorded, so that it can be read by the emulated operators.
+
+    Parameters
+    ----------
+    path : str
+        File path.
+    key : str
+        Key of the file path, for example ``".wav"``.
+    server : BaseServer, default: None
+        DPF server of the data sources. If ``None``, the global server is used.
+
+    Returns
+    -------
+    DataSources
+        Data sources containing the file path.
+    """
+    data_sources = DataSources(server=server)
+    data_sources.add_file_path(path, key)
+    _data_sources_paths[data_sources] = path
+    return data_sources
+
+
+def _get_data_sources_path(data_sources: DataSources) -> str:
+    """Get the file path of a data sources object created with :func:`_create_data_sources`."""
+    path = _data_sources_paths.get(data_sources)
+    if path is None:
+        raise _emulation_error(
+            "Emulated operators only support data sources created by the PyAnsys Sound classes."
+        )
+    return path
+
+
+# Emulated operators
+# ------------------------------------------------------------------------------
+
+
+class _OperatorOutput(NamedTuple):
+    """Output pin of an emulated operator, connected to the input of another one."""
+
+    operator: "_EmulatedOperator"
+    pin: int
+
+
+def _register_operator(*names: str):
+    """Register an emulated operator class for one or several DPF Sound operator names."""
+
+    def decorator(cls: type) -> type:
+        for name in names:
+            _EMULATED_OPERATORS[name] = cls
+        return cls
+
+    return decorator
+
+
+class _EmulatedOperator(ABC):
+    """Base class of the emulated operators.
+
+    Emulated operators implement the methods of the DPF ``Operator`` class that the PyAnsys Sound
+    classes use. Like DPF operators, they run on the first output request if not run explicitly.
+    Subclasses implement :meth:`_compute`, and are registered with :func:`_register_operator`.
+    """
+
+    def __init__(self, name: str):
+        """Initialize the operator."""
+        self.name = name
+        self._inputs = {}
+        self._outputs = None
+
+    def __str__(self) -> str:
+        """Return the string representation of the object."""
+        return f"Emulated DPF Sound operator '{self.name}'."
+
+    def connect(self, pin: int, inpt: Any, pin_out: int = 0):
+        """Connect an input pin.
+
+        Parameters
+        ----------
+        pin : int
+            Input pin.
+        inpt : Any
+            Input value, or another emulated operator whose output pin ``pin_out`` is connected.
+        pin_out : int, default: 0
+            Output pin of ``inpt``, if ``inpt`` is an emulated operator.
+        """
+        _profile_call(
+            "connect",
+            f"EmulatedOperator.connect[{pin}]",
+            self.__connect,
+            pin,
+            inpt,
+            pin_out,
+            operator=self.name,
+        )
+
+    def __connect(self, pin: int, inpt: Any, pin_out: int):
+        """Connect an input pin, without profiling."""
+        if isinstance(inpt, Operator):
+            raise _emulation_error(
+                f"The output of DPF operator '{inpt.name}' cannot be connected to emulated "
+                f"operator '{self.name}'."
+            )
+        if isinstance(inpt, _EmulatedOperator):
+            inpt = _OperatorOutput(inpt, pin_out)
+        self._inputs[pin] = inpt
+        self._outputs = None
+
+    def run(self):
+        """Compute the outputs."""
+        _profile_call("run", "EmulatedOperator.run", self.__run, operator=self.name)
+
+    def __run(self):
+        """Compute the outputs, without profiling."""
+        self._outputs = self._compute()
+
+    def get_output(self, pin: int = 0, output_type: Any = None) -> Any:
+        """Get an output, running the operator first if needed.
+
+        Parameters
+        ----------
+        pin : int, default: 0
+            Output pin.
+        output_type : Any, default: None
+            Output type. Only present for compatibility with the DPF ``Operator`` class: outputs
+            always have the type of the emulated operator output.
+
+        Returns
+        -------
+        Any
+            Output.
+        """
+        return _profile_call(
+            "get_output",
+            f"EmulatedOperator.get_output[{pin}]",
+            self.__get_output,
+            pin,
+            operator=self.name,
+        )
+
+    def __get_output(self, pin: int) -> Any:
+        """Get an output, without profiling."""
+        if self._outputs is None:
+            self.__run()
+        if pin not in self._outputs:
+            raise _emulation_error(f"Emulated operator '{self.name}' has no output pin {pin}.")
+        return self._outputs[pin]
+
+    def _get_input(self, pin: int) -> Any:
+        """Get the value connected to an input pin."""
+        if pin not in self._inputs:
+            raise _emulation_error(
+                f"Input pin {pin} of emulated operator '{self.name}' is not connected."
+            )
+
+        inpt = self._inputs[pin]
+        if isinstance(inpt, _OperatorOutput):
+            return inpt.operator.get_output(inpt.pin)
+        return inpt
+
+    @abstractmethod
+    def _compute(self) -> dict[int, Any]:
+        """Compute the outputs, indexed by output pin."""
+
+
+@_register_operator("apply_gain")
+class _EmulatedApplyGain(_EmulatedOperator):
+    """Emulation of the gain operator: signal, gain, and gain unit in, signal out."""
+
+    def _compute(self) -> dict[int, Any]:
+        signal = self._get_input(0)
+        gain = float(self._get_input(1))
+        if bool(self._get_input(2)):
+            gain = 10.0 ** (gain / 20.0)
+
+        data, _ = _get_signal_data(signal)
+        return {0: _create_field(data * gain, signal.time_freq_support, _get_unit(signal))}
+
+
+@_register_operator("sum_signals")
+class _EmulatedSumSignals(_EmulatedOperator):
+    """Emulation of the signal summation operator: signals in, summed signal out."""
+
+    def _compute(self) -> dict[int, Any]:
+        signals = list(self._get_input(0))
+        data = np.sum([np.asarray(signal.data, dtype=np.float64) for signal in signals], axis=0)
+        return {0: _create_field(data, signals[0].time_freq_support, _get_unit(signals[0]))}
+
+
+@_register_operator("filter_signal")
+class _EmulatedFilterSignal(_EmulatedOperator):
+    """Emulation of the filtering operator: signal and filter coefficients in, signal out."""
+
+    def _compute(self) -> dict[int, Any]:
+        signal = self._get_input(0)
+        b = np.asarray(self._get_input(1), dtype=np.float64)
+        a = np.asarray(self._get_input(2), dtype=np.float64)
+
+        data, _ = _get_signal_data(signal)
+        return {
+            0: _create_field(
+                _filter_signal(data, b, a), signal.time_freq_support, _get_unit(signal)
+            )
+        }
+
+
+@_register_operator("compute_stft")
+class _EmulatedStft(_EmulatedOperator):
+    """Emulation of the STFT operator: signal and STFT parameters in, STFT out."""
+
+    def _compute(self) -> dict[int, Any]:
+        signal = self._get_input(0)
+        fft_size = int(self._get_input(1))
+        data, sampling_frequency = _get_signal_data(signal)
+        spectra, frame_starts = _compute_stft(
+            data, fft_size, str(self._get_input(2)), float(self._get_input(3))
+        )
+
+        unit = _get_unit(signal)
+        frequency_support = _create_support(
+            np.arange(fft_size) * sampling_frequency / fft_size, "Hz"
+        )
+        stft = FieldsContainer()
+        stft.labels = ["channel_number", "complex", "time"]
+        stft.time_freq_support = _create_support(frame_starts / sampling_frequency, "s")
+        for i, spectrum in enumerate(spectra):
+            for complex_index, part in enumerate((spectrum.real, spectrum.imag)):
+                stft.add_field(
+                    {"channel_number": 0, "complex": complex_index, "time": i},
+                    _create_field(part, frequency_support, unit),
+                )
+        return {0: stft}
+
+
+@_register_operator("compute_power_spectral_density")
+class _EmulatedPowerSpectralDensity(_EmulatedOperator):
+    """Emulation of the PSD operator: signal and Welch parameters in, PSD out."""
+
+    def _compute(self) -> dict[int, Any]:
+        signal = self._get_input(0)
+        data, sampling_frequency = _get_signal_data(signal)
+        psd, frequencies = _compute_power_spectral_density(
+            data,
+            sampling_frequency,
+            str(self._get_input(1)),
+            int(self._get_input(2)),
+            int(self._get_input(3)),
+            float(self._get_input(4)),
+        )
+        return {
+            0: _create_field(
+                psd, _create_support(frequencies, "Hz"), f"{_get_unit(signal)}^2/Hz", signal.name
+            )
+        }
+
+
+@_register_operator("compute_level_over_time")
+class _EmulatedLevelOverTime(_EmulatedOperator):
+    """Emulation of the level-over-time operator: signal in, maximum and time-varying level out."""
+
+    def _compute(self) -> dict[int, Any]:
+        signal = self._get_input(0)
+        use_db_scale = int(self._get_input(1)) == 0
+        reference_value = float(self._get_input(2))
+        frequency_weighting = int(self._get_input(3))
+
+        data, sampling_frequency = _get_signal_data(signal)
+        if use_db_scale and frequency_weighting in FREQUENCY_WEIGHTINGS:
+            data = _apply_frequency_weighting(
+                data, sampling_frequency, FREQUENCY_WEIGHTINGS[frequency_weighting]
+            )
+
+        mean_squares, times = _compute_mean_squares_over_time(
+            data,
+            sampling_frequency,
+            int(self._get_input(4)),
+            float(self._get_input(5)),
+            float(self._get_input(6)),
+            str(self._get_input(7)),
+        )
+        if use_db_scale:
+            levels = 10.0 * np.log10(mean_squares / reference_value**2 + 1e-12)
+            unit = "dB"
+        else:
+            levels = np.sqrt(mean_squares)
+            unit = _get_unit(signal)
+
+        return {
+            0: float(np.max(levels)),
+            1: _create_field(levels, _create_support(times, "s"), unit, signal.name),
+        }
+
+
+@_register_operator(
+    "compute_one_third_octave_levels_from_signal",
+    "compute_one_third_octave_levels_from_psd",
+    "compute_one_third_octave_levels_from_psd_ansi_s1_11_1986",
+    "compute_octave_levels_from_psd",
+    "compute_octave_levels_from_psd_ansi_s1_11_1986",
+)
+class _EmulatedFractionalOctaveLevels(_EmulatedOperator):
+    """Emulation of the fractional-octave level operators: signal or PSD in, band levels out.
+
+    Band levels are in squared units. From a signal, the band levels are computed from the
+    periodogram of the whole signal, with the ANSI S1.11-1986 filter bank.
+    """
+
+    def _compute(self) -> dict[int, Any]:
+        source = self._get_input(0)
+        if self.name.endswith("from_signal"):
+            data, sampling_frequency = _get_signal_data(source)
+            bin_powers, frequencies = _compute_periodogram(data, sampling_frequency)
+            use_filter_bank = True
+            unit = f"{_get_unit(source)}^2"
+        else:
+            frequencies = np.asarray(source.time_freq_support.time_frequencies.data)
+            bin_powers = np.asarray(source.data, dtype=np.float64) * (
+                frequencies[1] - frequencies[0]
+            )
+            use_filter_bank = self.name.endswith("ansi_s1_11_1986")
+            unit = _get_unit(source).removesuffix("/Hz")
+
+        powers, center_frequencies = _compute_band_powers(
+            bin_powers, frequencies, 3 if "one_third" in self.name else 1, use_filter_bank
+        )
+        return {0: _create_field(powers, _create_support(center_frequencies, "Hz"), unit)}
+
+
+@_register_operator("get_frequency_weighting")
+class _EmulatedFrequencyWeighting(_EmulatedOperator):
+    """Emulation of the frequency weighting operator: frequencies in, gains in dB out."""
+
+    def _compute(self) -> dict[int, Any]:
+        gains = _get_frequency_weighting(np.asarray(self._get_input(0)), str(self._get_input(1)))
+        return {0: gains.tolist()}
+
+
+@_register_operator("load_wav_sas")
+class _EmulatedLoadWav(_EmulatedOperator):
+    """Emulation of the WAV loading operator: data sources in, signals and file format out.
+
+    The file is decoded with :class:`.LoadWavLocal`: Ansys Sound calibration data is not applied.
+    """
+
+    def _compute(self) -> dict[int, Any]:
+        # Imported here, because the PyAnsys Sound base classes depend on this module.
+        from ansys.sound.core._pyansys_sound import PyAnsysSoundWarning
+        from ansys.sound.core.signal_utilities.load_wav_local import LoadWavLocal
+
+        path = _get_data_sources_path(self._get_input(0))
+        load_wav = LoadWavLocal(path)
+        with warnings.catch_warnings(record=True) as caught_warnings:
+            warnings.simplefilter("always", PyAnsysSoundWarning)
+            load_wav.process()
+        if any(issubclass(warning.category, PyAnsysSoundWarning) for warning in caught_warnings):
+            warnings.warn(
+                PyAnsysSoundWarning(
+                    f"WAV file '{path}' contains Ansys Sound calibration data, which emulated "
+                    f"operator '{self.name}' does not apply."
+                )
+            )
+
+        signals = FieldsContainer()
+        signals.labels = ["channel_number"]
+        for channel, signal in enumerate(load_wav.get_output()):
+            signals.add_field({"channel_number": channel}, signal)
+        return {0: signals, 1: load_wav.get_sampling_frequency(), 2: load_wav.get_format()}
+
+
+@_register_operator("write_wav_sas")
+class _EmulatedWriteWav(_EmulatedOperator):
+    """Emulation of the WAV writing operator: signals and data sources in, no output.
+
+    Samples are clipped to the [-1, 1] range for integer formats.
+    """
+
+    def _compute(self) -> dict[int, Any]:
+        # Imported here, because the PyAnsys Sound base classes depend on this module.
+        from ansys.sound.core.signal_utilities.load_wav_local import SAMPLE_FORMATS
+
+        signals = list(self._get_input(0))
+        path = _get_data_sources_path(self._get_input(1))
+        bit_depth = str(self._get_input(2))
+
+        formats = {name: (key, scale) for key, (name, _, scale) in SAMPLE_FORMATS.items()}
+        if bit_depth not in formats:
+            raise _emulation_error(f"Bit depth '{bit_depth}' is not supported.")
+        (format_tag, bits_per_sample), full_scale = formats[bit_depth]
+
+        _, sampling_frequency = _get_signal_data(signals[0])
+        samples = np.column_stack([np.asarray(signal.data, dtype=np.float64) for signal in signals])
+        match bit_depth:
+            case "float32":
+                encoded = samples.astype("<f4")
+            case "int8":
+                # 8-bit WAV samples are unsigned, with an offset of 128.
+                encoded = np.clip(np.round(samples * full_scale) + 128.0, 0, 255).astype(np.uint8)
+            case _:
+                integers = np.clip(np.round(samples * full_scale), -full_scale, full_scale - 1)
+                encoded = integers.astype("<i4")
+                if bit_depth == "int16":
+                    encoded = encoded.astype("<i2")
+                elif bit_depth == "int24":
+                    # Keep the 3 least significant bytes of each little-endian 32-bit sample.
+                    encoded = encoded.view(np.uint8).reshape(*encoded.shape, 4)[..., :3]
+
+        data = np.ascontiguousarray(encoded).tobytes()
+        channel_count = samples.shape[1]
+        block_align = channel_count * bits_per_sample // 8
+        padding = b"\x00" * (len(data) % 2)
+        with open(path, "wb") as file:
+            file.write(b"RIFF" + struct.pack("<I", 36 + len(data) + len(padding)) + b"WAVE")
+            file.write(
+                b"fmt "
+                + struct.pack(
+                    "<IHHIIHH",
+                    16,
+                    format_tag,
+                    channel_count,
+                    int(round(sampling_frequency)),
+                    int(round(sampling_frequency)) * block_align,
+                    block_align,
+                    bits_per_sample,
+                )
+            )
+            file.write(b"data" + struct.pack("<I", len(data)) + data + padding)
+
+        return {}
+
+
+def _create_emulated_operator(name: str) -> _EmulatedOperator | None:
+    """Create an emulated operator, if an operator emulator is active and emulates it.
+
+    Only called by ``_acquire_operator()`` and ``_create_operator()`` of the operator pool, so
+    only the operators that the PyAnsys Sound classes get from the pool are emulated.
+
+    Parameters
+    ----------
+    name : str
+        DPF Sound operator name.
+
+    Returns
+    -------
+    _EmulatedOperator | None
+        Emulated operator, or ``None`` if the operator is not emulated.
+    """
+    emulator = _active_emulator
+    if emulator is None or name not in emulator.operators:
+        return None
+    return _EMULATED_OPERATORS[name](name)
+
+
+class OperatorEmulator:
+    """Replace lightweight DPF Sound operators with NumPy reference implementations.
+
+    Within the ``with`` block of an operator emulator, the PyAnsys Sound classes instantiated get
+    emulated operators, running in the client process, instead of the DPF Sound operators listed
+    in :meth:`get_supported_operators`. The instances keep using the emulated operators after the
+    block. This allows measuring the overhead of the PyAnsys Sound classes separately from the
+    DPF Sound computations, for example with :class:`.Profiler` (operator calls are then recorded
+    as ``EmulatedOperator`` calls), and testing processing chains without the DPF Sound plugin
+    license.
+
+    .. note::
+        Only the operators that the PyAnsys Sound classes take from the operator pool are
+        emulated: operators that a class creates directly, for example to connect a different set
+        of inputs on each run, are still DPF Sound operators.
+
+    .. note::
+        Emulated operators still receive and create DPF fields, which requires a DPF server.
+
+    .. note::
+        Emulated operators are reference implementations of the same processing: their results are
+        close to, but not identical with, those of the DPF Sound operators. For example, level
+        over time with the impulse time weighting applies the detector decay once per time step,
+        and one-third-octave levels from a signal are computed from its periodogram. Emulated
+        operators cannot be used in a :class:`.Pipeline`.
+
+    Examples
+    --------
+    Compute a PSD with the emulated operator, and profile the calls.
+
+    >>> from ansys.sound.core import OperatorEmulator, Profiler
+    >>> from ansys.sound.core.spectral_processing import PowerSpectralDensity
+    >>> with OperatorEmulator():
+    ...     psd = PowerSpectralDensity(input_signal=my_signal)
+    >>> with Profiler() as profiler:
+    ...     psd.process()
+    """
+
+    def __init__(self, operators: list[str] = None):
+        """Class instantiation takes the following parameters.
+
+        Parameters
+        ----------
+        operators : list[str], default: None
+            Names of the DPF Sound operators to emulate. If ``None``, all the operators listed in
+            :meth:`get_supported_operators` are emulated.
+        """
+        if operators is None:
+            operators = self.get_supported_operators()
+
+        unsupported_operators = [name for name in operators if name not in _EMULATED_OPERATORS]
+        if len(unsupported_operators) > 0:
+            raise _emulation_error(
+                f"Operators {unsupported_operators} cannot be emulated. Supported operators are "
+                f"{self.get_supported_operators()}."
+            )
+
+        self.__operators = frozenset(operators)
+
+    def __str__(self) -> str:
+        """Return the string representation of the object."""
+        active = "active" if _active_emulator is self else "inactive"
+        operators = "\n\t".join(sorted(self.operators))
+        return f"{self.__class__.__name__} object ({active}).\nEmulated operators:\n\t{operators}"
+
+    @property
+    def operators(self) -> frozenset[str]:
+        """Names of the emulated DPF Sound operators."""
+        return self.__operators
+
+    @staticmethod
+    def get_supported_operators() -> list[str]:
+        """Get the names of the DPF Sound operators that can be emulated.
+
+        Returns
+        -------
+        list[str]
+            Names of the DPF Sound operators that can be emulated, in alphabetical order.
+        """
+        return sorted(_EMULATED_OPERATORS)
+
+    def __enter__(self) -> "OperatorEmulator":
+        """Start emulating the operators."""
+        global _active_emulator
+
+        with _activation_lock:
+            if _active_emulator is not None:
+                raise _emulation_error("Another operator emulator is already active.")
+            _active_emulator = self
+
+        return self
+
+    def __exit__(self, *args):
+        """Stop emulating the operators."""
+        global _active_emulator
+
+        with _activation_lock:
+            _active_emulator = None
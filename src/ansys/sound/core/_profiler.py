@@ -0,0 +1,474 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Opt-in instrumentation of PyAnsys Sound processing and DPF operator calls."""
+
+from functools import wraps
+import itertools
+import json
+import os
+import threading
+import time
+from typing import Any, Callable
+
+from ansys.dpf.core import Operator
+import numpy as np
+
+# Profiler currently recording, if any. Instrumented functions only check this variable when no
+# profiler is active, which keeps the instrumentation overhead negligible.
+_active_profiler = None
+_activation_lock = threading.Lock()
+
+# Stack of the spans being recorded, per thread, to find the parent of each span.
+_span_stacks = threading.local()
+
+# Size in bytes of a double-precision value, as stored in DPF fields.
+DOUBLE_SIZE = 8
+
+
+def _get_payload_size(value: Any) -> int:
+    """Estimate the size in bytes of the data sent to or received from the DPF server.
+
+    Only the data actually transferred is counted, and it is sized without any call to the server.
+    DPF fields and fields containers are handles to data stored on the server, and count as 0
+    bytes: their data is counted when it is read, as the NumPy arrays output by the conversions.
+    DPF transfers floating-point data in double precision, so each real value of a NumPy array
+    counts as 8 bytes, and each complex value as 16 bytes, whatever the array's data type.
+    """
+    if isinstance(value, np.ndarray):
+        return value.size * DOUBLE_SIZE * (2 if np.iscomplexobj(value) else 1)
+    if isinstance(value, (list, tuple)):
+        return sum(_get_payload_size(item) for item in value)
+    if isinstance(value, str):
+        return len(value.encode())
+    if isinstance(value, (bool, int, float)):
+        return DOUBLE_SIZE
+    return 0
+
+
+def _profile_call(
+    category: str,
+    name: str,
+    function: Callable,
+    *args,
+    operator: str = None,
+    bytes_in: Callable[[], int] = None,
+    bytes_out: Callable[[Any], int] = None,
+    **kwargs,
+) -> Any:
+    """Call a function, and record the call in the active profiler, if any.
+
+    Parameters
+    ----------
+    category : str
+        Category of the call, for example ``"process"`` or ``"run"``.
+    name : str
+        Name of the call.
+    function : Callable
+        Function to call with the positional and keyword arguments.
+    operator : str, default: None
+        Name of the DPF operator involved in the call, if any.
+    bytes_in : Callable[[], int], default: None
+        Function returning the size in bytes of the data sent to the server.
+    bytes_out : Callable[[Any], int], default: None
+        Function returning the size in bytes of the data received from the server, from the
+        output of the call.
+
+    Returns
+    -------
+    Any
+        The function's output.
+    """
+    profiler = _active_profiler
+    if profiler is None:
+        return function(*args, **kwargs)
+
+    stack = getattr(_span_stacks, "stack", None)
+    if stack is None:
+        stack = _span_stacks.stack = []
+        _span_stacks.categories = []
+    span_id = next(profiler._span_ids)
+    parent_id = stack[-1] if len(stack) > 0 else None
+
+    # The data of a conversion made within another conversion is counted by the outer one only.
+    if category == "conversion" and "conversion" in _span_stacks.categories:
+        bytes_in = bytes_out = None
+
+    stack.append(span_id)
+    _span_stacks.categories.append(category)
+    start = time.perf_counter_ns()
+    error = None
+    try:
+        output = function(*args, **kwargs)
+        return output
+    except BaseException as exception:
+        output = None
+        error = exception
+        raise
+    finally:
+        end = time.perf_counter_ns()
+        stack.pop()
+        _span_stacks.categories.pop()
+        profiler._add_event(
+            {
+                "span_id": span_id,
+                "parent_id": parent_id,
+                "category": category,
+                "name": name,
+                "operator": operator,
+                "start": (start - profiler._start) * 1e-9,
+                "duration": (end - start) * 1e-9,
+                "bytes_in": bytes_in() if bytes_in is not None else 0,
+                "bytes_out": bytes_out(output) if bytes_out is not None and error is None else 0,
+                "thread_id": threading.get_ident(),
+                "error": repr(error) if error is not None else None,
+            }
+        )
+
+
+def _instrument_method(method: Callable, category: str) -> Callable:
+    """Instrument a method of a PyAnsys Sound class.
+
+    Parameters
+    ----------
+    method : Callable
+        Method to instrument.
+    category : str
+        Category of the calls to the method.
+
+    Returns
+    -------
+    Callable
+        The instrumented method.
+    """
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if _active_profiler is None:
+            return method(self, *args, **kwargs)
+
+        return _profile_call(
+            category,
+            f"{self.__class__.__name__}.{method.__name__}",
+            method,
+            self,
+            *args,
+            bytes_out=_get_payload_size if category == "conversion" else None,
+            **kwargs,
+        )
+
+    return wrapper
+
+
+def _instrument_function(category: str) -> Callable:
+    """Instrument a module-level function of PyAnsys Sound.
+
+    Parameters
+    ----------
+    category : str
+        Category of the calls to the function.
+
+    Returns
+    -------
+    Callable
+        The decorator.
+    """
+
+    def decorator(function: Callable) -> Callable:
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            if _active_profiler is None:
+                return function(*args, **kwargs)
+
+            return _profile_call(
+                category,
+                function.__name__,
+                function,
+                *args,
+                bytes_in=(
+                    (lambda: _get_payload_size([a for a in args if isinstance(a, np.ndarray)]))
+                    if category == "conversion"
+                    else None
+                ),
+                bytes_out=_get_payload_size if category == "conversion" else None,
+                **kwargs,
+            )
+
+        return wrapper
+
+    return decorator
+
+
+# Original methods of the DPF Operator class, replaced while a profiler is active.
+_OPERATOR_RUN = Operator.run
+_OPERATOR_CONNECT = Operator.connect
+_OPERATOR_GET_OUTPUT = Operator.get_output
+
+
+def _profiled_operator_run(self, *args, **kwargs):
+    """Run a DPF operator, and record the call."""
+    return _profile_call(
+        "run", "Operator.run", _OPERATOR_RUN, self, *args, operator=self.name, **kwargs
+    )
+
+
+def _profiled_operator_connect(self, pin, inpt, *args, **kwargs):
+    """Connect a DPF operator input, and record the call."""
+    return _profile_call(
+        "connect",
+        f"Operator.connect[{pin}]",
+        _OPERATOR_CONNECT,
+        self,
+        pin,
+        inpt,
+        *args,
+        operator=self.name,
+        bytes_in=lambda: _get_payload_size(inpt),
+        **kwargs,
+    )
+
+
+def _profiled_operator_get_output(self, pin=0, *args, **kwargs):
+    """Get a DPF operator output, and record the call."""
+    return _profile_call(
+        "get_output",
+        f"Operator.get_output[{pin}]",
+        _OPERATOR_GET_OUTPUT,
+        self,
+        pin,
+        *args,
+        operator=self.name,
+        bytes_out=_get_payload_size,
+        **kwargs,
+    )
+
+
+class Profiler:
+    """Record the duration and payload of PyAnsys Sound and DPF operator calls.
+
+    Within the ``with`` block of a profiler, the following calls are recorded, with their wall
+    time and, for DPF operator calls, the operator name, and the estimated size of the data sent to
+    or received from the server:
+
+    - ``process()`` methods of the PyAnsys Sound classes (category ``"process"``),
+    - ``get_output_as_nparray()`` methods of the PyAnsys Sound classes, and the
+      :func:`convert_fields_container_to_np_array` function (category ``"conversion"``),
+    - the creation of signal fields from NumPy arrays (category ``"conversion"``),
+    - DPF operator ``run()``, ``connect()``, and ``get_output()`` methods (categories ``"run"``,
+      ``"connect"``, and ``"get_output"``).
+
+    Calls made within another recorded call, for example the operator calls made by a
+    ``process()`` method, are recorded as its children. Only one profiler can record at a time.
+
+    Each transferred payload is counted once, on the call that transfers it, and is sized without
+    any additional call to the server:
+
+    - DPF fields and fields containers, passed to or returned by operators, are handles to data
+      stored on the server, and count as 0 bytes.
+    - The data of DPF fields is counted when it is read, as received data of the conversion that
+      outputs it as NumPy arrays. NumPy arrays converted into DPF fields are counted as sent data
+      of the conversion. A conversion made within another conversion is not counted twice.
+    - Other operator inputs and outputs (NumPy arrays, numbers, and strings) are counted on the
+      ``connect()`` and ``get_output()`` calls.
+
+    DPF transfers floating-point data in double precision: each real value counts as 8 bytes,
+    whatever the precision of the NumPy arrays (see :func:`.set_numpy_precision`).
+
+    Examples
+    --------
+    Profile a loudness computation, and export the results.
+
+    >>> from ansys.sound.core import Profiler
+    >>> from ansys.sound.core.psychoacoustics import LoudnessISO532_1_Stationary
+    >>> with Profiler() as profiler:
+    ...     loudness = LoudnessISO532_1_Stationary(signal=my_signal)
+    ...     loudness.process()
+    >>> table = profiler.get_table()
+    >>> summary = profiler.get_summary()
+    >>> profiler.export_chrome_trace("loudness_trace.json")
+    """
+
+    def __init__(self):
+        """Class instantiation takes no parameters."""
+        self.__events = []
+        self.__events_lock = threading.Lock()
+        self._span_ids = itertools.count(1)
+        self._start = time.perf_counter_ns()
+        self.__start_unix_ns = time.time_ns()
+
+    def __enter__(self) -> "Profiler":
+        """Start recording."""
+        # Imported here, because the PyAnsys Sound base classes depend on this module.
+        from ansys.sound.core._pyansys_sound import PyAnsysSoundException
+
+        global _active_profiler
+
+        with _activation_lock:
+            if _active_profiler is not None:
+                raise PyAnsysSoundException("Another profiler is already recording.")
+
+            self._start = time.perf_counter_ns()
+            self.__start_unix_ns = time.time_ns()
+            Operator.run = _profiled_operator_run
+            Operator.connect = _profiled_operator_connect
+            Operator.get_output = _profiled_operator_get_output
+            _active_profiler = self
+
+        return self
+
+    def __exit__(self, *args):
+        """Stop recording."""
+        global _active_profiler
+
+        with _activation_lock:
+            _active_profiler = None
+            Operator.run = _OPERATOR_RUN
+            Operator.connect = _OPERATOR_CONNECT
+            Operator.get_output = _OPERATOR_GET_OUTPUT
+
+    def _add_event(self, event: dict):
+        """Add a recorded call."""
+        with self.__events_lock:
+            self.__events.append(event)
+
+    def get_table(self) -> list[dict]:
+        """Get the recorded calls as a table.
+
+        The table can directly be converted into a pandas data frame, with
+        ``pandas.DataFrame(profiler.get_table())``.
+
+        Returns
+        -------
+        list[dict]
+            Recorded calls, sorted by start time. Each call is a dictionary with the following
+            keys: ``"span_id"``, ``"parent_id"`` (``None`` for top-level calls), ``"category"``,
+            ``"name"``, ``"operator"`` (``None`` if the call does not involve a specific operator),
+            ``"start"`` (in s, from the start of the recording), ``"duration"`` (in s),
+            ``"bytes_in"``, ``"bytes_out"``, ``"thread_id"``, and ``"error"`` (``None`` if the call
+            succeeded).
+        """
+        with self.__events_lock:
+            return sorted((dict(event) for event in self.__events), key=lambda e: e["start"])
+
+    def get_summary(self) -> dict[tuple[str, str], dict[str, float]]:
+        """Get the number of calls, total duration, and total payload, per call and operator.
+
+        Returns
+        -------
+        dict[tuple[str, str], dict[str, float]]
+            Statistics, indexed by call name and operator name (``None`` if the call does not
+            involve a specific operator). For each key, the dictionary contains the ``"count"``,
+            ``"duration"`` (in s), ``"bytes_in"``, and ``"bytes_out"`` totals.
+        """
+        summary = {}
+        for event in self.get_table():
+            statistics = summary.setdefault(
+                (event["name"], event["operator"]),
+                {"count": 0, "duration": 0.0, "bytes_in": 0, "bytes_out": 0},
+            )
+            statistics["count"] += 1
+            statistics["duration"] += event["duration"]
+            statistics["bytes_in"] += event["bytes_in"]
+            statistics["bytes_out"] += event["bytes_out"]
+        return summary
+
+    def get_spans(self) -> list[dict]:
+        """Get the recorded calls as OpenTelemetry-style spans.
+
+        Returns
+        -------
+        list[dict]
+            Spans, with the ``"trace_id"``, ``"span_id"``, ``"parent_span_id"``, ``"name"``,
+            ``"start_time_unix_nano"``, ``"end_time_unix_nano"``, ``"status"``, and
+            ``"attributes"`` keys of the OpenTelemetry span data model. Identifiers are
+            hexadecimal strings.
+        """
+        trace_id = f"{id(self):032x}"
+        spans = []
+        for event in self.get_table():
+            start = self.__start_unix_ns + round(event["start"] * 1e9)
+            attributes = {
+                "pyansys_sound.category": event["category"],
+                "pyansys_sound.bytes_in": event["bytes_in"],
+                "pyansys_sound.bytes_out": event["bytes_out"],
+                "thread.id": event["thread_id"],
+            }
+            if event["operator"] is not None:
+                attributes["dpf.operator"] = event["operator"]
+            spans.append(
+                {
+                    "trace_id": trace_id,
+                    "span_id": f"{event['span_id']:016x}",
+                    "parent_span_id": (
+                        f"{event['parent_id']:016x}" if event["parent_id"] is not None else None
+                    ),
+                    "name": event["name"],
+                    "start_time_unix_nano": start,
+                    "end_time_unix_nano": start + round(event["duration"] * 1e9),
+                    "status": {
+                        "status_code": "ERROR" if event["error"] is not None else "OK",
+                        "description": event["error"],
+                    },
+                    "attributes": attributes,
+                }
+            )
+        return spans
+
+    def get_chrome_trace(self) -> dict:
+        """Get the recorded calls in the Chrome trace event format.
+
+        Returns
+        -------
+        dict
+            Trace, which can be saved as a JSON file and opened in ``chrome://tracing`` or in
+            Perfetto.
+        """
+        events = [
+            {
+                "name": event["name"],
+                "cat": event["category"],
+                "ph": "X",
+                "ts": event["start"] * 1e6,
+                "dur": event["duration"] * 1e6,
+                "pid": os.getpid(),
+                "tid": event["thread_id"],
+                "args": {
+                    "operator": event["operator"],
+                    "bytes_in": event["bytes_in"],
+                    "bytes_out": event["bytes_out"],
+                    "error": event["error"],
+                },
+            }
+            for event in self.get_table()
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path: str):
+        """Export the recorded calls as a Chrome trace JSON file.
+
+        Parameters
+        ----------
+        path : str
+            Path of the JSON file to write.
+        """
+        with open(path, "w") as file:
+            json.dump(self.get_chrome_trace(), file)
@@ -22,18 +22,118 @@
 
 """PyAnsys Sound interface."""
 
+import contextvars
 from functools import wraps
-from typing import Any, Callable
+import inspect
+from typing import Any, Callable, NamedTuple
 import warnings
-
-from ansys.dpf.core import FieldsContainer
+import weakref
+
+from ansys.dpf.core import (
+    Field,
+    FieldsContainer,
+    Operator,
+    TimeFreqSupport,
+    fields_factory,
+    locations,
+)
 from ansys.tools.common.exceptions import VersionSyntaxError
 import numpy as np
 
+from ansys.sound.core._profiler import _instrument_function, _instrument_method
 from ansys.sound.core.server_helpers._check_version import _check_sound_version_and_raise
+from ansys.sound.core.server_helpers._operator_pool import (
+    _acquire_operator,
+    _create_operator,
+    _release_operator,
+)
+from ansys.sound.core.server_helpers._server_executor import _run_in_server_executor
 
 REFERENCE_ACOUSTIC_PRESSURE_IN_AIR = 2e-5
 
+# Floating-point precisions available for the signals and spectrograms returned as NumPy arrays.
+NUMPY_PRECISIONS = ("float64", "float32")
+# Process-wide setting, shared by all threads (see `set_numpy_precision()`).
+_numpy_precision = "float64"
+
+# Server that the instances being created are bound to, set by the `server` instantiation argument.
+_instantiation_server = contextvars.ContextVar("instantiation_server", default=None)
+
+SERVER_PARAMETER_DOCSTRING = """
+        server : BaseServer, default: None
+            DPF server on which the instance creates its DPF operators and objects, for example a
+            server leased from a :class:`.ServerPool`. If ``None``, the global server is used. The
+            DPF inputs of the instance, such as its input signal, must belong to the same server.
+"""
+
+
+def _bind_instantiation_server(init: Callable) -> Callable:
+    """Add the ``server`` keyword argument to the ``__init__`` method of a PyAnsys Sound class.
+
+    The server is available to :meth:`PyAnsysSound.__init__`, including when the instantiation
+    argument is passed to a subclass, through the ``_instantiation_server`` context variable.
+
+    Parameters
+    ----------
+    init : Callable
+        ``__init__`` method of the class.
+
+    Returns
+    -------
+    Callable
+        The ``__init__`` method, with the additional ``server`` keyword argument.
+    """
+
+    @wraps(init)
+    def wrapper(self, *args, server=None, **kwargs):
+        if server is None:
+            return init(self, *args, **kwargs)
+
+        token = _instantiation_server.set(server)
+        try:
+            init(self, *args, **kwargs)
+        finally:
+            _instantiation_server.reset(token)
+
+    # Expose the additional argument in the signature, before any variadic keyword argument.
+    signature = inspect.signature(init)
+    parameters = list(signature.parameters.values())
+    position = len(parameters)
+    if len(parameters) > 0 and parameters[-1].kind == inspect.Parameter.VAR_KEYWORD:
+        position -= 1
+    parameters.insert(
+        position, inspect.Parameter("server", inspect.Parameter.KEYWORD_ONLY, default=None)
+    )
+    wrapper.__signature__ = signature.replace(parameters=parameters)
+
+    if isinstance(init.__doc__, str):
+        if "Parameters\n" in init.__doc__:
+            wrapper.__doc__ = init.__doc__.rstrip() + SERVER_PARAMETER_DOCSTRING + "        "
+        else:
+            wrapper.__doc__ = (
+                init.__doc__.rstrip()
+                + "\n\n        Parameters\n        ----------"
+                + SERVER_PARAMETER_DOCSTRING
+                + "        "
+            )
+    return wrapper
+
+
+class _PipelineStage(NamedTuple):
+    """DPF operator of a PyAnsysSound instance, ready to be chained in a pipeline."""
+
+    operator: Operator
+    """DPF operator, with all inputs but the signal connected."""
+    input_pin: int | None
+    """Input pin of the signal, or None if the operator has no signal input."""
+    output_pin: int
+    """Output pin of the processed signal, or of the main output if the operator outputs no
+    signal."""
+    store_output: Callable[[], None]
+    """Function storing the operator outputs as the instance output, once the operator has run."""
+    outputs_signal: bool = True
+    """Whether the output at the output pin is a signal, which the next stage can process."""
+
 
 class PyAnsysSound:
     """
@@ -79,6 +179,18 @@ class PyAnsysSound:
         # Update the subclass's class attribute (to later check compliance, at class instantiation).
         cls._min_sound_version = min_sound_version
 
+        # Add the `server` instantiation argument.
+        if "__init__" in cls.__dict__:
+            cls.__init__ = _bind_instantiation_server(cls.__dict__["__init__"])
+
+        # Instrument the processing and conversion methods, for the profiler.
+        for method_name, category in (
+            ("process", "process"),
+            ("get_output_as_nparray", "conversion"),
+        ):
+            if method_name in cls.__dict__:
+                setattr(cls, method_name, _instrument_method(cls.__dict__[method_name], category))
+
         # Proceed with the subclass creation.
         super().__init_subclass__(**kwargs)
 
@@ -88,6 +200,9 @@ class PyAnsysSound:
         Checks DPF version compliance (if specified in class definition), and initialize necessary
         attributes.
         """
+        # Server of the DPF operators and objects of the instance (None for the global server).
+        self._server = _instantiation_server.get()
+
         if self._min_sound_version is not None:
             # Check current DPF Sound plugin version against class minimum requirement (if
             # specified).
@@ -97,11 +212,68 @@ class PyAnsysSound:
                     f"Class `{self.__class__.__name__}` requires DPF Sound plugin version "
                     f"{self._min_sound_version} or higher."
                 ),
+                server=self._server,
             )
 
         # Initialize output attribute.
         self._output = None
 
+        # Initialize the list of the functions giving the pooled operators back to the pool.
+        self._operator_releasers = []
+
+    def __enter__(self):
+        """Enter the runtime context of the instance."""
+        return self
+
+    def __exit__(self, *args):
+        """Exit the runtime context of the instance, and close it."""
+        self.close()
+
+    def close(self):
+        """Give the DPF operators of the instance back to the operator pool.
+
+        This is done automatically when the instance is garbage-collected. Closing the instance
+        explicitly makes its operators available sooner. The instance must not be used after it is
+        closed.
+        """
+        for release_operator in self._operator_releasers:
+            release_operator()
+        self._operator_releasers.clear()
+
+    def _get_pooled_operator(self, name: str, has_optional_inputs: bool = False) -> Operator:
+        """Get a DPF operator from the operator pool, for the lifetime of the instance.
+
+        The operator is given back to the pool when the instance is closed or garbage-collected.
+        It keeps the inputs connected by its previous user, and DPF operators cannot disconnect
+        an input. So a class that leaves some inputs unconnected on some runs (for example, an
+        optional list of frequencies) must set ``has_optional_inputs``.
+
+        Parameters
+        ----------
+        name : str
+            Operator name.
+        has_optional_inputs : bool, default: False
+            Whether the class leaves some operator inputs unconnected on some runs. If
+            :obj:`True`, a new operator is created instead of being taken from the pool, and it is
+            not given back to the pool.
+
+        Returns
+        -------
+        Operator
+            DPF operator.
+        """
+        if has_optional_inputs:
+            return _create_operator(name, server=self._server)
+
+        operator, server_reference = _acquire_operator(name, server=self._server)
+        release_operator = weakref.finalize(
+            self, _release_operator, name, operator, server_reference
+        )
+        # No need to give operators back when the interpreter exits.
+        release_operator.atexit = False
+        self._operator_releasers.append(release_operator)
+        return operator
+
     def plot(self):
         """Plot the output.
 
@@ -126,6 +298,56 @@ class PyAnsysSound:
         )
         return None
 
+    async def process_async(self, timeout: float = None):
+        """Process inputs asynchronously.
+
+        The :meth:`process` method runs in a pool of threads dedicated to the DPF server, so that
+        the asyncio event loop is not blocked while the server processes the inputs. The size of
+        this pool limits the number of concurrent calls to the server. For more information, see
+        :func:`.set_server_concurrency_limit`.
+
+        Parameters
+        ----------
+        timeout : float, default: None
+            Maximum duration in s to wait for the processing. If ``None``, there is no limit.
+
+        Notes
+        -----
+        If the call is cancelled or times out (:class:`asyncio.TimeoutError`) while it waits for
+        a free thread, the processing does not take place. Once started, the processing cannot
+        be interrupted on the server: it completes in the background.
+
+        The same instance must not be processed several times concurrently.
+        """
+        await _run_in_server_executor(self.process, timeout, server=self._server)
+
+    async def get_output_async(self, timeout: float = None) -> Any:
+        """Get the output asynchronously.
+
+        The :meth:`get_output` method runs in the pool of threads dedicated to the DPF server, as
+        :meth:`process_async` does.
+
+        Parameters
+        ----------
+        timeout : float, default: None
+            Maximum duration in s to wait for the output. If ``None``, there is no limit.
+
+        Returns
+        -------
+        Any
+            Output, as returned by the :meth:`get_output` method.
+        """
+        return await _run_in_server_executor(self.get_output, timeout, server=self._server)
+
+    def _get_pipeline_stage(self) -> _PipelineStage:
+        """Get the DPF operator of the instance, for use in a pipeline.
+
+        Not implemented in this class.
+        """
+        raise PyAnsysSoundException(
+            f"Class {self.__class__.__name__} cannot be used as a pipeline stage."
+        )
+
     def get_output(self) -> None:
         """Get output.
 
@@ -177,6 +399,7 @@ class PyAnsysSoundWarning(Warning):
         super().__init__(*args)
 
 
+@_instrument_function("conversion")
 def convert_fields_container_to_np_array(fields_container: FieldsContainer) -> np.ndarray:
     """Convert a DPF fields container to a NumPy array.
 
@@ -203,10 +426,187 @@ def convert_fields_container_to_np_array(fields_container: FieldsContainer) -> n
             return np.empty(0)
         case 1:
             # Single field => 1D NumPy array
-            return np.array(fields_container[0].data)
+            return _convert_field_to_np_array(fields_container[0])
         case _:
-            # Multiple fields => 2D NumPy array
-            return np.vstack([np.array(field.data) for field in fields_container])
+            # Multiple fields => 2D NumPy array, filled row by row
+            first_row = fields_container[0].data
+            output = np.empty((len(fields_container), len(first_row)), dtype=_get_real_dtype())
+            output[0] = first_row
+            for row in range(1, len(fields_container)):
+                output[row] = fields_container[row].data
+            return output
+
+
+def set_numpy_precision(precision: str):
+    """Set the floating-point precision of the signals and spectrograms returned as NumPy arrays.
+
+    By default, the NumPy getters of the PyAnsys Sound classes return double-precision arrays
+    (``float64`` and ``complex128``), like the DPF fields they are extracted from. With the
+    ``"float32"`` precision, the signals and spectrograms (for example, the outputs of
+    :class:`.LoadWav`, :class:`.Stft`, :class:`.Istft`, or :class:`.RpmOrderRepresentation`) are
+    returned as ``float32`` and ``complex64`` arrays instead, which halves their memory footprint
+    in the client. Time, frequency, and RPM scales, as well as indicator values, are always
+    returned in double precision.
+
+    .. note::
+        This setting only affects the client memory. DPF fields only store double-precision
+        data, so the data is still transferred between the client and the server in
+        ``float64``, and then converted. Single-precision NumPy inputs are converted to
+        ``float64`` before being sent to the server.
+
+    .. note::
+        The precision is a process-wide setting, shared by all threads, including the worker
+        threads of the classes processing several signals concurrently. Set it once, before
+        processing, rather than changing it while other threads read NumPy outputs.
+
+    Parameters
+    ----------
+    precision : str
+        Precision of the NumPy arrays, either ``"float64"`` (default) or ``"float32"``.
+
+    Examples
+    --------
+    >>> from ansys.sound.core import set_numpy_precision
+    >>> set_numpy_precision("float32")
+    """
+    global _numpy_precision
+
+    if precision not in NUMPY_PRECISIONS:
+        raise PyAnsysSoundException(
+            f"Precision must be one of {', '.join(repr(name) for name in NUMPY_PRECISIONS)}."
+        )
+    _numpy_precision = precision
+
+
+def get_numpy_precision() -> str:
+    """Get the floating-point precision of the signals and spectrograms returned as NumPy arrays.
+
+    Returns
+    -------
+    str
+        Precision of the NumPy arrays, either ``"float64"`` or ``"float32"``. See
+        :func:`set_numpy_precision`.
+    """
+    return _numpy_precision
+
+
+def _get_real_dtype() -> type:
+    """Get the NumPy data type of the real-valued signals, for the current precision."""
+    return np.float32 if _numpy_precision == "float32" else np.float64
+
+
+def _get_complex_dtype() -> type:
+    """Get the NumPy data type of the complex-valued spectrograms, for the current precision."""
+    return np.complex64 if _numpy_precision == "float32" else np.complex128
+
+
+def _convert_field_to_np_array(field: Field) -> np.ndarray:
+    """Copy the data of a DPF field into a NumPy array, with the current precision.
+
+    The field data is received from the server in double precision. With the ``"float32"``
+    precision, it is then cast into a single-precision array.
+
+    Parameters
+    ----------
+    field : Field
+        DPF field to convert.
+
+    Returns
+    -------
+    numpy.ndarray
+        Data of the field.
+    """
+    return np.array(field.data, dtype=_get_real_dtype())
+
+
+def _convert_complex_fields_container_to_np_array(
+    fields_container: FieldsContainer, label_space: dict, row_label: str = "time"
+) -> np.ndarray:
+    """Convert a complex DPF fields container into a 2D NumPy array, with the current precision.
+
+    The real and imaginary parts of the fields are written directly into the preallocated output
+    array, without any temporary complex array.
+
+    Parameters
+    ----------
+    fields_container : FieldsContainer
+        DPF fields container, with one field per row and per complex part (label ``"complex"``).
+    label_space : dict
+        Additional labels identifying the fields to convert, for example ``{"channel_number": 0}``.
+    row_label : str, default: "time"
+        Label indexing the rows of the output array.
+
+    Returns
+    -------
+    numpy.ndarray
+        2D complex NumPy array, with one row per value of label ``row_label``.
+    """
+    row_indexes = fields_container.get_available_ids_for_label(row_label)
+
+    output = None
+    for row, index in enumerate(row_indexes):
+        real_part = fields_container.get_field({**label_space, "complex": 0, row_label: index}).data
+        if output is None:
+            output = np.empty((len(row_indexes), len(real_part)), dtype=_get_complex_dtype())
+        output.real[row] = real_part
+        output.imag[row] = fields_container.get_field(
+            {**label_space, "complex": 1, row_label: index}
+        ).data
+
+    return output
+
+
+@_instrument_function("conversion")
+def _create_signal_field(
+    data: np.ndarray,
+    sampling_frequency: float,
+    unit: str = "Pa",
+    name: str = "",
+    server: Any = None,
+) -> Field:
+    """Create a DPF field containing a time-domain signal from a NumPy array.
+
+    The data is transferred to the DPF field as a contiguous NumPy buffer, without any conversion
+    into Python objects. The time support of the field is built from the sampling frequency.
+
+    Parameters
+    ----------
+    data : numpy.ndarray
+        Time-domain signal samples as a 1D NumPy array. DPF fields store double-precision data:
+        other data types are converted in a single vectorized copy.
+    sampling_frequency : float
+        Sampling frequency in Hz.
+    unit : str, default: "Pa"
+        Unit of the signal.
+    name : str, default: ""
+        Name of the field.
+    server : BaseServer, default: None
+        DPF server on which the field is created. If unspecified, the global server is used.
+
+    Returns
+    -------
+    Field
+        Time-domain signal as a DPF field.
+    """
+    data = np.ascontiguousarray(data, dtype=np.float64).reshape(-1)
+
+    field_time = fields_factory.create_scalar_field(
+        num_entities=1, location=locations.time_freq, server=server
+    )
+    field_time.append(np.arange(data.size, dtype=np.float64) / sampling_frequency, 1)
+    field_time.unit = "s"
+    support = TimeFreqSupport(server=server)
+    support.time_frequencies = field_time
+
+    field = fields_factory.create_scalar_field(
+        num_entities=1, location=locations.time_freq, server=server
+    )
+    field.append(data, 1)
+    field.unit = unit
+    field.name = name
+    field.time_freq_support = support
+
+    return field
 
 
 def scipy_required(func: Callable) -> Callable:
@@ -227,6 +627,42 @@ def scipy_required(func: Callable) -> Callable:
     return _package_required(func, "SciPy")
 
 
+def pyarrow_required(func: Callable) -> Callable:
+    """Decorate a function or method to ensure that PyArrow is installed.
+
+    If it is not installed, an exception is raised suggesting to install it.
+
+    Parameters
+    ----------
+    func : Callable
+        The function or method to which the decorator applies.
+
+    Returns
+    -------
+    Callable
+        The decorated function or method.
+    """
+    return _package_required(func, "PyArrow")
+
+
+def pandas_required(func: Callable) -> Callable:
+    """Decorate a function or method to ensure that pandas is installed.
+
+    If it is not installed, an exception is raised suggesting to install it.
+
+    Parameters
+    ----------
+    func : Callable
+        The function or method to which the decorator applies.
+
+    Returns
+    -------
+    Callable
+        The decorated function or method.
+    """
+    return _package_required(func, "pandas")
+
+
 def _package_required(func: Callable, package: str) -> Callable:
     """Decorate a function or method to ensure that the specified package is installed.
 
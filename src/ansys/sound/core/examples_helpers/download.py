@@ -40,23 +40,133 @@ consider:
     function with a call to function :func:`._download_file_in_local_examples_folder`. For example,
     ``path_on_client = _download_file_in_local_examples_folder("my_file.csv")``.
 
+Downloaded files are indexed by their SHA-256 checksum in the local examples folder, so that a
+verified local copy is reused instead of being downloaded again. Setting the environment variable
+``ANSYS_SOUND_EXAMPLES_OFFLINE`` to ``1`` (or ``true``) enables the offline mode, where the network
+is never accessed and only local copies are used. Similarly, files uploaded to a remote DPF server
+are recorded by checksum, so that a file already uploaded to a given server is not uploaded again.
+
 Note: in any case, the example data files must be submitted to the PyAnsys Sound examples
 repository, through a pull request, for the implemented download function to work. You can create
 the pull request by following this link:
 https://github.com/ansys/example-data/upload/main/pyansys-sound.
 """
 
+import hashlib
+import json
 import os
+import threading
 
 from ansys.dpf.core import server as server_module
 from ansys.dpf.core import upload_file_in_tmp_folder
 from ansys.tools.common.example_download import download_manager
 import platformdirs
 
+from .._pyansys_sound import PyAnsysSoundException
+
 # Setup data directory
 USER_DATA_PATH = platformdirs.user_data_dir(appname="ansys_sound_core", appauthor="Ansys")
 EXAMPLES_PATH = os.path.join(USER_DATA_PATH, "examples")
 
+# Checksum index of the files in the local examples folder.
+CACHE_INDEX_PATH = os.path.join(EXAMPLES_PATH, "cache_index.json")
+
+# Environment variable enabling the offline mode.
+OFFLINE_MODE_ENVIRONMENT_VARIABLE = "ANSYS_SOUND_EXAMPLES_OFFLINE"
+
+# Registry of the files already uploaded to remote DPF servers, indexed by server identity and file
+# checksum, with the path of the file on the server as value.
+_upload_registry = {}
+_upload_lock = threading.Lock()
+_cache_lock = threading.Lock()
+
+
+def _is_offline_mode() -> bool:
+    """Check whether the offline mode is enabled.
+
+    Returns
+    -------
+    bool
+        ``True`` if the environment variable ``ANSYS_SOUND_EXAMPLES_OFFLINE`` is set to ``1``,
+        ``true``, or ``yes`` (case-insensitive).
+    """
+    return os.environ.get(OFFLINE_MODE_ENVIRONMENT_VARIABLE, "").strip().lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+
+
+def _compute_file_checksum(file_path: str) -> str:
+    """Compute the SHA-256 checksum of a file.
+
+    Parameters
+    ----------
+    file_path : str
+        Path of the file.
+
+    Returns
+    -------
+    str
+        SHA-256 checksum of the file, as a hexadecimal string.
+    """
+    checksum = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b""):
+            checksum.update(chunk)
+
+    return checksum.hexdigest()
+
+
+def _read_cache_index() -> dict[str, str]:
+    """Read the checksum index of the local examples folder.
+
+    Returns
+    -------
+    dict[str, str]
+        Dictionary of file checksums indexed by file names. An empty dictionary is returned if the
+        index does not exist or cannot be read.
+    """
+    try:
+        with open(CACHE_INDEX_PATH, "r") as file:
+            index = json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+    return index if isinstance(index, dict) else {}
+
+
+def _write_cache_index(index: dict[str, str]):
+    """Write the checksum index of the local examples folder.
+
+    Parameters
+    ----------
+    index : dict[str, str]
+        Dictionary of file checksums indexed by file names.
+    """
+    os.makedirs(EXAMPLES_PATH, exist_ok=True)
+    temporary_path = f"{CACHE_INDEX_PATH}.tmp"
+    with open(temporary_path, "w") as file:
+        json.dump(index, file, indent=2, sort_keys=True)
+    os.replace(temporary_path, CACHE_INDEX_PATH)
+
+
+def _get_server_identity(server) -> tuple:
+    """Get a key identifying a DPF server process.
+
+    Parameters
+    ----------
+    server : ansys.dpf.core.server.Server
+        DPF server.
+
+    Returns
+    -------
+    tuple
+        IP address, port, and process ID of the server.
+    """
+    info = server.info
+    return (info.get("server_ip"), info.get("server_port"), info.get("server_process_id"))
+
 
 def _download_file_in_local_examples_folder(filename):
     """Download a file from the PyAnsys Sound examples repository to the local example files folder.
@@ -64,6 +174,13 @@ def _download_file_in_local_examples_folder(filename):
     The specified file is retrieved from the PyAnsys Sound examples repository at the URL
     https://github.com/ansys/example-data/raw/main/pyansys-sound/
 
+    If a copy of the file whose checksum matches the one recorded at download time is already
+    present in the local examples folder, this copy is used, and the network is not accessed.
+
+    In offline mode (environment variable ``ANSYS_SOUND_EXAMPLES_OFFLINE`` set to ``1``), the
+    network is never accessed: the local copy is used if it exists (its checksum is recorded if it
+    was not already), and an exception is raised otherwise, or if the local copy is corrupted.
+
     Parameters
     ----------
     filename : str
@@ -73,9 +190,44 @@ def _download_file_in_local_examples_folder(filename):
     -------
     Local path of the downloaded example file.
     """
-    return download_manager.download_file(
-        filename, "pyansys-sound", EXAMPLES_PATH, force=True, timeout=10.0
-    )
+    local_path = os.path.join(EXAMPLES_PATH, filename)
+
+    with _cache_lock:
+        index = _read_cache_index()
+        expected_checksum = index.get(filename)
+
+        if os.path.isfile(local_path):
+            checksum = _compute_file_checksum(local_path)
+            if checksum == expected_checksum:
+                return local_path
+
+            if _is_offline_mode():
+                if expected_checksum is not None:
+                    raise PyAnsysSoundException(
+                        f"Local copy of example file '{filename}' is corrupted, and it cannot be "
+                        f"downloaded again in offline mode. Unset the environment variable "
+                        f"{OFFLINE_MODE_ENVIRONMENT_VARIABLE} to download the file."
+                    )
+                # File was added manually to the local examples folder: trust and record it.
+                index[filename] = checksum
+                _write_cache_index(index)
+                return local_path
+
+        elif _is_offline_mode():
+            raise PyAnsysSoundException(
+                f"Example file '{filename}' is not available in the local examples folder "
+                f"({EXAMPLES_PATH}), and it cannot be downloaded in offline mode. Unset the "
+                f"environment variable {OFFLINE_MODE_ENVIRONMENT_VARIABLE} to download the file."
+            )
+
+        local_path = download_manager.download_file(
+            filename, "pyansys-sound", EXAMPLES_PATH, force=True, timeout=10.0
+        )
+
+        index[filename] = _compute_file_checksum(local_path)
+        _write_cache_index(index)
+
+    return local_path
 
 
 def _download_file_and_upload_to_server_tmp_folder(filename, server=None):
@@ -84,6 +236,10 @@ def _download_file_and_upload_to_server_tmp_folder(filename, server=None):
     If the server is remote, the file is uploaded to the server's temporary folder, and the remote
     path is returned. Otherwise, the local download path is returned.
 
+    Uploads are recorded by file checksum and server process: if the same file content was
+    already uploaded to the same server, the existing remote path is returned without uploading
+    the file again. Concurrent calls wait for each other, so that a file is uploaded only once.
+
     Parameters
     ----------
     filename : str
@@ -106,8 +262,18 @@ def _download_file_and_upload_to_server_tmp_folder(filename, server=None):
 
     if server.has_client():
         # If the server has a client, then it is a remote server and we need to upload the file
-        # to the server's temporary folder.
-        return upload_file_in_tmp_folder(file_path=local_path, server=server)  # pragma: no cover
+        # to the server's temporary folder, unless it was already uploaded.
+        key = (
+            _get_server_identity(server),
+            os.path.basename(local_path),
+            _compute_file_checksum(local_path),
+        )
+        with _upload_lock:
+            if key not in _upload_registry:
+                _upload_registry[key] = upload_file_in_tmp_folder(
+                    file_path=local_path, server=server
+                )
+            return _upload_registry[key]
     # Otherwise, the server is a local server, and we can use the local path directly.
     return local_path  # pragma: no cover
 
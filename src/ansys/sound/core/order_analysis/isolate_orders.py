@@ -24,12 +24,11 @@
 
 import warnings
 
-from ansys.dpf.core import Field, Operator, locations, natures, types
-import matplotlib.pyplot as plt
+from ansys.dpf.core import Field, locations, natures, types
 import numpy as np
 
 from . import OrderAnalysisParent
-from .._pyansys_sound import PyAnsysSoundException, PyAnsysSoundWarning
+from .._pyansys_sound import PyAnsysSoundException, PyAnsysSoundWarning, _convert_field_to_np_array
 
 
 class IsolateOrders(OrderAnalysisParent):
@@ -95,7 +94,7 @@ class IsolateOrders(OrderAnalysisParent):
         self.window_type = window_type
         self.window_overlap = window_overlap
         self.width_selection = width_selection
-        self.__operator = Operator("isolate_orders")
+        self.__operator = self._get_pooled_operator("isolate_orders")
 
     @property
     def signal(self) -> Field:
@@ -220,7 +219,9 @@ class IsolateOrders(OrderAnalysisParent):
             )
 
         # Convert order list to field.
-        orders = Field(nentities=1, nature=natures.scalar, location=locations.time_freq)
+        orders = Field(
+            nentities=1, nature=natures.scalar, location=locations.time_freq, server=self._server
+        )
         orders.append(self.orders, 1)
 
         self.__operator.connect(0, self.signal)
@@ -259,10 +260,12 @@ class IsolateOrders(OrderAnalysisParent):
         numpy.ndarray
             Temporal signal of the isolated orders in a NumPy array.
         """
-        return np.array(self.get_output().data)
+        return _convert_field_to_np_array(self.get_output())
 
     def plot(self):
         """Plot the signal after order isolation."""
+        import matplotlib.pyplot as plt
+
         if self._output is None:
             raise PyAnsysSoundException(
                 f"Output is not processed yet. Use the `{__class__.__name__}.process()` method."
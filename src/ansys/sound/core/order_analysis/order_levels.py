@@ -25,8 +25,7 @@
 import os
 import warnings
 
-from ansys.dpf.core import Field, FieldsContainer, Operator, types
-import matplotlib.pyplot as plt
+from ansys.dpf.core import Field, FieldsContainer, types
 import numpy as np
 
 from . import OrderAnalysisParent
@@ -107,7 +106,7 @@ class OrderLevels(OrderAnalysisParent, min_sound_version="2027.1.0"):
         self.order_resolution = order_resolution
         self.order_width = order_width
         self.__rpm_order_representation = None
-        self.__operator = Operator(ID_EXTRACT_ORDER_LEVELS)
+        self.__operator = self._get_pooled_operator(ID_EXTRACT_ORDER_LEVELS)
 
     def __str__(self):
         """Return the string representation of the object."""
@@ -254,6 +253,7 @@ class OrderLevels(OrderAnalysisParent, min_sound_version="2027.1.0"):
             rpm_profile=self.rpm_profile,
             max_order=self._compute_max_order(),
             order_resolution=self.order_resolution,
+            server=self._server,
         )
         rpm_order_repr.process()
         self.__rpm_order_representation = rpm_order_repr.get_output()
@@ -414,6 +414,8 @@ class OrderLevels(OrderAnalysisParent, min_sound_version="2027.1.0"):
         If more than 10 order values are specified in :attr:`orders`, only the first 10 are
         displayed.
         """
+        import matplotlib.pyplot as plt
+
         if self._output is None:
             raise PyAnsysSoundException(
                 f"Output is not processed yet. Use the `{__class__.__name__}.process()` method."
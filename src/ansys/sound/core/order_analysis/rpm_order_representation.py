@@ -24,11 +24,15 @@
 
 import warnings
 
-from ansys.dpf.core import Field, FieldsContainer, Operator, types
+from ansys.dpf.core import Field, FieldsContainer, types
 import numpy as np
 
 from . import OrderAnalysisParent
-from .._pyansys_sound import PyAnsysSoundException, PyAnsysSoundWarning
+from .._pyansys_sound import (
+    PyAnsysSoundException,
+    PyAnsysSoundWarning,
+    _convert_complex_fields_container_to_np_array,
+)
 
 ID_COMPUTE_RPM_ORDER_REPRESENTATION = "compute_rpm_order_representation"
 
@@ -92,7 +96,7 @@ class RpmOrderRepresentation(OrderAnalysisParent, min_sound_version="2027.1.0"):
         self.rpm_profile = rpm_profile
         self.max_order = max_order
         self.order_resolution = order_resolution
-        self.__operator = Operator(ID_COMPUTE_RPM_ORDER_REPRESENTATION)
+        self.__operator = self._get_pooled_operator(ID_COMPUTE_RPM_ORDER_REPRESENTATION)
 
     def __str__(self):
         """Return the string representation of the object."""
@@ -247,17 +251,7 @@ class RpmOrderRepresentation(OrderAnalysisParent, min_sound_version="2027.1.0"):
         if output is None:
             return np.array([]), np.array([]), np.array([]), np.array([])
 
-        rpm_indexes = output.get_available_ids_for_label("time")
-        Nrpm = len(rpm_indexes)
-        Norders = len(output.get_field({"complex": 0, "time": 0}).data)
-
-        # Pre-allocate memory for the output array.
-        rpm_order_representation = np.empty((Nrpm, Norders), dtype=np.complex128)
-
-        for i in rpm_indexes:
-            f1 = output.get_field({"complex": 0, "time": i})
-            f2 = output.get_field({"complex": 1, "time": i})
-            rpm_order_representation[i] = f1.data + 1j * f2.data
+        rpm_order_representation = _convert_complex_fields_container_to_np_array(output, {})
 
         order_values = np.array(output[0].time_freq_support.time_frequencies.data)
         rpm_values = np.array(
@@ -0,0 +1,731 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Stores indicator values of a corpus of sounds in a columnar Parquet file."""
+
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+import hashlib
+import json
+import os
+import warnings
+
+from ansys.dpf.core import server as server_module
+from ansys.dpf.core import upload_file_in_tmp_folder
+import numpy as np
+
+from .._pyansys_sound import (
+    PyAnsysSound,
+    PyAnsysSoundException,
+    PyAnsysSoundWarning,
+    pandas_required,
+    pyarrow_required,
+)
+from ..signal_utilities import LoadWav
+
+# Names of the columns that identify the sounds in the store.
+COLUMN_SOUND_HASH = "sound_hash"
+COLUMN_SOUND_NAME = "sound_name"
+
+# Key of the schema metadata that stores the definition of each indicator column.
+METADATA_INDICATORS = b"pyansys_sound_indicators"
+
+# Key of the schema metadata that stores the index of the channel the values are computed on.
+METADATA_CHANNEL_INDEX = b"pyansys_sound_channel_index"
+
+# Maximum number of failed sounds detailed in the message of the processing exception.
+MAX_REPORTED_ERRORS = 5
+
+# Size in bytes of the blocks read to hash the sound files.
+HASH_BLOCK_SIZE = 1 << 20
+
+
+def _hash_file(path: str) -> str:
+    """Compute the SHA-256 hash of the content of a file.
+
+    Parameters
+    ----------
+    path : str
+        Path to the file.
+
+    Returns
+    -------
+    str
+        Hexadecimal SHA-256 digest of the file content.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class IndicatorStore(PyAnsysSound):
+    """Stores indicator values of a corpus of sounds in a columnar Parquet file.
+
+    This class computes scalar indicators, with the PyAnsys Sound processing classes (for
+    example, those of the ``psychoacoustics`` and ``standard_levels`` sub-packages), for a corpus
+    of WAV files, and stores them in an Apache Arrow table, with one row per sound and one column
+    per indicator. The table is saved to, and reloaded from, a Parquet file.
+
+    Each sound is identified by the SHA-256 hash of its file content, so that renamed or moved
+    files are recognized, and modified files are recomputed. Each indicator column stores the
+    processing class, parameters, and getter used to compute it, and the store records the
+    channel of the WAV files the values are computed on. When :meth:`process` is called, only the
+    values that are missing from the store (new sounds, or new indicators) are computed, in
+    parallel threads, each sound being loaded once for all its missing indicators. A sound whose
+    processing fails does not stop the others: its values are left missing, and computed again at
+    the next call.
+
+    The stored values can then be retrieved as a feature matrix for model fitting, with
+    :meth:`get_feature_matrix`, or as a pandas data frame, with :meth:`get_data_frame`.
+
+    .. note::
+        This class requires the PyArrow Python library, and :meth:`get_data_frame` requires the
+        pandas Python library.
+
+    .. note::
+        The WAV files are hashed on the client side, and loaded on the DPF server with
+        :class:`.LoadWav`. If the DPF server is remote, each file is uploaded to the server's
+        temporary folder before it is loaded.
+
+    .. seealso::
+        :ref:`predict_listening_test_ratings`
+            Example demonstrating how to predict listening test ratings from psychoacoustic
+            indicators.
+
+    Examples
+    --------
+    Compute the loudness and sharpness of a corpus of sounds, and store them in a Parquet file.
+
+    >>> from ansys.sound.core.pipeline import IndicatorStore
+    >>> from ansys.sound.core.psychoacoustics import (
+    ...     LoudnessISO532_1_Stationary,
+    ...     SharpnessDIN45692,
+    ... )
+    >>> store = IndicatorStore(path="path/to/indicators.parquet", max_workers=4)
+    >>> store.add_indicator("LN", LoudnessISO532_1_Stationary, "get_loudness_level_phon")
+    >>> store.add_indicator(
+    ...     "S", SharpnessDIN45692, "get_sharpness", parameters={"field_type": "Free"}
+    ... )
+    >>> store.sound_paths = ["path/to/file1.wav", "path/to/file2.wav"]
+    >>> store.process()
+    >>> features = store.get_feature_matrix()
+
+    Compute the values of the sounds added to the corpus later on, and only these.
+
+    >>> store.sound_paths += ["path/to/file3.wav"]
+    >>> store.process()
+    """
+
+    def __init__(
+        self,
+        path: str = None,
+        sound_paths: list[str] = None,
+        channel_index: int = 0,
+        max_workers: int = None,
+        server_pool=None,
+    ):
+        """Class instantiation takes the following parameters.
+
+        Parameters
+        ----------
+        path : str, default: None
+            Path to the Parquet file of the store. If the file exists, the stored values are
+            loaded the first time :meth:`process` is called. The file is then updated each time
+            :meth:`process` computes new values. If ``None``, the values are only kept in memory.
+        sound_paths : list[str], default: None
+            Paths to the WAV files of the sounds to compute the indicators of.
+        channel_index : int, default: 0
+            Index of the channel of the WAV files on which to compute the indicators. It must be
+            the channel of the values already in the store, if any.
+        max_workers : int, default: None
+            Maximum number of sounds processed in parallel threads. If ``None``, the default
+            number of workers of :class:`concurrent.futures.ThreadPoolExecutor` is used.
+        server_pool : ServerPool, default: None
+            Pool of DPF servers to process the sounds on. If specified, each sound is processed on
+            a server leased from the pool. Otherwise, all sounds are processed on the server of the
+            instance.
+        """
+        super().__init__()
+        self.path = path
+        self.sound_paths = sound_paths
+        self.channel_index = channel_index
+        self.max_workers = max_workers
+        self.server_pool = server_pool
+        self.__indicators = {}
+        self.__sound_hashes = []
+        self.__processing_errors = {}
+
+    def __str__(self) -> str:
+        """Return the string representation of the object."""
+        str_indicators = ", ".join(self.__indicators) if self.__indicators else "None"
+        str_sound_count = self.__table.num_rows if self.__table is not None else "Not processed"
+        return (
+            f"{__class__.__name__} object\n"
+            "Data:\n"
+            f"\tPath: {self.path if self.path is not None else 'Not set'}\n"
+            f"\tNumber of sounds: {len(self.sound_paths)}\n"
+            f"\tIndicators: {str_indicators}\n"
+            f"Number of stored sounds: {str_sound_count}"
+        )
+
+    @property
+    def path(self) -> str:
+        """Path to the Parquet file of the store."""
+        return self.__path
+
+    @path.setter
+    def path(self, path: str):
+        """Set the path to the Parquet file."""
+        if path is not None and not isinstance(path, (str, os.PathLike)):
+            raise PyAnsysSoundException("Path must be specified as a string.")
+        self.__path = os.fspath(path) if path is not None else None
+        # The store of the new path is loaded at the next processing.
+        self.__is_loaded = False
+        self.__table = None
+        self._output = None
+
+    @property
+    def sound_paths(self) -> list[str]:
+        """Paths to the WAV files of the sounds to compute the indicators of."""
+        return self.__sound_paths
+
+    @sound_paths.setter
+    def sound_paths(self, sound_paths: list[str]):
+        """Set the paths to the WAV files."""
+        if sound_paths is None:
+            sound_paths = []
+        if not (
+            isinstance(sound_paths, (list, tuple))
+            and all(isinstance(path, (str, os.PathLike)) for path in sound_paths)
+        ):
+            raise PyAnsysSoundException("Sound paths must be specified as a list of strings.")
+        self.__sound_paths = [os.fspath(path) for path in sound_paths]
+
+    @property
+    def channel_index(self) -> int:
+        """Index of the channel of the WAV files on which to compute the indicators."""
+        return self.__channel_index
+
+    @channel_index.setter
+    def channel_index(self, channel_index: int):
+        """Set the channel index."""
+        if channel_index < 0:
+            raise PyAnsysSoundException("Channel index must be positive or zero.")
+        self.__channel_index = int(channel_index)
+
+    @property
+    def max_workers(self) -> int:
+        """Maximum number of sounds processed in parallel threads.
+
+        If ``None``, the default number of workers of
+        :class:`concurrent.futures.ThreadPoolExecutor` is used.
+        """
+        return self.__max_workers
+
+    @max_workers.setter
+    def max_workers(self, max_workers: int):
+        """Set the maximum number of workers."""
+        if max_workers is not None and max_workers < 1:
+            raise PyAnsysSoundException("Maximum number of workers must be greater than 0.")
+        self.__max_workers = max_workers
+
+    @property
+    def server_pool(self):
+        """Pool of DPF servers to process the sounds on."""
+        return self.__server_pool
+
+    @server_pool.setter
+    def server_pool(self, server_pool):
+        """Set the server pool."""
+        if server_pool is not None and not callable(getattr(server_pool, "lease", None)):
+            raise PyAnsysSoundException("Server pool must be specified as a ServerPool object.")
+        self.__server_pool = server_pool
+
+    def add_indicator(
+        self,
+        name: str,
+        indicator_class: type,
+        getter: str,
+        parameters: dict = None,
+        getter_parameters: dict = None,
+    ):
+        """Add an indicator to compute for all the sounds.
+
+        Parameters
+        ----------
+        name : str
+            Name of the indicator, used as column name in the store.
+        indicator_class : type
+            PyAnsys Sound processing class computing the indicator. It must take the signal as its
+            ``signal`` parameter.
+        getter : str
+            Name of the method of the processing class that returns the value of the indicator,
+            as a single number. For example, ``"get_loudness_level_phon"``.
+        parameters : dict, default: None
+            Parameters of the processing class other than the signal. Values must be numbers,
+            strings, Booleans, ``None``, or lists of these.
+        getter_parameters : dict, default: None
+            Parameters of the getter, with the same constraints as ``parameters``.
+        """
+        if not isinstance(name, str) or name in (COLUMN_SOUND_HASH, COLUMN_SOUND_NAME):
+            raise PyAnsysSoundException(
+                f"Indicator name must be a string, other than '{COLUMN_SOUND_HASH}' and "
+                f"'{COLUMN_SOUND_NAME}'."
+            )
+        if not (isinstance(indicator_class, type) and issubclass(indicator_class, PyAnsysSound)):
+            raise PyAnsysSoundException("Indicator class must be a PyAnsys Sound processing class.")
+        if not callable(getattr(indicator_class, getter, None)):
+            raise PyAnsysSoundException(
+                f"Class {indicator_class.__name__} has no method named '{getter}'."
+            )
+
+        definition = {
+            "class": f"{indicator_class.__module__}.{indicator_class.__qualname__}",
+            "parameters": parameters if parameters is not None else {},
+            "getter": getter,
+            "getter_parameters": getter_parameters if getter_parameters is not None else {},
+        }
+        try:
+            # Round-trip the definition, so that it compares equal to the stored definitions.
+            definition = json.loads(json.dumps(definition, sort_keys=True))
+        except (TypeError, ValueError):
+            raise PyAnsysSoundException(
+                "Parameters must only contain numbers, strings, Booleans, None, or lists of these."
+            )
+
+        self.__indicators[name] = (indicator_class, definition)
+
+    def delete_indicator(self, name: str):
+        """Delete an indicator from the indicators to compute.
+
+        The values already stored for this indicator are kept in the store.
+
+        Parameters
+        ----------
+        name : str
+            Name of the indicator.
+        """
+        if name not in self.__indicators:
+            raise PyAnsysSoundException(f"No indicator named '{name}'.")
+        del self.__indicators[name]
+
+    def get_indicator_names(self) -> list[str]:
+        """Get the names of the indicators to compute.
+
+        Returns
+        -------
+        list[str]
+            Names of the indicators, in the order in which they were added.
+        """
+        return list(self.__indicators)
+
+    @pyarrow_required
+    def process(self):
+        """Compute the missing indicator values, and update the store.
+
+        The sound files are hashed, and the values of the indicators that are missing from the
+        store are computed, in parallel threads. The store is then updated, and saved to the
+        Parquet file, if any.
+
+        If the processing of some sounds fails, the values of the other sounds are still stored
+        and saved, those of the failed sounds are left missing, and an exception listing the
+        failed sounds is then raised. See :meth:`get_processing_errors`.
+        """
+        if len(self.__indicators) == 0:
+            raise PyAnsysSoundException(
+                f"No indicator is defined. Use `{__class__.__name__}.add_indicator()`."
+            )
+
+        if not self.__is_loaded:
+            self.__load()
+
+        stored_channel_index = self.__get_stored_channel_index()
+        if stored_channel_index is not None and stored_channel_index != self.channel_index:
+            raise PyAnsysSoundException(
+                f"The store contains values computed on channel {stored_channel_index}, not on "
+                f"channel {self.channel_index}. Use another store path, or set the channel index "
+                f"to {stored_channel_index}."
+            )
+
+        stored_definitions = self.__get_stored_definitions()
+        for name, (_, definition) in self.__indicators.items():
+            if name in stored_definitions and stored_definitions[name] != definition:
+                raise PyAnsysSoundException(
+                    f"Indicator '{name}' is stored with a different definition. Use another "
+                    "indicator name."
+                )
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            sound_hashes = list(executor.map(_hash_file, self.sound_paths))
+
+            # Find the missing values of each sound. A sound listed twice is computed once.
+            stored_rows = self.__get_stored_rows()
+            stored_validity = {
+                name: self.__table.column(name).is_valid().to_numpy(zero_copy_only=False)
+                for name in self.__indicators
+                if name in stored_definitions
+            }
+            missing_indicators = {}
+            for sound_path, sound_hash in zip(self.sound_paths, sound_hashes):
+                if sound_hash in missing_indicators:
+                    continue
+                row = stored_rows.get(sound_hash)
+                names = [
+                    name
+                    for name in self.__indicators
+                    if row is None or name not in stored_validity or not stored_validity[name][row]
+                ]
+                if len(names) > 0:
+                    missing_indicators[sound_hash] = (sound_path, names)
+
+            futures = {
+                sound_hash: executor.submit(self.__compute_indicators, sound_path, names)
+                for sound_hash, (sound_path, names) in missing_indicators.items()
+            }
+            # A failed sound gets no value, so that the values of the others are still stored.
+            computed_values = {}
+            processing_errors = {}
+            for sound_hash, future in futures.items():
+                try:
+                    computed_values[sound_hash] = future.result()
+                except Exception as error:
+                    computed_values[sound_hash] = {}
+                    processing_errors[missing_indicators[sound_hash][0]] = error
+
+        self.__update_table(computed_values, dict(zip(sound_hashes, self.sound_paths)))
+        self.__sound_hashes = sound_hashes
+        self.__processing_errors = processing_errors
+        self._output = self.__table
+
+        if self.path is not None and len(computed_values) > 0:
+            self.__save()
+
+        if len(processing_errors) > 0:
+            details = "\n".join(
+                f"'{sound_path}': {error}"
+                for sound_path, error in list(processing_errors.items())[:MAX_REPORTED_ERRORS]
+            )
+            if len(processing_errors) > MAX_REPORTED_ERRORS:
+                details += f"\n... and {len(processing_errors) - MAX_REPORTED_ERRORS} more."
+            raise PyAnsysSoundException(
+                f"Indicators could not be computed for {len(processing_errors)} sound(s), whose "
+                "values are left missing. The values of the other sounds are stored. Use "
+                f"`{__class__.__name__}.get_processing_errors()` to get all errors.\n{details}"
+            ) from next(iter(processing_errors.values()))
+
+    def __load(self):
+        """Load the store from the Parquet file, if it exists."""
+        import pyarrow.parquet as pq
+
+        if self.path is not None and os.path.isfile(self.path):
+            # No memory mapping: the file must be replaceable when the store is saved, which a
+            # mapped file is not on Windows.
+            self.__table = pq.read_table(self.path)
+        self.__is_loaded = True
+
+    def __save(self):
+        """Save the store to the Parquet file.
+
+        The table is first written to a temporary file, which then replaces the store file, so that
+        an interrupted write does not corrupt the store.
+        """
+        import pyarrow.parquet as pq
+
+        temporary_path = f"{self.path}.tmp"
+        pq.write_table(self.__table, temporary_path)
+        os.replace(temporary_path, self.path)
+
+    def __get_stored_definitions(self) -> dict:
+        """Get the definitions of the stored indicator columns."""
+        if self.__table is None or self.__table.schema.metadata is None:
+            return {}
+        return json.loads(self.__table.schema.metadata.get(METADATA_INDICATORS, b"{}"))
+
+    def __get_stored_channel_index(self) -> int | None:
+        """Get the index of the channel the stored values are computed on."""
+        if self.__table is None or self.__table.schema.metadata is None:
+            return None
+        channel_index = self.__table.schema.metadata.get(METADATA_CHANNEL_INDEX)
+        return int(channel_index) if channel_index is not None else None
+
+    def __get_stored_rows(self) -> dict[str, int]:
+        """Get the row index of each stored sound, by hash."""
+        if self.__table is None:
+            return {}
+        return {
+            sound_hash: row
+            for row, sound_hash in enumerate(self.__table.column(COLUMN_SOUND_HASH).to_pylist())
+        }
+
+    def __compute_indicators(self, sound_path: str, names: list[str]) -> dict[str, float]:
+        """Load a sound, and compute some of the indicators.
+
+        Parameters
+        ----------
+        sound_path : str
+            Path to the WAV file of the sound.
+        names : list[str]
+            Names of the indicators to compute.
+
+        Returns
+        -------
+        dict[str, float]
+            Value of each computed indicator.
+        """
+        lease = self.server_pool.lease() if self.server_pool is not None else nullcontext()
+        with lease as leased_server:
+            server = leased_server if self.server_pool is not None else self._server
+
+            dpf_server = server_module.get_or_create_server(server)
+            if dpf_server.has_client():
+                # The server is remote: upload the file to its temporary folder.
+                sound_path = upload_file_in_tmp_folder(file_path=sound_path, server=dpf_server)
+
+            wav_loader = LoadWav(path_to_wav=sound_path, server=server)
+            wav_loader.process()
+            signals = wav_loader.get_output()
+            if self.channel_index >= len(signals):
+                raise PyAnsysSoundException(
+                    f"Channel index ({self.channel_index}) is out of range for file "
+                    f"'{sound_path}', which has {len(signals)} channel(s)."
+                )
+            signal = signals[self.channel_index]
+
+            values = {}
+            for name in names:
+                indicator_class, definition = self.__indicators[name]
+                indicator = indicator_class(
+                    signal=signal, **definition["parameters"], server=server
+                )
+                indicator.process()
+                value = getattr(indicator, definition["getter"])(**definition["getter_parameters"])
+                if np.size(value) != 1:
+                    raise PyAnsysSoundException(
+                        f"Indicator '{name}' must be a single number, but method "
+                        f"'{definition['getter']}' returned {np.size(value)} values."
+                    )
+                values[name] = float(np.ravel(value)[0])
+
+        return values
+
+    def __update_table(self, computed_values: dict[str, dict], sound_paths: dict[str, str]):
+        """Merge the computed values into the stored table.
+
+        Parameters
+        ----------
+        computed_values : dict[str, dict]
+            Computed values of each sound, by hash.
+        sound_paths : dict[str, str]
+            Path to the file of each sound, by hash.
+        """
+        import pyarrow as pa
+
+        stored_rows = self.__get_stored_rows()
+        stored_definitions = self.__get_stored_definitions()
+        new_hashes = [sound_hash for sound_hash in computed_values if sound_hash not in stored_rows]
+        row_count = len(stored_rows) + len(new_hashes)
+        rows = dict(stored_rows, **{h: len(stored_rows) + i for i, h in enumerate(new_hashes)})
+
+        def extend_column(name: str) -> tuple[np.ndarray, np.ndarray]:
+            """Get a stored column as values and validity mask, extended to the new rows."""
+            column = np.full(row_count, np.nan)
+            is_valid = np.zeros(row_count, dtype=bool)
+            if self.__table is not None and name in self.__table.column_names:
+                stored_column = self.__table.column(name)
+                column[: len(stored_rows)] = stored_column.to_numpy(zero_copy_only=False)
+                is_valid[: len(stored_rows)] = stored_column.is_valid().to_numpy(
+                    zero_copy_only=False
+                )
+            return column, is_valid
+
+        definitions = dict(stored_definitions)
+        columns = {}
+        for name in list(stored_definitions) + [
+            name for name in self.__indicators if name not in stored_definitions
+        ]:
+            values, is_valid = extend_column(name)
+            for sound_hash, sound_values in computed_values.items():
+                if name in sound_values:
+                    values[rows[sound_hash]] = sound_values[name]
+                    is_valid[rows[sound_hash]] = True
+            columns[name] = pa.array(values, mask=~is_valid, type=pa.float64())
+            if name not in definitions:
+                definitions[name] = self.__indicators[name][1]
+
+        stored_names = (
+            self.__table.column(COLUMN_SOUND_NAME).to_pylist() if self.__table is not None else []
+        )
+        sound_names = stored_names + [os.path.basename(sound_paths[h]) for h in new_hashes]
+        sound_hashes = list(stored_rows) + new_hashes
+
+        self.__table = pa.table(
+            {
+                COLUMN_SOUND_HASH: pa.array(sound_hashes, type=pa.string()),
+                COLUMN_SOUND_NAME: pa.array(sound_names, type=pa.string()),
+                **columns,
+            },
+            metadata={
+                METADATA_INDICATORS: json.dumps(definitions, sort_keys=True),
+                METADATA_CHANNEL_INDEX: str(self.channel_index),
+            },
+        )
+
+    def get_output(self):
+        """Get the stored table.
+
+        Returns
+        -------
+        pyarrow.Table
+            Table with one row per stored sound, and the columns ``sound_hash`` (SHA-256 hash of
+            the file content), ``sound_name`` (file name), and one column per stored indicator.
+            Missing values are null.
+        """
+        if self._output is None:
+            warnings.warn(
+                PyAnsysSoundWarning(
+                    f"Output is not processed yet. Use the `{__class__.__name__}.process()` method."
+                )
+            )
+
+        return self._output
+
+    def get_output_as_nparray(self) -> np.ndarray:
+        """Get the feature matrix of the sounds, as a NumPy array.
+
+        Returns
+        -------
+        numpy.ndarray
+            Same as :meth:`get_feature_matrix`. If the output is not processed yet, the array is
+            empty.
+        """
+        if self.get_output() is None:
+            return np.array([])
+
+        return self.get_feature_matrix()
+
+    def get_feature_matrix(self, indicator_names: list[str] = None) -> np.ndarray:
+        """Get the feature matrix of the sounds.
+
+        Parameters
+        ----------
+        indicator_names : list[str], default: None
+            Names of the stored indicators to include, in the order of the columns of the matrix.
+            If ``None``, the indicators to compute are included, in the order in which they were
+            added.
+
+        Returns
+        -------
+        numpy.ndarray
+            Indicator values, with shape (sounds, indicators). The rows are in the order of the
+            sound paths, as of the last call to :meth:`process`.
+        """
+        if self._output is None:
+            raise PyAnsysSoundException(
+                f"Output is not processed yet. Use the `{__class__.__name__}.process()` method."
+            )
+
+        columns = self.get_feature_columns(indicator_names)
+        rows = self.__get_stored_rows()
+        row_indexes = np.array([rows[sound_hash] for sound_hash in self.__sound_hashes], dtype=int)
+        if len(columns) == 0:
+            return np.zeros((len(row_indexes), 0))
+        return np.column_stack([values[row_indexes] for values in columns.values()])
+
+    def get_feature_columns(self, indicator_names: list[str] = None) -> dict[str, np.ndarray]:
+        """Get the values of all the stored sounds, per indicator.
+
+        The columns of the store are returned without copy, when they have no missing value.
+
+        Parameters
+        ----------
+        indicator_names : list[str], default: None
+            Names of the stored indicators to include. If ``None``, the indicators to compute are
+            included, in the order in which they were added.
+
+        Returns
+        -------
+        dict[str, numpy.ndarray]
+            Values of each indicator, in the order of the rows of the stored table. Missing
+            values are NaN.
+        """
+        if self._output is None:
+            raise PyAnsysSoundException(
+                f"Output is not processed yet. Use the `{__class__.__name__}.process()` method."
+            )
+
+        if indicator_names is None:
+            indicator_names = self.get_indicator_names()
+
+        stored_definitions = self.__get_stored_definitions()
+        for name in indicator_names:
+            if name not in stored_definitions:
+                raise PyAnsysSoundException(f"No indicator named '{name}' in the store.")
+
+        return {
+            name: self.__table.column(name).to_numpy(zero_copy_only=False)
+            for name in indicator_names
+        }
+
+    def get_sound_hashes(self) -> list[str]:
+        """Get the hashes of the sounds.
+
+        Returns
+        -------
+        list[str]
+            SHA-256 hash of the content of each sound file, in the order of the sound paths, as of
+            the last call to :meth:`process`.
+        """
+        if self._output is None:
+            raise PyAnsysSoundException(
+                f"Output is not processed yet. Use the `{__class__.__name__}.process()` method."
+            )
+
+        return list(self.__sound_hashes)
+
+    def get_processing_errors(self) -> dict[str, Exception]:
+        """Get the errors of the sounds whose processing failed.
+
+        Returns
+        -------
+        dict[str, Exception]
+            Exception raised by the processing of each failed sound, by sound path, during the
+            last call to :meth:`process`. The values of these sounds are missing from the store.
+        """
+        return dict(self.__processing_errors)
+
+    @pandas_required
+    def get_data_frame(self):
+        """Get the stored table, as a pandas data frame.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Stored table, indexed by the hash of the sounds. Missing values are NaN.
+        """
+        if self._output is None:
+            raise PyAnsysSoundException(
+                f"Output is not processed yet. Use the `{__class__.__name__}.process()` method."
+            )
+
+        return self.__table.to_pandas().set_index(COLUMN_SOUND_HASH)
@@ -0,0 +1,279 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Chain PyAnsys Sound processing classes in a DPF workflow."""
+
+from time import perf_counter
+import warnings
+
+from ansys.dpf.core import Field, Workflow
+import numpy as np
+
+from .._operator_emulator import _EmulatedOperator
+from .._pyansys_sound import PyAnsysSound, PyAnsysSoundException, PyAnsysSoundWarning
+
+ID_EXTRACT_FIELD = "ExtractFromFC"
+
+
+class Pipeline(PyAnsysSound):
+    """Chain PyAnsys Sound processing classes in a DPF workflow.
+
+    This class chains processing stages, each stage being an instance of a PyAnsys Sound class,
+    in a DPF workflow. The output signal of each stage is connected to the signal input of the
+    next stage on the DPF server, so that intermediate signals are never retrieved on the client
+    side. Only the outputs of the last stage are retrieved.
+
+    The supported stages are instances of :class:`.LoadWav` (first stage only),
+    :class:`.Resample`, :class:`.Filter`, :class:`.ApplyGain`, :class:`.LevelOverTime` (last stage
+    only), and :class:`.LoudnessISO532_1_TimeVarying` (last stage only). Each stage is configured
+    through its own attributes, except for its input signal, which is set by the pipeline.
+
+    Examples
+    --------
+    Load a WAV file, resample it, apply a gain, and compute its time-varying loudness.
+
+    >>> from ansys.sound.core.pipeline import Pipeline
+    >>> from ansys.sound.core.psychoacoustics import LoudnessISO532_1_TimeVarying
+    >>> from ansys.sound.core.signal_utilities import ApplyGain, LoadWav, Resample
+    >>> pipeline = Pipeline(
+    ...     stages=[
+    ...         LoadWav(path_to_wav="path/to/file.wav"),
+    ...         Resample(new_sampling_frequency=48000.0),
+    ...         ApplyGain(gain=6.0),
+    ...         LoudnessISO532_1_TimeVarying(),
+    ...     ]
+    ... )
+    >>> pipeline.process()
+    >>> loudness = pipeline.stages[-1].get_loudness_sone_vs_time()
+    >>> stage_timings = pipeline.get_stage_timings()
+    """
+
+    def __init__(
+        self, stages: list[PyAnsysSound] = None, signal: Field = None, channel_index: int = 0
+    ):
+        """Class instantiation takes the following parameters.
+
+        Parameters
+        ----------
+        stages : list[PyAnsysSound], default: None
+            Processing stages, in the order in which they are applied.
+        signal : Field, default: None
+            Input signal of the first stage, as a DPF field. Unused if the first stage is an
+            instance of :class:`.LoadWav`.
+        channel_index : int, default: 0
+            Index of the channel to process, if the first stage is an instance of
+            :class:`.LoadWav`.
+        """
+        super().__init__()
+        self.stages = stages if stages is not None else []
+        self.signal = signal
+        self.channel_index = channel_index
+        self.__operator_extract = self._get_pooled_operator(ID_EXTRACT_FIELD)
+        self.__workflow = None
+        self.__stage_timings = []
+
+    def __str__(self) -> str:
+        """Return the string representation of the object."""
+        stages = " -> ".join(stage.__class__.__name__ for stage in self.stages)
+        return f"{self.__class__.__name__} object.\nStages: {stages if stages else 'Not set'}"
+
+    @property
+    def stages(self) -> list[PyAnsysSound]:
+        """Processing stages, in the order in which they are applied."""
+        return self.__stages
+
+    @stages.setter
+    def stages(self, stages: list[PyAnsysSound]):
+        """Set the processing stages."""
+        if not (
+            isinstance(stages, (list, tuple))
+            and all(isinstance(stage, PyAnsysSound) for stage in stages)
+        ):
+            raise PyAnsysSoundException(
+                "Stages must be specified as a list of PyAnsys Sound class instances."
+            )
+        self.__stages = list(stages)
+
+    @property
+    def signal(self) -> Field:
+        """Input signal of the first stage, as a DPF field."""
+        return self.__signal
+
+    @signal.setter
+    def signal(self, signal: Field):
+        """Set the input signal."""
+        if not (signal is None or isinstance(signal, Field)):
+            raise PyAnsysSoundException("Signal must be specified as a DPF field.")
+        self.__signal = signal
+
+    @property
+    def channel_index(self) -> int:
+        """Index of the channel to process, if the first stage loads a WAV file."""
+        return self.__channel_index
+
+    @channel_index.setter
+    def channel_index(self, channel_index: int):
+        """Set the channel index."""
+        if channel_index < 0:
+            raise PyAnsysSoundException("Channel index must be positive or zero.")
+        self.__channel_index = int(channel_index)
+
+    def process(self):
+        """Build the DPF workflow chaining the stages, and run it.
+
+        The stage operators are run one after the other, on the DPF server, to measure the
+        duration of each stage. Only the outputs of the last stage are then retrieved, and can be
+        obtained with :meth:`get_output` or with the methods of the last stage.
+        """
+        if len(self.stages) == 0:
+            raise PyAnsysSoundException(
+                f"No stage is defined. Use `{self.__class__.__name__}.stages`."
+            )
+
+        self._output = None
+        self.__stage_timings = []
+
+        # Get the operators of the stages, with their parameters connected.
+        pipeline_stages = [stage._get_pipeline_stage() for stage in self.stages]
+        for stage, pipeline_stage in zip(self.stages, pipeline_stages):
+            if isinstance(pipeline_stage.operator, _EmulatedOperator):
+                raise PyAnsysSoundException(
+                    f"Stage {stage.__class__.__name__} uses an emulated operator, which cannot be "
+                    "used in a DPF workflow. Instantiate the stages outside of the "
+                    "`OperatorEmulator` block."
+                )
+
+        first_stage = pipeline_stages[0]
+        if first_stage.input_pin is None:
+            # The first stage loads the signal: extract the processed channel on the server.
+            self.__operator_extract.connect(0, first_stage.operator, first_stage.output_pin)
+            self.__operator_extract.connect(1, [self.channel_index])
+            first_stage_output = (self.__operator_extract, 0)
+        else:
+            if self.signal is None:
+                raise PyAnsysSoundException(
+                    f"No input signal is set. Use `{self.__class__.__name__}.signal`, or use a "
+                    "`LoadWav` instance as first stage."
+                )
+            first_stage_output = (first_stage.operator, first_stage.output_pin)
+
+        # Chain the stages: connect each stage's output signal to the next stage's input signal.
+        previous_output = first_stage_output
+        for index, pipeline_stage in enumerate(pipeline_stages[1:], start=1):
+            if not pipeline_stages[index - 1].outputs_signal:
+                raise PyAnsysSoundException(
+                    f"Stage {index - 1} ({self.stages[index - 1].__class__.__name__}) has no "
+                    "output signal, and can only be the last stage."
+                )
+            if pipeline_stage.input_pin is None:
+                raise PyAnsysSoundException(
+                    f"Stage {index} ({self.stages[index].__class__.__name__}) has no input "
+                    "signal, and can only be the first stage."
+                )
+            pipeline_stage.operator.connect(pipeline_stage.input_pin, *previous_output)
+            previous_output = (pipeline_stage.operator, pipeline_stage.output_pin)
+
+        workflow = Workflow(server=self._server)
+        workflow.add_operators([stage.operator for stage in pipeline_stages])
+        if first_stage.input_pin is None:
+            workflow.add_operator(self.__operator_extract)
+        else:
+            workflow.set_input_name("signal", first_stage.operator, first_stage.input_pin)
+            workflow.connect("signal", self.signal)
+        workflow.set_output_name("output", *previous_output)
+        self.__workflow = workflow
+
+        # Run the stages one after the other. Each operator uses the outputs of the previous one,
+        # which are already computed on the server.
+        for index, (stage, pipeline_stage) in enumerate(zip(self.stages, pipeline_stages)):
+            start_time = perf_counter()
+            pipeline_stage.operator.run()
+            if index == 0 and first_stage.input_pin is None:
+                self.__operator_extract.run()
+            if index == len(self.stages) - 1:
+                # Only the last stage's outputs are retrieved on the client side.
+                pipeline_stage.store_output()
+            self.__stage_timings.append((stage.__class__.__name__, perf_counter() - start_time))
+
+        self._output = self.stages[-1].get_output()
+
+    def get_output(self):
+        """Get the outputs of the last stage.
+
+        Returns
+        -------
+        Any
+            Outputs of the last stage, as returned by its ``get_output()`` method.
+        """
+        if self._output is None:
+            warnings.warn(
+                PyAnsysSoundWarning(
+                    f"Output is not processed yet. Use the `{self.__class__.__name__}.process()` "
+                    "method."
+                )
+            )
+
+        return self._output
+
+    def get_output_as_nparray(self):
+        """Get the outputs of the last stage as NumPy arrays.
+
+        Returns
+        -------
+        Any
+            Outputs of the last stage, as returned by its ``get_output_as_nparray()`` method.
+        """
+        if self.get_output() is None:
+            return np.array([])
+
+        return self.stages[-1].get_output_as_nparray()
+
+    def get_workflow(self) -> Workflow:
+        """Get the DPF workflow built during the last processing.
+
+        Returns
+        -------
+        Workflow
+            DPF workflow chaining the stage operators, with the input signal named ``"signal"``
+            (unless the first stage loads a WAV file) and the output signal of the last stage named
+            ``"output"``.
+        """
+        return self.__workflow
+
+    def get_stage_timings(self) -> list[tuple[str, float]]:
+        """Get the stages that ran during the last processing, and their durations.
+
+        Returns
+        -------
+        list[tuple[str, float]]
+            Class name and duration in s of each stage that ran, in order. If processing failed,
+            the stages after the failing one are not listed. The duration of the last stage
+            includes the retrieval of its outputs.
+        """
+        return list(self.__stage_timings)
+
+    def plot(self):
+        """Plot the outputs of the last stage, using its ``plot()`` method."""
+        if self.get_output() is None:
+            return None
+
+        return self.stages[-1].plot()
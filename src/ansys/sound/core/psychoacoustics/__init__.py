@@ -27,12 +27,17 @@ Helper functions related to the computation of psychoacoustics indicators.
 
 from ._psychoacoustics_parent import FIELD_DIFFUSE, FIELD_FREE, PsychoacousticsParent
 from .fluctuation_strength import FluctuationStrength
+from .indicator_bundle import IndicatorBundle
+from .indicator_over_time import IndicatorOverTime
 from .loudness_ansi_s3_4 import LoudnessANSI_S3_4
 from .loudness_iso_532_1_stationary import LoudnessISO532_1_Stationary
+from .loudness_iso_532_1_streaming import LoudnessISO532_1_Streaming
 from .loudness_iso_532_1_time_varying import LoudnessISO532_1_TimeVarying
 from .loudness_iso_532_2 import LoudnessISO532_2
+from .loudness_iso_532_2_batch import LoudnessISO532_2_Batch
 from .prominence_ratio import ProminenceRatio
 from .prominence_ratio_for_orders_over_time import ProminenceRatioForOrdersOverTime
+from .prominence_ratio_over_time import ProminenceRatioOverTime
 from .roughness import Roughness
 from .roughness_ecma_418_2 import RoughnessECMA418_2
 from .sharpness import Sharpness
@@ -40,14 +45,17 @@ from .sharpness_din_45692 import SharpnessDIN45692
 from .sharpness_din_45692_over_time import SharpnessDIN45692OverTime
 from .sharpness_over_time import SharpnessOverTime
 from .spectral_centroid import SpectralCentroid
+from .spectral_descriptors_over_time import SpectralDescriptorsOverTime
 from .tonality_aures import TonalityAures
 from .tonality_din_45681 import TonalityDIN45681
 from .tonality_ecma_418_2 import TonalityECMA418_2
 from .tonality_iso_1996_2 import TonalityISO1996_2
 from .tonality_iso_1996_2_over_time import TonalityISO1996_2_OverTime
 from .tonality_iso_ts_20065 import TonalityISOTS20065
+from .tonality_roughness_ecma_418_2 import TonalityRoughnessECMA418_2
 from .tone_to_noise_ratio import ToneToNoiseRatio
 from .tone_to_noise_ratio_for_orders_over_time import ToneToNoiseRatioForOrdersOverTime
+from .tone_to_noise_ratio_over_time import ToneToNoiseRatioOverTime
 
 __all__ = (
     "PsychoacousticsParent",
@@ -73,6 +81,14 @@ __all__ = (
     "ToneToNoiseRatioForOrdersOverTime",
     "TonalityISO1996_2",
     "ProminenceRatioForOrdersOverTime",
+    "IndicatorBundle",
+    "TonalityRoughnessECMA418_2",
+    "LoudnessISO532_1_Streaming",
+    "ProminenceRatioOverTime",
+    "ToneToNoiseRatioOverTime",
+    "SpectralDescriptorsOverTime",
+    "LoudnessISO532_2_Batch",
+    "IndicatorOverTime",
     "FIELD_FREE",
     "FIELD_DIFFUSE",
 )
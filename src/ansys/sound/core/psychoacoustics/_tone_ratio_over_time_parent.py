@@ -0,0 +1,470 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Computes tone-to-noise or prominence ratios over time, frame by frame."""
+
+from concurrent.futures import ThreadPoolExecutor
+import warnings
+
+from ansys.dpf.core import Field
+import numpy as np
+
+from . import PsychoacousticsParent
+from .._pyansys_sound import PyAnsysSoundException, PyAnsysSoundWarning
+from ..signal_utilities import CropSignal
+from ..spectral_processing import PowerSpectralDensity
+
+# Window types supported for the computation of the power spectral densities.
+WINDOW_TYPES = ("TRIANGULAR", "BLACKMAN", "HAMMING", "HANN", "GAUSS", "FLATTOP", "RECTANGULAR")
+
+
+class ToneRatioOverTimeParent(PsychoacousticsParent):
+    """Abstract base class for the tone-to-noise and prominence ratios over time.
+
+    This is the base class of :class:`ToneToNoiseRatioOverTime` and
+    :class:`ProminenceRatioOverTime`, and should not be used as is.
+
+    The signal is split into frames, which are cropped from the signal on the DPF server, so that
+    the signal is uploaded to the server only once. The power spectral density (PSD) of each frame
+    is computed separately with :class:`.PowerSpectralDensity` (Welch's method, with windows of
+    ``fft_size`` points and 50 % overlap), and the ratio is computed on this PSD with one operator
+    call per frame. The frames are processed concurrently.
+    """
+
+    # Class attributes (strings) with the name of the DPF Sound operator computing the ratio from a
+    # PSD, and the name of the ratio, as used in the operator output.
+    _operator_id = ""
+    _ratio_name = ""
+
+    def __init__(
+        self,
+        signal: Field = None,
+        window_length: float = 1.0,
+        overlap: float = 50.0,
+        fft_size: int = 8192,
+        window_type: str = "HANN",
+        frequency_list: list = None,
+        max_workers: int = None,
+    ):
+        """Class instantiation takes the following parameters.
+
+        Parameters
+        ----------
+        signal : Field, default: None
+            Signal in Pa on which to compute the ratio over time.
+        window_length : float, default: 1.0
+            Length, in s, of each frame of the signal on which a PSD is computed.
+        overlap : float, default: 50.0
+            Overlap, in %, between two successive frames.
+        fft_size : int, default: 8192
+            Number of FFT points of the PSDs. Must be a power of 2, and must not exceed the number
+            of samples in a frame.
+        window_type : str, default: "HANN"
+            Window type used for the PSD computation. Options are ``'TRIANGULAR'``,
+            ``'BLACKMAN'``, ``'HAMMING'``, ``'HANN'``, ``'GAUSS'``, ``'FLATTOP'``, and
+            ``'RECTANGULAR'``.
+        frequency_list : list, default: None
+            List of the frequencies in Hz of the tones on which to compute the ratio in each
+            frame. If unspecified, a peak detection method is applied to each frame's PSD, and the
+            ratio is computed for each detected tone.
+        max_workers : int, default: None
+            Maximum number of frames processed concurrently. If unspecified, the default number of
+            workers of :class:`concurrent.futures.ThreadPoolExecutor` is used.
+        """
+        super().__init__()
+        self.signal = signal
+        self.window_length = window_length
+        self.overlap = overlap
+        self.fft_size = fft_size
+        self.window_type = window_type
+        self.frequency_list = frequency_list
+        self.max_workers = max_workers
+
+    def __str__(self):
+        """Return the string representation of the object."""
+        str_name = f'"{self.signal.name}"' if self.signal is not None else "Not set"
+        str_frames = self.get_frame_count() if self._output is not None else "Not processed"
+
+        return (
+            f"{self.__class__.__name__} object\n"
+            "Data:\n"
+            f"\tSignal name: {str_name}\n"
+            f"\tWindow length: {self.window_length} s\n"
+            f"\tOverlap: {self.overlap} %\n"
+            f"\tFFT size: {self.fft_size}\n"
+            f"\tWindow type: {self.window_type}\n"
+            f"\tFrequency list: {self.frequency_list}\n"
+            f"Number of frames: {str_frames}"
+        )
+
+    @property
+    def signal(self) -> Field:
+        """Input signal in Pa."""
+        return self.__signal
+
+    @signal.setter
+    def signal(self, signal: Field):
+        """Set the signal."""
+        if not (isinstance(signal, Field) or signal is None):
+            raise PyAnsysSoundException("Signal must be specified as a DPF field.")
+        self.__signal = signal
+
+    @property
+    def window_length(self) -> float:
+        """Length, in s, of each frame of the signal on which a PSD is computed."""
+        return self.__window_length
+
+    @window_length.setter
+    def window_length(self, window_length: float):
+        """Set the window length, in s."""
+        if window_length <= 0.0:
+            raise PyAnsysSoundException("Window length must be strictly positive.")
+        self.__window_length = window_length
+
+    @property
+    def overlap(self) -> float:
+        """Overlap, in %, between two successive frames."""
+        return self.__overlap
+
+    @overlap.setter
+    def overlap(self, overlap: float):
+        """Set the overlap, in %."""
+        if not (0.0 <= overlap < 100.0):
+            raise PyAnsysSoundException(
+                "Overlap must be positive and strictly smaller than 100.0 %."
+            )
+        self.__overlap = overlap
+
+    @property
+    def fft_size(self) -> int:
+        """Number of FFT points of the PSDs.
+
+        Must be a power of 2.
+        """
+        return self.__fft_size
+
+    @fft_size.setter
+    def fft_size(self, fft_size: int):
+        """Set the FFT size."""
+        if fft_size < 2 or bin(fft_size).count("1") != 1:
+            raise PyAnsysSoundException("FFT size must be a power of 2, greater than 1.")
+        self.__fft_size = fft_size
+
+    @property
+    def window_type(self) -> str:
+        """Window type used for the PSD computation.
+
+        Options are ``'TRIANGULAR'``, ``'BLACKMAN'``, ``'HAMMING'``, ``'HANN'``, ``'GAUSS'``,
+        ``'FLATTOP'``, and ``'RECTANGULAR'``.
+        """
+        return self.__window_type
+
+    @window_type.setter
+    def window_type(self, window_type: str):
+        """Set the window type."""
+        if window_type not in WINDOW_TYPES:
+            raise PyAnsysSoundException(
+                "Window type is invalid. Options are 'TRIANGULAR', 'BLACKMAN', "
+                "'HAMMING', 'HANN', 'GAUSS', 'FLATTOP' and 'RECTANGULAR'."
+            )
+        self.__window_type = window_type
+
+    @property
+    def frequency_list(self) -> list[float]:
+        """Tone frequency list in Hz.
+
+        List of the frequencies in Hz of the tones on which to compute the ratio in each frame.
+        If ``None``, a peak detection method is applied to each frame's PSD, and the ratio is
+        computed for each detected tone.
+        """
+        return self.__frequency_list
+
+    @frequency_list.setter
+    def frequency_list(self, frequency_list: list[float]):
+        """Set the list of tone frequencies."""
+        if frequency_list is not None and len(frequency_list) == 0:
+            raise PyAnsysSoundException("Frequency list must contain at least one frequency.")
+        self.__frequency_list = frequency_list
+
+    @property
+    def max_workers(self) -> int:
+        """Maximum number of frames processed concurrently.
+
+        If ``None``, the default number of workers of
+        :class:`concurrent.futures.ThreadPoolExecutor` is used.
+        """
+        return self.__max_workers
+
+    @max_workers.setter
+    def max_workers(self, max_workers: int):
+        """Set the maximum number of workers."""
+        if max_workers is not None and max_workers < 1:
+            raise PyAnsysSoundException("Maximum number of workers must be greater than 0.")
+        self.__max_workers = max_workers
+
+    def process(self):
+        """Compute the ratio over time.
+
+        This method crops each frame of the signal on the DPF server, computes the frame's PSD, and
+        calls the appropriate DPF Sound operator to compute the ratio on this PSD, concurrently.
+        """
+        if self.signal == None:
+            raise PyAnsysSoundException(
+                f"No input signal defined. Use `{self.__class__.__name__}.signal`."
+            )
+
+        time_data = self.signal.time_freq_support.time_frequencies.data
+        if len(time_data) < 2:
+            raise PyAnsysSoundException("Specified signal must have at least two samples.")
+        sampling_frequency = 1 / (time_data[1] - time_data[0])
+
+        frame_length = int(round(self.window_length * sampling_frequency))
+        if frame_length < self.fft_size:
+            raise PyAnsysSoundException(
+                f"Window length ({self.window_length} s, that is, {frame_length} samples) must be "
+                f"greater than or equal to the FFT size ({self.fft_size} points)."
+            )
+        if len(time_data) < frame_length:
+            raise PyAnsysSoundException(
+                f"Signal duration must be greater than or equal to the window length "
+                f"({self.window_length} s)."
+            )
+        hop_size = max(1, int(round(frame_length * (1.0 - self.overlap / 100.0))))
+        frame_starts = np.arange(1 + (len(time_data) - frame_length) // hop_size) * hop_size
+
+        def compute_frame_ratios(frame_start: int) -> tuple:
+            return self.__compute_frame_ratios(
+                frame_start / sampling_frequency, (frame_start + frame_length) / sampling_frequency
+            )
+
+        if len(frame_starts) == 1:
+            frame_ratios = [compute_frame_ratios(frame_starts[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                frame_ratios = list(executor.map(compute_frame_ratios, frame_starts))
+
+        # Assemble (frames, tones) arrays, padded with NaN when the number of detected tones
+        # varies from one frame to another.
+        tone_count = max(len(ratios[0]) for ratios in frame_ratios)
+        tone_data = np.full((5, len(frame_ratios), tone_count), np.nan)
+        for frame_index, ratios in enumerate(frame_ratios):
+            for data_index in range(5):
+                tone_data[data_index, frame_index, : len(ratios[data_index])] = ratios[data_index]
+
+        self._output = (
+            tone_data[0],
+            tone_data[1],
+            tone_data[2],
+            tone_data[3],
+            tone_data[4],
+            np.array([ratios[5] for ratios in frame_ratios], dtype=float),
+            (frame_starts + frame_length / 2) / sampling_frequency,
+        )
+
+    def __compute_frame_ratios(self, start_time: float, end_time: float) -> tuple:
+        """Crop a frame of the signal, and compute its PSD and the ratio on this PSD.
+
+        Parameters
+        ----------
+        start_time : float
+            Start time of the frame, in s.
+        end_time : float
+            End time of the frame, in s.
+
+        Returns
+        -------
+        tuple
+            Frequencies, ratios, levels, lower and higher bandwidth limits of the tones, as NumPy
+            arrays, and maximum ratio, as a float.
+        """
+        with CropSignal(
+            signal=self.signal, start_time=start_time, end_time=end_time, server=self._server
+        ) as crop_signal:
+            crop_signal.process()
+            with PowerSpectralDensity(
+                crop_signal.get_output(),
+                fft_size=self.fft_size,
+                window_type=self.window_type,
+                window_length=self.fft_size,
+                overlap=0.5,
+                server=self._server,
+            ) as psd:
+                psd.process()
+                psd_field = psd.get_output()
+
+        # The frequency list is an optional input: with automatic peak detection, a pooled
+        # operator would keep the frequency list of its previous user.
+        operator = self._get_pooled_operator(self._operator_id, has_optional_inputs=True)
+        operator.connect(0, psd_field)
+        if self.frequency_list is not None:
+            operator.connect(1, list(np.float64(self.frequency_list)))
+        operator.run()
+        container = operator.get_output(0, "generic_data_container")
+
+        return (
+            np.array(container.get_property("frequency_Hz").data),
+            np.array(container.get_property(f"{self._ratio_name}_dB").data),
+            np.array(container.get_property("level_dB").data),
+            np.array(container.get_property("bandwidth_lower_Hz").data),
+            np.array(container.get_property("bandwidth_higher_Hz").data),
+            float(container.get_property(f"{self._ratio_name}_max")),
+        )
+
+    def get_output(self) -> tuple[np.ndarray]:
+        """Get the ratio data over time, as NumPy arrays.
+
+        Returns
+        -------
+        tuple[numpy.ndarray]
+            -   First element: tone frequencies in Hz, with shape (frames, tones).
+
+            -   Second element: tone ratios in dB, with shape (frames, tones).
+
+            -   Third element: tone levels in dB SPL, with shape (frames, tones).
+
+            -   Fourth element: lower-frequency limits, in Hz, of the critical bands centered on
+                the tones, with shape (frames, tones).
+
+            -   Fifth element: higher-frequency limits, in Hz, of the critical bands centered on
+                the tones, with shape (frames, tones).
+
+            -   Sixth element: maximum ratio in dB over time, with shape (frames,).
+
+            -   Seventh element: time at the center of each frame, in s.
+
+            .. note::
+                If :attr:`frequency_list` is specified, the tones are those of the list, in the
+                same order. Otherwise, the tones are those detected in each frame, and the arrays
+                are padded with NaN in the frames where fewer tones are detected.
+        """
+        if self._output == None:
+            warnings.warn(
+                PyAnsysSoundWarning(
+                    f"Output is not processed yet. "
+                    f"Use the `{self.__class__.__name__}.process()` method."
+                )
+            )
+
+        return self._output
+
+    def get_output_as_nparray(self) -> tuple[np.ndarray]:
+        """Get the ratio data over time, as NumPy arrays.
+
+        Returns
+        -------
+        tuple[numpy.ndarray]
+            Same as :meth:`get_output`. If the output is not processed yet, the arrays are empty.
+        """
+        output = self.get_output()
+
+        if output == None:
+            return tuple(np.array([]) for _ in range(7))
+
+        return output
+
+    def get_frame_count(self) -> int:
+        """Get the number of frames.
+
+        Returns
+        -------
+        int
+            Number of frames on which the ratio was computed.
+        """
+        return len(self.get_output_as_nparray()[6])
+
+    def get_peaks_frequencies_over_time(self) -> np.ndarray:
+        """Get the tones' frequencies over time.
+
+        Returns
+        -------
+        numpy.ndarray
+            Tones' frequencies in Hz, with shape (frames, tones).
+        """
+        return self.get_output_as_nparray()[0]
+
+    def get_peaks_levels_over_time(self) -> np.ndarray:
+        """Get the tones' levels over time.
+
+        Returns
+        -------
+        numpy.ndarray
+            Tones' levels in dB SPL, with shape (frames, tones).
+        """
+        return self.get_output_as_nparray()[2]
+
+    def get_peaks_low_frequencies_over_time(self) -> np.ndarray:
+        """Get the tones' lower-frequency limits over time.
+
+        Returns
+        -------
+        numpy.ndarray
+            Lower-frequency limits, in Hz, of the critical bands centered on the tones, with shape
+            (frames, tones).
+        """
+        return self.get_output_as_nparray()[3]
+
+    def get_peaks_high_frequencies_over_time(self) -> np.ndarray:
+        """Get the tones' higher-frequency limits over time.
+
+        Returns
+        -------
+        numpy.ndarray
+            Higher-frequency limits, in Hz, of the critical bands centered on the tones, with
+            shape (frames, tones).
+        """
+        return self.get_output_as_nparray()[4]
+
+    def get_time_scale(self) -> np.ndarray:
+        """Get the time scale.
+
+        Returns
+        -------
+        numpy.ndarray
+            Time at the center of each frame, in s.
+        """
+        return self.get_output_as_nparray()[6]
+
+    def plot(self):
+        """Plot the maximum ratio over time and, if specified, the ratio of each listed tone."""
+        import matplotlib.pyplot as plt
+
+        if self._output == None:
+            raise PyAnsysSoundException(
+                f"Output is not processed yet. Use the `{self.__class__.__name__}.process()` "
+                "method."
+            )
+
+        time = self.get_time_scale()
+
+        _, ax = plt.subplots()
+        ax.plot(time, self.get_output_as_nparray()[5], label=f"Maximum {self._ratio_name}")
+        if self.frequency_list is not None:
+            ratios = self.get_output_as_nparray()[1]
+            for tone_index, frequency in enumerate(self.frequency_list):
+                ax.plot(time, ratios[:, tone_index], label=f"{frequency} Hz")
+        ax.set_title(f"{self._ratio_name} over time")
+        ax.set_xlabel("Time (s)")
+        ax.set_ylabel(f"{self._ratio_name} (dB)")
+        ax.grid(True)
+        ax.legend()
+
+        plt.show()
@@ -24,8 +24,7 @@
 
 import warnings
 
-from ansys.dpf.core import Field, Operator, types
-import matplotlib.pyplot as plt
+from ansys.dpf.core import Field, types
 import numpy as np
 
 from . import PsychoacousticsParent
@@ -45,7 +44,7 @@ class FluctuationStrength(PsychoacousticsParent):
     MATLAB". Master thesis, Technischen Universitat Graz, pp. 1-112 (1998).
 
     .. seealso::
-        :class:`Roughness`
+        :class:`Roughness`, :class:`IndicatorOverTime`
 
     Examples
     --------
@@ -75,7 +74,7 @@ class FluctuationStrength(PsychoacousticsParent):
         """
         super().__init__()
         self.signal = signal
-        self.__operator = Operator(ID_COMPUTE_FLUCTUATION_STRENGTH)
+        self.__operator = self._get_pooled_operator(ID_COMPUTE_FLUCTUATION_STRENGTH)
 
     @property
     def signal(self) -> Field:
@@ -212,6 +211,8 @@ class FluctuationStrength(PsychoacousticsParent):
         This method displays the specific fluctuation strength, in vacil, as a function of the Bark
         band index.
         """
+        import matplotlib.pyplot as plt
+
         if self._output == None:
             raise PyAnsysSoundException(
                 "Output is not processed yet. Use the `FluctuationStrength.process()` method."
@@ -0,0 +1,545 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Computes ISO 532-1 loudness once, and derives sharpness and other indicators from it."""
+
+import warnings
+
+from ansys.dpf.core import Field
+import numpy as np
+
+from . import FIELD_DIFFUSE, FIELD_FREE, PsychoacousticsParent
+from .._pyansys_sound import PyAnsysSoundException, PyAnsysSoundWarning
+from .loudness_iso_532_1_stationary import LoudnessISO532_1_Stationary
+from .loudness_iso_532_1_time_varying import LoudnessISO532_1_TimeVarying
+
+# Sharpness weighting functions.
+SHARPNESS_ZWICKER = "Zwicker"
+SHARPNESS_AURES = "Aures"
+SHARPNESS_DIN_45692 = "DIN45692"
+
+# Sharpness calibration factor in acum, such that a narrow-band noise centered on 1 kHz, with a
+# bandwidth of 1 critical band and a level of 60 dB, has a sharpness of 1 acum.
+SHARPNESS_CALIBRATION_FACTOR = 0.11
+
+
+def _get_sharpness_weighting(bark_band_indexes: np.ndarray, weighting: str) -> np.ndarray:
+    """Get the weighting function g(z) of the sharpness, as a function of the Bark band index.
+
+    The Aures weighting also depends on the loudness, which is accounted for in
+    :func:`_compute_sharpness`.
+
+    Parameters
+    ----------
+    bark_band_indexes : numpy.ndarray
+        Bark band indexes z, in Bark.
+    weighting : str
+        Weighting function: ``"Zwicker"`` (Zwicker & Fastl), ``"Aures"``, or ``"DIN45692"``.
+
+    Returns
+    -------
+    numpy.ndarray
+        Weighting function values.
+    """
+    z = np.asarray(bark_band_indexes, dtype=float)
+    match weighting:
+        case "Zwicker":
+            return np.where(z <= 16.0, 1.0, 0.066 * np.exp(0.171 * z))
+        case "DIN45692":
+            return np.where(z <= 15.8, 1.0, 0.15 * np.exp(0.42 * (z - 15.8)) + 0.85)
+        case "Aures":
+            return 0.078 * np.exp(0.171 * z) / z
+        case _:
+            raise PyAnsysSoundException(
+                f'Invalid sharpness weighting "{weighting}". Available options are '
+                f'"{SHARPNESS_ZWICKER}", "{SHARPNESS_AURES}", and "{SHARPNESS_DIN_45692}".'
+            )
+
+
+def _compute_sharpness(
+    specific_loudness: np.ndarray,
+    bark_band_indexes: np.ndarray,
+    loudness: float | np.ndarray,
+    weighting: str = SHARPNESS_ZWICKER,
+) -> float | np.ndarray:
+    """Compute the sharpness from the specific loudness.
+
+    The sharpness is S = k * sum(N'(z) g(z) z dz) / N, where k is the calibration factor, N'(z)
+    the specific loudness, g(z) the weighting function, and N the loudness. With the Aures
+    weighting, N is replaced with ln(0.05 N + 1).
+
+    Parameters
+    ----------
+    specific_loudness : numpy.ndarray
+        Specific loudness in sone/Bark, as a function of the Bark band index (last axis). Several
+        spectra (over time, for example) can be passed as a 2D array, one spectrum per row.
+    bark_band_indexes : numpy.ndarray
+        Bark band indexes in Bark, evenly spaced.
+    loudness : float | numpy.ndarray
+        Loudness in sone, one value per spectrum.
+    weighting : str, default: "Zwicker"
+        Weighting function: ``"Zwicker"`` (Zwicker & Fastl), ``"Aures"``, or ``"DIN45692"``.
+
+    Returns
+    -------
+    float | numpy.ndarray
+        Sharpness in acum, one value per spectrum. The sharpness of a silent spectrum is 0.
+    """
+    z = np.asarray(bark_band_indexes, dtype=float)
+    bark_step = z[1] - z[0]
+    weighted_sum = (
+        np.asarray(specific_loudness) @ (_get_sharpness_weighting(z, weighting) * z) * bark_step
+    )
+
+    loudness = np.asarray(loudness, dtype=float)
+    if weighting == SHARPNESS_AURES:
+        loudness = np.log(0.05 * loudness + 1.0)
+
+    sharpness = SHARPNESS_CALIBRATION_FACTOR * np.divide(
+        weighted_sum, loudness, out=np.zeros(np.shape(weighted_sum)), where=loudness > 0.0
+    )
+    return sharpness if np.ndim(sharpness) > 0 else float(sharpness)
+
+
+class IndicatorBundle(PsychoacousticsParent):
+    """Computes ISO 532-1 loudness once, and derives sharpness and other indicators from it.
+
+    The classes :class:`LoudnessISO532_1_Stationary`, :class:`Sharpness`, and
+    :class:`SharpnessDIN45692` each run the ISO 532-1 loudness model on the signal. This class runs
+    it once, and derives the sharpness (with Zwicker & Fastl, Aures, or DIN 45692 weighting) and
+    spectral summaries of the specific loudness locally. Optionally, it also computes the
+    time-varying loudness, and its percentiles.
+
+    .. note::
+        The sharpness is computed by this class with its own implementation of the weighting
+        functions (see :meth:`get_sharpness`). It is not checked against the classes
+        :class:`Sharpness` and :class:`SharpnessDIN45692`, whose values can differ, for
+        example in the calibration or in the integration over the Bark bands. Use these classes
+        when reference values are needed.
+
+    .. seealso::
+        :class:`LoudnessISO532_1_Stationary`, :class:`LoudnessISO532_1_TimeVarying`,
+        :class:`Sharpness`, :class:`SharpnessDIN45692`
+
+    Examples
+    --------
+    Compute the loudness, sharpness, and loudness percentiles of a signal.
+
+    >>> from ansys.sound.core.psychoacoustics import IndicatorBundle
+    >>> indicators = IndicatorBundle(signal=my_signal, compute_over_time=True)
+    >>> indicators.process()
+    >>> loudness_value = indicators.get_loudness_sone()
+    >>> sharpness_value = indicators.get_sharpness()
+    >>> sharpness_din_value = indicators.get_sharpness(weighting="DIN45692")
+    >>> N5, N10 = indicators.get_loudness_percentiles_sone([5, 10])
+
+    .. seealso::
+        :ref:`calculate_psychoacoustic_indicators`
+            Example demonstrating how to compute various psychoacoustic indicators.
+    """
+
+    def __init__(
+        self,
+        signal: Field = None,
+        field_type: str = FIELD_FREE,
+        compute_over_time: bool = False,
+    ):
+        """Class instantiation takes the following parameters.
+
+        Parameters
+        ----------
+        signal : Field, default: None
+            Signal in Pa on which to compute the indicators.
+        field_type : str, default: "Free"
+            Sound field type. Available options are `"Free"` and `"Diffuse"`.
+        compute_over_time : bool, default: False
+            Whether to also compute the ISO 532-1 loudness for time-varying sounds, from which the
+            loudness over time and its percentiles are derived.
+        """
+        super().__init__()
+        self.signal = signal
+        self.field_type = field_type
+        self.compute_over_time = compute_over_time
+
+    def __str__(self):
+        """Return the string representation of the object."""
+        if self._output is None:
+            str_indicators = "Not processed"
+        else:
+            str_indicators = (
+                f"\n\tLoudness: {self.get_loudness_sone():.2f} sones"
+                f"\n\tSharpness: {self.get_sharpness():.2f} acums"
+            )
+
+        str_name = f'"{self.signal.name}"' if self.signal is not None else "Not set"
+
+        return (
+            f"{__class__.__name__} object\n"
+            "Data:\n"
+            f"\tSignal name: {str_name}\n"
+            f"\tField type: {self.field_type}\n"
+            f"\tCompute over time: {self.compute_over_time}\n"
+            f"Indicators: {str_indicators}"
+        )
+
+    @property
+    def signal(self) -> Field:
+        """Input signal in Pa."""
+        return self.__signal
+
+    @signal.setter
+    def signal(self, signal: Field):
+        """Set the signal."""
+        if not (isinstance(signal, Field) or signal is None):
+            raise PyAnsysSoundException("Signal must be specified as a DPF field.")
+        self.__signal = signal
+
+    @property
+    def field_type(self) -> str:
+        """Sound field type.
+
+        Available options are `"Free"` and `"Diffuse"`.
+        """
+        return self.__field_type
+
+    @field_type.setter
+    def field_type(self, field_type: str):
+        """Set the sound field type."""
+        if field_type.lower() not in [FIELD_FREE.lower(), FIELD_DIFFUSE.lower()]:
+            raise PyAnsysSoundException(
+                f'Invalid field type "{field_type}". Available options are "{FIELD_FREE}" and '
+                f'"{FIELD_DIFFUSE}".'
+            )
+        self.__field_type = field_type
+
+    @property
+    def compute_over_time(self) -> bool:
+        """Whether to also compute the ISO 532-1 loudness for time-varying sounds."""
+        return self.__compute_over_time
+
+    @compute_over_time.setter
+    def compute_over_time(self, compute_over_time: bool):
+        """Set whether to compute the loudness over time."""
+        self.__compute_over_time = bool(compute_over_time)
+
+    def process(self):
+        """Compute the loudness, and derive the other indicators.
+
+        This method calls the appropriate DPF Sound operators to compute the loudness of the
+        signal. The other indicators are derived in the client when they are requested.
+        """
+        if self.signal == None:
+            raise PyAnsysSoundException(
+                f"No signal found for indicator computation. Use `{__class__.__name__}.signal`."
+            )
+
+        loudness = LoudnessISO532_1_Stationary(
+            signal=self.signal, field_type=self.field_type, server=self._server
+        )
+        loudness.process()
+
+        loudness_over_time = None
+        if self.compute_over_time:
+            loudness_over_time = LoudnessISO532_1_TimeVarying(
+                signal=self.signal, field_type=self.field_type, server=self._server
+            )
+            loudness_over_time.process()
+
+        self._output = (
+            loudness.get_output(),
+            loudness_over_time.get_output() if loudness_over_time is not None else None,
+        )
+
+    def get_output(self) -> tuple:
+        """Get the outputs of the loudness computations.
+
+        Returns
+        -------
+        tuple
+            -   First element (tuple): output of the ISO 532-1 loudness computation for
+                stationary sounds. See :meth:`LoudnessISO532_1_Stationary.get_output`.
+
+            -   Second element (tuple): output of the ISO 532-1 loudness computation for
+                time-varying sounds (see :meth:`LoudnessISO532_1_TimeVarying.get_output`), or
+                :obj:`None` if :attr:`compute_over_time` is :obj:`False`.
+        """
+        if self._output == None:
+            warnings.warn(
+                PyAnsysSoundWarning(
+                    f"Output is not processed yet. Use the `{__class__.__name__}.process()` method."
+                )
+            )
+
+        return self._output
+
+    def get_output_as_nparray(self) -> tuple[np.ndarray]:
+        """Get the loudness data in a tuple of NumPy arrays.
+
+        Returns
+        -------
+        tuple[numpy.ndarray]
+            -   First element: loudness in sone.
+
+            -   Second element: loudness level in phon.
+
+            -   Third element: specific loudness in sone/Bark, as a function of the Bark band index.
+
+            -   Fourth element: Bark band indexes, in Bark.
+
+            -   Fifth element: loudness over time in sone (empty if :attr:`compute_over_time` is
+                :obj:`False`).
+
+            -   Sixth element: time scale of the loudness over time, in s (empty if
+                :attr:`compute_over_time` is :obj:`False`).
+        """
+        output = self.get_output()
+
+        if output == None:
+            return np.nan, np.nan, np.array([]), np.array([]), np.array([]), np.array([])
+
+        loudness, loudness_over_time = output
+        if loudness_over_time is None:
+            loudness_vs_time = np.array([])
+            time_scale = np.array([])
+        else:
+            loudness_vs_time = np.array(loudness_over_time[0].data)
+            time_scale = np.array(loudness_over_time[0].time_freq_support.time_frequencies.data)
+
+        return (
+            np.array(loudness[0]),
+            np.array(loudness[1]),
+            np.array(loudness[2].data),
+            np.array(loudness[2].time_freq_support.time_frequencies.data),
+            loudness_vs_time,
+            time_scale,
+        )
+
+    def get_loudness_sone(self) -> float:
+        """Get the loudness in sone.
+
+        Returns
+        -------
+        float
+            Loudness in sone.
+        """
+        return self.get_output_as_nparray()[0]
+
+    def get_loudness_level_phon(self) -> float:
+        """Get the loudness level in phon.
+
+        Returns
+        -------
+        float
+            Loudness level in phon.
+        """
+        return self.get_output_as_nparray()[1]
+
+    def get_specific_loudness(self) -> np.ndarray:
+        """Get the specific loudness.
+
+        Returns
+        -------
+        numpy.ndarray
+            Specific loudness array in sone/Bark, as a function of the Bark band index.
+        """
+        return self.get_output_as_nparray()[2]
+
+    def get_bark_band_indexes(self) -> np.ndarray:
+        """Get Bark band indexes.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of Bark band indexes, in Bark.
+        """
+        return self.get_output_as_nparray()[3]
+
+    def get_bark_band_frequencies(self) -> np.ndarray:
+        """Get Bark band frequencies.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of Bark band frequencies in Hz.
+        """
+        return self._convert_bark_to_hertz(self.get_bark_band_indexes())
+
+    def get_sharpness(self, weighting: str = SHARPNESS_ZWICKER) -> float:
+        """Get the sharpness, derived from the specific loudness.
+
+        The sharpness is S = 0.11 * sum(N'(z) g(z) z dz) / N, in acum, where N'(z) is the specific
+        loudness, N the loudness, and g(z) the weighting function:
+
+        -   ``"Zwicker"`` (Zwicker & Fastl): g(z) = 1 up to 16 Bark, and 0.066 exp(0.171 z) above.
+        -   ``"DIN45692"``: g(z) = 1 up to 15.8 Bark, and 0.15 exp(0.42 (z - 15.8)) + 0.85 above.
+        -   ``"Aures"``: g(z) = 0.078 exp(0.171 z) / z, with N replaced with ln(0.05 N + 1).
+
+        Parameters
+        ----------
+        weighting : str, default: "Zwicker"
+            Weighting function of the specific loudness. Available options are `"Zwicker"`,
+            `"Aures"`, and `"DIN45692"`.
+
+        Returns
+        -------
+        float
+            Sharpness in acum.
+        """
+        loudness, _, specific_loudness, bark_band_indexes, _, _ = self.get_output_as_nparray()
+        if len(specific_loudness) == 0:
+            return np.nan
+
+        return _compute_sharpness(specific_loudness, bark_band_indexes, loudness, weighting)
+
+    def get_specific_loudness_centroid(self) -> float:
+        """Get the centroid of the specific loudness.
+
+        Returns
+        -------
+        float
+            Centroid of the specific loudness over the Bark band indexes, in Bark.
+        """
+        specific_loudness, bark_band_indexes = self.get_output_as_nparray()[2:4]
+        if np.sum(specific_loudness) <= 0.0:
+            return np.nan
+
+        return float(np.average(bark_band_indexes, weights=specific_loudness))
+
+    def get_specific_loudness_spread(self) -> float:
+        """Get the spread of the specific loudness around its centroid.
+
+        Returns
+        -------
+        float
+            Standard deviation of the Bark band indexes, weighted by the specific loudness, in
+            Bark.
+        """
+        specific_loudness, bark_band_indexes = self.get_output_as_nparray()[2:4]
+        if np.sum(specific_loudness) <= 0.0:
+            return np.nan
+
+        centroid = np.average(bark_band_indexes, weights=specific_loudness)
+        return float(
+            np.sqrt(np.average((bark_band_indexes - centroid) ** 2, weights=specific_loudness))
+        )
+
+    def get_peak_bark_band_index(self) -> float:
+        """Get the Bark band index where the specific loudness is maximum.
+
+        Returns
+        -------
+        float
+            Bark band index of the specific loudness maximum, in Bark.
+        """
+        specific_loudness, bark_band_indexes = self.get_output_as_nparray()[2:4]
+        if len(specific_loudness) == 0:
+            return np.nan
+
+        return float(bark_band_indexes[np.argmax(specific_loudness)])
+
+    def get_loudness_sone_vs_time(self) -> np.ndarray:
+        """Get the loudness over time.
+
+        Returns
+        -------
+        numpy.ndarray
+            Loudness in sone over time.
+        """
+        self.__check_over_time()
+        return self.get_output_as_nparray()[4]
+
+    def get_time_scale(self) -> np.ndarray:
+        """Get the time scale of the loudness over time.
+
+        Returns
+        -------
+        numpy.ndarray
+            Time array in s.
+        """
+        self.__check_over_time()
+        return self.get_output_as_nparray()[5]
+
+    def get_loudness_percentiles_sone(self, percentages: list[float]) -> np.ndarray:
+        """Get percentiles of the loudness over time.
+
+        The percentile Nx is the loudness exceeded during x% of the time. For example, N5 is the
+        loudness exceeded during 5% of the time.
+
+        Parameters
+        ----------
+        percentages : list[float]
+            Percentages of time x, between 0 and 100.
+
+        Returns
+        -------
+        numpy.ndarray
+            Loudness percentiles Nx in sone, one per percentage.
+        """
+        self.__check_over_time()
+        percentages = np.asarray(percentages, dtype=float)
+        if np.any((percentages < 0.0) | (percentages > 100.0)):
+            raise PyAnsysSoundException("Percentages must be between 0 and 100.")
+
+        loudness_vs_time = self.get_output_as_nparray()[4]
+        if len(loudness_vs_time) == 0:
+            return np.full(percentages.shape, np.nan)
+
+        return np.percentile(loudness_vs_time, 100.0 - percentages)
+
+    def __check_over_time(self):
+        """Check that the loudness over time is computed."""
+        if self._output is not None and self._output[1] is None:
+            raise PyAnsysSoundException(
+                "Loudness over time is not computed. Set "
+                f"`{__class__.__name__}.compute_over_time` to `True` and process again."
+            )
+
+    def plot(self):
+        """Plot the specific loudness, and the loudness over time if it is computed."""
+        import matplotlib.pyplot as plt
+
+        if self._output == None:
+            raise PyAnsysSoundException(
+                f"Output is not processed yet. Use the `{__class__.__name__}.process()` method."
+            )
+
+        if self.compute_over_time and self._output[1] is not None:
+            _, axes = plt.subplots(2, 1)
+        else:
+            _, axes = plt.subplots(1, 1)
+            axes = [axes]
+
+        axes[0].plot(self.get_bark_band_indexes(), self.get_specific_loudness())
+        axes[0].set_title("Specific loudness")
+        axes[0].set_xlabel("z (Bark)")
+        axes[0].set_ylabel("N' (sone/Bark)")
+        axes[0].grid(True)
+
+        if len(axes) > 1:
+            axes[1].plot(self.get_time_scale(), self.get_loudness_sone_vs_time())
+            axes[1].set_title("Loudness over time")
+            axes[1].set_xlabel("Time (s)")
+            axes[1].set_ylabel("N (sone)")
+            axes[1].grid(True)
+
+        plt.tight_layout()
+        plt.show()
@@ -0,0 +1,430 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Computes a stationary indicator over sliding windows of a signal."""
+
+from concurrent.futures import ThreadPoolExecutor
+import warnings
+
+from ansys.dpf.core import Field
+import numpy as np
+
+from . import PsychoacousticsParent
+from .._pyansys_sound import PyAnsysSound, PyAnsysSoundException, PyAnsysSoundWarning
+from ..signal_utilities import CropSignal
+from .fluctuation_strength import FluctuationStrength
+from .loudness_ansi_s3_4 import LoudnessANSI_S3_4
+from .roughness import Roughness
+from .spectral_centroid import SpectralCentroid
+from .tonality_aures import TonalityAures
+
+# Getter returning the single value of the stationary indicators that have no over-time output.
+DEFAULT_GETTERS = {
+    Roughness: "get_roughness",
+    FluctuationStrength: "get_fluctuation_strength",
+    TonalityAures: "get_tonality",
+    SpectralCentroid: "get_spectral_centroid",
+    LoudnessANSI_S3_4: "get_loudness_sone",
+}
+
+
+class IndicatorOverTime(PsychoacousticsParent):
+    """Computes a stationary indicator over sliding windows of a signal.
+
+    Some indicators, such as roughness, fluctuation strength, Aures tonality, spectral centroid, or
+    ANSI S3.4 loudness, are defined for stationary sounds, and yield a single value for the whole
+    signal. This class applies such an indicator to successive, possibly overlapping, windows of
+    a signal, to evaluate it over time, for example over the operating cycle of a machine.
+
+    Each window is cropped from the signal on the DPF server, so that the signal is uploaded to
+    the server only once, and the windows are processed concurrently. The value of the indicator
+    in each window is returned as a time series, with the time at the center of each window.
+
+    .. seealso::
+        :class:`Roughness`, :class:`FluctuationStrength`, :class:`TonalityAures`,
+        :class:`SpectralCentroid`, :class:`LoudnessANSI_S3_4`
+
+    Examples
+    --------
+    Compute the roughness of a signal over 2-s windows, with 50 % overlap, and display it.
+
+    >>> from ansys.sound.core.psychoacoustics import IndicatorOverTime, Roughness
+    >>> roughness = IndicatorOverTime(
+    ...     signal=my_signal, indicator_class=Roughness, window_length=2.0, overlap=50.0
+    ... )
+    >>> roughness.process()
+    >>> roughness_values = roughness.get_indicator_over_time()
+    >>> time_scale = roughness.get_time_scale()
+    >>> roughness.plot()
+
+    Compute the diffuse-field ANSI S3.4 loudness level over time.
+
+    >>> from ansys.sound.core.psychoacoustics import LoudnessANSI_S3_4
+    >>> loudness_level = IndicatorOverTime(
+    ...     signal=my_signal,
+    ...     indicator_class=LoudnessANSI_S3_4,
+    ...     getter="get_loudness_level_phon",
+    ...     parameters={"field_type": "Diffuse"},
+    ... )
+    >>> loudness_level.process()
+    """
+
+    def __init__(
+        self,
+        signal: Field = None,
+        indicator_class: type = None,
+        getter: str = None,
+        parameters: dict = None,
+        getter_parameters: dict = None,
+        window_length: float = 1.0,
+        overlap: float = 50.0,
+        max_workers: int = None,
+    ):
+        """Class instantiation takes the following parameters.
+
+        Parameters
+        ----------
+        signal : Field, default: None
+            Signal on which to compute the indicator over time.
+        indicator_class : type, default: None
+            PyAnsys Sound processing class computing the indicator, for example
+            :class:`Roughness`. It must take the signal as its ``signal`` parameter.
+        getter : str, default: None
+            Name of the method of the processing class that returns the value of the indicator,
+            as a single number. If ``None``, the default getter of the class is used, for the
+            classes that have one: :class:`Roughness`, :class:`FluctuationStrength`,
+            :class:`TonalityAures`, :class:`SpectralCentroid`, and :class:`LoudnessANSI_S3_4`.
+        parameters : dict, default: None
+            Parameters of the processing class other than the signal.
+        getter_parameters : dict, default: None
+            Parameters of the getter.
+        window_length : float, default: 1.0
+            Length, in s, of each window on which the indicator is computed.
+        overlap : float, default: 50.0
+            Overlap, in %, between two successive windows.
+        max_workers : int, default: None
+            Maximum number of windows processed concurrently. If ``None``, the default number of
+            workers of :class:`concurrent.futures.ThreadPoolExecutor` is used.
+        """
+        super().__init__()
+        self.signal = signal
+        self.indicator_class = indicator_class
+        self.getter = getter
+        self.parameters = parameters
+        self.getter_parameters = getter_parameters
+        self.window_length = window_length
+        self.overlap = overlap
+        self.max_workers = max_workers
+
+    def __str__(self):
+        """Return the string representation of the object."""
+        str_name = f'"{self.signal.name}"' if self.signal is not None else "Not set"
+        str_class = self.indicator_class.__name__ if self.indicator_class is not None else "Not set"
+        str_getter = (
+            self.getter
+            if self.getter is not None
+            else DEFAULT_GETTERS.get(self.indicator_class, "Not set")
+        )
+        str_windows = self.get_window_count() if self._output is not None else "Not processed"
+
+        return (
+            f"{__class__.__name__} object\n"
+            "Data:\n"
+            f"\tSignal name: {str_name}\n"
+            f"\tIndicator: {str_class}\n"
+            f"\tGetter: {str_getter}\n"
+            f"\tParameters: {self.parameters}\n"
+            f"\tWindow length: {self.window_length} s\n"
+            f"\tOverlap: {self.overlap} %\n"
+            f"Number of windows: {str_windows}"
+        )
+
+    @property
+    def signal(self) -> Field:
+        """Input signal."""
+        return self.__signal
+
+    @signal.setter
+    def signal(self, signal: Field):
+        """Set the signal."""
+        if not (isinstance(signal, Field) or signal is None):
+            raise PyAnsysSoundException("Signal must be specified as a DPF field.")
+        self.__signal = signal
+
+    @property
+    def indicator_class(self) -> type:
+        """PyAnsys Sound processing class computing the indicator."""
+        return self.__indicator_class
+
+    @indicator_class.setter
+    def indicator_class(self, indicator_class: type):
+        """Set the indicator class."""
+        if indicator_class is not None and not (
+            isinstance(indicator_class, type) and issubclass(indicator_class, PyAnsysSound)
+        ):
+            raise PyAnsysSoundException("Indicator class must be a PyAnsys Sound processing class.")
+        self.__indicator_class = indicator_class
+
+    @property
+    def getter(self) -> str:
+        """Name of the method of the processing class that returns the value of the indicator.
+
+        If ``None``, the default getter of the processing class is used.
+        """
+        return self.__getter
+
+    @getter.setter
+    def getter(self, getter: str):
+        """Set the getter."""
+        if getter is not None and not isinstance(getter, str):
+            raise PyAnsysSoundException("Getter must be specified as a method name.")
+        self.__getter = getter
+
+    @property
+    def parameters(self) -> dict:
+        """Parameters of the processing class other than the signal."""
+        return self.__parameters
+
+    @parameters.setter
+    def parameters(self, parameters: dict):
+        """Set the parameters of the processing class."""
+        if parameters is not None and not isinstance(parameters, dict):
+            raise PyAnsysSoundException("Parameters must be specified as a dictionary.")
+        self.__parameters = parameters
+
+    @property
+    def getter_parameters(self) -> dict:
+        """Parameters of the getter."""
+        return self.__getter_parameters
+
+    @getter_parameters.setter
+    def getter_parameters(self, getter_parameters: dict):
+        """Set the parameters of the getter."""
+        if getter_parameters is not None and not isinstance(getter_parameters, dict):
+            raise PyAnsysSoundException("Getter parameters must be specified as a dictionary.")
+        self.__getter_parameters = getter_parameters
+
+    @property
+    def window_length(self) -> float:
+        """Length, in s, of each window on which the indicator is computed."""
+        return self.__window_length
+
+    @window_length.setter
+    def window_length(self, window_length: float):
+        """Set the window length, in s."""
+        if window_length <= 0.0:
+            raise PyAnsysSoundException("Window length must be strictly positive.")
+        self.__window_length = window_length
+
+    @property
+    def overlap(self) -> float:
+        """Overlap, in %, between two successive windows."""
+        return self.__overlap
+
+    @overlap.setter
+    def overlap(self, overlap: float):
+        """Set the overlap, in %."""
+        if not (0.0 <= overlap < 100.0):
+            raise PyAnsysSoundException(
+                "Overlap must be positive and strictly smaller than 100.0 %."
+            )
+        self.__overlap = overlap
+
+    @property
+    def max_workers(self) -> int:
+        """Maximum number of windows processed concurrently.
+
+        If ``None``, the default number of workers of
+        :class:`concurrent.futures.ThreadPoolExecutor` is used.
+        """
+        return self.__max_workers
+
+    @max_workers.setter
+    def max_workers(self, max_workers: int):
+        """Set the maximum number of workers."""
+        if max_workers is not None and max_workers < 1:
+            raise PyAnsysSoundException("Maximum number of workers must be greater than 0.")
+        self.__max_workers = max_workers
+
+    def __get_getter(self) -> str:
+        """Get the name of the getter, or the default getter of the processing class."""
+        if self.getter is not None:
+            return self.getter
+
+        getter = DEFAULT_GETTERS.get(self.indicator_class)
+        if getter is None:
+            raise PyAnsysSoundException(
+                f"Class {self.indicator_class.__name__} has no default getter. Use "
+                f"`{__class__.__name__}.getter`."
+            )
+        return getter
+
+    def process(self):
+        """Compute the indicator over time.
+
+        This method crops each window of the signal on the DPF server, and computes the indicator
+        on each window, concurrently.
+        """
+        if self.signal == None:
+            raise PyAnsysSoundException(
+                f"No input signal defined. Use `{__class__.__name__}.signal`."
+            )
+        if self.indicator_class is None:
+            raise PyAnsysSoundException(
+                f"No indicator class defined. Use `{__class__.__name__}.indicator_class`."
+            )
+
+        getter = self.__get_getter()
+        if not callable(getattr(self.indicator_class, getter, None)):
+            raise PyAnsysSoundException(
+                f"Class {self.indicator_class.__name__} has no method named '{getter}'."
+            )
+
+        time_data = self.signal.time_freq_support.time_frequencies.data
+        if len(time_data) < 2:
+            raise PyAnsysSoundException("Specified signal must have at least two samples.")
+        sampling_frequency = 1 / (time_data[1] - time_data[0])
+
+        window_size = int(round(self.window_length * sampling_frequency))
+        if len(time_data) < window_size:
+            raise PyAnsysSoundException(
+                f"Signal duration must be greater than or equal to the window length "
+                f"({self.window_length} s)."
+            )
+        hop_size = max(1, int(round(window_size * (1.0 - self.overlap / 100.0))))
+        window_starts = np.arange(1 + (len(time_data) - window_size) // hop_size) * hop_size
+
+        def compute_window_value(window_start: int) -> float:
+            with CropSignal(
+                signal=self.signal,
+                start_time=window_start / sampling_frequency,
+                end_time=(window_start + window_size) / sampling_frequency,
+                server=self._server,
+            ) as crop_signal:
+                crop_signal.process()
+                with self.indicator_class(
+                    signal=crop_signal.get_output(),
+                    **(self.parameters if self.parameters is not None else {}),
+                    server=self._server,
+                ) as indicator:
+                    indicator.process()
+                    value = getattr(indicator, getter)(
+                        **(self.getter_parameters if self.getter_parameters is not None else {})
+                    )
+
+            if np.size(value) != 1:
+                raise PyAnsysSoundException(
+                    f"The indicator must be a single number, but method '{getter}' returned "
+                    f"{np.size(value)} values."
+                )
+            return float(np.ravel(value)[0])
+
+        if len(window_starts) == 1:
+            values = [compute_window_value(window_starts[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                values = list(executor.map(compute_window_value, window_starts))
+
+        self._output = (
+            np.array(values, dtype=float),
+            (window_starts + window_size / 2) / sampling_frequency,
+        )
+
+    def get_output(self) -> tuple[np.ndarray]:
+        """Get the indicator over time, as NumPy arrays.
+
+        Returns
+        -------
+        tuple[numpy.ndarray]
+            -   First element: value of the indicator in each window.
+
+            -   Second element: time at the center of each window, in s.
+        """
+        if self._output == None:
+            warnings.warn(
+                PyAnsysSoundWarning(
+                    f"Output is not processed yet. Use the `{__class__.__name__}.process()` method."
+                )
+            )
+
+        return self._output
+
+    def get_output_as_nparray(self) -> tuple[np.ndarray]:
+        """Get the indicator over time, as NumPy arrays.
+
+        Returns
+        -------
+        tuple[numpy.ndarray]
+            Same as :meth:`get_output`. If the output is not processed yet, the arrays are empty.
+        """
+        output = self.get_output()
+
+        if output == None:
+            return np.array([]), np.array([])
+
+        return output
+
+    def get_indicator_over_time(self) -> np.ndarray:
+        """Get the value of the indicator in each window.
+
+        Returns
+        -------
+        numpy.ndarray
+            Value of the indicator in each window.
+        """
+        return self.get_output_as_nparray()[0]
+
+    def get_time_scale(self) -> np.ndarray:
+        """Get the time scale.
+
+        Returns
+        -------
+        numpy.ndarray
+            Time at the center of each window, in s.
+        """
+        return self.get_output_as_nparray()[1]
+
+    def get_window_count(self) -> int:
+        """Get the number of windows.
+
+        Returns
+        -------
+        int
+            Number of windows on which the indicator is computed.
+        """
+        return len(self.get_time_scale())
+
+    def plot(self):
+        """Plot the indicator over time."""
+        import matplotlib.pyplot as plt
+
+        if self._output == None:
+            raise PyAnsysSoundException(
+                f"Output is not processed yet. Use the `{__class__.__name__}.process()` method."
+            )
+
+        plt.plot(self.get_time_scale(), self.get_indicator_over_time(), marker="o")
+        plt.title(f"{self.indicator_class.__name__} over time")
+        plt.xlabel("Time (s)")
+        plt.ylabel(self.__get_getter().removeprefix("get_").replace("_", " ").capitalize())
+        plt.grid(True)
+        plt.show()
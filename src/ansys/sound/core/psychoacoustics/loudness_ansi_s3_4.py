@@ -24,7 +24,7 @@
 
 import warnings
 
-from ansys.dpf.core import Field, Operator, types
+from ansys.dpf.core import Field, types
 import numpy as np
 
 from . import FIELD_DIFFUSE, FIELD_FREE, PsychoacousticsParent
@@ -41,7 +41,7 @@ class LoudnessANSI_S3_4(PsychoacousticsParent):
     scope of this standard is now covered by the ISO 532-2:2017 standard.
 
     .. seealso::
-        :class:`LoudnessISO532_2`
+        :class:`LoudnessISO532_2`, :class:`IndicatorOverTime`
 
     Examples
     --------
@@ -67,7 +67,7 @@ class LoudnessANSI_S3_4(PsychoacousticsParent):
         super().__init__()
         self.signal = signal
         self.field_type = field_type
-        self.__operator = Operator(ID_COMPUTE_LOUDNESS_ANSI_S3_4)
+        self.__operator = self._get_pooled_operator(ID_COMPUTE_LOUDNESS_ANSI_S3_4)
 
     def __str__(self):
         """Return the string representation of the object."""
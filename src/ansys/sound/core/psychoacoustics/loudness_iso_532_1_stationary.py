@@ -24,8 +24,7 @@
 
 import warnings
 
-from ansys.dpf.core import Field, Operator, types
-import matplotlib.pyplot as plt
+from ansys.dpf.core import Field, types
 import numpy as np
 
 from . import FIELD_DIFFUSE, FIELD_FREE, PsychoacousticsParent
@@ -77,7 +76,7 @@ class LoudnessISO532_1_Stationary(PsychoacousticsParent):
         super().__init__()
         self.signal = signal
         self.field_type = field_type
-        self.__operator = Operator(ID_COMPUTE_LOUDNESS_ISO_STATIONARY)
+        self.__operator = self._get_pooled_operator(ID_COMPUTE_LOUDNESS_ISO_STATIONARY)
 
     @property
     def signal(self) -> Field:
@@ -246,6 +245,8 @@ class LoudnessISO532_1_Stationary(PsychoacousticsParent):
         This method displays the specific loudness in sone/Bark as a function of the Bark band
         index.
         """
+        import matplotlib.pyplot as plt
+
         if self._output == None:
             raise PyAnsysSoundException(
                 "Output is not processed yet. Use the "
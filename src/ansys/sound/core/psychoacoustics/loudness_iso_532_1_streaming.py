@@ -0,0 +1,538 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Computes ISO 532-1 loudness for time-varying sounds, block by block."""
+
+import warnings
+
+from ansys.dpf.core import Field
+import numpy as np
+
+from . import FIELD_FREE, PsychoacousticsParent
+from .._pyansys_sound import (
+    PyAnsysSoundException,
+    PyAnsysSoundWarning,
+    _create_signal_field,
+)
+from .loudness_iso_532_1_time_varying import LoudnessISO532_1_TimeVarying
+
+# Bin edges of the running loudness histograms. Loudness bins are logarithmically spaced (relative
+# resolution about 0.5 %), and loudness level bins are 0.01 phon wide.
+LOUDNESS_HISTOGRAM_EDGES = np.concatenate(([0.0], np.geomspace(1e-3, 1e3, 2801)))
+LOUDNESS_LEVEL_HISTOGRAM_EDGES = np.linspace(0.0, 140.0, 14001)
+
+
+class _RunningHistogram:
+    """Fixed-bin histogram of a quantity, used to compute its percentiles in constant memory.
+
+    Values outside the bin edges are counted in the first or last bin. The maximum value is tracked
+    exactly. Percentiles are interpolated within a bin, so that their error is bounded by the bin
+    width.
+    """
+
+    def __init__(self, bin_edges: np.ndarray):
+        """Class instantiation takes the following parameters.
+
+        Parameters
+        ----------
+        bin_edges : numpy.ndarray
+            Increasing bin edges.
+        """
+        self.__bin_edges = np.asarray(bin_edges, dtype=float)
+        self.reset()
+
+    def reset(self):
+        """Clear all the counted values."""
+        self.__counts = np.zeros(len(self.__bin_edges) - 1, dtype=np.int64)
+        self.__min = np.inf
+        self.__max = -np.inf
+
+    @property
+    def count(self) -> int:
+        """Number of counted values."""
+        return int(self.__counts.sum())
+
+    @property
+    def max(self) -> float:
+        """Maximum counted value, or NaN if no value was counted."""
+        return self.__max if self.count > 0 else np.nan
+
+    def add(self, values: np.ndarray):
+        """Count new values.
+
+        Parameters
+        ----------
+        values : numpy.ndarray
+            Values to count.
+        """
+        values = np.asarray(values, dtype=float).reshape(-1)
+        if len(values) == 0:
+            return
+
+        bin_indexes = np.clip(
+            np.searchsorted(self.__bin_edges, values, side="right") - 1, 0, len(self.__counts) - 1
+        )
+        self.__counts += np.bincount(bin_indexes, minlength=len(self.__counts))
+        self.__min = min(self.__min, values.min())
+        self.__max = max(self.__max, values.max())
+
+    def get_exceeded_value(self, percentage: float) -> float:
+        """Get the value that is exceeded by a given percentage of the counted values.
+
+        Parameters
+        ----------
+        percentage : float
+            Percentage, between 0 and 100.
+
+        Returns
+        -------
+        float
+            Value exceeded by ``percentage`` % of the counted values, or NaN if no value was
+            counted.
+        """
+        count = self.count
+        if count == 0:
+            return np.nan
+        if percentage <= 0.0:
+            return self.__max
+        if percentage >= 100.0:
+            return self.__min
+
+        target = (1.0 - percentage / 100.0) * count
+        cumulative_counts = np.cumsum(self.__counts)
+        bin_index = min(int(np.searchsorted(cumulative_counts, target)), len(self.__counts) - 1)
+        previous_count = cumulative_counts[bin_index] - self.__counts[bin_index]
+        fraction = (target - previous_count) / max(self.__counts[bin_index], 1)
+
+        lower_edge = self.__bin_edges[bin_index]
+        value = lower_edge + fraction * (self.__bin_edges[bin_index + 1] - lower_edge)
+        return float(np.clip(value, self.__min, self.__max))
+
+
+class LoudnessISO532_1_Streaming(PsychoacousticsParent):
+    """Computes ISO 532-1:2017 loudness for time-varying sounds, block by block.
+
+    This class computes the time-varying loudness of a signal that is provided as successive
+    blocks, for example for live monitoring or very long recordings. Each call to :meth:`process`
+    (or :meth:`push`) outputs the loudness of the new frames only, and updates the maximum and
+    percentile loudness (Nmax, N5, N10) and loudness level (Lmax, L5, L10) of all the blocks
+    processed so far.
+
+    Each block is computed together with the end of the previous blocks (warm-up), so that the
+    temporal masking and decay of the ISO 532-1 model carry over from one block to the next. The
+    percentiles are computed from fixed-bin histograms, so that the memory remains constant,
+    whatever the duration of the stream. Their error is bounded by the bin width: about 0.5 % for
+    the loudness, and 0.01 phon for the loudness level.
+
+    .. seealso::
+        :class:`LoudnessISO532_1_TimeVarying`
+
+    Examples
+    --------
+    Compute the loudness of a signal provided as successive blocks, and get its N5 percentile.
+
+    >>> from ansys.sound.core.psychoacoustics import LoudnessISO532_1_Streaming
+    >>> loudness = LoudnessISO532_1_Streaming(field_type="Free")
+    >>> for block in my_blocks:
+    ...     loudness_sone, loudness_level_phon, time = loudness.push(block)
+    >>> N5 = loudness.get_N5_sone()
+
+    .. seealso::
+        :ref:`calculate_psychoacoustic_indicators`
+            Example demonstrating how to compute various psychoacoustic indicators.
+    """
+
+    def __init__(
+        self,
+        signal: Field = None,
+        field_type: str = FIELD_FREE,
+        warm_up_duration: float = 0.5,
+    ):
+        """Class instantiation takes the following parameters.
+
+        Parameters
+        ----------
+        signal : Field, default: None
+            Next block of the signal, in Pa, on which to compute time-varying ISO532-1 loudness.
+        field_type : str, default: "Free"
+            Sound field type. Available options are `"Free"` and `"Diffuse"`.
+        warm_up_duration : float, default: 0.5
+            Duration, in s, of the end of the previous blocks that is computed again together with
+            each new block, so that the state of the loudness model carries over.
+        """
+        super().__init__()
+        self.__loudness = LoudnessISO532_1_TimeVarying(server=self._server)
+        self.__loudness_histogram = _RunningHistogram(LOUDNESS_HISTOGRAM_EDGES)
+        self.__loudness_level_histogram = _RunningHistogram(LOUDNESS_LEVEL_HISTOGRAM_EDGES)
+        self.signal = signal
+        self.field_type = field_type
+        self.warm_up_duration = warm_up_duration
+        self.reset()
+
+    def __str__(self):
+        """Return the string representation of the object."""
+        if self.get_frame_count() == 0:
+            str_indicators = "Not processed"
+        else:
+            str_indicators = (
+                f"\n\tNmax: {self.get_Nmax_sone():.2f} sones"
+                f"\n\tN5: {self.get_N5_sone():.2f} sones"
+                f"\n\tN10: {self.get_N10_sone():.2f} sones"
+            )
+
+        return (
+            f"{__class__.__name__} object\n"
+            "Data:\n"
+            f"\tField type: {self.field_type}\n"
+            f"\tWarm-up duration: {self.warm_up_duration} s\n"
+            f"\tProcessed frames: {self.get_frame_count()}\n"
+            f"Indicators: {str_indicators}"
+        )
+
+    @property
+    def signal(self) -> Field:
+        """Next block of the input signal, in Pa."""
+        return self.__signal
+
+    @signal.setter
+    def signal(self, signal: Field):
+        """Set the signal."""
+        if not (isinstance(signal, Field) or signal is None):
+            raise PyAnsysSoundException("Signal must be specified as a DPF field.")
+        self.__signal = signal
+
+    @property
+    def field_type(self) -> str:
+        """Sound field type.
+
+        Available options are `"Free"` and `"Diffuse"`.
+        """
+        return self.__loudness.field_type
+
+    @field_type.setter
+    def field_type(self, field_type: str):
+        """Set the sound field type."""
+        self.__loudness.field_type = field_type
+
+    @property
+    def warm_up_duration(self) -> float:
+        """Warm-up duration in s.
+
+        Duration of the end of the previous blocks that is computed again together with each new
+        block, so that the state of the loudness model carries over.
+        """
+        return self.__warm_up_duration
+
+    @warm_up_duration.setter
+    def warm_up_duration(self, warm_up_duration: float):
+        """Set the warm-up duration."""
+        if warm_up_duration < 0.0:
+            raise PyAnsysSoundException("Warm-up duration must be greater than or equal to 0 s.")
+        self.__warm_up_duration = warm_up_duration
+
+    def reset(self):
+        """Reset the stream.
+
+        This method discards the end of the previous blocks, and the maximum and percentile
+        loudness, so that the next block is processed as the start of a new signal.
+        """
+        self.__sampling_frequency = None
+        self.__buffer = np.zeros(0)
+        self.__buffer_start = 0
+        self.__next_frame_time = 0.0
+        self.__frame_period = None
+        self.__loudness_histogram.reset()
+        self.__loudness_level_histogram.reset()
+        self._output = None
+
+    def process(self):
+        """Compute the time-varying ISO532-1 loudness of the next block of the signal.
+
+        This method calls the appropriate DPF Sound operator to compute the loudness of the block
+        in :attr:`signal`, preceded by the warm-up part of the previous blocks. Only the frames that
+        were not output by the previous blocks are stored, and added to the maximum and percentile
+        loudness.
+        """
+        if self.__signal == None:
+            raise PyAnsysSoundException(
+                "No signal found for loudness versus time computation. "
+                f"Use `{__class__.__name__}.signal`."
+            )
+
+        time_data = self.__signal.time_freq_support.time_frequencies.data
+        if len(time_data) < 2:
+            raise PyAnsysSoundException("Specified signal must have at least two samples.")
+
+        sampling_frequency = 1 / (time_data[1] - time_data[0])
+        if self.__sampling_frequency is None:
+            self.__sampling_frequency = sampling_frequency
+        elif np.round(sampling_frequency, 1) != np.round(self.__sampling_frequency, 1):
+            raise PyAnsysSoundException(
+                f"Specified signal's sampling frequency ({sampling_frequency:.1f} Hz) must match "
+                f"the sampling frequency of the previous blocks "
+                f"({self.__sampling_frequency:.1f} Hz). Use `{__class__.__name__}.reset()` to "
+                f"start a new signal."
+            )
+
+        # Compute the loudness of the new block, preceded by the warm-up part of previous blocks.
+        samples = np.concatenate((self.__buffer, np.array(self.__signal.data, dtype=np.float64)))
+        self.__loudness.signal = _create_signal_field(
+            samples, self.__sampling_frequency, name=self.__signal.name, server=self._server
+        )
+        self.__loudness.process()
+        loudness, _, _, loudness_level, _, _, time = self.__loudness.get_output_as_nparray()
+        time = self.__buffer_start / self.__sampling_frequency + time
+
+        # Only keep the frames that were not output yet.
+        if len(time) > 1:
+            self.__frame_period = time[1] - time[0]
+        frame_period = (
+            self.__frame_period
+            if self.__frame_period is not None
+            else 1 / self.__sampling_frequency
+        )
+        is_new = time >= self.__next_frame_time - frame_period / 2
+        self._output = (loudness[is_new], loudness_level[is_new], time[is_new])
+        if np.any(is_new):
+            self.__next_frame_time = time[is_new][-1] + frame_period
+
+        self.__loudness_histogram.add(self._output[0])
+        self.__loudness_level_histogram.add(self._output[1])
+
+        # Only retain the samples needed to warm up the model for the next block. The retained
+        # samples start a whole number of frame periods before the next frame, so that the frames
+        # of the next block fall on the same time grid (at least one frame period, so that they
+        # always include the last output frame).
+        sample_count = self.__buffer_start + len(samples)
+        warm_up_frame_count = max(np.ceil(self.__warm_up_duration / frame_period), 1)
+        retained_start = int(
+            np.round(
+                (self.__next_frame_time - warm_up_frame_count * frame_period)
+                * self.__sampling_frequency
+            )
+        )
+        retained_start = min(max(retained_start, self.__buffer_start), sample_count)
+        self.__buffer = samples[retained_start - self.__buffer_start :]
+        self.__buffer_start = retained_start
+
+    def push(self, block: Field) -> tuple[np.ndarray]:
+        """Compute the time-varying ISO532-1 loudness of the next block of the signal.
+
+        This method sets :attr:`signal`, calls :meth:`process`, and returns the loudness of the new
+        frames.
+
+        Parameters
+        ----------
+        block : Field
+            Next block of the signal, in Pa. Its sampling frequency must be that of the previous
+            blocks.
+
+        Returns
+        -------
+        tuple[numpy.ndarray]
+            -   First element: instantaneous loudness of the new frames, in sone.
+
+            -   Second element: instantaneous loudness level of the new frames, in phon.
+
+            -   Third element: time of the new frames, in s, from the start of the signal.
+        """
+        self.signal = block
+        self.process()
+        return self.get_output_as_nparray()
+
+    def get_output(self) -> tuple[np.ndarray]:
+        """Get the time-varying loudness of the new frames of the last processed block.
+
+        Returns
+        -------
+        tuple[numpy.ndarray]
+            -   First element: instantaneous loudness of the new frames, in sone.
+
+            -   Second element: instantaneous loudness level of the new frames, in phon.
+
+            -   Third element: time of the new frames, in s, from the start of the signal.
+        """
+        if self._output == None:
+            warnings.warn(
+                PyAnsysSoundWarning(
+                    f"Output is not processed yet. Use the `{__class__.__name__}.process()` method."
+                )
+            )
+
+        return self._output
+
+    def get_output_as_nparray(self) -> tuple[np.ndarray]:
+        """Get the time-varying loudness of the new frames of the last block, as NumPy arrays.
+
+        Returns
+        -------
+        tuple[numpy.ndarray]
+            -   First element: instantaneous loudness of the new frames, in sone.
+
+            -   Second element: instantaneous loudness level of the new frames, in phon.
+
+            -   Third element: time of the new frames, in s, from the start of the signal.
+        """
+        output = self.get_output()
+
+        if output == None:
+            return np.array([]), np.array([]), np.array([])
+
+        return output
+
+    def get_loudness_sone_vs_time(self) -> np.ndarray:
+        """Get the instantaneous loudness of the new frames of the last block, in sone.
+
+        Returns
+        -------
+        numpy.ndarray
+            Instantaneous loudness in sone.
+        """
+        return self.get_output_as_nparray()[0]
+
+    def get_loudness_level_phon_vs_time(self) -> np.ndarray:
+        """Get the instantaneous loudness level of the new frames of the last block, in phon.
+
+        Returns
+        -------
+        numpy.ndarray
+            Instantaneous loudness level in phon.
+        """
+        return self.get_output_as_nparray()[1]
+
+    def get_time_scale(self) -> np.ndarray:
+        """Get the time of the new frames of the last block.
+
+        Returns
+        -------
+        numpy.ndarray
+            Time of the new frames, in s, from the start of the signal.
+        """
+        return self.get_output_as_nparray()[2]
+
+    def get_frame_count(self) -> int:
+        """Get the number of frames processed since the start of the signal.
+
+        Returns
+        -------
+        int
+            Number of frames.
+        """
+        return self.__loudness_histogram.count
+
+    def get_Nmax_sone(self) -> float:
+        """Get the maximum instantaneous loudness since the start of the signal.
+
+        Returns
+        -------
+        float
+            Maximum loudness in sone.
+        """
+        return self.__loudness_histogram.max
+
+    def get_N5_sone(self) -> float:
+        """Get the N5 percentile loudness since the start of the signal.
+
+        N5 is the loudness that is exceeded during a cumulated 5 % of the signal duration.
+
+        Returns
+        -------
+        float
+            N5 percentile loudness in sone.
+        """
+        return self.__loudness_histogram.get_exceeded_value(5.0)
+
+    def get_N10_sone(self) -> float:
+        """Get the N10 percentile loudness since the start of the signal.
+
+        N10 is the loudness that is exceeded during a cumulated 10 % of the signal duration.
+
+        Returns
+        -------
+        float
+            N10 percentile loudness in sone.
+        """
+        return self.__loudness_histogram.get_exceeded_value(10.0)
+
+    def get_Lmax_phon(self) -> float:
+        """Get the maximum instantaneous loudness level since the start of the signal.
+
+        Returns
+        -------
+        float
+            Maximum loudness level in phon.
+        """
+        return self.__loudness_level_histogram.max
+
+    def get_L5_phon(self) -> float:
+        """Get the L5 percentile loudness level since the start of the signal.
+
+        L5 is the loudness level that is exceeded during a cumulated 5 % of the signal duration.
+
+        Returns
+        -------
+        float
+            L5 percentile loudness level in phon.
+        """
+        return self.__loudness_level_histogram.get_exceeded_value(5.0)
+
+    def get_L10_phon(self) -> float:
+        """Get the L10 percentile loudness level since the start of the signal.
+
+        L10 is the loudness level that is exceeded during a cumulated 10 % of the signal duration.
+
+        Returns
+        -------
+        float
+            L10 percentile loudness level in phon.
+        """
+        return self.__loudness_level_histogram.get_exceeded_value(10.0)
+
+    def plot(self):
+        """Plot the instantaneous loudness and loudness level of the new frames of the last block.
+
+        This method displays the instantaneous loudness (N), in sone, and instantaneous loudness
+        level (L_N), in phon.
+        """
+        import matplotlib.pyplot as plt
+
+        if self._output == None:
+            raise PyAnsysSoundException(
+                f"Output is not processed yet. Use the `{__class__.__name__}.process()` method."
+            )
+
+        time = self.get_time_scale()
+
+        _, (ax1, ax2) = plt.subplots(2, 1, sharex=True)
+
+        ax1.plot(time, self.get_loudness_sone_vs_time())
+        ax1.set_title("Instantaneous loudness")
+        ax1.set_ylabel("N (sone)")
+        ax1.grid(True)
+
+        ax2.plot(time, self.get_loudness_level_phon_vs_time())
+        ax2.set_title("Instantaneous loudness level")
+        ax2.set_xlabel("Time (s)")
+        ax2.set_ylabel(r"$\mathregular{L_N}$ (phon)")
+        ax2.grid(True)
+
+        plt.show()
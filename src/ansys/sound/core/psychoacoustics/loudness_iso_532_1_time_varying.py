@@ -24,12 +24,15 @@
 
 import warnings
 
-from ansys.dpf.core import Field, Operator, types
-import matplotlib.pyplot as plt
+from ansys.dpf.core import Field, types
 import numpy as np
 
 from . import FIELD_DIFFUSE, FIELD_FREE, PsychoacousticsParent
-from .._pyansys_sound import PyAnsysSoundException, PyAnsysSoundWarning
+from .._pyansys_sound import (
+    PyAnsysSoundException,
+    PyAnsysSoundWarning,
+    _PipelineStage,
+)
 
 # Name of the DPF Sound operator used in this module.
 ID_COMPUTE_LOUDNESS_ISO_TIME_VARYING = "compute_loudness_iso532_1_vs_time"
@@ -42,7 +45,7 @@ class LoudnessISO532_1_TimeVarying(PsychoacousticsParent):
     corresponding to the "Zwicker method", for time-varying sounds.
 
     .. seealso::
-        :class:`LoudnessISO532_1_Stationary`
+        :class:`LoudnessISO532_1_Stationary`, :class:`LoudnessISO532_1_Streaming`
 
     Examples
     --------
@@ -80,7 +83,7 @@ class LoudnessISO532_1_TimeVarying(PsychoacousticsParent):
         super().__init__()
         self.signal = signal
         self.field_type = field_type
-        self.__operator = Operator(ID_COMPUTE_LOUDNESS_ISO_TIME_VARYING)
+        self.__operator = self._get_pooled_operator(ID_COMPUTE_LOUDNESS_ISO_TIME_VARYING)
 
     @property
     def signal(self) -> Field:
@@ -124,12 +127,20 @@ class LoudnessISO532_1_TimeVarying(PsychoacousticsParent):
             )
 
         self.__operator.connect(0, self.signal)
-        self.__operator.connect(1, self.field_type)
+        self.__connect_parameters()
 
         # Runs the operator
         self.__operator.run()
 
         # Stores outputs in the tuple variable
+        self.__store_output()
+
+    def __connect_parameters(self):
+        """Connect the operator inputs, except the signal."""
+        self.__operator.connect(1, self.field_type)
+
+    def __store_output(self):
+        """Store the operator outputs."""
         self._output = (
             self.__operator.get_output(0, types.field),
             self.__operator.get_output(1, types.double),
@@ -139,6 +150,18 @@ class LoudnessISO532_1_TimeVarying(PsychoacousticsParent):
             self.__operator.get_output(5, types.double),
         )
 
+    def _get_pipeline_stage(self) -> _PipelineStage:
+        """Get the DPF operator of the instance, for use in a pipeline.
+
+        Returns
+        -------
+        _PipelineStage
+            DPF operator, with all inputs but the signal connected, signal input and output pins,
+            and function storing the operator outputs.
+        """
+        self.__connect_parameters()
+        return _PipelineStage(self.__operator, 0, 0, self.__store_output, outputs_signal=False)
+
     def get_output(self) -> tuple:
         """Get time-varying loudness data.
 
@@ -315,6 +338,8 @@ class LoudnessISO532_1_TimeVarying(PsychoacousticsParent):
         This method displays the instantaneous loudness (N), in sone, and instantaneous loudness
         level (L_N), in phon.
         """
+        import matplotlib.pyplot as plt
+
         if self.get_output() == None:
             raise PyAnsysSoundException(
                 "Output is not processed yet. Use the "
@@ -24,8 +24,7 @@
 
 import warnings
 
-from ansys.dpf.core import Field, Operator, fields_container_factory, types
-import matplotlib.pyplot as plt
+from ansys.dpf.core import Field, fields_container_factory, types
 import numpy as np
 
 from . import FIELD_DIFFUSE, FIELD_FREE, PsychoacousticsParent
@@ -45,7 +44,7 @@ class LoudnessISO532_2(PsychoacousticsParent):
     ISO 532-2:2017 standard, corresponding to the "Moore-Glasberg method".
 
     .. seealso::
-        :class:`LoudnessISO532_1_Stationary`
+        :class:`LoudnessISO532_1_Stationary`, :class:`LoudnessISO532_2_Batch`
 
     Examples
     --------
@@ -109,7 +108,7 @@ class LoudnessISO532_2(PsychoacousticsParent):
         self.signal = signal
         self.field_type = field_type
         self.recording_type = recording_type
-        self.__operator = Operator(ID_COMPUTE_LOUDNESS_ISO_532_2)
+        self.__operator = self._get_pooled_operator(ID_COMPUTE_LOUDNESS_ISO_532_2)
 
     def __str__(self):
         """Return the string representation of the class."""
@@ -219,7 +218,9 @@ class LoudnessISO532_2(PsychoacousticsParent):
 
         signal = self.signal
         if isinstance(self.signal, list):
-            signal = fields_container_factory.over_time_freq_fields_container(self.signal)
+            signal = fields_container_factory.over_time_freq_fields_container(
+                self.signal, server=self._server
+            )
 
         self.__operator.connect(0, signal)
         self.__operator.connect(1, self.field_type)
@@ -418,6 +419,8 @@ class LoudnessISO532_2(PsychoacousticsParent):
         This method displays the binaural specific loudness in sone/Cam as a function of the ERB
         center frequency.
         """
+        import matplotlib.pyplot as plt
+
         if self._output == None:
             raise PyAnsysSoundException(
                 "Output is not processed yet. Use the " f"`{__class__.__name__}.process()` method."
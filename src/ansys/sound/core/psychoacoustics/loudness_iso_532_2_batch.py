@@ -0,0 +1,520 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Computes ISO 532-2:2017 loudness of many recordings."""
+
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+import warnings
+
+from ansys.dpf.core import Field, fields_container_factory, types
+import numpy as np
+
+from . import FIELD_DIFFUSE, FIELD_FREE, PsychoacousticsParent
+from .._pyansys_sound import PyAnsysSoundException, PyAnsysSoundWarning, _create_signal_field
+from ..server_helpers._operator_pool import _acquire_operator, _release_operator
+from .loudness_iso_532_2 import ID_COMPUTE_LOUDNESS_ISO_532_2, RECORDING_HEAD, RECORDING_MIC
+
+
+class LoudnessISO532_2_Batch(PsychoacousticsParent):
+    """Computes ISO 532-2:2017 loudness of many recordings.
+
+    This class computes the binaural and monaural loudness of a list of recordings according to
+    the ISO 532-2:2017 standard, as :class:`LoudnessISO532_2` does for a single recording. Each
+    recording is either a single signal, presented diotically (same signal at both ears), or a
+    pair of signals, presented dichotically (one signal at each ear), for example the recordings
+    of a head and torso simulator in a listening test.
+
+    The recordings are processed concurrently, each with a DPF operator taken from the operator
+    pool of the server. If a :class:`.ServerPool` is specified, the recordings are spread over its
+    servers instead. The results of all recordings are returned as stacked NumPy arrays.
+
+    .. seealso::
+        :class:`LoudnessISO532_2`
+
+    Examples
+    --------
+    Compute the loudness of binaural recordings, and display their binaural specific loudness.
+
+    >>> from ansys.sound.core.psychoacoustics import LoudnessISO532_2_Batch
+    >>> loudness = LoudnessISO532_2_Batch(
+    ...     signals=[[my_left_signal_1, my_right_signal_1], [my_left_signal_2, my_right_signal_2]],
+    ...     field_type="Free",
+    ...     recording_type="Head",
+    ... )
+    >>> loudness.process()
+    >>> binaural_loudness_values = loudness.get_binaural_loudness_sone()
+    >>> monaural_loudness_values = loudness.get_monaural_loudness_sone()
+    >>> loudness.plot()
+
+    Spread the recordings over two DPF servers.
+
+    >>> from ansys.sound.core.server_helpers import ServerPool
+    >>> with ServerPool(server_count=2) as pool:
+    ...     loudness = LoudnessISO532_2_Batch(
+    ...         signals=my_binaural_recordings, recording_type="Head", server_pool=pool
+    ...     )
+    ...     loudness.process()
+    """
+
+    def __init__(
+        self,
+        signals: list[Field | list[Field]] = None,
+        field_type: str = FIELD_FREE,
+        recording_type: str = RECORDING_MIC,
+        max_workers: int = None,
+        server_pool=None,
+    ):
+        """Class instantiation takes the following parameters.
+
+        Parameters
+        ----------
+        signals : list[Field | list[Field]], default: None
+            Recordings in Pa on which to compute loudness. Each recording is either a
+            :class:`Field <ansys.dpf.core.field.Field>`, for a diotic listening assumption (same
+            signal presented at both ears), or a list of exactly 2
+            :class:`Field <ansys.dpf.core.field.Field>`, for a dichotic listening assumption (each
+            field's signal presented at each ear).
+        field_type : str, default: "Free"
+            Sound field type. Available options are `"Free"` and `"Diffuse"`.
+        recording_type : str, default: "Mic"
+            Recording type. Available options are `"Mic"` for a single microphone and `"Head"` for
+            a head and torso simulator.
+        max_workers : int, default: None
+            Maximum number of recordings processed concurrently. If ``None``, the default number
+            of workers of :class:`concurrent.futures.ThreadPoolExecutor` is used.
+        server_pool : ServerPool, default: None
+            Pool of DPF servers to spread the recordings over. If specified, each recording is
+            transferred to, and processed on, a server leased from the pool. Otherwise, all
+            recordings are processed on the server of the instance.
+        """
+        super().__init__()
+        self.signals = signals
+        self.field_type = field_type
+        self.recording_type = recording_type
+        self.max_workers = max_workers
+        self.server_pool = server_pool
+
+    def __str__(self):
+        """Return the string representation of the class."""
+        if self.signals is not None:
+            dichotic_count = sum(isinstance(signal, list) for signal in self.signals)
+            signals_str = (
+                f"\tNumber of recordings: {len(self.signals)} "
+                f"({len(self.signals) - dichotic_count} diotic, {dichotic_count} dichotic)\n"
+            )
+        else:
+            signals_str = "\tNumber of recordings: Not set\n"
+
+        if self.recording_type == RECORDING_MIC:
+            rec_str = "Single microphone"
+        else:
+            rec_str = "Head and torso simulator"
+
+        if self._output is not None:
+            binaural_loudness = self.get_binaural_loudness_sone()
+            output_str = (
+                f"Binaural loudness: {binaural_loudness.min():.3} to "
+                f"{binaural_loudness.max():.3} sones"
+            )
+        else:
+            output_str = "Binaural loudness: Not processed"
+
+        return (
+            f"{__class__.__name__} object.\n"
+            "Data\n"
+            f"{signals_str}"
+            f"\tField type: {self.field_type}\n"
+            f"\tRecording type: {self.recording_type} ({rec_str})\n"
+            f"{output_str}"
+        )
+
+    @property
+    def signals(self) -> list[Field | list[Field]]:
+        """Recordings in Pa.
+
+        Each recording is either a :class:`Field <ansys.dpf.core.field.Field>`, for a diotic
+        listening assumption (same signal presented at both ears), or a list of exactly 2
+        :class:`Field <ansys.dpf.core.field.Field>`, for a dichotic listening assumption (each
+        field's signal presented at each ear).
+        """
+        return self.__signals
+
+    @signals.setter
+    def signals(self, signals: list[Field | list[Field]]):
+        """Set the recordings."""
+        if signals is not None:
+            if not isinstance(signals, (list, tuple)) or len(signals) == 0:
+                raise PyAnsysSoundException(
+                    "Signals must be specified as a non-empty list of recordings."
+                )
+            for signal in signals:
+                if isinstance(signal, (list, tuple)):
+                    if len(signal) != 2 or not all(isinstance(f, Field) for f in signal):
+                        raise PyAnsysSoundException(
+                            "Each dichotic recording must be a list of exactly 2 fields "
+                            "corresponding to the signals presented at the two ears."
+                        )
+                elif not isinstance(signal, Field):
+                    raise PyAnsysSoundException(
+                        "Each recording must be specified as a DPF field or a list of exactly 2 "
+                        "DPF fields."
+                    )
+            signals = [list(signal) if isinstance(signal, tuple) else signal for signal in signals]
+        self.__signals = signals
+
+    @property
+    def field_type(self) -> str:
+        """Sound field type.
+
+        Available options are `"Free"` and `"Diffuse"`.
+        """
+        return self.__field_type
+
+    @field_type.setter
+    def field_type(self, field_type: str):
+        """Set the sound field type."""
+        if field_type.lower() not in [FIELD_FREE.lower(), FIELD_DIFFUSE.lower()]:
+            raise PyAnsysSoundException(
+                f'Invalid field type "{field_type}". Available options are "{FIELD_FREE}" and '
+                f'"{FIELD_DIFFUSE}".'
+            )
+        self.__field_type = field_type
+
+    @property
+    def recording_type(self) -> str:
+        """Recording type.
+
+        Available options are `"Mic"` for a single microphone and `"Head"` for a head and torso
+        simulator.
+        """
+        return self.__recording_type
+
+    @recording_type.setter
+    def recording_type(self, recording_type: str):
+        """Set the recording type."""
+        if recording_type.lower() not in [RECORDING_MIC.lower(), RECORDING_HEAD.lower()]:
+            raise PyAnsysSoundException(
+                f'Invalid recording type "{recording_type}". Available options are '
+                f'"{RECORDING_MIC}" and "{RECORDING_HEAD}".'
+            )
+        self.__recording_type = recording_type
+
+    @property
+    def max_workers(self) -> int:
+        """Maximum number of recordings processed concurrently.
+
+        If ``None``, the default number of workers of
+        :class:`concurrent.futures.ThreadPoolExecutor` is used.
+        """
+        return self.__max_workers
+
+    @max_workers.setter
+    def max_workers(self, max_workers: int):
+        """Set the maximum number of workers."""
+        if max_workers is not None and max_workers < 1:
+            raise PyAnsysSoundException("Maximum number of workers must be greater than 0.")
+        self.__max_workers = max_workers
+
+    @property
+    def server_pool(self):
+        """Pool of DPF servers to spread the recordings over."""
+        return self.__server_pool
+
+    @server_pool.setter
+    def server_pool(self, server_pool):
+        """Set the server pool."""
+        if server_pool is not None and not callable(getattr(server_pool, "lease", None)):
+            raise PyAnsysSoundException("Server pool must be specified as a ServerPool object.")
+        self.__server_pool = server_pool
+
+    def process(self):
+        """Compute the loudness of all recordings.
+
+        This method calls the appropriate DPF Sound operator to compute the loudness of each
+        recording. The recordings are processed concurrently.
+        """
+        if self.signals == None:
+            raise PyAnsysSoundException(
+                f"No input signals set. Use `{__class__.__name__}.signals`."
+            )
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(self.__compute_loudness, self.signals))
+
+        # The ERBn-number scale is the same for all recordings.
+        self._output = tuple(np.stack(values) for values in zip(*(r[:-1] for r in results))) + (
+            results[0][-1],
+        )
+
+    def __compute_loudness(self, signal: Field | list[Field]) -> tuple[np.ndarray]:
+        """Compute the loudness of a recording.
+
+        Parameters
+        ----------
+        signal : Field | list[Field]
+            Recording.
+
+        Returns
+        -------
+        tuple[numpy.ndarray]
+            Binaural loudness, binaural loudness level, monaural loudness at each ear, monaural
+            loudness level at each ear, binaural specific loudness, monaural specific loudness at
+            each ear, and ERBn-number scale.
+        """
+        lease = self.server_pool.lease() if self.server_pool is not None else nullcontext()
+        with lease as leased_server:
+            if self.server_pool is not None:
+                # Transfer the recording to the leased server.
+                server = leased_server
+                fields = [signal] if isinstance(signal, Field) else signal
+                fields = [self.__transfer_field(field, server) for field in fields]
+                signal = fields[0] if len(fields) == 1 else fields
+            else:
+                server = self._server
+
+            if isinstance(signal, list):
+                signal = fields_container_factory.over_time_freq_fields_container(
+                    signal, server=server
+                )
+
+            operator, server_reference = _acquire_operator(
+                ID_COMPUTE_LOUDNESS_ISO_532_2, server=server
+            )
+            try:
+                operator.connect(0, signal)
+                operator.connect(1, self.field_type)
+                operator.connect(2, self.recording_type)
+                operator.run()
+
+                binaural_loudness = operator.get_output(0, types.double)
+                binaural_loudness_level = operator.get_output(1, types.double)
+                monaural_loudness = np.array(operator.get_output(2, types.vec_double))
+                monaural_loudness_level = np.array(operator.get_output(3, types.vec_double))
+                binaural_specific_loudness = operator.get_output(4, types.field)
+                monaural_specific_loudness = np.vstack(
+                    [
+                        np.array(field.data)
+                        for field in operator.get_output(5, types.fields_container)
+                    ]
+                )
+            finally:
+                _release_operator(ID_COMPUTE_LOUDNESS_ISO_532_2, operator, server_reference)
+
+        # With a diotic recording, the monaural values are the same at both ears.
+        if len(monaural_loudness) == 1:
+            monaural_loudness = np.repeat(monaural_loudness, 2)
+            monaural_loudness_level = np.repeat(monaural_loudness_level, 2)
+            monaural_specific_loudness = np.repeat(monaural_specific_loudness, 2, axis=0)
+
+        return (
+            np.float64(binaural_loudness),
+            np.float64(binaural_loudness_level),
+            monaural_loudness,
+            monaural_loudness_level,
+            np.array(binaural_specific_loudness.data),
+            monaural_specific_loudness,
+            np.array(binaural_specific_loudness.time_freq_support.time_frequencies.data),
+        )
+
+    @staticmethod
+    def __transfer_field(field: Field, server) -> Field:
+        """Create a copy of a signal on another server.
+
+        Parameters
+        ----------
+        field : Field
+            Signal.
+        server : BaseServer
+            Server to create the copy on.
+
+        Returns
+        -------
+        Field
+            Copy of the signal on the server.
+        """
+        time = field.time_freq_support.time_frequencies.data
+        return _create_signal_field(
+            np.array(field.data),
+            1.0 / (time[1] - time[0]),
+            unit=field.unit,
+            name=field.name,
+            server=server,
+        )
+
+    def get_output(self) -> tuple[np.ndarray]:
+        """Get the binaural and monaural loudness, loudness level, and specific loudness.
+
+        Returns
+        -------
+        tuple[numpy.ndarray]
+            -   First element: binaural loudness in sone, with shape (recordings,).
+
+            -   Second element: binaural loudness level in phon, with shape (recordings,).
+
+            -   Third element: monaural loudness in sone at each ear, with shape (recordings, 2).
+
+            -   Fourth element: monaural loudness level in phon at each ear, with shape
+                (recordings, 2).
+
+            -   Fifth element: binaural specific loudness in sone/Cam, as a function of the ERB
+                center frequency, with shape (recordings, bands).
+
+            -   Sixth element: monaural specific loudness in sone/Cam at each ear, as a function
+                of the ERB center frequency, with shape (recordings, 2, bands).
+
+            -   Seventh element: ERBn-number scale in Cam, where specific loudness is defined.
+
+            For diotic recordings, the monaural values are the same at both ears.
+        """
+        if self._output == None:
+            warnings.warn(
+                PyAnsysSoundWarning(
+                    "Output is not processed yet. Use the "
+                    f"`{__class__.__name__}.process()` method."
+                )
+            )
+
+        return self._output
+
+    def get_output_as_nparray(self) -> tuple[np.ndarray]:
+        """Get loudness data in a tuple of NumPy arrays.
+
+        Returns
+        -------
+        tuple[numpy.ndarray]
+            Same as :meth:`get_output`. If the output is not processed yet, the arrays are empty.
+        """
+        output = self.get_output()
+
+        if output == None:
+            return tuple(np.array([]) for _ in range(7))
+
+        return output
+
+    def get_binaural_loudness_sone(self) -> np.ndarray:
+        """Get the binaural loudness in sone.
+
+        Returns
+        -------
+        numpy.ndarray
+            Binaural loudness in sone, with shape (recordings,).
+        """
+        return self.get_output_as_nparray()[0]
+
+    def get_binaural_loudness_level_phon(self) -> np.ndarray:
+        """Get the binaural loudness level in phon.
+
+        Returns
+        -------
+        numpy.ndarray
+            Binaural loudness level in phon, with shape (recordings,).
+        """
+        return self.get_output_as_nparray()[1]
+
+    def get_monaural_loudness_sone(self) -> np.ndarray:
+        """Get the monaural loudness in sone at each ear.
+
+        Returns
+        -------
+        numpy.ndarray
+            Monaural loudness in sone at each ear, with shape (recordings, 2).
+        """
+        return self.get_output_as_nparray()[2]
+
+    def get_monaural_loudness_level_phon(self) -> np.ndarray:
+        """Get the monaural loudness level in phon at each ear.
+
+        Returns
+        -------
+        numpy.ndarray
+            Monaural loudness level in phon at each ear, with shape (recordings, 2).
+        """
+        return self.get_output_as_nparray()[3]
+
+    def get_binaural_specific_loudness(self) -> np.ndarray:
+        """Get the binaural specific loudness.
+
+        Returns
+        -------
+        numpy.ndarray
+            Binaural specific loudness in sone/Cam, as a function of the ERB center frequency,
+            with shape (recordings, bands).
+        """
+        return self.get_output_as_nparray()[4]
+
+    def get_monaural_specific_loudness(self) -> np.ndarray:
+        """Get the monaural specific loudness at each ear.
+
+        Returns
+        -------
+        numpy.ndarray
+            Monaural specific loudness in sone/Cam at each ear, as a function of the ERB center
+            frequency, with shape (recordings, 2, bands).
+        """
+        return self.get_output_as_nparray()[5]
+
+    def get_erb_center_frequencies(self) -> np.ndarray:
+        """Get the ERB center frequencies in Hz.
+
+        This method returns the center frequencies in Hz of the equivalent rectangular bandwidths
+        (ERB), where the specific loudness is defined.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of ERB center frequencies in Hz.
+        """
+        return (pow(10, self.get_erbn_numbers() / 21.366) - 1) / 0.004368
+
+    def get_erbn_numbers(self) -> np.ndarray:
+        """Get the ERBn-number scale in Cam.
+
+        Returns
+        -------
+        numpy.ndarray
+            ERBn-number scale in Cam.
+        """
+        return self.get_output_as_nparray()[6]
+
+    def plot(self):
+        """Plot the binaural specific loudness of all recordings.
+
+        This method displays the binaural specific loudness in sone/Cam of each recording as a
+        function of the ERB center frequency.
+        """
+        import matplotlib.pyplot as plt
+
+        if self._output == None:
+            raise PyAnsysSoundException(
+                f"Output is not processed yet. Use the `{__class__.__name__}.process()` method."
+            )
+
+        center_frequency = self.get_erb_center_frequencies()
+        for index, specific_loudness in enumerate(self.get_binaural_specific_loudness()):
+            plt.plot(center_frequency, specific_loudness, label=f"Recording {index}")
+        plt.title("Binaural specific loudness")
+        plt.xlabel("ERB center frequency (Hz)")
+        plt.ylabel("N' (sone/Cam)")
+        plt.legend()
+        plt.grid(True)
+        plt.show()
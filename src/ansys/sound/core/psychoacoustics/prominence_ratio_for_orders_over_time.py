@@ -24,8 +24,7 @@
 
 import warnings
 
-from ansys.dpf.core import Field, Operator, types
-import matplotlib.pyplot as plt
+from ansys.dpf.core import Field, types
 import numpy as np
 
 from . import PsychoacousticsParent
@@ -81,7 +80,7 @@ class ProminenceRatioForOrdersOverTime(PsychoacousticsParent):
         self.signal = signal
         self.profile = profile
         self.order_list = order_list
-        self.__operator = Operator(ID_COMPUTE_PR_FOR_ORDERS_OVER_TIME)
+        self.__operator = self._get_pooled_operator(ID_COMPUTE_PR_FOR_ORDERS_OVER_TIME)
 
     def __str__(self):
         """Return the string representation of the object."""
@@ -274,6 +273,8 @@ class ProminenceRatioForOrdersOverTime(PsychoacousticsParent):
         use_rpm_scale : bool
             Indicates whether to plot the PR as a function of time or RPM.
         """
+        import matplotlib.pyplot as plt
+
         output = self.get_output()
         if output is None:
             raise PyAnsysSoundException(
@@ -0,0 +1,92 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Computes the ECMA 418-1/ISO 7779 prominence ratio (PR) over time."""
+
+import numpy as np
+
+from ._tone_ratio_over_time_parent import ToneRatioOverTimeParent
+
+
+class ProminenceRatioOverTime(ToneRatioOverTimeParent):
+    """Computes the ECMA 418-1/ISO 7779 prominence ratio (PR) over time.
+
+    This class computes the PR, as defined in the ECMA 418-1 and ISO 7779 standards, over time
+    in a given time-domain signal, without requiring an RPM profile. The signal is split into
+    frames, and the PR is computed on the power spectral density (PSD) of each frame,
+    concurrently.
+
+    .. seealso::
+        :class:`ProminenceRatio`, :class:`ProminenceRatioForOrdersOverTime`,
+        :class:`ToneToNoiseRatioOverTime`
+
+    Examples
+    --------
+    Compute and display the prominence ratio over time of the tones detected in a signal.
+
+    >>> from ansys.sound.core.psychoacoustics import ProminenceRatioOverTime
+    >>> prominence_ratio = ProminenceRatioOverTime(
+    ...     signal=my_signal, window_length=1.0, overlap=50.0
+    ... )
+    >>> prominence_ratio.process()
+    >>> max_pr_over_time = prominence_ratio.get_max_PR_over_time()
+    >>> time_scale = prominence_ratio.get_time_scale()
+    >>> prominence_ratio.plot()
+
+    Compute the prominence ratio over time at specific frequencies.
+
+    >>> prominence_ratio = ProminenceRatioOverTime(
+    ...     signal=my_signal, frequency_list=[500, 1000]
+    ... )
+    >>> prominence_ratio.process()
+    >>> pr_values = prominence_ratio.get_PR_values_over_time()
+
+    .. seealso::
+        :ref:`calculate_PR_and_TNR`
+            Example demonstrating how to compute tone-to-noise ratio and prominence ratio.
+    """
+
+    _operator_id = "compute_PR"
+    _ratio_name = "PR"
+
+    def get_PR_values_over_time(self) -> np.ndarray:
+        """Get the tones' PR values over time.
+
+        Returns
+        -------
+        numpy.ndarray
+            Tones' PR values in dB, with shape (frames, tones). If :attr:`frequency_list` is
+            specified, the tones are those of the list, in the same order. Otherwise, the tones
+            are those detected in each frame, and the array is padded with NaN in the frames where
+            fewer tones are detected.
+        """
+        return self.get_output_as_nparray()[1]
+
+    def get_max_PR_over_time(self) -> np.ndarray:
+        """Get the maximum PR value over time.
+
+        Returns
+        -------
+        numpy.ndarray
+            Maximum PR value in dB in each frame.
+        """
+        return self.get_output_as_nparray()[5]
@@ -24,8 +24,7 @@
 
 import warnings
 
-from ansys.dpf.core import Field, Operator, types
-import matplotlib.pyplot as plt
+from ansys.dpf.core import Field, types
 import numpy as np
 
 from . import PsychoacousticsParent
@@ -42,7 +41,7 @@ class Roughness(PsychoacousticsParent):
     model described in Daniel and Weber's reference paper.
 
     .. seealso::
-        :class:`RoughnessECMA418_2`, :class:`FluctuationStrength`
+        :class:`RoughnessECMA418_2`, :class:`FluctuationStrength`, :class:`IndicatorOverTime`
 
     References
     ----------
@@ -74,7 +73,7 @@ class Roughness(PsychoacousticsParent):
         """
         super().__init__()
         self.signal = signal
-        self.__operator = Operator(ID_COMPUTE_ROUGHNESS)
+        self.__operator = self._get_pooled_operator(ID_COMPUTE_ROUGHNESS)
 
     def __str__(self):
         """Return the string representation of the object."""
@@ -250,6 +249,8 @@ class Roughness(PsychoacousticsParent):
 
     def plot(self):
         """Plot the specific roughness and the roughness over time."""
+        import matplotlib.pyplot as plt
+
         if self._output is None:
             raise PyAnsysSoundException(
                 "Output is not processed yet. Use the `Roughness.process()` method."
@@ -24,8 +24,7 @@
 
 import warnings
 
-from ansys.dpf.core import Field, Operator, types
-import matplotlib.pyplot as plt
+from ansys.dpf.core import Field, types
 import numpy as np
 
 from . import FIELD_DIFFUSE, FIELD_FREE, PsychoacousticsParent
@@ -73,7 +72,7 @@ class RoughnessECMA418_2(PsychoacousticsParent, min_sound_version="2027.1.0"):
         super().__init__()
         self.signal = signal
         self.field_type = field_type
-        self.__operator = Operator(ID_COMPUTE_ROUGHNESS_ECMA418_2)
+        self.__operator = self._get_pooled_operator(ID_COMPUTE_ROUGHNESS_ECMA418_2)
 
     def __str__(self):
         """Return the string representation of the object."""
@@ -264,6 +263,8 @@ class RoughnessECMA418_2(PsychoacousticsParent, min_sound_version="2027.1.0"):
 
     def plot(self):
         """Plot the specific roughness and the roughness over time."""
+        import matplotlib.pyplot as plt
+
         if self._output is None:
             raise PyAnsysSoundException(
                 f"Output is not processed yet. Use the `{__class__.__name__}.process()` method."
@@ -24,7 +24,7 @@
 
 import warnings
 
-from ansys.dpf.core import Field, Operator, types
+from ansys.dpf.core import Field, types
 import numpy as np
 
 from . import FIELD_DIFFUSE, FIELD_FREE, PsychoacousticsParent
@@ -74,7 +74,7 @@ class SharpnessDIN45692(PsychoacousticsParent):
         super().__init__()
         self.signal = signal
         self.field_type = field_type
-        self.__operator = Operator(ID_COMPUTE_SHARPNESS_DIN)
+        self.__operator = self._get_pooled_operator(ID_COMPUTE_SHARPNESS_DIN)
 
     def __str__(self):
         """Return the string representation of the object."""
@@ -24,8 +24,7 @@
 
 import warnings
 
-from ansys.dpf.core import Field, Operator, types
-import matplotlib.pyplot as plt
+from ansys.dpf.core import Field, types
 import numpy as np
 
 from . import FIELD_DIFFUSE, FIELD_FREE, PsychoacousticsParent
@@ -78,7 +77,7 @@ class SharpnessDIN45692OverTime(PsychoacousticsParent):
         super().__init__()
         self.signal = signal
         self.field_type = field_type
-        self.__operator = Operator(ID_COMPUTE_SHARPNESS_DIN)
+        self.__operator = self._get_pooled_operator(ID_COMPUTE_SHARPNESS_DIN)
 
     def __str__(self):
         """Return the string representation of the object."""
@@ -223,6 +222,8 @@ class SharpnessDIN45692OverTime(PsychoacousticsParent):
 
     def plot(self):
         """Plot the DIN 45692 sharpness over time."""
+        import matplotlib.pyplot as plt
+
         if self._output == None:
             raise PyAnsysSoundException(
                 f"Output is not processed yet. Use the `{__class__.__name__}.process()` method."
@@ -24,7 +24,7 @@
 
 import warnings
 
-from ansys.dpf.core import Field, Operator
+from ansys.dpf.core import Field
 import numpy as np
 
 from . import PsychoacousticsParent
@@ -38,7 +38,8 @@ class SpectralCentroid(PsychoacousticsParent):
     distribution of the spectral energy of a signal.
 
     .. seealso::
-        :class:`Sharpness`, :class:`SharpnessDIN45692`
+        :class:`Sharpness`, :class:`SharpnessDIN45692`, :class:`SpectralDescriptorsOverTime`,
+        :class:`IndicatorOverTime`
 
     Examples
     --------
@@ -60,7 +61,7 @@ class SpectralCentroid(PsychoacousticsParent):
         """
         super().__init__()
         self.signal = signal
-        self.__operator = Operator("compute_spectral_centroid")
+        self.__operator = self._get_pooled_operator("compute_spectral_centroid")
 
     @property
     def signal(self) -> Field:
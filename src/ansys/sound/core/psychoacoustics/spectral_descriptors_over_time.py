@@ -0,0 +1,576 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Computes spectral descriptors over time from a short-time Fourier transform."""
+
+import warnings
+
+from ansys.dpf.core import Field
+import numpy as np
+
+from . import PsychoacousticsParent
+from .._framing import _get_hop_size
+from .._pyansys_sound import PyAnsysSoundException, PyAnsysSoundWarning, _create_signal_field
+from ..spectrogram_processing import Stft
+
+# Names of the spectral descriptors, in the order of the output.
+SPECTRAL_DESCRIPTORS = ("centroid", "spread", "flatness", "roll_off", "flux")
+
+
+def _compute_spectral_descriptors(
+    magnitudes: np.ndarray,
+    frequencies: np.ndarray,
+    roll_off_percentage: float,
+    previous_magnitude: np.ndarray = None,
+) -> tuple[np.ndarray]:
+    """Compute the spectral descriptors of successive spectra.
+
+    Parameters
+    ----------
+    magnitudes : numpy.ndarray
+        One-sided magnitude spectra, with shape (frames, frequencies).
+    frequencies : numpy.ndarray
+        Frequencies of the spectra, in Hz.
+    roll_off_percentage : float
+        Percentage of the spectral energy below the roll-off frequency.
+    previous_magnitude : numpy.ndarray, default: None
+        Magnitude spectrum of the frame preceding the first frame, used to compute its flux. If
+        unspecified, the flux of the first frame is 0.
+
+    Returns
+    -------
+    tuple[numpy.ndarray]
+        Spectral centroid, spread, flatness, roll-off, and flux, one value per frame. The
+        descriptors of silent frames are 0.
+    """
+    magnitudes = np.asarray(magnitudes, dtype=np.float64)
+    powers = magnitudes**2
+    magnitude_sums = magnitudes.sum(axis=1)
+    power_sums = powers.sum(axis=1)
+    is_silent = power_sums <= 0.0
+
+    def divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+        return np.divide(numerator, denominator, out=np.zeros(len(numerator)), where=~is_silent)
+
+    centroid = divide(magnitudes @ frequencies, magnitude_sums)
+    spread = np.sqrt(
+        divide(
+            (magnitudes * (frequencies - centroid[:, np.newaxis]) ** 2).sum(axis=1), magnitude_sums
+        )
+    )
+
+    # Ratio of the geometric mean to the arithmetic mean of the power spectrum.
+    tiny = np.finfo(np.float64).tiny
+    flatness = divide(np.exp(np.log(powers + tiny).mean(axis=1)), powers.mean(axis=1))
+
+    cumulative_powers = np.cumsum(powers, axis=1)
+    roll_off_indexes = np.argmax(
+        cumulative_powers >= (roll_off_percentage / 100.0) * power_sums[:, np.newaxis], axis=1
+    )
+    roll_off = np.where(is_silent, 0.0, frequencies[roll_off_indexes])
+
+    if previous_magnitude is None:
+        previous_magnitude = magnitudes[:1]
+    flux = np.sqrt(
+        (np.diff(magnitudes, axis=0, prepend=np.reshape(previous_magnitude, (1, -1))) ** 2).sum(
+            axis=1
+        )
+    )
+
+    return centroid, spread, flatness, roll_off, flux
+
+
+class SpectralDescriptorsOverTime(PsychoacousticsParent):
+    """Computes spectral descriptors over time from a short-time Fourier transform (STFT).
+
+    This class computes the spectral centroid, spread, flatness, roll-off, and flux over time, of
+    one or several channels. For each channel, the STFT is computed once, and all descriptors are
+    derived from its magnitude, in a single vectorized pass:
+
+    -   The centroid is the magnitude-weighted mean frequency, in Hz.
+
+    -   The spread is the magnitude-weighted standard deviation of the frequency around the
+        centroid, in Hz.
+
+    -   The flatness is the ratio of the geometric mean to the arithmetic mean of the power
+        spectrum, between 0 (pure tone) and 1 (white noise).
+
+    -   The roll-off is the frequency, in Hz, below which a given percentage of the spectral energy
+        lies.
+
+    -   The flux is the Euclidean distance between the magnitude spectra of two successive frames,
+        in the unit of the signal.
+
+    The signal can also be processed block by block, with :meth:`push`, for example for live
+    monitoring. In this case, the descriptors of the frames that are complete are output with each
+    block, and the flux carries over from one block to the next.
+
+    .. seealso::
+        :class:`SpectralCentroid`, :class:`Stft`
+
+    Examples
+    --------
+    Compute the spectral descriptors over time of a signal.
+
+    >>> from ansys.sound.core.psychoacoustics import SpectralDescriptorsOverTime
+    >>> descriptors = SpectralDescriptorsOverTime(signal=my_signal, fft_size=2048)
+    >>> descriptors.process()
+    >>> centroid = descriptors.get_spectral_centroid_over_time()
+    >>> flatness = descriptors.get_spectral_flatness_over_time()
+    >>> descriptors.plot()
+
+    Compute the spectral descriptors of a two-channel signal provided as successive blocks.
+
+    >>> descriptors = SpectralDescriptorsOverTime()
+    >>> for left_block, right_block in my_blocks:
+    ...     centroid, spread, flatness, roll_off, flux, time = descriptors.push(
+    ...         [left_block, right_block]
+    ...     )
+    """
+
+    def __init__(
+        self,
+        signal: Field | list[Field] = None,
+        fft_size: int = 2048,
+        window_type: str = "HANN",
+        window_overlap: float = 0.5,
+        roll_off_percentage: float = 85.0,
+    ):
+        """Class instantiation takes the following parameters.
+
+        Parameters
+        ----------
+        signal : Field | list[Field], default: None
+            Signal on which to compute the spectral descriptors, as a DPF field, or as a list of
+            DPF fields (one per channel) with the same sampling frequency and duration.
+        fft_size : int, default: 2048
+            Size of the FFT used to compute the STFT.
+        window_type : str, default: 'HANN'
+            Window type used for the FFT computation. Options are ``'TRIANGULAR'``, ``'BLACKMAN'``,
+            ``'BLACKMANHARRIS'``, ``'HAMMING'``, ``'HANN'``, ``'GAUSS'``, ``'FLATTOP'``, and
+            ``'RECTANGULAR'``.
+        window_overlap : float, default: 0.5
+            Overlap value between two successive FFT computations. Values can range from 0 to 1.
+        roll_off_percentage : float, default: 85.0
+            Percentage of the spectral energy below the roll-off frequency.
+        """
+        super().__init__()
+        self.__stft = Stft(server=self._server)
+        self.signal = signal
+        self.fft_size = fft_size
+        self.window_type = window_type
+        self.window_overlap = window_overlap
+        self.roll_off_percentage = roll_off_percentage
+        self.reset()
+
+    def __str__(self):
+        """Return the string representation of the object."""
+        if self.signal is None:
+            str_name = "Not set"
+        elif isinstance(self.signal, Field):
+            str_name = f'"{self.signal.name}"'
+        else:
+            str_name = ", ".join(f'"{channel.name}"' for channel in self.signal)
+
+        return (
+            f"{__class__.__name__} object\n"
+            "Data:\n"
+            f"\tSignal name: {str_name}\n"
+            f"\tFFT size: {self.fft_size}\n"
+            f"\tWindow type: {self.window_type}\n"
+            f"\tWindow overlap: {self.window_overlap}\n"
+            f"\tRoll-off percentage: {self.roll_off_percentage} %"
+        )
+
+    @property
+    def signal(self) -> Field | list[Field]:
+        """Input signal, as a DPF field, or as a list of DPF fields (one per channel)."""
+        return self.__signal
+
+    @signal.setter
+    def signal(self, signal: Field | list[Field]):
+        """Set the signal."""
+        if signal is not None:
+            if isinstance(signal, list):
+                if len(signal) == 0 or not all(isinstance(f, Field) for f in signal):
+                    raise PyAnsysSoundException(
+                        "The input signal list must contain at least one DPF field."
+                    )
+            elif not isinstance(signal, Field):
+                raise PyAnsysSoundException(
+                    "Signal must be specified as a DPF field or a list of DPF fields."
+                )
+        self.__signal = signal
+
+    @property
+    def fft_size(self) -> int:
+        """Number of FFT points."""
+        return self.__stft.fft_size
+
+    @fft_size.setter
+    def fft_size(self, fft_size: int):
+        """Set the FFT size."""
+        self.__stft.fft_size = fft_size
+
+    @property
+    def window_type(self) -> str:
+        """Window type.
+
+        Supported options are ``'TRIANGULAR'``, ``'BLACKMAN'``, ``'BLACKMANHARRIS'``, ``'HAMMING'``,
+        ``'HANN'``, ``'GAUSS'``, ``'FLATTOP'``, and ``'RECTANGULAR'``.
+        """
+        return self.__stft.window_type
+
+    @window_type.setter
+    def window_type(self, window_type: str):
+        """Set the window type."""
+        self.__stft.window_type = window_type
+
+    @property
+    def window_overlap(self) -> float:
+        """Window overlap, between 0 and 1."""
+        return self.__stft.window_overlap
+
+    @window_overlap.setter
+    def window_overlap(self, window_overlap: float):
+        """Set the window overlap."""
+        self.__stft.window_overlap = window_overlap
+
+    @property
+    def roll_off_percentage(self) -> float:
+        """Percentage of the spectral energy below the roll-off frequency."""
+        return self.__roll_off_percentage
+
+    @roll_off_percentage.setter
+    def roll_off_percentage(self, roll_off_percentage: float):
+        """Set the roll-off percentage."""
+        if not (0.0 < roll_off_percentage <= 100.0):
+            raise PyAnsysSoundException(
+                "Roll-off percentage must be strictly positive and smaller than or equal to 100 %."
+            )
+        self.__roll_off_percentage = roll_off_percentage
+
+    def reset(self):
+        """Reset the block processing.
+
+        This method discards the samples and spectra retained from the previous blocks, so that the
+        next block pushed with :meth:`push` is processed as the start of a new signal.
+        """
+        self.__sampling_frequency = None
+        self.__buffers = None
+        self.__buffer_start = 0
+        self.__previous_magnitudes = None
+        self._output = None
+
+    def process(self):
+        """Compute the spectral descriptors over time of the whole signal.
+
+        This method calls the appropriate DPF Sound operator to compute the STFT of each channel of
+        the signal, and derives all spectral descriptors from it.
+        """
+        if self.signal is None:
+            raise PyAnsysSoundException(
+                f"No signal found for spectral descriptors computation. "
+                f"Use `{__class__.__name__}.signal`."
+            )
+
+        channels = [self.signal] if isinstance(self.signal, Field) else self.signal
+        descriptors = []
+        for channel in channels:
+            magnitudes, frequencies, time = self.__compute_magnitudes(channel)
+            descriptors.append(
+                _compute_spectral_descriptors(magnitudes, frequencies, self.roll_off_percentage)
+            )
+
+        self.__store_output(descriptors, time)
+
+    def push(self, block: Field | list[Field]) -> tuple[np.ndarray]:
+        """Compute the spectral descriptors over time of the next block of the signal.
+
+        The block is appended to the samples retained from the previous blocks, and the descriptors
+        of the frames that are complete are output. The remaining samples are retained for the
+        next block.
+
+        Parameters
+        ----------
+        block : Field | list[Field]
+            Next block of the signal, as a DPF field, or as a list of DPF fields (one per channel)
+            with the same number of samples. The sampling frequency and the number of channels must
+            be those of the previous blocks.
+
+        Returns
+        -------
+        tuple[numpy.ndarray]
+            Spectral descriptors of the new frames, as in :meth:`get_output`.
+        """
+        channels = [block] if isinstance(block, Field) else block
+        if not (
+            isinstance(channels, list)
+            and len(channels) > 0
+            and all(isinstance(channel, Field) for channel in channels)
+        ):
+            raise PyAnsysSoundException(
+                "Block must be specified as a DPF field or a list of DPF fields."
+            )
+
+        time_data = channels[0].time_freq_support.time_frequencies.data
+        if len(time_data) < 2:
+            raise PyAnsysSoundException("Specified block must have at least two samples.")
+        sampling_frequency = 1 / (time_data[1] - time_data[0])
+
+        if self.__buffers is None:
+            self.__sampling_frequency = sampling_frequency
+            self.__buffers = [np.zeros(0) for _ in channels]
+        elif np.round(sampling_frequency, 1) != np.round(self.__sampling_frequency, 1):
+            raise PyAnsysSoundException(
+                f"Specified block's sampling frequency ({sampling_frequency:.1f} Hz) must match "
+                f"the sampling frequency of the previous blocks "
+                f"({self.__sampling_frequency:.1f} Hz). Use `{__class__.__name__}.reset()` to "
+                f"start a new signal."
+            )
+        elif len(channels) != len(self.__buffers):
+            raise PyAnsysSoundException(
+                f"Specified block's number of channels ({len(channels)}) must match the number of "
+                f"channels of the previous blocks ({len(self.__buffers)})."
+            )
+
+        buffers = [
+            np.concatenate((buffer, np.array(channel.data, dtype=np.float64)))
+            for buffer, channel in zip(self.__buffers, channels)
+        ]
+        if len(set(len(buffer) for buffer in buffers)) > 1:
+            raise PyAnsysSoundException("All channels of a block must have the same length.")
+
+        # Only the frames entirely within the retained and new samples are complete.
+        hop_size = _get_hop_size(self.fft_size, self.window_overlap)
+        frame_count = max(0, 1 + (len(buffers[0]) - self.fft_size) // hop_size)
+
+        descriptors = []
+        time = np.zeros(0)
+        previous_magnitudes = []
+        for channel_index, buffer in enumerate(buffers):
+            if frame_count == 0:
+                descriptors.append(tuple(np.zeros(0) for _ in SPECTRAL_DESCRIPTORS))
+                continue
+
+            channel = _create_signal_field(
+                buffer[: (frame_count - 1) * hop_size + self.fft_size],
+                self.__sampling_frequency,
+                server=self._server,
+            )
+            magnitudes, frequencies, time = self.__compute_magnitudes(channel)
+            magnitudes, time = magnitudes[:frame_count], time[:frame_count]
+            descriptors.append(
+                _compute_spectral_descriptors(
+                    magnitudes,
+                    frequencies,
+                    self.roll_off_percentage,
+                    (
+                        self.__previous_magnitudes[channel_index]
+                        if self.__previous_magnitudes is not None
+                        else None
+                    ),
+                )
+            )
+            previous_magnitudes.append(magnitudes[-1])
+
+        if frame_count > 0:
+            self.__previous_magnitudes = previous_magnitudes
+        time = self.__buffer_start / self.__sampling_frequency + time
+        self.__buffers = [buffer[frame_count * hop_size :] for buffer in buffers]
+        self.__buffer_start += frame_count * hop_size
+
+        self.__store_output(descriptors, time)
+        return self.get_output_as_nparray()
+
+    def __compute_magnitudes(self, signal: Field) -> tuple[np.ndarray]:
+        """Compute the one-sided STFT magnitude of a signal.
+
+        Parameters
+        ----------
+        signal : Field
+            Signal.
+
+        Returns
+        -------
+        tuple[numpy.ndarray]
+            -   First element: magnitude spectra, with shape (frames, frequencies).
+
+            -   Second element: frequencies in Hz.
+
+            -   Third element: time of the frames, in s.
+        """
+        self.__stft.signal = signal
+        self.__stft.process()
+
+        magnitudes = self.__stft.get_stft_magnitude_as_nparray()
+        magnitudes = np.transpose(magnitudes[: self.fft_size // 2 + 1])
+
+        time_data = signal.time_freq_support.time_frequencies.data
+        frequencies = np.arange(magnitudes.shape[1]) / (
+            self.fft_size * (time_data[1] - time_data[0])
+        )
+        time = np.array(self.__stft.get_output().time_freq_support.time_frequencies.data)
+
+        return magnitudes, frequencies, time
+
+    def __store_output(self, descriptors: list[tuple[np.ndarray]], time: np.ndarray):
+        """Store the descriptors of all channels, with shape (channels, frames)."""
+        self._output = tuple(
+            np.array([channel_descriptors[i] for channel_descriptors in descriptors])
+            for i in range(len(SPECTRAL_DESCRIPTORS))
+        ) + (time,)
+
+    def get_output(self) -> tuple[np.ndarray]:
+        """Get the spectral descriptors over time.
+
+        Returns
+        -------
+        tuple[numpy.ndarray]
+            -   First element: spectral centroid in Hz.
+
+            -   Second element: spectral spread in Hz.
+
+            -   Third element: spectral flatness.
+
+            -   Fourth element: spectral roll-off in Hz.
+
+            -   Fifth element: spectral flux, in the unit of the signal.
+
+            -   Sixth element: time of the frames, in s.
+
+            The first five elements have the shape (channels, frames).
+        """
+        if self._output == None:
+            warnings.warn(
+                PyAnsysSoundWarning(
+                    f"Output is not processed yet. Use the `{__class__.__name__}.process()` method."
+                )
+            )
+
+        return self._output
+
+    def get_output_as_nparray(self) -> tuple[np.ndarray]:
+        """Get the spectral descriptors over time, as NumPy arrays.
+
+        Returns
+        -------
+        tuple[numpy.ndarray]
+            Same as :meth:`get_output`. If the output is not processed yet, the arrays are empty.
+        """
+        output = self.get_output()
+
+        if output == None:
+            return tuple(np.array([]) for _ in range(len(SPECTRAL_DESCRIPTORS) + 1))
+
+        return output
+
+    def get_spectral_centroid_over_time(self) -> np.ndarray:
+        """Get the spectral centroid over time.
+
+        Returns
+        -------
+        numpy.ndarray
+            Spectral centroid in Hz, with shape (channels, frames).
+        """
+        return self.get_output_as_nparray()[0]
+
+    def get_spectral_spread_over_time(self) -> np.ndarray:
+        """Get the spectral spread over time.
+
+        Returns
+        -------
+        numpy.ndarray
+            Spectral spread in Hz, with shape (channels, frames).
+        """
+        return self.get_output_as_nparray()[1]
+
+    def get_spectral_flatness_over_time(self) -> np.ndarray:
+        """Get the spectral flatness over time.
+
+        Returns
+        -------
+        numpy.ndarray
+            Spectral flatness, between 0 and 1, with shape (channels, frames).
+        """
+        return self.get_output_as_nparray()[2]
+
+    def get_spectral_roll_off_over_time(self) -> np.ndarray:
+        """Get the spectral roll-off over time.
+
+        Returns
+        -------
+        numpy.ndarray
+            Spectral roll-off in Hz, with shape (channels, frames).
+        """
+        return self.get_output_as_nparray()[3]
+
+    def get_spectral_flux_over_time(self) -> np.ndarray:
+        """Get the spectral flux over time.
+
+        Returns
+        -------
+        numpy.ndarray
+            Spectral flux, in the unit of the signal, with shape (channels, frames).
+        """
+        return self.get_output_as_nparray()[4]
+
+    def get_time_scale(self) -> np.ndarray:
+        """Get the time scale.
+
+        Returns
+        -------
+        numpy.ndarray
+            Time of the frames, in s.
+        """
+        return self.get_output_as_nparray()[5]
+
+    def plot(self):
+        """Plot the spectral descriptors over time, for all channels."""
+        import matplotlib.pyplot as plt
+
+        if self._output == None:
+            raise PyAnsysSoundException(
+                f"Output is not processed yet. Use the `{__class__.__name__}.process()` method."
+            )
+
+        time = self.get_time_scale()
+        labels = (
+            "Centroid (Hz)",
+            "Spread (Hz)",
+            "Flatness",
+            f"Roll-off {self.roll_off_percentage} % (Hz)",
+            "Flux",
+        )
+
+        _, axes = plt.subplots(len(labels), 1, sharex=True)
+        for ax, values, label in zip(axes, self.get_output_as_nparray(), labels):
+            for channel_index, channel_values in enumerate(values):
+                ax.plot(time, channel_values, label=f"Channel {channel_index}")
+            ax.set_ylabel(label)
+            ax.grid(True)
+        axes[0].set_title("Spectral descriptors over time")
+        axes[0].legend()
+        axes[-1].set_xlabel("Time (s)")
+
+        plt.tight_layout()
+        plt.show()
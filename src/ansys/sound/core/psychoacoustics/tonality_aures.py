@@ -24,8 +24,7 @@
 
 import warnings
 
-from ansys.dpf.core import Field, Operator, types
-import matplotlib.pyplot as plt
+from ansys.dpf.core import Field, types
 import numpy as np
 
 from . import PsychoacousticsParent
@@ -40,7 +39,8 @@ class TonalityAures(PsychoacousticsParent):
 
     .. seealso::
         :class:`TonalityDIN45681`, :class:`TonalityISOTS20065`, :class:`TonalityECMA418_2`,
-        :class:`TonalityISO1996_2`, :class:`TonalityISO1996_2_OverTime`
+        :class:`TonalityISO1996_2`, :class:`TonalityISO1996_2_OverTime`,
+        :class:`IndicatorOverTime`
 
     References
     ----------
@@ -93,7 +93,7 @@ class TonalityAures(PsychoacousticsParent):
         self.overlap = overlap
         self.account_for_w1 = account_for_w1
         self.w1_threshold = w1_threshold
-        self.__operator = Operator(ID_COMPUTE_TONALITY_AURES)
+        self.__operator = self._get_pooled_operator(ID_COMPUTE_TONALITY_AURES)
 
     def __str__(self) -> str:
         """Return the string representation of the object."""
@@ -321,6 +321,8 @@ class TonalityAures(PsychoacousticsParent):
 
     def plot(self):
         """Plot the tonality over time."""
+        import matplotlib.pyplot as plt
+
         if self._output is None:
             raise PyAnsysSoundException(
                 f"Output is not processed yet. Use the {__class__.__name__}.process() method."
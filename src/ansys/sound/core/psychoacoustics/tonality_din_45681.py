@@ -24,8 +24,7 @@
 
 import warnings
 
-from ansys.dpf.core import Field, GenericDataContainersCollection, Operator, types
-import matplotlib.pyplot as plt
+from ansys.dpf.core import Field, GenericDataContainersCollection, types
 import numpy as np
 
 from . import PsychoacousticsParent
@@ -36,6 +35,21 @@ ID_COMPUTE_TONALITY_DIN_45681 = "compute_tonality_din45681"
 
 TONE_TYPES = ("", "FG")
 
+# Names of the per-tone properties in the tonality details collection, and corresponding field
+# names in the structured array returned by TonalityDIN45681.get_all_tone_details().
+TONE_DETAILS_PROPERTIES = (
+    ("differences", "decisive_difference"),
+    ("uncertainties", "uncertainty"),
+    ("frequencies", "decisive_frequency"),
+    ("types", "tone_type"),
+    ("critical_band_lower_limits", "critical_band_lower_limit"),
+    ("critical_band_upper_limits", "critical_band_upper_limit"),
+    ("mean_narrowband_masking_noise_levels", "mean_narrowband_masking_noise_level"),
+    ("tone_levels", "tone_level"),
+    ("masking_noise_levels", "masking_noise_level"),
+    ("masking_indices", "masking_index"),
+)
+
 
 class TonalityDIN45681(PsychoacousticsParent):
     """Computes DIN 45681 tonality.
@@ -80,7 +94,7 @@ class TonalityDIN45681(PsychoacousticsParent):
         self.signal = signal
         self.window_length = window_length
         self.overlap = overlap
-        self.__operator = Operator(ID_COMPUTE_TONALITY_DIN_45681)
+        self.__operator = self._get_pooled_operator(ID_COMPUTE_TONALITY_DIN_45681)
 
     def __str__(self):
         """Return the string representation of the object."""
@@ -360,10 +374,12 @@ class TonalityDIN45681(PsychoacousticsParent):
         # Check validity of the input spectrum index.
         self.__check_spectrum_index(spectrum_index)
 
+        output = self.get_output_as_nparray()
+
         return (
-            self.get_output_as_nparray()[3][spectrum_index],
-            self.get_output_as_nparray()[4][spectrum_index],
-            self.get_output_as_nparray()[5][spectrum_index],
+            output[3][spectrum_index],
+            output[4][spectrum_index],
+            output[5][spectrum_index],
         )
 
     def get_tone_number(self, spectrum_index: int) -> int:
@@ -432,17 +448,18 @@ class TonalityDIN45681(PsychoacousticsParent):
         # Check validities of input indexes.
         self.__check_spectrum_index(spectrum_index)
 
-        if tone_index >= self.get_tone_number(spectrum_index):
-            raise PyAnsysSoundException(
-                f"Tone index {tone_index} is out of bounds "
-                f"(total tone count in specified spectrum is {self.get_spectrum_number()})."
-            )
-
         # Extract collection.
         collection = self.get_output()[7]
         # Extract spectrum tones' data from collection, as a GenericDataContainer.
         spectrum = collection.get_entry(spectrum_index)
 
+        tone_count = len(spectrum.get_property("differences"))
+        if tone_index >= tone_count:
+            raise PyAnsysSoundException(
+                f"Tone index {tone_index} is out of bounds "
+                f"(total tone count in specified spectrum is {tone_count})."
+            )
+
         return (
             spectrum.get_property("differences").data[tone_index],
             spectrum.get_property("uncertainties").data[tone_index],
@@ -456,12 +473,93 @@ class TonalityDIN45681(PsychoacousticsParent):
             spectrum.get_property("masking_indices").data[tone_index],
         )
 
+    def get_all_tone_details(self) -> np.ndarray:
+        """Get the data of all detected tones, in all spectra, in a single structured array.
+
+        Unlike calling :meth:`get_tone_details` for each spectrum and each tone, this method reads
+        each tone property of a spectrum only once, in bulk, which is much faster when many tones
+        are detected.
+
+        Returns
+        -------
+        numpy.ndarray
+            Structured array with one element per detected tone, ordered by spectrum index then
+            tone index, and the following fields:
+
+            -   ``"spectrum_index"`` (int): index of the spectrum where the tone was detected.
+
+            -   ``"time"`` (float): time of the spectrum, in s.
+
+            -   ``"decisive_difference"`` (float): decisive difference DLj, in dB.
+
+            -   ``"uncertainty"`` (float): uncertainty, in dB.
+
+            -   ``"decisive_frequency"`` (float): decisive frequency, in Hz.
+
+            -   ``"tone_type"`` (str): tone type ('' for individual tones, or 'FG' for groups
+                of tones).
+
+            -   ``"critical_band_lower_limit"`` (float): critical band lower limit, in Hz.
+
+            -   ``"critical_band_upper_limit"`` (float): critical band upper limit, in Hz.
+
+            -   ``"mean_narrowband_masking_noise_level"`` (float): mean narrow-band masking
+                noise level Ls, in dBA.
+
+            -   ``"tone_level"`` (float): tone level Lt, in dBA.
+
+            -   ``"masking_noise_level"`` (float): masking noise level Lg, in dBA.
+
+            -   ``"masking_index"`` (float): masking index av, in dB.
+
+            If the output is not processed yet, the returned array is empty.
+        """
+        dtype = [("spectrum_index", np.int64), ("time", np.float64)] + [
+            (name, "U2" if name == "tone_type" else np.float64)
+            for _, name in TONE_DETAILS_PROPERTIES
+        ]
+
+        output = self.get_output()
+        if output == None:
+            return np.zeros(0, dtype=dtype)
+
+        time_scale = self.get_time_scale()
+        collection = output[7]
+
+        # Read each property once per spectrum, rather than once per tone.
+        columns = {name: [] for _, name in TONE_DETAILS_PROPERTIES}
+        spectrum_indexes = []
+        for spectrum_index in range(len(time_scale)):
+            spectrum = collection.get_entry(spectrum_index)
+            for property_name, name in TONE_DETAILS_PROPERTIES:
+                columns[name].append(np.asarray(spectrum.get_property(property_name).data))
+            spectrum_indexes.append(
+                np.full(len(columns["decisive_difference"][-1]), spectrum_index)
+            )
+
+        if len(spectrum_indexes) == 0:
+            return np.zeros(0, dtype=dtype)
+
+        spectrum_indexes = np.concatenate(spectrum_indexes)
+        details = np.zeros(len(spectrum_indexes), dtype=dtype)
+        details["spectrum_index"] = spectrum_indexes
+        details["time"] = time_scale[spectrum_indexes]
+        for name, values in columns.items():
+            values = np.concatenate(values)
+            if name == "tone_type":
+                values = np.asarray(TONE_TYPES)[values.astype(int)]
+            details[name] = values
+
+        return details
+
     def plot(self):
         """Plot the DIN 45681's decisive difference and frequency, and tonal adjustment, over time.
 
         This method displays the decisive difference DLj in dB, the decisive frequency in Hz, and
         the tonal adjustment Kt in dB, over time.
         """
+        import matplotlib.pyplot as plt
+
         if self._output == None:
             raise PyAnsysSoundException(
                 f"Output is not processed yet. Use the `{__class__.__name__}.process()` method."
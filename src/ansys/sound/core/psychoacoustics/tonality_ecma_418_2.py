@@ -24,8 +24,7 @@
 
 import warnings
 
-from ansys.dpf.core import Field, Operator, _global_server, types
-import matplotlib.pyplot as plt
+from ansys.dpf.core import Field, _global_server, types
 import numpy as np
 
 from . import FIELD_DIFFUSE, FIELD_FREE, PsychoacousticsParent
@@ -98,12 +97,13 @@ class TonalityECMA418_2(PsychoacousticsParent):
         super().__init__()
 
         # Determine if the server version is higher than or equal to 11.0.
-        self.__server_meets_version_11 = _global_server().meet_version("11.0")
+        server = self._server if self._server is not None else _global_server()
+        self.__server_meets_version_11 = server.meet_version("11.0")
 
         self.signal = signal
         self.field_type = field_type
         self.edition = edition
-        self.__operator = Operator(ID_COMPUTE_TONALITY_ECMA_418_2)
+        self.__operator = self._get_pooled_operator(ID_COMPUTE_TONALITY_ECMA_418_2)
 
     def __str__(self):
         """Return the string representation of the object."""
@@ -340,6 +340,8 @@ class TonalityECMA418_2(PsychoacousticsParent):
 
         This method displays the tonality in dB and the tone frequency in Hz, over time.
         """
+        import matplotlib.pyplot as plt
+
         if self._output == None:
             raise PyAnsysSoundException(
                 f"Output is not processed yet. Use the ``{__class__.__name__}.process()`` method."
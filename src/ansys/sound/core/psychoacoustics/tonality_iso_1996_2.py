@@ -24,7 +24,7 @@
 
 import warnings
 
-from ansys.dpf.core import DataTree, Field, Operator, types
+from ansys.dpf.core import DataTree, Field, types
 import numpy as np
 
 from . import PsychoacousticsParent
@@ -95,7 +95,7 @@ class TonalityISO1996_2(PsychoacousticsParent):
         self.noise_pause_threshold = noise_pause_threshold
         self.effective_analysis_bandwidth = effective_analysis_bandwidth
         self.noise_bandwidth_ratio = noise_bandwidth_ratio
-        self.__operator = Operator(ID_COMPUTE_TONALITY_ISO1996_2)
+        self.__operator = self._get_pooled_operator(ID_COMPUTE_TONALITY_ISO1996_2)
 
     def __str__(self):
         """Return the string representation of the object."""
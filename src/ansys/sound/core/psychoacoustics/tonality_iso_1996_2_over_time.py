@@ -24,15 +24,8 @@
 
 import warnings
 
-from ansys.dpf.core import (
-    Field,
-    GenericDataContainer,
-    GenericDataContainersCollection,
-    Operator,
-    types,
-)
+from ansys.dpf.core import Field, GenericDataContainer, GenericDataContainersCollection, types
 from ansys.dpf.core.collection import Collection
-import matplotlib.pyplot as plt
 import numpy as np
 
 from . import PsychoacousticsParent
@@ -119,7 +112,7 @@ class TonalityISO1996_2_OverTime(PsychoacousticsParent):
         self.noise_pause_threshold = noise_pause_threshold
         self.effective_analysis_bandwidth = effective_analysis_bandwidth
         self.noise_bandwidth_ratio = noise_bandwidth_ratio
-        self.__operator = Operator(ID_COMPUTE_TONALITY_ISO_1996_2_OVER_TIME)
+        self.__operator = self._get_pooled_operator(ID_COMPUTE_TONALITY_ISO_1996_2_OVER_TIME)
 
     def __str__(self) -> str:
         """Return the string representation of the object."""
@@ -393,8 +386,58 @@ class TonalityISO1996_2_OverTime(PsychoacousticsParent):
         segment_details = self.get_output()[2].get_entry({"spectrum_number": segment_index})
         return {key: segment_details.get_property(key) for key in LIST_SEGMENT_DETAILS_KEYS}
 
+    def get_all_segment_details(self) -> np.ndarray:
+        """Get the ISO 1996-2 tonality details of all segments, in a single structured array.
+
+        This method gathers in one array the details that :meth:`get_segment_details` returns for
+        each segment. It is a convenience only: the details are stored as separate properties of
+        each segment's DPF generic data container, so each property is still read once per
+        segment, and this method is not faster than calling :meth:`get_segment_details` in a loop.
+
+        Returns
+        -------
+        numpy.ndarray
+            Structured array with one element per segment, and the following fields:
+
+            -   Segment index (`"segment_index"`),
+
+            -   Segment start time in s (`"segment_start_time_s"`),
+
+            -   Segment end time in s (`"segment_end_time_s"`),
+
+            -   Main tone's critical band lower frequency in Hz (`"lower_critical_band_limit_Hz"`),
+
+            -   Main tone's critical band higher frequency in Hz
+                (`"higher_critical_band_limit_Hz"`),
+
+            -   Total tone level in dBA (`"total_tonal_level_dBA"`),
+
+            -   Total noise level in dBA (`"total_noise_level_dBA"`).
+
+            If the output is not processed yet, the returned array is empty.
+        """
+        dtype = [("segment_index", np.int64)] + [
+            (key, np.float64) for key in LIST_SEGMENT_DETAILS_KEYS
+        ]
+
+        segment_count = self.get_segment_count()
+        details = np.zeros(segment_count, dtype=dtype)
+        if segment_count == 0:
+            return details
+
+        collection = self.get_output()[2]
+        for segment_index in range(segment_count):
+            segment_details = collection.get_entry({"spectrum_number": segment_index})
+            details[segment_index] = (segment_index,) + tuple(
+                segment_details.get_property(key) for key in LIST_SEGMENT_DETAILS_KEYS
+            )
+
+        return details
+
     def plot(self):
         """Plot the ISO 1996-2 tonal audibility and tonal adjustment over time."""
+        import matplotlib.pyplot as plt
+
         if self._output is None:
             raise PyAnsysSoundException(
                 f"Output is not processed yet. Use the ``{__class__.__name__}.process()`` method."
@@ -24,8 +24,7 @@
 
 import warnings
 
-from ansys.dpf.core import Field, GenericDataContainersCollection, Operator, types
-import matplotlib.pyplot as plt
+from ansys.dpf.core import Field, GenericDataContainersCollection, types
 import numpy as np
 
 from . import PsychoacousticsParent
@@ -80,7 +79,7 @@ class TonalityISOTS20065(PsychoacousticsParent):
         self.signal = signal
         self.window_length = window_length
         self.overlap = overlap
-        self.__operator = Operator(ID_COMPUTE_TONALITY_ISOTS_20065)
+        self.__operator = self._get_pooled_operator(ID_COMPUTE_TONALITY_ISOTS_20065)
 
     def __str__(self):
         """Overloads the __str__ method."""
@@ -427,6 +426,8 @@ class TonalityISOTS20065(PsychoacousticsParent):
         This method displays the decisive audibility DLj in dB, and the decisive frequency in Hz,
         over time.
         """
+        import matplotlib.pyplot as plt
+
         if self._output == None:
             raise PyAnsysSoundException(
                 f"Output is not processed yet. Use the `{__class__.__name__}.process()` method."
@@ -0,0 +1,390 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Computes ECMA-418-2 tonality and roughness together."""
+
+from concurrent.futures import ThreadPoolExecutor
+import warnings
+
+from ansys.dpf.core import Field
+import numpy as np
+
+from . import FIELD_FREE, PsychoacousticsParent
+from .._pyansys_sound import PyAnsysSoundException, PyAnsysSoundWarning
+from .roughness_ecma_418_2 import RoughnessECMA418_2
+from .tonality_ecma_418_2 import TonalityECMA418_2
+
+
+class TonalityRoughnessECMA418_2(PsychoacousticsParent, min_sound_version="2027.1.0"):
+    """Computes ECMA-418-2 tonality and roughness together.
+
+    This class computes the outputs of :class:`TonalityECMA418_2` and :class:`RoughnessECMA418_2`
+    on the same signal, in a single call: tonality, tonality and tone frequency over time,
+    roughness, specific roughness, and roughness over time. Both calculations are submitted
+    concurrently to the DPF server. Depending on how many requests the server processes in
+    parallel, the processing time can therefore be shorter than the sum of the two calculations.
+    The benchmark cases ``TonalityRoughnessECMA418_2``, ``TonalityECMA418_2``, and
+    ``RoughnessECMA418_2`` allow measuring this on a given server.
+
+    .. note::
+        The roughness is computed according to the 4th edition (2025) of ECMA-418-2, as in
+        :class:`RoughnessECMA418_2`. The edition of the tonality calculation is set with
+        :attr:`edition`.
+
+    .. seealso::
+        :class:`TonalityECMA418_2`, :class:`RoughnessECMA418_2`
+
+    Examples
+    --------
+    Compute the ECMA-418-2 tonality and roughness of a signal.
+
+    >>> from ansys.sound.core.psychoacoustics import TonalityRoughnessECMA418_2
+    >>> analyzer = TonalityRoughnessECMA418_2(signal=my_signal, field_type="Free")
+    >>> analyzer.process()
+    >>> tonality_value = analyzer.get_tonality()
+    >>> roughness_value = analyzer.get_roughness()
+    >>> analyzer.plot()
+
+    .. seealso::
+        :ref:`calculate_psychoacoustic_indicators`
+            Example demonstrating how to compute various psychoacoustic indicators.
+    """
+
+    def __init__(self, signal: Field = None, field_type: str = FIELD_FREE, edition: str = "3rd"):
+        """Class instantiation takes the following parameters.
+
+        Parameters
+        ----------
+        signal : Field, default: None
+            Signal in Pa on which to compute tonality and roughness.
+        field_type : str, default: "Free"
+            Sound field type. Available options are `"Free"` and `"Diffuse"`.
+        edition : str, default: "3rd"
+            Edition of the ECMA-418-2 standard to use for the tonality calculation. Available
+            options are `"1st"` and `"3rd"`. See :class:`TonalityECMA418_2`.
+        """
+        super().__init__()
+        self.__tonality = TonalityECMA418_2(server=self._server)
+        self.__roughness = RoughnessECMA418_2(server=self._server)
+        self.signal = signal
+        self.field_type = field_type
+        self.edition = edition
+
+    def __str__(self):
+        """Return the string representation of the object."""
+        if self._output is None:
+            str_indicators = "Not processed"
+        else:
+            str_indicators = (
+                f"\n\tTonality: {self.get_tonality():.2f} tuHMS"
+                f"\n\tRoughness: {self.get_roughness():.2f} asper"
+            )
+
+        str_name = f'"{self.signal.name}"' if self.signal is not None else "Not set"
+
+        return (
+            f"{__class__.__name__} object\n"
+            "Data:\n"
+            f"\tSignal name: {str_name}\n"
+            f"\tField type: {self.field_type}\n"
+            f"\tEdition of the standard (tonality): {self.edition}\n"
+            f"Indicators: {str_indicators}"
+        )
+
+    @property
+    def signal(self) -> Field:
+        """Input signal in Pa."""
+        return self.__tonality.signal
+
+    @signal.setter
+    def signal(self, signal: Field):
+        """Set the signal."""
+        self.__tonality.signal = signal
+        self.__roughness.signal = signal
+
+    @property
+    def field_type(self) -> str:
+        """Sound field type.
+
+        Available options are `"Free"` and `"Diffuse"`.
+        """
+        return self.__roughness.field_type
+
+    @field_type.setter
+    def field_type(self, field_type: str):
+        """Set the sound field type."""
+        self.__roughness.field_type = field_type
+        self.__tonality.field_type = field_type
+
+    @property
+    def edition(self) -> str:
+        """Edition of the ECMA-418-2 standard to use for the tonality calculation.
+
+        Available options are `"1st"` for the 2020 version, and `"3rd"` for the 2024 version.
+        """
+        return self.__tonality.edition
+
+    @edition.setter
+    def edition(self, edition: str):
+        """Set the edition of the ECMA-418-2 standard to use for the tonality calculation."""
+        if edition is None:
+            raise PyAnsysSoundException(
+                'No edition of the standard specified. Available options are "1st" and "3rd".'
+            )
+        self.__tonality.edition = edition
+
+    def process(self):
+        """Compute the ECMA-418-2 tonality and roughness.
+
+        This method calls the appropriate DPF Sound operators, concurrently.
+        """
+        if self.signal is None:
+            raise PyAnsysSoundException(f"No input signal set. Use `{__class__.__name__}.signal`.")
+
+        # The tonality runs in a helper thread, while the roughness runs in the calling thread.
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="PyAnsysSound") as executor:
+            tonality_future = executor.submit(self.__tonality.process)
+            self.__roughness.process()
+            tonality_future.result()
+
+        self._output = (*self.__tonality.get_output(), *self.__roughness.get_output())
+
+    def get_output(self) -> tuple:
+        """Get the ECMA-418-2 tonality and roughness data.
+
+        Returns
+        -------
+        tuple
+            -   First element (float): tonality, in tuHMS.
+
+            -   Second element (Field): tonality over time, in tuHMS.
+
+            -   Third element (Field): tone frequency over time, in Hz.
+
+            -   Fourth element (float): roughness, in asper.
+
+            -   Fifth element (Field): specific roughness, in asperHMS/Bark.
+
+            -   Sixth element (Field): roughness over time, in asper.
+        """
+        if self._output is None:
+            warnings.warn(
+                PyAnsysSoundWarning(
+                    f"Output is not processed yet. Use the `{__class__.__name__}.process()` method."
+                )
+            )
+
+        return self._output
+
+    def get_output_as_nparray(self) -> tuple[np.ndarray]:
+        """Get the ECMA-418-2 tonality and roughness data in a tuple of NumPy arrays.
+
+        Returns
+        -------
+        tuple[numpy.ndarray]
+            -   First element: tonality, in tuHMS.
+
+            -   Second element: tonality over time, in tuHMS.
+
+            -   Third element: tone frequency over time, in Hz.
+
+            -   Fourth element: time scale of the tonality over time, in s.
+
+            -   Fifth element: time scale of the tone frequency over time, in s.
+
+            -   Sixth element: roughness, in asper.
+
+            -   Seventh element: specific roughness, in asperHMS/Bark.
+
+            -   Eighth element: Bark band indexes of the specific roughness, in Bark.
+
+            -   Ninth element: roughness over time, in asper.
+
+            -   Tenth element: time scale of the roughness over time, in s.
+        """
+        return (*self.__get_tonality_output_as_nparray(), *self.__get_roughness_output_as_nparray())
+
+    def __get_tonality_output_as_nparray(self) -> tuple[np.ndarray]:
+        """Get the tonality data only, in a tuple of NumPy arrays.
+
+        The getters use this method (or the roughness one), so that the data of the other
+        calculation is not converted.
+
+        Returns
+        -------
+        tuple[numpy.ndarray]
+            First five elements of :meth:`get_output_as_nparray`.
+        """
+        if self.get_output() is None:
+            return (np.nan, *[np.array([])] * 4)
+
+        return self.__tonality.get_output_as_nparray()
+
+    def __get_roughness_output_as_nparray(self) -> tuple[np.ndarray]:
+        """Get the roughness data only, in a tuple of NumPy arrays.
+
+        Returns
+        -------
+        tuple[numpy.ndarray]
+            Last five elements of :meth:`get_output_as_nparray`.
+        """
+        if self.get_output() is None:
+            return (np.nan, *[np.array([])] * 4)
+
+        return self.__roughness.get_output_as_nparray()
+
+    def get_tonality(self) -> float:
+        """Get the ECMA-418-2 tonality, in tuHMS.
+
+        Returns
+        -------
+        float
+            ECMA-418-2 tonality, in tuHMS.
+        """
+        return self.__get_tonality_output_as_nparray()[0]
+
+    def get_tonality_over_time(self) -> np.ndarray:
+        """Get the ECMA-418-2 tonality over time, in tuHMS.
+
+        Returns
+        -------
+        numpy.ndarray
+            ECMA-418-2 tonality over time, in tuHMS.
+        """
+        return self.__get_tonality_output_as_nparray()[1]
+
+    def get_tone_frequency_over_time(self) -> np.ndarray:
+        """Get the ECMA-418-2 tone frequency over time, in Hz.
+
+        Returns
+        -------
+        numpy.ndarray
+            ECMA-418-2 tone frequency over time, in Hz.
+        """
+        return self.__get_tonality_output_as_nparray()[2]
+
+    def get_tonality_time_scale(self) -> np.ndarray:
+        """Get the time scale of the ECMA-418-2 tonality over time, in s.
+
+        Returns
+        -------
+        numpy.ndarray
+            Time array, in seconds, of the ECMA-418-2 tonality over time.
+        """
+        return self.__get_tonality_output_as_nparray()[3]
+
+    def get_tone_frequency_time_scale(self) -> np.ndarray:
+        """Get the time scale of the ECMA-418-2 tone frequency over time, in s.
+
+        Returns
+        -------
+        numpy.ndarray
+            Time array, in seconds, of the ECMA-418-2 tone frequency over time.
+        """
+        return self.__get_tonality_output_as_nparray()[4]
+
+    def get_roughness(self) -> float:
+        """Get the overall ECMA-418-2 roughness, in asper.
+
+        Returns
+        -------
+        float
+            Roughness value, in asper.
+        """
+        return self.__get_roughness_output_as_nparray()[0]
+
+    def get_specific_roughness(self) -> np.ndarray:
+        """Get the ECMA-418-2 specific roughness, in asperHMS/Bark.
+
+        Returns
+        -------
+        numpy.ndarray
+            Specific roughness, that is, the roughness in each Bark band, in asperHMS/Bark.
+        """
+        return self.__get_roughness_output_as_nparray()[1]
+
+    def get_bark_band_indexes(self) -> np.ndarray:
+        """Get the Bark band indexes where the specific roughness is defined.
+
+        Returns
+        -------
+        numpy.ndarray
+            Bark band indexes, in BarkHMS.
+        """
+        return self.__get_roughness_output_as_nparray()[2]
+
+    def get_roughness_over_time(self) -> np.ndarray:
+        """Get the ECMA-418-2 roughness over time, in asper.
+
+        Returns
+        -------
+        numpy.ndarray
+            Roughness over time, in asper.
+        """
+        return self.__get_roughness_output_as_nparray()[3]
+
+    def get_roughness_time_scale(self) -> np.ndarray:
+        """Get the time scale of the ECMA-418-2 roughness over time, in s.
+
+        Returns
+        -------
+        numpy.ndarray
+            Time array, in seconds, of the roughness over time.
+        """
+        return self.__get_roughness_output_as_nparray()[4]
+
+    def plot(self):
+        """Plot the tonality, tone frequency, roughness over time, and specific roughness."""
+        import matplotlib.pyplot as plt
+
+        if self._output is None:
+            raise PyAnsysSoundException(
+                f"Output is not processed yet. Use the `{__class__.__name__}.process()` method."
+            )
+
+        _, axes = plt.subplots(2, 2)
+
+        axes[0, 0].plot(self.get_tonality_time_scale(), self.get_tonality_over_time())
+        axes[0, 0].set_title("ECMA-418-2 tonality")
+        axes[0, 0].set_xlabel("Time (s)")
+        axes[0, 0].set_ylabel("T (tuHMS)")
+
+        axes[1, 0].plot(self.get_tone_frequency_time_scale(), self.get_tone_frequency_over_time())
+        axes[1, 0].set_title("ECMA-418-2 tone frequency")
+        axes[1, 0].set_xlabel("Time (s)")
+        axes[1, 0].set_ylabel(r"$\mathregular{f_{ton}}$ (Hz)")
+
+        axes[0, 1].plot(self.get_roughness_time_scale(), self.get_roughness_over_time())
+        axes[0, 1].set_title("ECMA-418-2 roughness over time")
+        axes[0, 1].set_xlabel("Time (s)")
+        axes[0, 1].set_ylabel("R (asper)")
+
+        axes[1, 1].plot(self.get_bark_band_indexes(), self.get_specific_roughness())
+        axes[1, 1].set_title("ECMA-418-2 specific roughness")
+        axes[1, 1].set_xlabel("z (BarkHMS)")
+        axes[1, 1].set_ylabel("R' (asperHMS/Bark)")
+
+        for axis in axes.flat:
+            axis.grid(True)
+
+        plt.tight_layout()
+        plt.show()
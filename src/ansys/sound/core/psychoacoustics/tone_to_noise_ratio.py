@@ -22,16 +22,71 @@
 
 """Computes the ECMA 418-1/ISO 7779 tone-to-noise ratio (TNR)."""
 
-from math import log10
+from functools import lru_cache
 import warnings
 
 from ansys.dpf.core import Field, GenericDataContainer, Operator
-import matplotlib.pyplot as plt
 import numpy as np
 
 from . import PsychoacousticsParent
 from .._pyansys_sound import PyAnsysSoundException, PyAnsysSoundWarning
 
+# Names of the per-peak properties in the TNR generic data container, and corresponding field
+# names in the structured array returned by ToneToNoiseRatio.get_peaks_table().
+PEAK_PROPERTIES = (
+    ("frequency_Hz", "frequency"),
+    ("TNR_dB", "value"),
+    ("level_dB", "level"),
+    ("bandwidth_lower_Hz", "low_frequency"),
+    ("bandwidth_higher_Hz", "high_frequency"),
+)
+
+PEAKS_TABLE_DTYPE = [(name, np.float64) for _, name in PEAK_PROPERTIES] + [
+    ("is_prominent", np.bool_)
+]
+
+
+def _compute_reference_curve(frequencies: np.ndarray) -> np.ndarray:
+    """Compute the ECMA 418-1/ISO 7779 TNR reference curve at the specified frequencies.
+
+    Parameters
+    ----------
+    frequencies : numpy.ndarray
+        Frequencies in Hz.
+
+    Returns
+    -------
+    numpy.ndarray
+        Reference curve values in dB (0 outside the 89.1-11220 Hz range).
+    """
+    frequencies = np.asarray(frequencies, dtype=np.float64)
+    curve = np.zeros(len(frequencies))
+
+    is_low = (frequencies >= 89.1) & (frequencies < 1000)
+    curve[is_low] = 8 + 8.33 * np.log10(1000 / frequencies[is_low])
+    curve[(frequencies >= 1000) & (frequencies < 11220)] = 8
+
+    return curve
+
+
+@lru_cache(maxsize=16)
+def _get_cached_reference_curve(frequencies: bytes) -> np.ndarray:
+    """Get the TNR reference curve of a frequency grid, computed once per grid.
+
+    Parameters
+    ----------
+    frequencies : bytes
+        Raw bytes of the float64 array of the frequencies in Hz, used as the cache key.
+
+    Returns
+    -------
+    numpy.ndarray
+        Read-only reference curve values in dB.
+    """
+    curve = _compute_reference_curve(np.frombuffer(frequencies, dtype=np.float64))
+    curve.flags.writeable = False
+    return curve
+
 
 class ToneToNoiseRatio(PsychoacousticsParent):
     """Computes the ECMA 418-1/ISO 7779 tone-to-noise ratio (TNR).
@@ -40,7 +95,8 @@ class ToneToNoiseRatio(PsychoacousticsParent):
     and ISO 7779 standards.
 
     .. seealso::
-        :class:`ProminenceRatio`, :class:`ToneToNoiseRatioForOrdersOverTime`
+        :class:`ProminenceRatio`, :class:`ToneToNoiseRatioForOrdersOverTime`,
+        :class:`ToneToNoiseRatioOverTime`
 
     Examples
     --------
@@ -96,7 +152,9 @@ class ToneToNoiseRatio(PsychoacousticsParent):
         super().__init__()
         self.psd = psd  # uses the setter
         self.frequency_list = frequency_list  # uses the setter
-        self.__operator = Operator("compute_TNR")
+        self.__peaks = None
+        self.__max_value = None
+        self.__operator = Operator("compute_TNR", server=self._server)
 
     @property
     def psd(self) -> Field:
@@ -162,6 +220,17 @@ class ToneToNoiseRatio(PsychoacousticsParent):
         # Stores outputs in the tuple variable
         self._output = self.__operator.get_output(0, "generic_data_container")
 
+        # Extract all peak data once, rather than in each getter.
+        self.__peaks = np.zeros(
+            len(self._output.get_property("frequency_Hz").data), dtype=PEAKS_TABLE_DTYPE
+        )
+        for property_name, name in PEAK_PROPERTIES:
+            self.__peaks[name] = self._output.get_property(property_name).data
+        self.__peaks["is_prominent"] = self.__peaks["value"] > _compute_reference_curve(
+            self.__peaks["frequency"]
+        )
+        self.__max_value = np.copy(self._output.get_property("TNR_max"))
+
     def get_output(self) -> GenericDataContainer:
         """Get TNR data as a generic data container.
 
@@ -202,19 +271,46 @@ class ToneToNoiseRatio(PsychoacousticsParent):
         .. note::
             The first five elements are arrays of the same length. The sixth element is a float.
         """
-        tnr_container = self.get_output()
-        if tnr_container == None:
+        if self.get_output() == None:
             return None
 
-        return (
-            np.copy(tnr_container.get_property("frequency_Hz").data),
-            np.copy(tnr_container.get_property("TNR_dB").data),
-            np.copy(tnr_container.get_property("level_dB").data),
-            np.copy(tnr_container.get_property("bandwidth_lower_Hz").data),
-            np.copy(tnr_container.get_property("bandwidth_higher_Hz").data),
-            np.copy(tnr_container.get_property("TNR_max")),
+        return tuple(np.copy(self.__peaks[name]) for _, name in PEAK_PROPERTIES) + (
+            np.copy(self.__max_value),
         )
 
+    def get_peaks_table(self) -> np.ndarray:
+        """Get the data of all peaks in a single structured array.
+
+        The peak data are extracted once from the output, when calling :meth:`process`. Therefore,
+        this method is much faster than calling the individual getters for each peak.
+
+        Returns
+        -------
+        numpy.ndarray
+            Structured array with one element per peak, and the following fields:
+
+            -   ``"frequency"`` (float): frequency of the peak, in Hz.
+
+            -   ``"value"`` (float): TNR value, in dB.
+
+            -   ``"level"`` (float): level of the peak, in dB SPL.
+
+            -   ``"low_frequency"`` (float): lower-frequency limit of the critical band centered
+                on the peak, in Hz.
+
+            -   ``"high_frequency"`` (float): higher-frequency limit of the critical band
+                centered on the peak, in Hz.
+
+            -   ``"is_prominent"`` (bool): whether the TNR value is higher than the reference
+                curve at the peak frequency, that is, whether the tone is prominent.
+
+            If the output is not processed yet, the returned array is empty.
+        """
+        if self.get_output() == None:
+            return np.zeros(0, dtype=PEAKS_TABLE_DTYPE)
+
+        return np.copy(self.__peaks)
+
     def get_nb_tones(self) -> int:
         """Get the number of tones.
 
@@ -228,7 +324,7 @@ class ToneToNoiseRatio(PsychoacousticsParent):
                 "Output is not processed yet. Use the 'ToneToNoiseRatio.process()' method."
             )
 
-        return len(self.get_output_as_nparray()[0])
+        return len(self.__peaks)
 
     def get_peaks_frequencies(self) -> np.ndarray:
         """Get the vector of the peaks' frequencies in Hz.
@@ -238,10 +334,10 @@ class ToneToNoiseRatio(PsychoacousticsParent):
         numpy.ndarray
             Vector of the peaks' frequencies in Hz.
         """
-        if self.get_output_as_nparray() == None:
+        if self.get_output() == None:
             return None
 
-        return self.get_output_as_nparray()[0]
+        return np.copy(self.__peaks["frequency"])
 
     def get_TNR_values(self) -> np.ndarray:
         """Get the vector of the peaks' TNR values in dB.
@@ -251,10 +347,10 @@ class ToneToNoiseRatio(PsychoacousticsParent):
         numpy.ndarray
             Vector of the peaks' TNR values in dB.
         """
-        if self.get_output_as_nparray() == None:
+        if self.get_output() == None:
             return None
 
-        return self.get_output_as_nparray()[1]
+        return np.copy(self.__peaks["value"])
 
     def get_peaks_levels(self) -> np.ndarray:
         """Get the vector of the peaks' level values in dB SPL.
@@ -264,10 +360,10 @@ class ToneToNoiseRatio(PsychoacousticsParent):
         numpy.ndarray
             Vector of the peaks' level values in dB SPL.
         """
-        if self.get_output_as_nparray() == None:
+        if self.get_output() == None:
             return None
 
-        return self.get_output_as_nparray()[2]
+        return np.copy(self.__peaks["level"])
 
     def get_peaks_low_frequencies(self) -> np.ndarray:
         """Get the vector of the peaks' lower-frequency limits in Hz.
@@ -277,10 +373,10 @@ class ToneToNoiseRatio(PsychoacousticsParent):
         numpy.ndarray
             Vector of the peaks' lower-frequency limits in Hz.
         """
-        if self.get_output_as_nparray() == None:
+        if self.get_output() == None:
             return None
 
-        return self.get_output_as_nparray()[3]
+        return np.copy(self.__peaks["low_frequency"])
 
     def get_peaks_high_frequencies(self) -> np.ndarray:
         """Get the vector of the peaks' higher-frequency limits in Hz.
@@ -290,10 +386,10 @@ class ToneToNoiseRatio(PsychoacousticsParent):
         numpy.ndarray
             Vector of the peaks' higher-frequency limits in Hz.
         """
-        if self.get_output_as_nparray() == None:
+        if self.get_output() == None:
             return None
 
-        return self.get_output_as_nparray()[4]
+        return np.copy(self.__peaks["high_frequency"])
 
     def get_max_TNR_value(self) -> float:
         """Get the maximum TNR value in dB.
@@ -303,10 +399,10 @@ class ToneToNoiseRatio(PsychoacousticsParent):
         float
             Maximum TNR value in dB.
         """
-        if self.get_output_as_nparray() == None:
+        if self.get_output() == None:
             return None
 
-        return self.get_output_as_nparray()[5]
+        return np.copy(self.__max_value)
 
     def get_single_tone_info(self, tone_index: int) -> tuple[float]:
         """Get the TNR information for a tone.
@@ -340,13 +436,8 @@ class ToneToNoiseRatio(PsychoacousticsParent):
                 f"Tone index is out of bound. It must be between 0 and {nb_tones - 1}."
             )
 
-        return (
-            self.get_peaks_frequencies()[tone_index],
-            self.get_TNR_values()[tone_index],
-            self.get_peaks_levels()[tone_index],
-            self.get_peaks_low_frequencies()[tone_index],
-            self.get_peaks_high_frequencies()[tone_index],
-        )
+        peak = self.__peaks[tone_index]
+        return tuple(peak[name] for _, name in PEAK_PROPERTIES)
 
     def get_reference_curve(self) -> np.ndarray:
         """Get the reference threshold curve, above which a tone is considered as prominent.
@@ -360,57 +451,43 @@ class ToneToNoiseRatio(PsychoacousticsParent):
         if self.__psd == None:
             raise PyAnsysSoundException("No PSD set. Use 'ToneToNoiseRatio.psd'.")
 
-        all_frequencies = self.__psd.time_freq_support.time_frequencies.data
-        curve_length = len(all_frequencies)
-        ref_curve = np.ndarray(curve_length)
-
-        for index in range(curve_length):
-            current_frequency = all_frequencies[index]
-            if current_frequency < 89.1:
-                ref_curve[index] = 0
-
-            elif current_frequency < 1000:
-                ref_curve[index] = 8 + 8.33 * log10(1000 / current_frequency)
-
-            elif current_frequency < 11220:
-                ref_curve[index] = 8
-
-            else:
-                ref_curve[index] = 0
-
-        return ref_curve
+        frequencies = np.asarray(
+            self.__psd.time_freq_support.time_frequencies.data, dtype=np.float64
+        )
+        return np.copy(_get_cached_reference_curve(frequencies.tobytes()))
 
     def plot(self):
         """Plot the TNR for all identified peaks, along with the threshold curve."""
+        import matplotlib.pyplot as plt
+
         if self._output == None:
             raise PyAnsysSoundException(
                 "Output is not processed yet. Use the 'ToneToNoiseRatio.process()' method."
             )
 
-        tones_frequencies = self.get_peaks_frequencies()
-        TNR_values = self.get_TNR_values()
+        tones_frequencies = self.__peaks["frequency"]
+        TNR_values = self.__peaks["value"]
 
         all_frequencies = np.copy(self.__psd.time_freq_support.time_frequencies.data)
 
         # Cut both curves at 11220 Hz,
         # which is the maximum frequency for which the reference threshold curve is defined
-        max_index = np.min(np.where(all_frequencies > 11220)) + 1
+        max_index = min(
+            np.searchsorted(all_frequencies, 11220, side="right") + 1, len(all_frequencies)
+        )
         all_frequencies = all_frequencies[:max_index]
 
-        final_curve_length = len(all_frequencies)
-        TNR_final_curve = np.ndarray(final_curve_length)
-        TNR_final_curve.fill(0)
-
-        # for each tone:
-        # - find its corresponding index in all_frequencies
-        # - replace this index in TNR_final_curve by corresponding TNR value
-        for tone_index in range(self.get_nb_tones()):
-            frequency = tones_frequencies[tone_index]
-            tnr_value = TNR_values[tone_index]
-            for index in range(final_curve_length):
-                if abs(all_frequencies[index] - frequency) / frequency < 1.0e-3:
-                    TNR_final_curve[index] = tnr_value
-                    break
+        # Place each tone's TNR value at the first frequency in all_frequencies that matches the
+        # tone's frequency within 0.1 %
+        TNR_final_curve = np.zeros(len(all_frequencies))
+        indexes = np.minimum(
+            np.searchsorted(all_frequencies, tones_frequencies * (1 - 1.0e-3), side="right"),
+            len(all_frequencies) - 1,
+        )
+        is_matched = (
+            np.abs(all_frequencies[indexes] - tones_frequencies) / tones_frequencies < 1.0e-3
+        )
+        TNR_final_curve[indexes[is_matched]] = TNR_values[is_matched]
 
         # Plot
         plt.plot(all_frequencies, TNR_final_curve, color="blue", label="TNR")
@@ -24,8 +24,7 @@
 
 import warnings
 
-from ansys.dpf.core import Field, Operator, types
-import matplotlib.pyplot as plt
+from ansys.dpf.core import Field, types
 import numpy as np
 
 from . import PsychoacousticsParent
@@ -78,7 +77,9 @@ class ToneToNoiseRatioForOrdersOverTime(PsychoacousticsParent):
         self.signal = signal
         self.profile = profile
         self.order_list = order_list
-        self.__operator = Operator("compute_tone_to_noise_ratio_for_orders_over_time")
+        self.__operator = self._get_pooled_operator(
+            "compute_tone_to_noise_ratio_for_orders_over_time"
+        )
 
     def __str__(self):
         """Return the string representation of the object."""
@@ -271,6 +272,8 @@ class ToneToNoiseRatioForOrdersOverTime(PsychoacousticsParent):
         use_rpm_scale : bool
             Indicates whether to plot the TNR as a function of time or RPM.
         """
+        import matplotlib.pyplot as plt
+
         output = self.get_output()
         if output is None:
             raise PyAnsysSoundException(
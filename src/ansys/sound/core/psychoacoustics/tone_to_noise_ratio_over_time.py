@@ -0,0 +1,92 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Computes the ECMA 418-1/ISO 7779 tone-to-noise ratio (TNR) over time."""
+
+import numpy as np
+
+from ._tone_ratio_over_time_parent import ToneRatioOverTimeParent
+
+
+class ToneToNoiseRatioOverTime(ToneRatioOverTimeParent):
+    """Computes the ECMA 418-1/ISO 7779 tone-to-noise ratio (TNR) over time.
+
+    This class computes the TNR, as defined in the ECMA 418-1 and ISO 7779 standards, over time
+    in a given time-domain signal, without requiring an RPM profile. The signal is split into
+    frames, and the TNR is computed on the power spectral density (PSD) of each frame,
+    concurrently.
+
+    .. seealso::
+        :class:`ToneToNoiseRatio`, :class:`ToneToNoiseRatioForOrdersOverTime`,
+        :class:`ProminenceRatioOverTime`
+
+    Examples
+    --------
+    Compute and display the tone-to-noise ratio over time of the tones detected in a signal.
+
+    >>> from ansys.sound.core.psychoacoustics import ToneToNoiseRatioOverTime
+    >>> tone_to_noise_ratio = ToneToNoiseRatioOverTime(
+    ...     signal=my_signal, window_length=1.0, overlap=50.0
+    ... )
+    >>> tone_to_noise_ratio.process()
+    >>> max_tnr_over_time = tone_to_noise_ratio.get_max_TNR_over_time()
+    >>> time_scale = tone_to_noise_ratio.get_time_scale()
+    >>> tone_to_noise_ratio.plot()
+
+    Compute the tone-to-noise ratio over time at specific frequencies.
+
+    >>> tone_to_noise_ratio = ToneToNoiseRatioOverTime(
+    ...     signal=my_signal, frequency_list=[500, 1000]
+    ... )
+    >>> tone_to_noise_ratio.process()
+    >>> tnr_values = tone_to_noise_ratio.get_TNR_values_over_time()
+
+    .. seealso::
+        :ref:`calculate_PR_and_TNR`
+            Example demonstrating how to compute tone-to-noise ratio and prominence ratio.
+    """
+
+    _operator_id = "compute_TNR"
+    _ratio_name = "TNR"
+
+    def get_TNR_values_over_time(self) -> np.ndarray:
+        """Get the tones' TNR values over time.
+
+        Returns
+        -------
+        numpy.ndarray
+            Tones' TNR values in dB, with shape (frames, tones). If :attr:`frequency_list` is
+            specified, the tones are those of the list, in the same order. Otherwise, the tones
+            are those detected in each frame, and the array is padded with NaN in the frames where
+            fewer tones are detected.
+        """
+        return self.get_output_as_nparray()[1]
+
+    def get_max_TNR_over_time(self) -> np.ndarray:
+        """Get the maximum TNR value over time.
+
+        Returns
+        -------
+        numpy.ndarray
+            Maximum TNR value in dB in each frame.
+        """
+        return self.get_output_as_nparray()[5]
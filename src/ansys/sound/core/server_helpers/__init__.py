@@ -33,13 +33,30 @@ from ._check_version import (
     requires_sound_version,
 )
 from ._connect_to_or_start_server import connect_to_or_start_server
+from ._operator_pool import (
+    clear_operator_pool,
+    get_operator_pool_statistics,
+    set_operator_pool_size,
+)
+from ._server_executor import get_server_concurrency_limit, set_server_concurrency_limit
+from ._server_pool import ServerPool
 from ._validate_dpf_sound_connection import validate_dpf_sound_connection
+from ._warm_start import start_warm_server, start_warm_server_in_background, warm_up_server
 
 __all__ = (
     "connect_to_or_start_server",
     "validate_dpf_sound_connection",
     "requires_sound_version",
     "get_sound_version",
+    "get_operator_pool_statistics",
+    "clear_operator_pool",
+    "set_operator_pool_size",
+    "get_server_concurrency_limit",
+    "set_server_concurrency_limit",
+    "ServerPool",
+    "start_warm_server",
+    "start_warm_server_in_background",
+    "warm_up_server",
     "_check_sound_version",
     "_check_sound_version_and_raise",
 )
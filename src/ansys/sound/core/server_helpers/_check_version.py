@@ -92,12 +92,15 @@ def requires_sound_version(min_sound_version: str) -> Callable:
             Any
                 The original function's or method's output.
             """
+            # For methods of PyAnsys Sound classes, check the server of the instance.
+            server = getattr(args[0], "_server", None) if len(args) > 0 else None
             _check_sound_version_and_raise(
                 min_sound_version,
                 (
                     f"Function or method `{func.__name__}()` requires DPF Sound plugin version "
                     f"{min_sound_version} or higher."
                 ),
+                server=server,
             )
             return func(*args, **kwargs)
 
@@ -106,7 +109,7 @@ def requires_sound_version(min_sound_version: str) -> Callable:
     return decorator
 
 
-def _check_sound_version_and_raise(min_sound_version: str, error_msg: str):
+def _check_sound_version_and_raise(min_sound_version: str, error_msg: str, server=None):
     """Check the DPF Sound plugin version and raise an exception if the specified version is higher.
 
     Parameters
@@ -115,12 +118,14 @@ def _check_sound_version_and_raise(min_sound_version: str, error_msg: str):
         Minimum DPF Sound plugin version required.
     error_msg : str
         Error message to display if the version check fails.
+    server : BaseServer, default: None
+        DPF server. If ``None``, the global server is used.
     """
-    if not _check_sound_version(min_sound_version):
+    if not _check_sound_version(min_sound_version, server=server):
         raise VersionError(f"DPF Sound plugin version error: {error_msg}")
 
 
-def _check_sound_version(min_sound_version: str) -> bool:
+def _check_sound_version(min_sound_version: str, server=None) -> bool:
     """Check the current DPF Sound plugin version against the specified minimum version.
 
     Before Ansys 2027 R1, the DPF Sound plugin version is verified according to the DPF Server/DPF
@@ -131,6 +136,8 @@ def _check_sound_version(min_sound_version: str) -> bool:
     ----------
     min_sound_version : str
         Minimum DPF Sound plugin version required.
+    server : BaseServer, default: None
+        DPF server. If ``None``, the global server is used.
 
     Returns
     -------
@@ -138,20 +145,28 @@ def _check_sound_version(min_sound_version: str) -> bool:
         True if the current DPF Sound plugin version is greater than or equal to the specified
         version, False otherwise.
     """
-    if "get_version_info" not in available_operator_names():
+    if server is None:
+        server = _global_server()
+
+    if "get_version_info" not in available_operator_names(server):
         # Operator get_version_info is only introduced in Ansys 2027 R1, so if it does not exist,
         # we use the matching DPF server version to perform the check.
         if min_sound_version not in MATCHING_VERSIONS:
             raise VersionError(f"Unknown DPF Sound plugin version {min_sound_version}.")
 
-        return _global_server().meet_version(MATCHING_VERSIONS[min_sound_version])
+        return server.meet_version(MATCHING_VERSIONS[min_sound_version])
 
-    return parse(get_sound_version()) >= parse(min_sound_version)
+    return parse(get_sound_version(server)) >= parse(min_sound_version)
 
 
-def get_sound_version() -> str:
+def get_sound_version(server=None) -> str:
     """Get the current DPF Sound plugin version.
 
+    Parameters
+    ----------
+    server : BaseServer, default: None
+        DPF server. If ``None``, the global server is used.
+
     Returns
     -------
     str
@@ -161,12 +176,12 @@ def get_sound_version() -> str:
     -----
     This function requires DPF Sound plugin version 2027.1.0 or higher.
     """
-    if "get_version_info" not in available_operator_names():
+    if "get_version_info" not in available_operator_names(server):
         raise VersionError(
             "Function get_sound_version() requires DPF Sound plugin version 2027.1.0 or higher."
         )
 
-    version_retriever = Operator("get_version_info")
+    version_retriever = Operator("get_version_info", server=server)
     version_retriever.run()
     year = version_retriever.get_output(0, types.int)
     major = version_retriever.get_output(1, types.int)
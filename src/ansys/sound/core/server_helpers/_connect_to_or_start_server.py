@@ -23,6 +23,7 @@
 """Helpers to connect to or start a DPF server with the DPF Sound plugin."""
 
 import os
+import time
 from typing import Optional, Union
 
 from ansys.dpf.core import (
@@ -108,8 +109,52 @@ def connect_to_or_start_server(
         :ref:`initialize_server_and_deal_with_license`
             Example demonstrating how to connect to or start a DPF server with the DPF Sound plugin.
     """
+    server = _connect_to_or_start_sound_server(port, ip, ansys_path, as_global=True)
+
+    # if required, check out the DPF Sound license once and for all for this session
+    lic_context = None
+    if use_license_context == True:
+        lic_context = LicenseContextManager(license_increment_name, server=server)
+
+    return server, lic_context
+
+
+def _connect_to_or_start_sound_server(
+    port: Optional[int] = None,
+    ip: Optional[str] = None,
+    ansys_path: Optional[str] = None,
+    as_global: bool = True,
+    timings: Optional[dict[str, float]] = None,
+    use_port_from_environment: bool = True,
+) -> server_types.InProcessServer | server_types.GrpcServer:
+    """Connect to or start a DPF server, check its version, and load the DPF Sound plugin.
+
+    Parameters
+    ----------
+    port : int, default: None
+        Port that the DPF server is listening to. See :func:`connect_to_or_start_server`.
+    ip : str, default: None
+        IP address for the DPF server.
+    ansys_path : str, default: None
+        Root path for the Ansys installation. Ignored if either the port or IP address is set.
+    as_global : bool, default: True
+        Whether the server becomes the global server, that is, the one used by the DPF entities
+        that are created without an explicit server.
+    timings : dict[str, float], default: None
+        Dictionary in which to store the duration in s of the startup phases, under the keys
+        ``"server_start"``, ``"version_check"``, and ``"plugin_load"``.
+    use_port_from_environment : bool, default: True
+        Whether to connect to the server at the port in the environment variable
+        ``ANSRV_DPF_SOUND_PORT``, if defined, when neither the port nor the IP address is set. If
+        :obj:`False`, a local server is started instead.
+
+    Returns
+    -------
+    InProcessServer | GrpcServer
+        Server object started or connected to.
+    """
     # Collect the port to connect to the server (if unspecified in arguments)
-    if port is None:
+    if port is None and use_port_from_environment:
         port_in_env = os.environ.get("ANSRV_DPF_SOUND_PORT")
         if port_in_env is not None:
             port = int(port_in_env)
@@ -120,18 +165,24 @@ def connect_to_or_start_server(
     if ip is not None:  # pragma: no cover
         connect_kwargs["ip"] = ip
 
+    timings = timings if timings is not None else {}
+    start_time = time.perf_counter()
+
     full_path_dll = ""
     if len(list(connect_kwargs.keys())) > 0:
         # Remote server => connect using gRPC
         server = connect_to_server(
             **connect_kwargs,
-            as_global=True,
+            as_global=as_global,
         )
     else:  # pragma: no cover
         # Local server => start a local server
-        server = start_local_server(ansys_path=ansys_path, as_global=True)
+        server = start_local_server(ansys_path=ansys_path, as_global=as_global)
         full_path_dll = os.path.join(server.ansys_path, "Acoustics\\SAS\\ads\\")
 
+    timings["server_start"] = time.perf_counter() - start_time
+    start_time = time.perf_counter()
+
     required_version = "8.0"
     server.check_version(
         required_version,
@@ -139,11 +190,10 @@ def connect_to_or_start_server(
         f"(Ansys 2024 R2) or later. Your version is currently {server.version}.",
     )
 
-    load_library(full_path_dll + "dpf_sound.dll", "dpf_sound", server=server)
+    timings["version_check"] = time.perf_counter() - start_time
+    start_time = time.perf_counter()
 
-    # if required, check out the DPF Sound license once and for all for this session
-    lic_context = None
-    if use_license_context == True:
-        lic_context = LicenseContextManager(license_increment_name, server=server)
+    load_library(full_path_dll + "dpf_sound.dll", "dpf_sound", server=server)
+    timings["plugin_load"] = time.perf_counter() - start_time
 
-    return server, lic_context
+    return server
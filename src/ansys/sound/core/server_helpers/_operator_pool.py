@@ -0,0 +1,265 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Pool of DPF operators, shared by the instances of the PyAnsys Sound classes."""
+
+from collections import defaultdict
+import threading
+import weakref
+
+import ansys.dpf.core as dpf
+from ansys.dpf.core import Operator, _global_server
+
+from .._operator_emulator import _create_emulated_operator
+
+# Default maximum number of idle operators kept in the pool, per operator name and per server.
+DEFAULT_MAX_IDLE_OPERATORS = 8
+
+# Pools, indexed by server identity. DPF servers are not hashable, so each pool stores a weak
+# reference to its server, which allows detecting when the server is gone.
+_pools = {}
+_pools_lock = threading.Lock()
+_max_idle_operators = DEFAULT_MAX_IDLE_OPERATORS
+
+
+class _OperatorPool:
+    """Pool of idle DPF operators for one server, indexed by operator name."""
+
+    def __init__(self, server):
+        """Initialize the pool."""
+        self.server_reference = weakref.ref(server)
+        self.idle_operators = defaultdict(list)
+        self.statistics = defaultdict(
+            lambda: {"created": 0, "reused": 0, "released": 0, "discarded": 0}
+        )
+
+    def acquire(self, name: str) -> Operator:
+        """Take an idle operator from the pool, or create one."""
+        statistics = self.statistics[name]
+        if len(self.idle_operators[name]) > 0:
+            statistics["reused"] += 1
+            return self.idle_operators[name].pop()
+
+        statistics["created"] += 1
+        return Operator(name, server=self.server_reference())
+
+    def release(self, name: str, operator: Operator):
+        """Give an operator back to the pool, or discard it if the pool is full."""
+        if len(self.idle_operators[name]) < _max_idle_operators:
+            self.statistics[name]["released"] += 1
+            self.idle_operators[name].append(operator)
+        else:
+            self.statistics[name]["discarded"] += 1
+
+
+def _get_pool(server, create: bool = True) -> _OperatorPool | None:
+    """Get the pool of a server, creating it if needed.
+
+    Must be called with the pools lock held.
+    """
+    pool = _pools.get(id(server))
+    if pool is not None and pool.server_reference() is server:
+        return pool
+
+    # Either no pool exists for this server, or the server the pool was created for is gone and
+    # its identity was reused.
+    _pools.pop(id(server), None)
+    if not create:
+        return None
+
+    pool = _OperatorPool(server)
+    _pools[id(server)] = pool
+    return pool
+
+
+def _acquire_operator(name: str, server=None) -> tuple[Operator, weakref.ref]:
+    """Get an operator of a server from the pool.
+
+    The operator keeps the input pins connected by its previous user, if any. Only classes that
+    connect all the operator inputs they use, each time they use the operator, may use pooled
+    operators. The other classes get a new operator with :func:`_create_operator`.
+
+    If an operator emulator is active and emulates the operator, a new emulated operator is
+    returned instead, with no server.
+
+    Parameters
+    ----------
+    name : str
+        Operator name.
+    server : BaseServer, default: None
+        DPF server. If ``None``, the global server is used.
+
+    Returns
+    -------
+    tuple[Operator, weakref.ref]
+        Operator, and weak reference to the server the operator belongs to, to pass to
+        :func:`_release_operator` (``None`` for an emulated operator).
+    """
+    emulated_operator = _create_emulated_operator(name)
+    if emulated_operator is not None:
+        # Emulated operators run in the client process, and are not pooled.
+        return emulated_operator, None
+
+    if server is None:
+        server = _global_server()
+    with _pools_lock:
+        operator = _get_pool(server).acquire(name)
+    return operator, weakref.ref(server)
+
+
+def _create_operator(name: str, server=None) -> Operator:
+    """Create a new operator of a server, outside of the pool.
+
+    The operator has no input connected, and must not be given back to the pool. If an operator
+    emulator is active and emulates the operator, an emulated operator is returned instead.
+
+    Parameters
+    ----------
+    name : str
+        Operator name.
+    server : BaseServer, default: None
+        DPF server. If ``None``, the global server is used.
+
+    Returns
+    -------
+    Operator
+        New operator.
+    """
+    emulated_operator = _create_emulated_operator(name)
+    if emulated_operator is not None:
+        return emulated_operator
+
+    return Operator(name, server=server)
+
+
+def _release_operator(name: str, operator: Operator, server_reference: weakref.ref):
+    """Give an operator obtained with :func:`_acquire_operator` back to the pool.
+
+    Parameters
+    ----------
+    name : str
+        Operator name.
+    operator : Operator
+        Operator to give back to the pool.
+    server_reference : weakref.ref
+        Weak reference to the server the operator belongs to, or ``None`` for an emulated
+        operator.
+    """
+    if server_reference is None:
+        return
+
+    server = server_reference()
+    if server is None:
+        # The server is gone, and so are its operators.
+        return
+
+    with _pools_lock:
+        pool = _get_pool(server, create=False)
+        if pool is not None:
+            pool.release(name, operator)
+
+
+def get_operator_pool_statistics(server=None) -> dict[str, dict[str, int]]:
+    """Get the statistics of the operator pool of a DPF server.
+
+    PyAnsys Sound classes take their DPF operators from a pool, instead of creating new ones, and
+    give them back when they are closed or garbage-collected. Creating an operator requires a call
+    to the server, which is costly with a remote server, in particular when processing many files in
+    a loop.
+
+    Parameters
+    ----------
+    server : BaseServer, default: None
+        DPF server. If ``None``, the global server is used.
+
+    Returns
+    -------
+    dict[str, dict[str, int]]
+        Statistics, per operator name. For each operator name, the dictionary contains:
+
+        - ``"created"``: number of operators created, because no idle operator was available.
+        - ``"reused"``: number of idle operators handed out again.
+        - ``"released"``: number of operators given back to the pool.
+        - ``"discarded"``: number of operators not kept because the pool was full.
+        - ``"idle"``: number of operators currently idle in the pool.
+
+    Examples
+    --------
+    >>> from ansys.sound.core.server_helpers import get_operator_pool_statistics
+    >>> statistics = get_operator_pool_statistics()
+    """
+    server = server if server is not None else dpf.SERVER
+    if server is None:
+        return {}
+
+    with _pools_lock:
+        pool = _get_pool(server, create=False)
+        if pool is None:
+            return {}
+
+        return {
+            name: {**statistics, "idle": len(pool.idle_operators[name])}
+            for name, statistics in pool.statistics.items()
+        }
+
+
+def clear_operator_pool(server=None):
+    """Discard the idle operators and reset the statistics of the operator pool of a DPF server.
+
+    Parameters
+    ----------
+    server : BaseServer, default: None
+        DPF server. If ``None``, the global server is used.
+    """
+    server = server if server is not None else dpf.SERVER
+    if server is None:
+        return
+
+    with _pools_lock:
+        _pools.pop(id(server), None)
+
+
+def set_operator_pool_size(max_idle_operators: int):
+    """Set the maximum number of idle operators kept in the operator pools.
+
+    Operators given back to a pool that already holds this number of idle operators with the same
+    name are discarded. Setting the size to 0 disables the pooling.
+
+    Parameters
+    ----------
+    max_idle_operators : int
+        Maximum number of idle operators kept, per operator name and per server. The default value
+        is 8.
+    """
+    # Imported here, because the PyAnsys Sound base classes depend on this module.
+    from ansys.sound.core._pyansys_sound import PyAnsysSoundException
+
+    global _max_idle_operators
+
+    if max_idle_operators < 0:
+        raise PyAnsysSoundException("Maximum number of idle operators must be positive or zero.")
+
+    with _pools_lock:
+        _max_idle_operators = max_idle_operators
+        for pool in _pools.values():
+            for operators in pool.idle_operators.values():
+                del operators[max_idle_operators:]
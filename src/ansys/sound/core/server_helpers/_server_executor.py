@@ -0,0 +1,204 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Executors bounding the number of concurrent asynchronous calls to each DPF server."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import threading
+from typing import Any, Callable
+import weakref
+
+import ansys.dpf.core as dpf
+from ansys.dpf.core import _global_server
+
+# Default maximum number of concurrent asynchronous calls to a server.
+DEFAULT_CONCURRENCY_LIMIT = 4
+
+# Executors and concurrency limiters, indexed by server identity. DPF servers are not hashable, so
+# each item is stored with a weak reference to its server, which allows detecting when the server is
+# gone.
+_executors = {}
+_executors_lock = threading.Lock()
+_concurrency_limits = {}
+
+
+class _ConcurrencyLimiter:
+    """Semaphore bounding the number of concurrent calls to a server, with a changeable limit.
+
+    The executor threads of a server acquire the limiter before each call. When the limit changes,
+    the executor is replaced, and the calls running or waiting in the former executor still share
+    the limiter with the new one, so that the limit is never exceeded.
+    """
+
+    def __init__(self, limit: int):
+        """Initialize the limiter."""
+        self.__limit = limit
+        self.__running_calls = 0
+        self.__condition = threading.Condition()
+
+    def set_limit(self, limit: int):
+        """Set the maximum number of concurrent calls.
+
+        When the limit is lowered, the running calls complete, and no other call starts until fewer
+        calls than the new limit are running.
+        """
+        with self.__condition:
+            self.__limit = limit
+            self.__condition.notify_all()
+
+    def run(self, function: Callable) -> Any:
+        """Wait for a free slot, and run a function."""
+        with self.__condition:
+            self.__condition.wait_for(lambda: self.__running_calls < self.__limit)
+            self.__running_calls += 1
+        try:
+            return function()
+        finally:
+            with self.__condition:
+                self.__running_calls -= 1
+                self.__condition.notify_all()
+
+
+def _get_server_item(items: dict, server) -> Any:
+    """Get the item stored for a server, or None if there is none or if its server is gone."""
+    server_reference, item = items.get(id(server), (None, None))
+    return item if server_reference is not None and server_reference() is server else None
+
+
+def _create_server_executor(server, limit: int, limiter: _ConcurrencyLimiter = None):
+    """Create the executor of a server, and store it with its limiter.
+
+    Must be called with ``_executors_lock`` held.
+    """
+    executor = ThreadPoolExecutor(max_workers=limit, thread_name_prefix="PyAnsysSound")
+    limiter = limiter if limiter is not None else _ConcurrencyLimiter(limit)
+    _executors[id(server)] = (weakref.ref(server), (executor, limiter))
+    # Stop the executor threads once the server is gone.
+    weakref.finalize(server, executor.shutdown, wait=False)
+    return executor, limiter
+
+
+def _get_server_executor(server) -> tuple[ThreadPoolExecutor, _ConcurrencyLimiter]:
+    """Get the executor of a server and its limiter, creating them if needed."""
+    with _executors_lock:
+        item = _get_server_item(_executors, server)
+        if item is not None:
+            return item
+
+        limit = _get_server_item(_concurrency_limits, server) or DEFAULT_CONCURRENCY_LIMIT
+        return _create_server_executor(server, limit)
+
+
+async def _run_in_server_executor(function: Callable, timeout: float = None, server=None) -> Any:
+    """Run a function in the executor of a server, and wait for its result.
+
+    Parameters
+    ----------
+    function : Callable
+        Function to run, without arguments.
+    timeout : float, default: None
+        Maximum duration in s to wait for the result. If ``None``, there is no limit.
+    server : BaseServer, default: None
+        DPF server. If ``None``, the global server is used.
+
+    Returns
+    -------
+    Any
+        The function's output.
+    """
+    executor, limiter = _get_server_executor(server if server is not None else _global_server())
+
+    # Cancelling the asyncio future (explicitly, or because of the timeout) cancels the executor
+    # job, if it has not started yet.
+    future = asyncio.wrap_future(executor.submit(limiter.run, function))
+    return await asyncio.wait_for(future, timeout)
+
+
+def set_server_concurrency_limit(max_concurrent_calls: int, server=None):
+    """Set the maximum number of concurrent asynchronous calls to a DPF server.
+
+    The ``process_async()`` and ``get_output_async()`` methods of the PyAnsys Sound classes run in
+    a pool of threads dedicated to the server, so that the asyncio event loop is not blocked. The
+    size of the pool limits the number of calls that the server processes at the same time, the
+    other ones waiting in a queue.
+
+    The limit is never exceeded, including by the calls already running or waiting in the queue:
+    when it is lowered, the running calls complete, and no other call starts until fewer calls
+    than the new limit are running. When it is raised, the calls submitted afterwards benefit from
+    the new limit, while the calls already waiting in the queue are still started by the threads
+    of the former pool, within the former limit.
+
+    Parameters
+    ----------
+    max_concurrent_calls : int
+        Maximum number of concurrent calls. The default value is 4.
+    server : BaseServer, default: None
+        DPF server. If ``None``, the global server is used.
+
+    Examples
+    --------
+    >>> from ansys.sound.core.server_helpers import set_server_concurrency_limit
+    >>> set_server_concurrency_limit(8)
+    """
+    # Imported here, because the PyAnsys Sound base classes depend on this module.
+    from ansys.sound.core._pyansys_sound import PyAnsysSoundException
+
+    if max_concurrent_calls < 1:
+        raise PyAnsysSoundException("Maximum number of concurrent calls must be at least 1.")
+
+    server = server if server is not None else _global_server()
+    with _executors_lock:
+        _concurrency_limits[id(server)] = (weakref.ref(server), max_concurrent_calls)
+        item = _get_server_item(_executors, server)
+        if item is None:
+            return
+
+        # The pool size of the executor cannot change: a new executor is created, with the same
+        # limiter. The former one completes its pending jobs, which wait for the limiter, and then
+        # stops.
+        executor, limiter = item
+        limiter.set_limit(max_concurrent_calls)
+        _create_server_executor(server, max_concurrent_calls, limiter)
+
+    executor.shutdown(wait=False)
+
+
+def get_server_concurrency_limit(server=None) -> int:
+    """Get the maximum number of concurrent asynchronous calls to a DPF server.
+
+    Parameters
+    ----------
+    server : BaseServer, default: None
+        DPF server. If ``None``, the global server is used.
+
+    Returns
+    -------
+    int
+        Maximum number of concurrent calls.
+    """
+    server = server if server is not None else dpf.SERVER
+    if server is None:
+        return DEFAULT_CONCURRENCY_LIMIT
+
+    with _executors_lock:
+        return _get_server_item(_concurrency_limits, server) or DEFAULT_CONCURRENCY_LIMIT
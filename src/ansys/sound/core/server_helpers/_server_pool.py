@@ -0,0 +1,389 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Pool of DPF servers with the DPF Sound plugin, leased to concurrent workers."""
+
+from contextlib import contextmanager
+import threading
+import time
+from typing import Iterator, Optional
+
+from ansys.dpf.core import LicenseContextManager, available_operator_names
+
+from ._warm_start import _start_warm_server
+
+# Operator whose availability indicates that the DPF Sound plugin is loaded on a server.
+HEALTH_CHECK_OPERATOR = "load_wav_sas"
+
+
+def _get_server_address(server) -> str:
+    """Get the address of a server: ``"ip:port"``, or ``"in-process"`` for an in-process server."""
+    port = getattr(server, "port", None)
+    if port is None:
+        return "in-process"
+    return f"{server.ip}:{port}"
+
+
+class _PooledServer:
+    """Server of a pool, with its licensing context and its lease counters."""
+
+    def __init__(
+        self,
+        server,
+        license_context: Optional[LicenseContextManager],
+        startup_timings: dict[str, float],
+    ):
+        """Initialize the pooled server."""
+        self.server = server
+        self.license_context = license_context
+        self.startup_timings = startup_timings
+        self.active_leases = 0
+        self.total_leases = 0
+        self.healthy = True
+
+
+class ServerPool:
+    """Pool of DPF servers with the DPF Sound plugin, leased to concurrent workers.
+
+    The function :func:`connect_to_or_start_server` starts or connects to a single server, which
+    becomes the global server used by all PyAnsys Sound classes. This class instead starts or
+    connects to several servers, loads the DPF Sound plugin on each of them, and leases them to
+    workers (threads or asyncio tasks), so that independent processing runs in parallel on
+    different servers.
+
+    Each lease goes to the healthy server with the fewest active leases. The processing classes
+    are bound to the leased server with their ``server`` argument. All the DPF inputs of a bound
+    instance (fields, fields containers) must belong to the same server.
+
+    Servers started by the pool are not global: the DPF entities created without an explicit
+    server keep using the global server.
+
+    Examples
+    --------
+    Start two local servers, and process signals in parallel threads.
+
+    >>> from concurrent.futures import ThreadPoolExecutor
+    >>> from ansys.sound.core.server_helpers import ServerPool
+    >>> from ansys.sound.core.signal_utilities import LoadWav
+    >>> from ansys.sound.core.psychoacoustics import LoudnessISO532_1_Stationary
+    >>> def compute_loudness(path):
+    ...     with pool.lease() as server:
+    ...         wav_loader = LoadWav(path_to_wav=path, server=server)
+    ...         wav_loader.process()
+    ...         loudness = LoudnessISO532_1_Stationary(
+    ...             signal=wav_loader.get_output()[0], server=server
+    ...         )
+    ...         loudness.process()
+    ...         return loudness.get_loudness_sone()
+    >>> paths = ["path/to/file1.wav", "path/to/file2.wav", "path/to/file3.wav"]
+    >>> with ServerPool(server_count=2) as pool:
+    ...     with ThreadPoolExecutor(max_workers=4) as executor:
+    ...         loudness_values = list(executor.map(compute_loudness, paths))
+    """
+
+    def __init__(
+        self,
+        server_count: int = 1,
+        ports: Optional[list[int]] = None,
+        ip: Optional[str] = None,
+        ansys_path: Optional[str] = None,
+        use_license_context: bool = False,
+        license_increment_name: str = "avrxp_snd_level1",
+        max_leases_per_server: Optional[int] = None,
+        warm_up: bool = False,
+    ):
+        """Start or connect to the servers of the pool.
+
+        Parameters
+        ----------
+        server_count : int, default: 1
+            Number of servers to start or connect to. Ignored if ``ports`` is set.
+        ports : list[int], default: None
+            Ports of the remote DPF servers to connect to, one per server. If unspecified,
+            ``server_count`` local servers are started, each on its own port. The environment
+            variable ``ANSRV_DPF_SOUND_PORT``, which designates a single server, is then ignored.
+        ip : str, default: None
+            IP address of the remote DPF servers.
+        ansys_path : str, default: None
+            Root path for the Ansys installation from which local servers are started. For
+            example, `"C:/Program Files/ANSYS Inc/v261"`. This parameter is ignored if either the
+            ports or IP address are set.
+        use_license_context : bool, default: False
+            Whether to check out the DPF Sound license increment once for each server, for the
+            lifetime of the pool (see parameter ``license_increment_name``). See
+            :func:`connect_to_or_start_server`.
+        license_increment_name : str, default: "avrxp_snd_level1"
+            Name of the license increment to check out. Only taken into account if
+            ``use_license_context`` is :obj:`True`.
+        max_leases_per_server : int, default: None
+            Maximum number of concurrent leases of each server. When all servers have reached
+            this number, :meth:`acquire` waits for a server to be released. If unspecified, the
+            number of concurrent leases is not limited.
+        warm_up : bool, default: False
+            Whether to warm up each server when it starts, with :func:`warm_up_server`: commonly
+            used operators are preloaded (as many instances of each as the maximum number of
+            leases per server), and an end-to-end probe is run.
+
+        """
+        # Imported here, because the PyAnsys Sound base classes depend on this module.
+        from ansys.sound.core._pyansys_sound import PyAnsysSoundException
+
+        if ports is None and server_count < 1:
+            raise PyAnsysSoundException("Number of servers must be at least 1.")
+        if max_leases_per_server is not None and max_leases_per_server < 1:
+            raise PyAnsysSoundException("Maximum number of leases per server must be at least 1.")
+
+        self.__max_leases_per_server = max_leases_per_server
+        self.__condition = threading.Condition()
+        self.__servers: list[_PooledServer] = []
+
+        try:
+            for port in ports if ports is not None else [None] * server_count:
+                server, license_context, timings = _start_warm_server(
+                    port=port,
+                    ip=ip,
+                    ansys_path=ansys_path,
+                    use_license_context=use_license_context,
+                    license_increment_name=license_increment_name,
+                    as_global=False,
+                    operator_count=max_leases_per_server or 1,
+                    run_probe=warm_up,
+                    operators=None if warm_up else [],
+                    use_port_from_environment=False,
+                )
+                self.__servers.append(_PooledServer(server, license_context, timings))
+
+                # Leasing the same server as several ones would exceed its maximum number of
+                # leases.
+                address = _get_server_address(server)
+                for pooled in self.__servers[:-1]:
+                    if _get_server_address(pooled.server) == address:
+                        raise PyAnsysSoundException(
+                            f"Several servers of the pool are the same server ({address})."
+                        )
+        except Exception:
+            self.close()
+            raise
+
+    def __enter__(self) -> "ServerPool":
+        """Enter the runtime context of the pool."""
+        return self
+
+    def __exit__(self, *exception_info):
+        """Close the pool when leaving its runtime context."""
+        self.close()
+
+    def __len__(self) -> int:
+        """Return the number of servers in the pool."""
+        return len(self.__servers)
+
+    def __str__(self) -> str:
+        """Return the string representation of the pool."""
+        healthy_count = sum(pooled.healthy for pooled in self.__servers)
+        active_count = sum(pooled.active_leases for pooled in self.__servers)
+        return (
+            f"ServerPool with {len(self.__servers)} server(s), {healthy_count} healthy, "
+            f"{active_count} active lease(s)"
+        )
+
+    @property
+    def servers(self) -> list:
+        """Servers of the pool."""
+        return [pooled.server for pooled in self.__servers]
+
+    @property
+    def max_leases_per_server(self) -> Optional[int]:
+        """Maximum number of concurrent leases of each server."""
+        return self.__max_leases_per_server
+
+    def acquire(self, timeout: Optional[float] = None):
+        """Lease the least-loaded healthy server of the pool.
+
+        The server must be given back with :meth:`release`. Prefer the :meth:`lease` context
+        manager, which releases the server automatically.
+
+        Parameters
+        ----------
+        timeout : float, default: None
+            Maximum duration in s to wait for a server, when all servers have reached their
+            maximum number of leases. If unspecified, there is no limit.
+
+        Returns
+        -------
+        BaseServer
+            Leased server.
+        """
+        # Imported here, because the PyAnsys Sound base classes depend on this module.
+        from ansys.sound.core._pyansys_sound import PyAnsysSoundException
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.__condition:
+            while True:
+                healthy_servers = [pooled for pooled in self.__servers if pooled.healthy]
+                if len(healthy_servers) == 0:
+                    raise PyAnsysSoundException("No healthy server is available in the pool.")
+
+                available_servers = [
+                    pooled
+                    for pooled in healthy_servers
+                    if self.__max_leases_per_server is None
+                    or pooled.active_leases < self.__max_leases_per_server
+                ]
+                if len(available_servers) > 0:
+                    # Least-loaded server first, then the least used one overall, so that the
+                    # servers are used in turn when the load is low.
+                    pooled = min(
+                        available_servers,
+                        key=lambda pooled: (pooled.active_leases, pooled.total_leases),
+                    )
+                    pooled.active_leases += 1
+                    pooled.total_leases += 1
+                    return pooled.server
+
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise PyAnsysSoundException(
+                        f"No server of the pool became available within {timeout} s."
+                    )
+                self.__condition.wait(remaining)
+
+    def release(self, server, healthy: bool = True):
+        """Give a leased server back to the pool.
+
+        Parameters
+        ----------
+        server : BaseServer
+            Server returned by :meth:`acquire`.
+        healthy : bool, default: True
+            Whether the server is still usable. Set to :obj:`False` if the processing failed
+            because of the server (lost connection, for example): the server is then no longer
+            leased, until :meth:`check_health` finds it healthy again.
+        """
+        # Imported here, because the PyAnsys Sound base classes depend on this module.
+        from ansys.sound.core._pyansys_sound import PyAnsysSoundException
+
+        with self.__condition:
+            pooled = self.__find(server)
+            if pooled is None or pooled.active_leases == 0:
+                raise PyAnsysSoundException("Server is not leased from this pool.")
+
+            pooled.active_leases -= 1
+            pooled.healthy = pooled.healthy and healthy
+            self.__condition.notify_all()
+
+    @contextmanager
+    def lease(self, timeout: Optional[float] = None) -> Iterator:
+        """Lease the least-loaded healthy server of the pool, for the duration of a context.
+
+        Parameters
+        ----------
+        timeout : float, default: None
+            Maximum duration in s to wait for a server, when all servers have reached their
+            maximum number of leases. If unspecified, there is no limit.
+
+        Yields
+        ------
+        BaseServer
+            Leased server, released when leaving the context.
+        """
+        server = self.acquire(timeout)
+        try:
+            yield server
+        finally:
+            self.release(server)
+
+    def check_health(self) -> list[bool]:
+        """Check that the servers of the pool are reachable and have the DPF Sound plugin loaded.
+
+        Unhealthy servers are no longer leased. Servers found healthy again are leased again.
+
+        Returns
+        -------
+        list[bool]
+            Health of each server of the pool, in the order of :attr:`servers`.
+        """
+        health = [self.__is_healthy(pooled.server) for pooled in self.__servers]
+        with self.__condition:
+            for pooled, healthy in zip(self.__servers, health):
+                pooled.healthy = healthy
+            self.__condition.notify_all()
+        return health
+
+    def get_statistics(self) -> list[dict]:
+        """Get the lease statistics of the servers of the pool.
+
+        Returns
+        -------
+        list[dict]
+            Statistics of each server, in the order of :attr:`servers`, with keys
+            ``"active_leases"`` (number of current leases), ``"total_leases"`` (number of leases
+            since the pool was created), and ``"healthy"``.
+        """
+        with self.__condition:
+            return [
+                {
+                    "active_leases": pooled.active_leases,
+                    "total_leases": pooled.total_leases,
+                    "healthy": pooled.healthy,
+                }
+                for pooled in self.__servers
+            ]
+
+    def get_startup_timings(self) -> list[dict[str, float]]:
+        """Get the duration of the startup phases of the servers of the pool.
+
+        Returns
+        -------
+        list[dict[str, float]]
+            Duration in s of the startup phases of each server, in the order of :attr:`servers`.
+            See :func:`start_warm_server` for the list of phases.
+        """
+        return [dict(pooled.startup_timings) for pooled in self.__servers]
+
+    def close(self):
+        """Release the licensing contexts, and shut down the servers started by the pool.
+
+        Servers that the pool connected to are left running.
+        """
+        with self.__condition:
+            servers, self.__servers = self.__servers, []
+            self.__condition.notify_all()
+
+        for pooled in servers:
+            pooled.license_context = None
+            if getattr(pooled.server, "local_server", False):  # pragma: no cover
+                pooled.server.shutdown()
+
+    def __find(self, server) -> Optional[_PooledServer]:
+        """Find the pooled server holding a server."""
+        for pooled in self.__servers:
+            if pooled.server is server:
+                return pooled
+        return None
+
+    @staticmethod
+    def __is_healthy(server) -> bool:
+        """Probe a server."""
+        try:
+            return HEALTH_CHECK_OPERATOR in available_operator_names(server)
+        except Exception:
+            return False
@@ -0,0 +1,302 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Helpers to start DPF servers ahead of demand, and warm them up."""
+
+from concurrent.futures import Future
+import threading
+import time
+from typing import Optional
+
+from ansys.dpf.core import (
+    LicenseContextManager,
+    _global_server,
+    available_operator_names,
+    server_types,
+)
+import numpy as np
+
+from ._connect_to_or_start_server import _connect_to_or_start_sound_server
+from ._operator_pool import _acquire_operator, _release_operator
+
+# DPF Sound operators preloaded by default in the operator pool of a warmed-up server. Only
+# operators that the PyAnsys Sound classes take from the pool (with _get_pooled_operator) are
+# worth preloading: the others would stay idle in the pool.
+DEFAULT_PRELOADED_OPERATORS = (
+    "load_wav_sas",
+    "write_wav_sas",
+    "apply_gain",
+    "sum_signals",
+    "compute_stft",
+    "compute_istft",
+    "resample",
+    "compute_level_over_time",
+    "compute_overall_level",
+    "compute_loudness_iso532_1",
+    "compute_loudness_iso532_1_vs_time",
+)
+
+# Number of samples and sampling frequency in Hz of the warm-up probe signal.
+PROBE_SAMPLE_COUNT = 1024
+PROBE_SAMPLING_FREQUENCY = 44100.0
+
+
+def warm_up_server(
+    server=None,
+    operators: Optional[list[str]] = None,
+    operator_count: int = 1,
+    run_probe: bool = True,
+) -> dict[str, float]:
+    """Warm up a DPF server with the DPF Sound plugin, before processing requests.
+
+    The first instantiation of each DPF Sound operator, and the first processing, are slower than
+    the following ones. This function moves this cost out of the critical path of the first
+    requests: it instantiates commonly used operators and stores them in the operator pool of the
+    server, where the PyAnsys Sound classes pick them up, and it runs a tiny end-to-end probe
+    (signal transfer, processing, and output retrieval), which also validates that the server
+    is ready.
+
+    Parameters
+    ----------
+    server : BaseServer, default: None
+        DPF server. If ``None``, the global server is used.
+    operators : list[str], default: None
+        Names of the operators to preload. If unspecified, a set of commonly used operators is
+        preloaded. Operators unavailable on the server are skipped.
+    operator_count : int, default: 1
+        Number of instances of each operator to preload, typically the number of concurrent
+        workers using the server. It is limited by the operator pool size (see
+        :func:`set_operator_pool_size`).
+    run_probe : bool, default: True
+        Whether to run the end-to-end probe.
+
+    Returns
+    -------
+    dict[str, float]
+        Duration in s of the warm-up phases, with keys ``"operator_preload"`` and ``"probe"``
+        (if the probe is run).
+
+    Examples
+    --------
+    >>> from ansys.sound.core.server_helpers import connect_to_or_start_server, warm_up_server
+    >>> server, _ = connect_to_or_start_server()
+    >>> timings = warm_up_server(server, operator_count=4)
+    """
+    # Imported here, because the PyAnsys Sound base classes depend on this module.
+    from ansys.sound.core._pyansys_sound import PyAnsysSoundException
+
+    if operator_count < 1:
+        raise PyAnsysSoundException("Number of preloaded operators must be at least 1.")
+
+    server = server if server is not None else _global_server()
+    operators = operators if operators is not None else DEFAULT_PRELOADED_OPERATORS
+    timings = {}
+
+    start_time = time.perf_counter()
+    available_operators = set(available_operator_names(server)) if len(operators) > 0 else set()
+    for name in operators:
+        if name not in available_operators:
+            continue
+        # All instances are acquired before being released, so that the pool keeps them all.
+        acquired_operators = [_acquire_operator(name, server=server) for _ in range(operator_count)]
+        for operator, server_reference in acquired_operators:
+            _release_operator(name, operator, server_reference)
+    timings["operator_preload"] = time.perf_counter() - start_time
+
+    if run_probe:
+        start_time = time.perf_counter()
+        _run_probe(server)
+        timings["probe"] = time.perf_counter() - start_time
+
+    return timings
+
+
+def _run_probe(server):
+    """Apply a gain to a short signal on a server, and check the result."""
+    # Imported here, because the PyAnsys Sound base classes depend on this module.
+    from ansys.sound.core._pyansys_sound import PyAnsysSoundException, _create_signal_field
+    from ansys.sound.core.signal_utilities import ApplyGain
+
+    time_vector = np.arange(PROBE_SAMPLE_COUNT) / PROBE_SAMPLING_FREQUENCY
+    data = np.sin(2 * np.pi * 1000.0 * time_vector)
+    signal = _create_signal_field(data, PROBE_SAMPLING_FREQUENCY, server=server)
+
+    gain = ApplyGain(signal=signal, gain=2.0, gain_in_db=False, server=server)
+    gain.process()
+    if not np.allclose(gain.get_output_as_nparray(), 2.0 * data):
+        raise PyAnsysSoundException("Warm-up probe returned unexpected results.")
+
+
+def start_warm_server(
+    port: Optional[int] = None,
+    ip: Optional[str] = None,
+    ansys_path: Optional[str] = None,
+    use_license_context: bool = False,
+    license_increment_name: str = "avrxp_snd_level1",
+    as_global: bool = True,
+    operators: Optional[list[str]] = None,
+    operator_count: int = 1,
+    run_probe: bool = True,
+) -> tuple[
+    server_types.InProcessServer | server_types.GrpcServer,
+    LicenseContextManager,
+    dict[str, float],
+]:
+    """Connect to or start a DPF server with the DPF Sound plugin, and warm it up.
+
+    This function does the same as :func:`connect_to_or_start_server`, and then warms the server
+    up with :func:`warm_up_server`. It also reports the duration of each startup phase, to track
+    the cold-start latency.
+
+    Parameters
+    ----------
+    port : int, default: None
+        Port that the DPF server is listening to.
+    ip : str, default: None
+        IP address for the DPF server.
+    ansys_path : str, default: None
+        Root path for the Ansys installation. This parameter is ignored if either the port or IP
+        address is set.
+    use_license_context : bool, default: False
+        Whether to check out the DPF Sound license increment before using PyAnsys Sound. See
+        :func:`connect_to_or_start_server`.
+    license_increment_name : str, default: "avrxp_snd_level1"
+        Name of the license increment to check out. Only taken into account if
+        ``use_license_context`` is :obj:`True`.
+    as_global : bool, default: True
+        Whether the server becomes the global server.
+    operators : list[str], default: None
+        Names of the operators to preload. See :func:`warm_up_server`.
+    operator_count : int, default: 1
+        Number of instances of each operator to preload. See :func:`warm_up_server`.
+    run_probe : bool, default: True
+        Whether to run the end-to-end probe. See :func:`warm_up_server`.
+
+    Returns
+    -------
+    InProcessServer | GrpcServer
+        Server object started or connected to.
+    LicenseContextManager
+        Licensing context object. :obj:`None` if ``use_license_context`` is set to
+        :obj:`False`.
+    dict[str, float]
+        Duration in s of the startup phases, with keys ``"server_start"``, ``"version_check"``,
+        ``"plugin_load"``, ``"license_checkout"`` (if a license context is used),
+        ``"operator_preload"``, ``"probe"`` (if the probe is run), and ``"total"``.
+
+    Examples
+    --------
+    >>> from ansys.sound.core.server_helpers import start_warm_server
+    >>> server, lic_context, timings = start_warm_server(use_license_context=True)
+    >>> print(timings)
+    """
+    return _start_warm_server(
+        port,
+        ip,
+        ansys_path,
+        use_license_context,
+        license_increment_name,
+        as_global,
+        operators,
+        operator_count,
+        run_probe,
+    )
+
+
+def _start_warm_server(
+    port: Optional[int] = None,
+    ip: Optional[str] = None,
+    ansys_path: Optional[str] = None,
+    use_license_context: bool = False,
+    license_increment_name: str = "avrxp_snd_level1",
+    as_global: bool = True,
+    operators: Optional[list[str]] = None,
+    operator_count: int = 1,
+    run_probe: bool = True,
+    use_port_from_environment: bool = True,
+) -> tuple[
+    server_types.InProcessServer | server_types.GrpcServer,
+    LicenseContextManager,
+    dict[str, float],
+]:
+    """Connect to or start a DPF server with the DPF Sound plugin, and warm it up.
+
+    Same as :func:`start_warm_server`, with the additional parameter
+    ``use_port_from_environment``: if :obj:`False`, the environment variable
+    ``ANSRV_DPF_SOUND_PORT`` is ignored, and a local server is started when neither the port nor
+    the IP address is set.
+    """
+    start_time = time.perf_counter()
+    timings = {}
+    server = _connect_to_or_start_sound_server(
+        port, ip, ansys_path, as_global, timings, use_port_from_environment
+    )
+
+    lic_context = None
+    if use_license_context:
+        phase_start_time = time.perf_counter()
+        lic_context = LicenseContextManager(license_increment_name, server=server)
+        timings["license_checkout"] = time.perf_counter() - phase_start_time
+
+    timings.update(warm_up_server(server, operators, operator_count, run_probe))
+    timings["total"] = time.perf_counter() - start_time
+
+    return server, lic_context, timings
+
+
+def start_warm_server_in_background(**kwargs) -> Future:
+    """Start and warm up a DPF server in a background thread, ahead of demand.
+
+    The server starts while the application does something else, for example, while a worker
+    initializes or waits for its first request.
+
+    Parameters
+    ----------
+    **kwargs
+        Arguments of :func:`start_warm_server`.
+
+    Returns
+    -------
+    concurrent.futures.Future
+        Future whose result is the output of :func:`start_warm_server`, that is, the server, the
+        licensing context, and the startup phase durations. If the startup fails, the future
+        holds the exception.
+
+    Examples
+    --------
+    >>> from ansys.sound.core.server_helpers import start_warm_server_in_background
+    >>> future = start_warm_server_in_background(use_license_context=True)
+    >>> # Do something else, then wait for the server when the first request arrives.
+    >>> server, lic_context, timings = future.result()
+    """
+    future = Future()
+
+    def start():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(start_warm_server(**kwargs))
+        except BaseException as exception:
+            future.set_exception(exception)
+
+    threading.Thread(target=start, name="PyAnsysSoundWarmStart", daemon=True).start()
+    return future
@@ -24,12 +24,17 @@
 
 import warnings
 
-from ansys.dpf.core import Field, Operator, TimeFreqSupport, fields_factory, locations
+from ansys.dpf.core import Field, TimeFreqSupport, fields_factory, locations
 from ansys.dpf.core.available_result import Homogeneity
-import matplotlib.pyplot as plt
 import numpy as np
 
-from .._pyansys_sound import PyAnsysSoundException, PyAnsysSoundWarning, scipy_required
+from .._pyansys_sound import (
+    PyAnsysSoundException,
+    PyAnsysSoundWarning,
+    _convert_field_to_np_array,
+    _PipelineStage,
+    scipy_required,
+)
 from ..server_helpers._check_version import _check_sound_version
 from ..signal_processing import SignalProcessingParent
 
@@ -133,9 +138,9 @@ class Filter(SignalProcessingParent):
         """
         super().__init__()
 
-        self.__operator_design = Operator(ID_OPERATOR_DESIGN)
-        self.__operator_load = Operator(ID_OPERATOR_LOAD)
-        self.__operator_filter = Operator(ID_OPERATOR_FILTER)
+        self.__operator_design = self._get_pooled_operator(ID_OPERATOR_DESIGN)
+        self.__operator_load = self._get_pooled_operator(ID_OPERATOR_LOAD)
+        self.__operator_filter = self._get_pooled_operator(ID_OPERATOR_FILTER)
 
         self.__sampling_frequency = sampling_frequency
 
@@ -308,6 +313,18 @@ class Filter(SignalProcessingParent):
                 f"Input signal is not set. Use `{__class__.__name__}.signal`."
             )
 
+        # Set operator inputs.
+        self.__operator_filter.connect(0, self.signal)
+        self.__connect_parameters()
+
+        # Run the operator.
+        self.__operator_filter.run()
+
+        # Get the output.
+        self.__store_output()
+
+    def __connect_parameters(self):
+        """Check and connect the operator inputs, except the signal."""
         if self.a_coefficients is None or len(self.a_coefficients) == 0:
             raise PyAnsysSoundException(
                 "Filter's denominator coefficients (a_coefficients) must be defined and cannot be "
@@ -324,17 +341,25 @@ class Filter(SignalProcessingParent):
                 f"`{__class__.__name__}.design_FIR_from_FRF_file()` method."
             )
 
-        # Set operator inputs.
-        self.__operator_filter.connect(0, self.signal)
         self.__operator_filter.connect(1, list(self.b_coefficients))
         self.__operator_filter.connect(2, list(self.a_coefficients))
 
-        # Run the operator.
-        self.__operator_filter.run()
-
-        # Get the output.
+    def __store_output(self):
+        """Store the operator output."""
         self._output = self.__operator_filter.get_output(0, "field")
 
+    def _get_pipeline_stage(self) -> _PipelineStage:
+        """Get the DPF operator of the instance, for use in a pipeline.
+
+        Returns
+        -------
+        _PipelineStage
+            DPF operator, with all inputs but the signal connected, signal input and output pins,
+            and function storing the operator outputs.
+        """
+        self.__connect_parameters()
+        return _PipelineStage(self.__operator_filter, 0, 0, self.__store_output)
+
     def get_output(self) -> Field:
         """Get the filtered signal as a DPF field.
 
@@ -365,10 +390,12 @@ class Filter(SignalProcessingParent):
         if output == None:
             return np.array([])
 
-        return np.array(output.data)
+        return _convert_field_to_np_array(output)
 
     def plot(self):
         """Plot the filtered signal in a figure."""
+        import matplotlib.pyplot as plt
+
         if self._output == None:
             raise PyAnsysSoundException(
                 f"Output is not processed yet. Use the `{__class__.__name__}.process()` method."
@@ -388,6 +415,8 @@ class Filter(SignalProcessingParent):
 
     def plot_FRF(self):
         """Plot the frequency response function (FRF) of the filter."""
+        import matplotlib.pyplot as plt
+
         if self.frf is None:
             raise PyAnsysSoundException(
                 "Filter's frequency response function (FRF) is not set. Use "
@@ -468,16 +497,16 @@ class Filter(SignalProcessingParent):
             )
 
             f_freq = fields_factory.create_scalar_field(
-                num_entities=1, location=locations.time_freq
+                num_entities=1, location=locations.time_freq, server=self._server
             )
             f_freq.append(freq, 1)
 
-            frf_support = TimeFreqSupport()
+            frf_support = TimeFreqSupport(server=self._server)
             frf_support.time_frequencies = f_freq
 
             # Bypass the FRF setter to avoid infinite loops.
             self.__frf = fields_factory.create_scalar_field(
-                num_entities=1, location=locations.time_freq
+                num_entities=1, location=locations.time_freq, server=self._server
             )
             self.__frf.append(20 * np.log10(abs(complex_response)), 1)
             if _check_sound_version("2026.1.0"):
@@ -30,6 +30,7 @@ from .apply_gain import ApplyGain
 from .create_signal_field import CreateSignalField
 from .crop_signal import CropSignal
 from .load_wav import LoadWav
+from .load_wav_local import LoadWavLocal
 from .resample import Resample
 from .sum_signals import SumSignals
 from .write_wav import WriteWav
@@ -38,6 +39,7 @@ from .zero_pad import ZeroPad
 __all__ = (
     "SignalUtilitiesParent",
     "LoadWav",
+    "LoadWavLocal",
     "WriteWav",
     "Resample",
     "ZeroPad",
@@ -23,7 +23,6 @@
 """Signal utilities."""
 
 from ansys.dpf.core import Field
-import matplotlib.pyplot as plt
 
 from .._pyansys_sound import PyAnsysSound, PyAnsysSoundException
 
@@ -37,6 +36,8 @@ class SignalUtilitiesParent(PyAnsysSound):
 
     def plot(self):
         """Plot the resulting signals in a single figure."""
+        import matplotlib.pyplot as plt
+
         if self._output is None:
             raise PyAnsysSoundException(
                 "Output is not processed yet. "
@@ -24,11 +24,16 @@
 
 import warnings
 
-from ansys.dpf.core import Field, Operator, types
+from ansys.dpf.core import Field, types
 import numpy as np
 
 from . import SignalUtilitiesParent
-from .._pyansys_sound import PyAnsysSoundException, PyAnsysSoundWarning
+from .._pyansys_sound import (
+    PyAnsysSoundException,
+    PyAnsysSoundWarning,
+    _convert_field_to_np_array,
+    _PipelineStage,
+)
 
 
 class ApplyGain(SignalUtilitiesParent):
@@ -65,7 +70,7 @@ class ApplyGain(SignalUtilitiesParent):
         self.signal = signal
         self.gain = gain
         self.gain_in_db = gain_in_db
-        self.__operator = Operator("apply_gain")
+        self.__operator = self._get_pooled_operator("apply_gain")
 
     @property
     def signal(self) -> Field:
@@ -120,15 +125,35 @@ class ApplyGain(SignalUtilitiesParent):
             )
 
         self.__operator.connect(0, self.signal)
-        self.__operator.connect(1, float(self.gain))
-        self.__operator.connect(2, bool(self.gain_in_db))
+        self.__connect_parameters()
 
         # Runs the operator
         self.__operator.run()
 
         # Stores output in the variable
+        self.__store_output()
+
+    def __connect_parameters(self):
+        """Connect the operator inputs, except the signal."""
+        self.__operator.connect(1, float(self.gain))
+        self.__operator.connect(2, bool(self.gain_in_db))
+
+    def __store_output(self):
+        """Store the operator output."""
         self._output = self.__operator.get_output(0, types.field)
 
+    def _get_pipeline_stage(self) -> _PipelineStage:
+        """Get the DPF operator of the instance, for use in a pipeline.
+
+        Returns
+        -------
+        _PipelineStage
+            DPF operator, with all inputs but the signal connected, signal input and output pins,
+            and function storing the operator outputs.
+        """
+        self.__connect_parameters()
+        return _PipelineStage(self.__operator, 0, 0, self.__store_output)
+
     def get_output(self) -> Field:
         """Get the signal with a gain as a DPF field.
 
@@ -155,4 +180,4 @@ class ApplyGain(SignalUtilitiesParent):
         numpy.ndarray
             Signal with an applied gain as a NumPy array.
         """
-        return np.array(self.get_output().data)
+        return _convert_field_to_np_array(self.get_output())
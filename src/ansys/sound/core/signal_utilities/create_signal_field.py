@@ -24,11 +24,11 @@
 
 import warnings
 
-from ansys.dpf.core import Field, Operator
+from ansys.dpf.core import Field
 import numpy as np
 
 from . import SignalUtilitiesParent
-from .._pyansys_sound import PyAnsysSoundException, PyAnsysSoundWarning
+from .._pyansys_sound import PyAnsysSoundException, PyAnsysSoundWarning, _convert_field_to_np_array
 
 
 class CreateSignalField(SignalUtilitiesParent):
@@ -72,7 +72,7 @@ class CreateSignalField(SignalUtilitiesParent):
         self.data = data
         self.sampling_frequency = sampling_frequency
         self.unit = unit
-        self.__operator = Operator("create_field_from_vector")
+        self.__operator = self._get_pooled_operator("create_field_from_vector")
 
     @property
     def data(self) -> np.ndarray:
@@ -153,4 +153,4 @@ class CreateSignalField(SignalUtilitiesParent):
             Time-domain signal data in a NumPy array.
         """
         output = self.get_output()
-        return output.data
+        return _convert_field_to_np_array(output)
@@ -24,11 +24,11 @@
 
 import warnings
 
-from ansys.dpf.core import Field, Operator, types
+from ansys.dpf.core import Field, types
 import numpy as np
 
 from . import SignalUtilitiesParent
-from .._pyansys_sound import PyAnsysSoundException, PyAnsysSoundWarning
+from .._pyansys_sound import PyAnsysSoundException, PyAnsysSoundWarning, _convert_field_to_np_array
 
 
 class CropSignal(SignalUtilitiesParent):
@@ -62,7 +62,7 @@ class CropSignal(SignalUtilitiesParent):
         self.signal = signal
         self.start_time = start_time
         self.end_time = end_time
-        self.__operator = Operator("get_cropped_signal")
+        self.__operator = self._get_pooled_operator("get_cropped_signal")
 
     @property
     def start_time(self) -> float:
@@ -146,4 +146,4 @@ class CropSignal(SignalUtilitiesParent):
         numpy.ndarray
             Cropped signal in a NumPy array.
         """
-        return np.array(self.get_output().data)
+        return _convert_field_to_np_array(self.get_output())
@@ -24,13 +24,19 @@
 
 import warnings
 
-from ansys.dpf.core import DataSources, Field, Operator, types
+from ansys.dpf.core import Field, types
 import numpy as np
 
 from ansys.sound.core.server_helpers import requires_sound_version
 
 from . import SignalUtilitiesParent
-from .._pyansys_sound import PyAnsysSoundException, PyAnsysSoundWarning
+from .._operator_emulator import _create_data_sources
+from .._pyansys_sound import (
+    PyAnsysSoundException,
+    PyAnsysSoundWarning,
+    _PipelineStage,
+    convert_fields_container_to_np_array,
+)
 
 
 class LoadWav(SignalUtilitiesParent):
@@ -64,7 +70,7 @@ class LoadWav(SignalUtilitiesParent):
         """
         super().__init__()
         self.path_to_wav = path_to_wav
-        self.__operator = Operator("load_wav_sas")
+        self.__operator = self._get_pooled_operator("load_wav_sas")
 
     @property
     def path_to_wav(self) -> str:
@@ -81,6 +87,16 @@ class LoadWav(SignalUtilitiesParent):
 
         This method calls the appropriate DPF Sound operator to load the WAV file.
         """
+        self.__connect_parameters()
+
+        # Run the operator
+        self.__operator.run()
+
+        # Store outputs
+        self.__store_output()
+
+    def __connect_parameters(self):
+        """Check and connect the operator input."""
         if self.path_to_wav == "":
             raise PyAnsysSoundException(
                 "Path for loading WAV file is not specified. Use "
@@ -88,23 +104,30 @@ class LoadWav(SignalUtilitiesParent):
             )
 
         # Load a WAV file
-        data_source_in = DataSources()
-
-        # Create input path
-        data_source_in.add_file_path(self.path_to_wav, ".wav")
+        data_source_in = _create_data_sources(self.path_to_wav, ".wav", server=self._server)
 
         # Load WAV file and store it in a container
         self.__operator.connect(0, data_source_in)
 
-        # Run the operator
-        self.__operator.run()
-
-        # Store outputs
+    def __store_output(self):
+        """Store the operator output."""
         self._output = [f for f in self.__operator.get_output(0, types.fields_container)]
         # Note: sampling frequency and format are retrieved within their respective getter methods,
         # because their availabilility depends on the DPF Sound plugin version (which is managed by
         # these methods' `requires_sound_version` decorator).
 
+    def _get_pipeline_stage(self) -> _PipelineStage:
+        """Get the DPF operator of the instance, for use in a pipeline.
+
+        Returns
+        -------
+        _PipelineStage
+            DPF operator, with its input connected, no signal input pin, output pin of the loaded
+            signal (as a DPF fields container), and function storing the operator output.
+        """
+        self.__connect_parameters()
+        return _PipelineStage(self.__operator, None, 0, self.__store_output)
+
     def get_output(self) -> list[Field]:
         """Get the signal loaded from the WAV file as list of DPF fields.
 
@@ -134,9 +157,7 @@ class LoadWav(SignalUtilitiesParent):
         output = self.get_output()
         if output is None:
             return np.array([])
-        if len(output) == 1:
-            return np.array(output[0].data)
-        return np.vstack([np.array(f.data) for f in output])
+        return convert_fields_container_to_np_array(output)
 
     @requires_sound_version("2026.1.0")
     def get_sampling_frequency(self) -> float:
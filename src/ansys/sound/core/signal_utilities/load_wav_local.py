@@ -0,0 +1,345 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Loads a signal from a local WAV file using memory mapping."""
+
+import os
+import struct
+import warnings
+
+from ansys.dpf.core import Field
+import numpy as np
+
+from . import SignalUtilitiesParent
+from .._pyansys_sound import (
+    PyAnsysSoundException,
+    PyAnsysSoundWarning,
+    _create_signal_field,
+    _get_real_dtype,
+)
+
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_IEEE_FLOAT = 0x0003
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+RF64_SIZE_PLACEHOLDER = 0xFFFFFFFF
+
+# Sample formats, indexed by (format tag, bits per sample): format name, stored data type, and
+# full-scale value used for normalization.
+SAMPLE_FORMATS = {
+    (WAVE_FORMAT_PCM, 8): ("int8", np.uint8, 128.0),
+    (WAVE_FORMAT_PCM, 16): ("int16", np.dtype("<i2"), 32768.0),
+    (WAVE_FORMAT_PCM, 24): ("int24", np.uint8, 8388608.0),
+    (WAVE_FORMAT_PCM, 32): ("int32", np.dtype("<i4"), 2147483648.0),
+    (WAVE_FORMAT_IEEE_FLOAT, 32): ("float32", np.dtype("<f4"), 1.0),
+}
+
+
+class LoadWavLocal(SignalUtilitiesParent):
+    """Load a signal, and its sampling frequency and format from a local WAV file.
+
+    Unlike :class:`LoadWav`, which decodes the file on the DPF server, this class decodes the file
+    on the client side. The audio samples are memory-mapped, and each channel is converted into a
+    DPF field by transferring a contiguous NumPy buffer, without any conversion into Python lists.
+    This is well suited to large recordings that are available locally. RIFF and RF64 files are
+    supported, with PCM samples (8, 16, 24, or 32 bits) or 32-bit floating-point samples.
+
+    .. note::
+        Integer samples are normalized to the [-1, 1] range. Calibration data that Ansys Sound
+        stores in its own WAV chunks is not read: use :class:`LoadWav` to load calibrated files.
+
+    .. seealso::
+        :class:`LoadWav`
+
+    Examples
+    --------
+    Load a signal from a local WAV file.
+
+    >>> from ansys.sound.core.signal_utilities import LoadWavLocal
+    >>> load_wav = LoadWavLocal(path_to_wav="path/to/file.wav")
+    >>> load_wav.process()
+    >>> signal = load_wav.get_output()
+    >>> sampling_frequency = load_wav.get_sampling_frequency()
+    """
+
+    def __init__(self, path_to_wav: str = ""):
+        """Class instantiation takes the following parameters.
+
+        Parameters
+        ----------
+        path_to_wav : str, default: ""
+            Local path to the WAV file to load. The path can be set during the instantiation
+            of the object or with the ``LoadWavLocal.path_to_wav`` attribute.
+        """
+        super().__init__()
+        self.path_to_wav = path_to_wav
+
+        self.__samples = None
+        self.__sampling_frequency = None
+        self.__format = None
+
+    @property
+    def path_to_wav(self) -> str:
+        """Local path to the WAV file."""
+        return self.__path_to_wav
+
+    @path_to_wav.setter
+    def path_to_wav(self, path_to_wav: str):
+        """Set the path to the WAV file."""
+        self.__path_to_wav = path_to_wav
+
+    def process(self):
+        """Load the WAV file.
+
+        This method reads the WAV file header, memory-maps the audio samples, and creates one DPF
+        field per channel.
+        """
+        if self.path_to_wav == "":
+            raise PyAnsysSoundException(
+                "Path for loading WAV file is not specified. Use "
+                f"`{self.__class__.__name__}.path_to_wav`."
+            )
+
+        if not os.path.isfile(self.path_to_wav):
+            raise PyAnsysSoundException(f"WAV file '{self.path_to_wav}' does not exist.")
+
+        self.__samples, self.__sampling_frequency, self.__format = self.__map_samples()
+
+        name = os.path.splitext(os.path.basename(self.path_to_wav))[0]
+        self._output = [
+            _create_signal_field(
+                self.__decode_channel(channel),
+                self.__sampling_frequency,
+                unit="Pa",
+                name=name,
+                server=self._server,
+            )
+            for channel in range(self.__samples.shape[1])
+        ]
+
+    def get_output(self) -> list[Field]:
+        """Get the signal loaded from the WAV file as list of DPF fields.
+
+        Returns
+        -------
+        list[Field]
+            Signal loaded from the WAV file as a list of DPF fields (one per channel).
+        """
+        if self._output is None:
+            warnings.warn(
+                PyAnsysSoundWarning(
+                    f"Output is not processed yet. Use the `{self.__class__.__name__}.process()` "
+                    "method."
+                )
+            )
+
+        return self._output
+
+    def get_output_as_nparray(self) -> np.ndarray:
+        """Get the signal loaded from the WAV file as a NumPy array.
+
+        The samples are decoded from the memory-mapped file, without retrieving the data of the
+        output DPF fields. The array has the precision set with :func:`.set_numpy_precision`.
+
+        Returns
+        -------
+        numpy.ndarray
+            Signal loaded from the WAV file in a NumPy array. The array is 1D for a single-channel
+            file, and 2D (channels, samples) otherwise.
+        """
+        if self.get_output() is None:
+            return np.array([])
+
+        dtype = _get_real_dtype()
+        channel_count = self.__samples.shape[1]
+        if channel_count == 1:
+            return self.__decode_channel(0).astype(dtype, copy=False)
+        return np.vstack(
+            [self.__decode_channel(channel) for channel in range(channel_count)]
+        ).astype(dtype, copy=False)
+
+    def get_sampling_frequency(self) -> float:
+        """Get the sampling frequency in Hz of the loaded signal.
+
+        The sampling frequency is read from the file header: no DPF operator is called.
+
+        Returns
+        -------
+        float
+            Sampling frequency in Hz of the loaded signal.
+        """
+        if self._output is None:
+            warnings.warn(
+                PyAnsysSoundWarning(
+                    f"Output is not processed yet. Use the `{self.__class__.__name__}.process()` "
+                    "method."
+                )
+            )
+            return None
+
+        return self.__sampling_frequency
+
+    def get_format(self) -> str:
+        """Get the format of the loaded WAV file.
+
+        Returns
+        -------
+        str
+            Format of the loaded WAV file. Can be either "float32", "int32", "int24", "int16", or
+            "int8".
+        """
+        if self._output is None:
+            warnings.warn(
+                PyAnsysSoundWarning(
+                    f"Output is not processed yet. Use the `{self.__class__.__name__}.process()` "
+                    "method."
+                )
+            )
+            return None
+
+        return self.__format
+
+    def __map_samples(self) -> tuple[np.memmap, float, str]:
+        """Parse the WAV file header and memory-map the audio samples.
+
+        Returns
+        -------
+        numpy.memmap
+            Memory-mapped samples, with shape (frames, channels), or (frames, channels, 3) for
+            24-bit samples.
+        float
+            Sampling frequency in Hz.
+        str
+            Sample format.
+        """
+        file_size = os.path.getsize(self.path_to_wav)
+        fmt = None
+        data_offset = None
+        data_size = None
+        rf64_data_size = None
+        has_calibration = False
+
+        with open(self.path_to_wav, "rb") as file:
+            header = file.read(12)
+            if len(header) < 12 or header[:4] not in (b"RIFF", b"RF64") or header[8:] != b"WAVE":
+                raise PyAnsysSoundException(
+                    f"File '{self.path_to_wav}' is not a valid RIFF or RF64 WAV file."
+                )
+            is_rf64 = header[:4] == b"RF64"
+
+            while True:
+                chunk_header = file.read(8)
+                if len(chunk_header) < 8:
+                    break
+                chunk_id, chunk_size = chunk_header[:4], struct.unpack("<I", chunk_header[4:])[0]
+                chunk_start = file.tell()
+
+                if chunk_id == b"ds64":
+                    _, rf64_data_size = struct.unpack("<QQ", file.read(16))
+                elif chunk_id == b"fmt ":
+                    fmt = file.read(chunk_size)
+                elif chunk_id == b"data":
+                    data_offset = chunk_start
+                    data_size = chunk_size
+                    if is_rf64 and chunk_size == RF64_SIZE_PLACEHOLDER:
+                        data_size = rf64_data_size
+                    data_size = min(data_size, file_size - data_offset)
+                    chunk_size = data_size
+                elif chunk_id == b"VRXP":
+                    has_calibration = True
+
+                next_chunk = chunk_start + chunk_size + (chunk_size % 2)
+                if next_chunk > file_size:
+                    break
+                file.seek(next_chunk)
+
+        if fmt is None or len(fmt) < 16 or data_offset is None:
+            raise PyAnsysSoundException(
+                f"File '{self.path_to_wav}' is not a valid WAV file (missing format or data)."
+            )
+
+        format_tag, channel_count, sampling_frequency, _, block_align, bits_per_sample = (
+            struct.unpack("<HHIIHH", fmt[:16])
+        )
+        if format_tag == WAVE_FORMAT_EXTENSIBLE and len(fmt) >= 26:
+            # The actual format tag is stored in the first two bytes of the sub-format GUID.
+            format_tag = struct.unpack("<H", fmt[24:26])[0]
+
+        if (format_tag, bits_per_sample) not in SAMPLE_FORMATS:
+            raise PyAnsysSoundException(
+                f"Format of WAV file '{self.path_to_wav}' is not supported. Supported formats are "
+                "8-, 16-, 24-, and 32-bit PCM, and 32-bit floating point."
+            )
+        format_name, dtype, _ = SAMPLE_FORMATS[(format_tag, bits_per_sample)]
+
+        if has_calibration:
+            warnings.warn(
+                PyAnsysSoundWarning(
+                    f"WAV file '{self.path_to_wav}' contains Ansys Sound calibration data, which "
+                    f"is not applied by {self.__class__.__name__}. Use LoadWav to load the "
+                    "calibrated signal."
+                )
+            )
+
+        frame_count = data_size // block_align
+        if format_name == "int24":
+            shape = (frame_count, channel_count, 3)
+        else:
+            shape = (frame_count, channel_count)
+
+        samples = np.memmap(
+            self.path_to_wav, dtype=dtype, mode="r", offset=data_offset, shape=shape
+        )
+
+        return samples, float(sampling_frequency), format_name
+
+    def __decode_channel(self, channel: int) -> np.ndarray:
+        """Decode the samples of one channel into normalized double-precision values.
+
+        Parameters
+        ----------
+        channel : int
+            Channel index.
+
+        Returns
+        -------
+        numpy.ndarray
+            Decoded samples of the channel.
+        """
+        full_scale = {name: scale for name, _, scale in SAMPLE_FORMATS.values()}[self.__format]
+        samples = self.__samples[:, channel]
+
+        match self.__format:
+            case "int8":
+                # 8-bit WAV samples are unsigned, with an offset of 128.
+                return (samples.astype(np.float64) - 128.0) / full_scale
+            case "int24":
+                # Assemble little-endian 3-byte samples, with sign extension of the upper byte.
+                values = (
+                    samples[:, 0].astype(np.int32)
+                    | (samples[:, 1].astype(np.int32) << 8)
+                    | (samples[:, 2].astype(np.int8).astype(np.int32) << 16)
+                )
+                return values / full_scale
+            case "float32":
+                return samples.astype(np.float64)
+            case _:
+                return samples / full_scale
@@ -24,11 +24,16 @@
 
 import warnings
 
-from ansys.dpf.core import Field, Operator, types
+from ansys.dpf.core import Field, types
 import numpy as np
 
 from . import SignalUtilitiesParent
-from .._pyansys_sound import PyAnsysSoundException, PyAnsysSoundWarning
+from .._pyansys_sound import (
+    PyAnsysSoundException,
+    PyAnsysSoundWarning,
+    _convert_field_to_np_array,
+    _PipelineStage,
+)
 
 
 class Resample(SignalUtilitiesParent):
@@ -61,7 +66,7 @@ class Resample(SignalUtilitiesParent):
         super().__init__()
         self.signal = signal
         self.new_sampling_frequency = new_sampling_frequency
-        self.__operator = Operator("resample")
+        self.__operator = self._get_pooled_operator("resample")
 
     @property
     def new_sampling_frequency(self) -> float:
@@ -100,14 +105,34 @@ class Resample(SignalUtilitiesParent):
             )
 
         self.__operator.connect(0, self.signal)
-        self.__operator.connect(1, float(self.new_sampling_frequency))
+        self.__connect_parameters()
 
         # Runs the operator
         self.__operator.run()
 
         # Stores output in the variable
+        self.__store_output()
+
+    def __connect_parameters(self):
+        """Connect the operator inputs, except the signal."""
+        self.__operator.connect(1, float(self.new_sampling_frequency))
+
+    def __store_output(self):
+        """Store the operator output."""
         self._output = self.__operator.get_output(0, types.field)
 
+    def _get_pipeline_stage(self) -> _PipelineStage:
+        """Get the DPF operator of the instance, for use in a pipeline.
+
+        Returns
+        -------
+        _PipelineStage
+            DPF operator, with all inputs but the signal connected, signal input and output pins,
+            and function storing the operator outputs.
+        """
+        self.__connect_parameters()
+        return _PipelineStage(self.__operator, 0, 0, self.__store_output)
+
     def get_output(self) -> Field:
         """Get the resampled signal as a DPF field.
 
@@ -130,4 +155,4 @@ class Resample(SignalUtilitiesParent):
         numpy.ndarray
             Resampled signal in a NumPy array.
         """
-        return np.array(self.get_output().data)
+        return _convert_field_to_np_array(self.get_output())
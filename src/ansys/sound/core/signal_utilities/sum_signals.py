@@ -24,11 +24,11 @@
 
 import warnings
 
-from ansys.dpf.core import Field, Operator, fields_container_factory, types
+from ansys.dpf.core import Field, fields_container_factory, types
 import numpy as np
 
 from . import SignalUtilitiesParent
-from .._pyansys_sound import PyAnsysSoundException, PyAnsysSoundWarning
+from .._pyansys_sound import PyAnsysSoundException, PyAnsysSoundWarning, _convert_field_to_np_array
 
 
 class SumSignals(SignalUtilitiesParent):
@@ -56,7 +56,7 @@ class SumSignals(SignalUtilitiesParent):
         """
         super().__init__()
         self.signals = signals
-        self.__operator = Operator("sum_signals")
+        self.__operator = self._get_pooled_operator("sum_signals")
 
     @property
     def signals(self) -> list[Field]:
@@ -90,7 +90,7 @@ class SumSignals(SignalUtilitiesParent):
             )
 
         signal_as_fields_container = fields_container_factory.over_time_freq_fields_container(
-            self.signals
+            self.signals, server=self._server
         )
         self.__operator.connect(0, signal_as_fields_container)
 
@@ -124,4 +124,4 @@ class SumSignals(SignalUtilitiesParent):
             Summed signal in a NumPy array.
         """
         output = self.get_output()
-        return output.data
+        return _convert_field_to_np_array(output)
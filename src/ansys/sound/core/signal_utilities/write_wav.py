@@ -24,9 +24,10 @@
 
 import warnings
 
-from ansys.dpf.core import DataSources, Field, Operator, fields_container_factory
+from ansys.dpf.core import Field, fields_container_factory
 
 from . import SignalUtilitiesParent
+from .._operator_emulator import _create_data_sources
 from .._pyansys_sound import PyAnsysSoundException, PyAnsysSoundWarning
 
 
@@ -77,7 +78,7 @@ class WriteWav(SignalUtilitiesParent):
         self.path_to_write = path_to_write
         self.signal = signal
         self.bit_depth = bit_depth
-        self.__operator = Operator("write_wav_sas")
+        self.__operator = self._get_pooled_operator("write_wav_sas")
 
     @property
     def signal(self) -> Field | list[Field]:
@@ -146,14 +147,13 @@ class WriteWav(SignalUtilitiesParent):
             raise PyAnsysSoundException("No signal is specified for writing to a WAV file. \
                     Use `WriteWav.signal`.")
 
-        data_source_out = DataSources()
-        data_source_out.add_file_path(self.path_to_write, ".wav")
+        data_source_out = _create_data_sources(self.path_to_write, ".wav", server=self._server)
 
         signal = self.signal
         if isinstance(signal, Field):
             signal = [signal]
         signal_as_fields_container = fields_container_factory.over_time_freq_fields_container(
-            signal
+            signal, server=self._server
         )
         self.__operator.connect(0, signal_as_fields_container)
         self.__operator.connect(1, data_source_out)
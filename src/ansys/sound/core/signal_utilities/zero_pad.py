@@ -24,11 +24,11 @@
 
 import warnings
 
-from ansys.dpf.core import Field, Operator, types
+from ansys.dpf.core import Field, types
 import numpy as np
 
 from . import SignalUtilitiesParent
-from .._pyansys_sound import PyAnsysSoundException, PyAnsysSoundWarning
+from .._pyansys_sound import PyAnsysSoundException, PyAnsysSoundWarning, _convert_field_to_np_array
 
 
 class ZeroPad(SignalUtilitiesParent):
@@ -57,7 +57,7 @@ class ZeroPad(SignalUtilitiesParent):
         super().__init__()
         self.signal = signal
         self.duration_zeros = duration_zeros
-        self.__operator = Operator("append_zeros_to_signal")
+        self.__operator = self._get_pooled_operator("append_zeros_to_signal")
 
     @property
     def signal(self) -> Field:
@@ -126,4 +126,4 @@ class ZeroPad(SignalUtilitiesParent):
         numpy.ndarray
             Zero-padded signal in a NumPy array.
         """
-        return np.array(self.get_output().data)
+        return _convert_field_to_np_array(self.get_output())
@@ -25,8 +25,7 @@
 import os
 import warnings
 
-from ansys.dpf.core import Field, GenericDataContainersCollection, Operator, types
-from matplotlib import pyplot as plt
+from ansys.dpf.core import Field, GenericDataContainersCollection, types
 import numpy as np
 
 from ansys.sound.core.signal_utilities import SumSignals
@@ -77,8 +76,8 @@ class SoundComposer(SoundComposerParent):
             Path to the Sound Composer project file to load (.scn).
         """
         super().__init__()
-        self.__operator_load = Operator(ID_OPERATOR_LOAD)
-        self.__operator_save = Operator(ID_OPERATOR_SAVE)
+        self.__operator_load = self._get_pooled_operator(ID_OPERATOR_LOAD)
+        self.__operator_save = self._get_pooled_operator(ID_OPERATOR_SAVE)
 
         self.tracks = []
         self.name = "Unnamed"
@@ -167,7 +166,7 @@ class SoundComposer(SoundComposerParent):
 
         self.tracks = []
         for i in range(len(track_collection)):
-            track = Track()
+            track = Track(server=self._server)
             track.set_from_generic_data_containers(track_collection.get_entry({"track_index": i}))
             self.add_track(track)
 
@@ -228,7 +227,7 @@ class SoundComposer(SoundComposerParent):
                 track_signal.unit = ""
                 track_signals.append(track_signal)
 
-            track_sum = SumSignals(signals=track_signals)
+            track_sum = SumSignals(signals=track_signals, server=self._server)
             track_sum.process()
 
             self._output = track_sum.get_output()
@@ -266,6 +265,8 @@ class SoundComposer(SoundComposerParent):
 
     def plot(self):
         """Plot the generated signal of the Sound Composer project."""
+        from matplotlib import pyplot as plt
+
         if self._output is None:
             raise PyAnsysSoundException(
                 f"Output is not processed yet. Use the `{__class__.__name__}.process()` method."
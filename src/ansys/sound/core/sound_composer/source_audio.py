@@ -25,7 +25,6 @@
 import warnings
 
 from ansys.dpf.core import Field, GenericDataContainer, Operator
-from matplotlib import pyplot as plt
 import numpy as np
 
 from ansys.sound.core.signal_utilities import LoadWav, Resample
@@ -68,7 +67,7 @@ class SourceAudio(SourceParent):
         super().__init__()
 
         # Define DPF Sound operators.
-        self.__operator_load = Operator(ID_LOAD_FROM_TEXT)
+        self.__operator_load = Operator(ID_LOAD_FROM_TEXT, server=self._server)
 
         # Load the audio file, if specified.
         if len(file) > 0:
@@ -129,7 +128,7 @@ class SourceAudio(SourceParent):
         file : str
             Path to the WAV file.
         """
-        loader = LoadWav(file)
+        loader = LoadWav(file, server=self._server)
         loader.process()
         signal = loader.get_output()
 
@@ -203,7 +202,7 @@ class SourceAudio(SourceParent):
             )
             return (None, None)
         else:
-            source_data = GenericDataContainer()
+            source_data = GenericDataContainer(server=self._server)
             source_data.set_property("sound_composer_source", self.source_audio_data)
             return (source_data, None)
 
@@ -232,7 +231,9 @@ class SourceAudio(SourceParent):
         support_data = self.source_audio_data.time_freq_support.time_frequencies.data
         if np.round(1 / (support_data[1] - support_data[0]), 1) != np.round(sampling_frequency, 1):
             resampler = Resample(
-                signal=self.source_audio_data, new_sampling_frequency=sampling_frequency
+                signal=self.source_audio_data,
+                new_sampling_frequency=sampling_frequency,
+                server=self._server,
             )
             resampler.process()
             self._output = resampler.get_output()
@@ -273,6 +274,8 @@ class SourceAudio(SourceParent):
 
     def plot(self):
         """Plot the generated sound."""
+        from matplotlib import pyplot as plt
+
         if self._output == None:
             raise PyAnsysSoundException(
                 f"Output is not processed yet. Use the ``{__class__.__name__}.process()`` method."
@@ -24,8 +24,7 @@
 
 import warnings
 
-from ansys.dpf.core import Field, FieldsContainer, GenericDataContainer, Operator
-from matplotlib import pyplot as plt
+from ansys.dpf.core import Field, FieldsContainer, GenericDataContainer
 import numpy as np
 
 from .._pyansys_sound import PyAnsysSoundException, PyAnsysSoundWarning
@@ -85,8 +84,8 @@ class SourceBroadbandNoise(SourceParent):
         self.source_control = source_control
 
         # Define DPF Sound operators.
-        self.__operator_load = Operator(ID_COMPUTE_LOAD_SOURCE_BBN)
-        self.__operator_generate = Operator(ID_COMPUTE_GENERATE_SOUND_BBN)
+        self.__operator_load = self._get_pooled_operator(ID_COMPUTE_LOAD_SOURCE_BBN)
+        self.__operator_generate = self._get_pooled_operator(ID_COMPUTE_GENERATE_SOUND_BBN)
 
         if len(file) > 0:
             self.load_source_bbn(file)
@@ -263,7 +262,7 @@ class SourceBroadbandNoise(SourceParent):
             Source control data as a DPF generic data container.
         """
         self.source_bbn = source_data.get_property("sound_composer_source")
-        self.source_control = SourceControlTime()
+        self.source_control = SourceControlTime(server=self._server)
         control = source_control_data.get_property("sound_composer_source_control_one_parameter")
         self.source_control.control = control
         self.source_control.description = source_control_data.get_property(
@@ -290,7 +289,7 @@ class SourceBroadbandNoise(SourceParent):
             )
             source_data = None
         else:
-            source_data = GenericDataContainer()
+            source_data = GenericDataContainer(server=self._server)
             source_data.set_property("sound_composer_source", self.source_bbn)
 
         if not self.is_source_control_valid():
@@ -302,7 +301,7 @@ class SourceBroadbandNoise(SourceParent):
             )
             source_control_data = None
         else:
-            source_control_data = GenericDataContainer()
+            source_control_data = GenericDataContainer(server=self._server)
             source_control_data.set_property(
                 "sound_composer_source_control_one_parameter", self.source_control.control
             )
@@ -381,6 +380,8 @@ class SourceBroadbandNoise(SourceParent):
 
     def plot(self):
         """Plot the resulting signal."""
+        from matplotlib import pyplot as plt
+
         if self._output == None:
             raise PyAnsysSoundException(
                 f"Output is not processed yet. Use the '{__class__.__name__}.process()' method."
@@ -400,6 +401,8 @@ class SourceBroadbandNoise(SourceParent):
 
     def plot_control(self):
         """Plot the source control."""
+        from matplotlib import pyplot as plt
+
         if not self.is_source_control_valid():
             raise PyAnsysSoundException(
                 "Broadband noise source control is not set. "
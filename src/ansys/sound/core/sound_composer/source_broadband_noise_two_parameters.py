@@ -24,8 +24,7 @@
 
 import warnings
 
-from ansys.dpf.core import Field, FieldsContainer, GenericDataContainer, Operator
-from matplotlib import pyplot as plt
+from ansys.dpf.core import Field, FieldsContainer, GenericDataContainer
 import numpy as np
 
 from .._pyansys_sound import PyAnsysSoundException, PyAnsysSoundWarning
@@ -93,8 +92,8 @@ class SourceBroadbandNoiseTwoParameters(SourceParent):
         self.source_control2 = source_control2
 
         # Define DPF Sound operators.
-        self.__operator_load = Operator(ID_COMPUTE_LOAD_SOURCE_BBN_2PARAMS)
-        self.__operator_generate = Operator(ID_COMPUTE_GENERATE_SOUND_BBN_2PARAMS)
+        self.__operator_load = self._get_pooled_operator(ID_COMPUTE_LOAD_SOURCE_BBN_2PARAMS)
+        self.__operator_generate = self._get_pooled_operator(ID_COMPUTE_GENERATE_SOUND_BBN_2PARAMS)
 
         if len(file) > 0:
             self.load_source_bbn_two_parameters(file)
@@ -317,13 +316,13 @@ class SourceBroadbandNoiseTwoParameters(SourceParent):
         """
         self.source_bbn_two_parameters = source_data.get_property("sound_composer_source")
         control = source_control_data.get_property("sound_composer_source_control_parameter_1")
-        self.source_control1 = SourceControlTime()
+        self.source_control1 = SourceControlTime(server=self._server)
         self.source_control1.control = control
         self.source_control1.description = source_control_data.get_property(
             "sound_composer_source_control_two_parameter_displayed_string1"
         )
         control = source_control_data.get_property("sound_composer_source_control_parameter_2")
-        self.source_control2 = SourceControlTime()
+        self.source_control2 = SourceControlTime(server=self._server)
         self.source_control2.control = control
         self.source_control2.description = source_control_data.get_property(
             "sound_composer_source_control_two_parameter_displayed_string2"
@@ -349,7 +348,7 @@ class SourceBroadbandNoiseTwoParameters(SourceParent):
             )
             source_data = None
         else:
-            source_data = GenericDataContainer()
+            source_data = GenericDataContainer(server=self._server)
             source_data.set_property("sound_composer_source", self.source_bbn_two_parameters)
 
         if not self.is_source_control_valid():
@@ -361,7 +360,7 @@ class SourceBroadbandNoiseTwoParameters(SourceParent):
             )
             source_control_data = None
         else:
-            source_control_data = GenericDataContainer()
+            source_control_data = GenericDataContainer(server=self._server)
             source_control_data.set_property(
                 "sound_composer_source_control_parameter_1", self.source_control1.control
             )
@@ -450,6 +449,8 @@ class SourceBroadbandNoiseTwoParameters(SourceParent):
 
     def plot(self):
         """Plot the resulting signal."""
+        from matplotlib import pyplot as plt
+
         if self._output == None:
             raise PyAnsysSoundException(
                 f"Output is not processed yet. Use the '{__class__.__name__}.process()' method."
@@ -473,6 +474,8 @@ class SourceBroadbandNoiseTwoParameters(SourceParent):
 
     def plot_control(self):
         """Plot the source controls."""
+        from matplotlib import pyplot as plt
+
         if not self.is_source_control_valid():
             raise PyAnsysSoundException(
                 "At least one source control for broadband noise source with two parameters is "
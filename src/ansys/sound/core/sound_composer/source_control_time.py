@@ -25,7 +25,6 @@
 import warnings
 
 from ansys.dpf.core import Field, Operator
-from matplotlib import pyplot as plt
 
 from ansys.sound.core.signal_utilities.load_wav import LoadWav
 
@@ -74,7 +73,7 @@ class SourceControlTime(SourceControlParent):
         super().__init__()
 
         # Define DPF Sound operators.
-        self.__operator_load = Operator(ID_LOAD_FROM_TEXT)
+        self.__operator_load = Operator(ID_LOAD_FROM_TEXT, server=self._server)
 
         if len(file_str) > 0:
             if file_str.endswith(".wav"):
@@ -153,7 +152,7 @@ class SourceControlTime(SourceControlParent):
         file_str : str
             Path to the WAV file.
         """
-        loader = LoadWav(file_str)
+        loader = LoadWav(file_str, server=self._server)
         loader.process()
         self.control = loader.get_output()[0]
 
@@ -181,6 +180,8 @@ class SourceControlTime(SourceControlParent):
 
     def plot(self):
         """Plot the control profile."""
+        from matplotlib import pyplot as plt
+
         time = self.control.time_freq_support.time_frequencies
         unit = self.control.unit if isinstance(self.control.unit, str) else self.control.unit[1]
         str_unit = f" ({unit})" if len(unit) > 0 else ""
@@ -24,8 +24,7 @@
 
 import warnings
 
-from ansys.dpf.core import Field, FieldsContainer, GenericDataContainer, Operator
-from matplotlib import pyplot as plt
+from ansys.dpf.core import Field, FieldsContainer, GenericDataContainer
 import numpy as np
 
 from .._pyansys_sound import PyAnsysSoundException, PyAnsysSoundWarning
@@ -84,8 +83,8 @@ class SourceHarmonics(SourceParent):
         self.source_control = source_control
 
         # Define DPF Sound operators.
-        self.__operator_load = Operator(ID_COMPUTE_LOAD_SOURCE_HARMONICS)
-        self.__operator_generate = Operator(ID_COMPUTE_GENERATE_SOUND_HARMONICS)
+        self.__operator_load = self._get_pooled_operator(ID_COMPUTE_LOAD_SOURCE_HARMONICS)
+        self.__operator_generate = self._get_pooled_operator(ID_COMPUTE_GENERATE_SOUND_HARMONICS)
 
         if len(file) > 0:
             self.load_source_harmonics(file)
@@ -276,7 +275,7 @@ class SourceHarmonics(SourceParent):
         """
         self.source_harmonics = source_data.get_property("sound_composer_source")
         control = source_control_data.get_property("sound_composer_source_control_one_parameter")
-        self.source_control = SourceControlTime()
+        self.source_control = SourceControlTime(server=self._server)
         self.source_control.control = control
         self.source_control.description = source_control_data.get_property(
             "sound_composer_source_control_one_parameter_displayed_string"
@@ -302,7 +301,7 @@ class SourceHarmonics(SourceParent):
             )
             source_data = None
         else:
-            source_data = GenericDataContainer()
+            source_data = GenericDataContainer(server=self._server)
             source_data.set_property("sound_composer_source", self.source_harmonics)
 
         if not self.is_source_control_valid():
@@ -314,7 +313,7 @@ class SourceHarmonics(SourceParent):
             )
             source_control_data = None
         else:
-            source_control_data = GenericDataContainer()
+            source_control_data = GenericDataContainer(server=self._server)
             source_control_data.set_property(
                 "sound_composer_source_control_one_parameter", self.source_control.control
             )
@@ -393,6 +392,8 @@ class SourceHarmonics(SourceParent):
 
     def plot(self):
         """Plot the resulting signal."""
+        from matplotlib import pyplot as plt
+
         if self._output == None:
             raise PyAnsysSoundException(
                 f"Output is not processed yet. Use the '{__class__.__name__}.process()' method."
@@ -412,6 +413,8 @@ class SourceHarmonics(SourceParent):
 
     def plot_control(self):
         """Plot the source control."""
+        from matplotlib import pyplot as plt
+
         if not self.is_source_control_valid():
             raise PyAnsysSoundException(
                 "Harmonics source control is not set/valid. "
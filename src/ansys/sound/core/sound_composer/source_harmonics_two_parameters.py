@@ -24,8 +24,7 @@
 
 import warnings
 
-from ansys.dpf.core import Field, FieldsContainer, GenericDataContainer, Operator
-from matplotlib import pyplot as plt
+from ansys.dpf.core import Field, FieldsContainer, GenericDataContainer
 import numpy as np
 
 from .._pyansys_sound import PyAnsysSoundException, PyAnsysSoundWarning
@@ -98,8 +97,10 @@ class SourceHarmonicsTwoParameters(SourceParent):
         self.source_control2 = source_control2
 
         # Define DPF Sound operators.
-        self.__operator_load = Operator(ID_COMPUTE_LOAD_SOURCE_HARMONICS_2PARAMS)
-        self.__operator_generate = Operator(ID_COMPUTE_GENERATE_SOUND_HARMONICS_2PARAMS)
+        self.__operator_load = self._get_pooled_operator(ID_COMPUTE_LOAD_SOURCE_HARMONICS_2PARAMS)
+        self.__operator_generate = self._get_pooled_operator(
+            ID_COMPUTE_GENERATE_SOUND_HARMONICS_2PARAMS
+        )
 
         if len(file) > 0:
             self.load_source_harmonics_two_parameters(file)
@@ -329,13 +330,13 @@ class SourceHarmonicsTwoParameters(SourceParent):
         """
         self.source_harmonics_two_parameters = source_data.get_property("sound_composer_source")
         control = source_control_data.get_property("sound_composer_source_control_parameter_1")
-        self.source_control_rpm = SourceControlTime()
+        self.source_control_rpm = SourceControlTime(server=self._server)
         self.source_control_rpm.control = control
         self.source_control_rpm.description = source_control_data.get_property(
             "sound_composer_source_control_two_parameter_displayed_string1"
         )
         control = source_control_data.get_property("sound_composer_source_control_parameter_2")
-        self.source_control2 = SourceControlTime()
+        self.source_control2 = SourceControlTime(server=self._server)
         self.source_control2.control = control
         self.source_control2.description = source_control_data.get_property(
             "sound_composer_source_control_two_parameter_displayed_string2"
@@ -361,7 +362,7 @@ class SourceHarmonicsTwoParameters(SourceParent):
             )
             source_data = None
         else:
-            source_data = GenericDataContainer()
+            source_data = GenericDataContainer(server=self._server)
             source_data.set_property("sound_composer_source", self.source_harmonics_two_parameters)
 
         if not self.is_source_control_valid():
@@ -373,7 +374,7 @@ class SourceHarmonicsTwoParameters(SourceParent):
             )
             source_control_data = None
         else:
-            source_control_data = GenericDataContainer()
+            source_control_data = GenericDataContainer(server=self._server)
             source_control_data.set_property(
                 "sound_composer_source_control_parameter_1", self.source_control_rpm.control
             )
@@ -462,6 +463,8 @@ class SourceHarmonicsTwoParameters(SourceParent):
 
     def plot(self):
         """Plot the resulting signal."""
+        from matplotlib import pyplot as plt
+
         if self._output == None:
             raise PyAnsysSoundException(
                 f"Output is not processed yet. Use the '{__class__.__name__}.process()' method."
@@ -485,6 +488,8 @@ class SourceHarmonicsTwoParameters(SourceParent):
 
     def plot_control(self):
         """Plot the source controls."""
+        from matplotlib import pyplot as plt
+
         if not self.is_source_control_valid():
             raise PyAnsysSoundException(
                 "At least one source control for harmonics source with two parameters is not set. "
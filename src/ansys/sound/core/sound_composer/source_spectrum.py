@@ -24,8 +24,7 @@
 
 import warnings
 
-from ansys.dpf.core import Field, GenericDataContainer, Operator
-from matplotlib import pyplot as plt
+from ansys.dpf.core import Field, GenericDataContainer
 import numpy as np
 
 from .._pyansys_sound import PyAnsysSoundException, PyAnsysSoundWarning
@@ -81,8 +80,8 @@ class SourceSpectrum(SourceParent):
         self.source_control = source_control
 
         # Define DPF Sound operators.
-        self.__operator_load = Operator(ID_COMPUTE_LOAD_SOURCE_SPECTRUM)
-        self.__operator_generate = Operator(ID_COMPUTE_GENERATE_SOUND_SPECTRUM)
+        self.__operator_load = self._get_pooled_operator(ID_COMPUTE_LOAD_SOURCE_SPECTRUM)
+        self.__operator_generate = self._get_pooled_operator(ID_COMPUTE_GENERATE_SOUND_SPECTRUM)
 
         # load_source_spectrum can only be called after __operator_load is defined.
         if len(file_source) > 0:
@@ -216,7 +215,9 @@ class SourceSpectrum(SourceParent):
         method = Methods[
             source_control_data.get_property("sound_composer_source_control_spectrum_method")
         ]
-        self.source_control = SourceControlSpectrum(duration=duration, method=method)
+        self.source_control = SourceControlSpectrum(
+            duration=duration, method=method, server=self._server
+        )
 
     def get_as_generic_data_containers(self) -> tuple[GenericDataContainer]:
         """Get the source and source control data as generic data containers.
@@ -238,7 +239,7 @@ class SourceSpectrum(SourceParent):
             )
             source_data = None
         else:
-            source_data = GenericDataContainer()
+            source_data = GenericDataContainer(server=self._server)
             source_data.set_property("sound_composer_source", self.source_spectrum_data)
 
         if not self.is_source_control_valid():
@@ -250,7 +251,7 @@ class SourceSpectrum(SourceParent):
             )
             source_control_data = None
         else:
-            source_control_data = GenericDataContainer()
+            source_control_data = GenericDataContainer(server=self._server)
             source_control_data.set_property(
                 "sound_composer_source_control_spectrum_duration", self.source_control.duration
             )
@@ -334,6 +335,8 @@ class SourceSpectrum(SourceParent):
 
     def plot(self):
         """Plot the resulting signal."""
+        from matplotlib import pyplot as plt
+
         if self._output == None:
             raise PyAnsysSoundException(
                 f"Output is not processed yet. Use the '{__class__.__name__}.process()' method."
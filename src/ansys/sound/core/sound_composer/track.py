@@ -26,7 +26,6 @@ from typing import Union
 import warnings
 
 from ansys.dpf.core import Field, GenericDataContainer
-from matplotlib import pyplot as plt
 import numpy as np
 
 from ansys.sound.core.signal_processing import Filter
@@ -220,7 +219,7 @@ class Track(SoundComposerParent):
         # Create filter attribute.
         if track_data.get_property("track_is_filter") == 1:
             frequency_response_function = track_data.get_property("track_filter")
-            self.filter = Filter(sampling_frequency=sampling_frequency)
+            self.filter = Filter(sampling_frequency=sampling_frequency, server=self._server)
             self.filter.frf = frequency_response_function
         else:
             self.filter = None
@@ -249,7 +248,7 @@ class Track(SoundComposerParent):
             source_data, source_control_data = self.source.get_as_generic_data_containers()
 
             # Create a generic data container for the track.
-            track_data = GenericDataContainer()
+            track_data = GenericDataContainer(server=self._server)
 
             # Set track generic data container properties.
             track_data.set_property("track_name", self.name)
@@ -303,7 +302,9 @@ class Track(SoundComposerParent):
             signal = self.filter.get_output()
 
         if self.gain != 0.0:
-            gain_obj = ApplyGain(signal=signal, gain=self.gain, gain_in_db=True)
+            gain_obj = ApplyGain(
+                signal=signal, gain=self.gain, gain_in_db=True, server=self._server
+            )
             gain_obj.process()
             signal = gain_obj.get_output()
 
@@ -342,6 +343,8 @@ class Track(SoundComposerParent):
 
     def plot(self):
         """Plot the resulting signal."""
+        from matplotlib import pyplot as plt
+
         if self._output == None:
             raise PyAnsysSoundException(
                 f"Output is not processed yet. Use the {__class__.__name__}.process() method."
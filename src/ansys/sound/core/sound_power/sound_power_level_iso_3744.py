@@ -22,14 +22,15 @@
 
 """Computes ISO 3744 sound power level."""
 
+from concurrent.futures import ThreadPoolExecutor
 import warnings
 
-from ansys.dpf.core import Field, Operator, fields_container_factory
-import matplotlib.pyplot as plt
+from ansys.dpf.core import Field, Operator, fields_container_factory, fields_factory, locations
 import numpy as np
 
 from . import SoundPowerParent
 from .._pyansys_sound import PyAnsysSoundException, PyAnsysSoundWarning
+from ..server_helpers._operator_pool import _acquire_operator, _release_operator
 
 ID_COMPUTE_SOUND_POWER_LEVEL = "compute_sound_power_level_iso3744"
 ID_LOAD_SOUND_POWER_LEVEL = "load_project_sound_power_level_iso3744"
@@ -40,6 +41,11 @@ class SoundPowerLevelISO3744(SoundPowerParent):
 
     This class computes the sound power level according to the ISO 3744 standard.
 
+    The band levels of each microphone signal are computed separately and cached, and then
+    energetically averaged over the measurement surface before the K1, K2, C1, and C2 corrections
+    are applied. Thus, adding or deleting a microphone signal, or changing a correction, only
+    requires computing the microphone signals that were not processed yet.
+
     Examples
     --------
     Compute and display sound power level following the ISO 3744 standard.
@@ -73,6 +79,7 @@ class SoundPowerLevelISO3744(SoundPowerParent):
         K2: float = 0.0,
         C1: float = 0.0,
         C2: float = 0.0,
+        max_workers: int = None,
     ):
         """Class instantiation takes the following parameters.
 
@@ -95,8 +102,18 @@ class SoundPowerLevelISO3744(SoundPowerParent):
         C2 : float, default: 0.0
             Meteorological radiation impedance correction C2 in dB (Annex G of ISO 3744).
             By default, 0.0 dB.
+        max_workers : int, default: None
+            Maximum number of microphone signals processed concurrently. If unspecified, the
+            default number of workers of :class:`concurrent.futures.ThreadPoolExecutor` is used.
         """
         super().__init__()
+
+        # Initialize empty lists meant to store microphone signals, and their individual sound
+        # power levels (computed on demand).
+        self.__signals = []
+        self.__microphone_levels = []
+
+        self.max_workers = max_workers
         self.surface_shape = surface_shape
         self.surface_radius = surface_radius
         self.K1 = K1
@@ -104,15 +121,12 @@ class SoundPowerLevelISO3744(SoundPowerParent):
         self.C1 = C1
         self.C2 = C2
 
-        # Initialize an empty list meant to store microphone signals.
-        self.__signals = []
-
         # Define output field.
         self._output = None
 
         # Define DPF Sound operators.
-        self.__operator_compute = Operator(ID_COMPUTE_SOUND_POWER_LEVEL)
-        self.__operator_load = Operator(ID_LOAD_SOUND_POWER_LEVEL)
+        self.__operator_compute = self._get_pooled_operator(ID_COMPUTE_SOUND_POWER_LEVEL)
+        self.__operator_load = self._get_pooled_operator(ID_LOAD_SOUND_POWER_LEVEL)
 
     def __str__(self):
         """Overloads the __str__ method."""
@@ -153,6 +167,7 @@ class SoundPowerLevelISO3744(SoundPowerParent):
                 "'Half-hemisphere'."
             )
         self.__surface_shape = surface_shape
+        self.__clear_microphone_levels()
 
     @property
     def surface_radius(self) -> float:
@@ -165,6 +180,23 @@ class SoundPowerLevelISO3744(SoundPowerParent):
         if surface_radius <= 0:
             raise PyAnsysSoundException("Input surface radius must be strictly positive.")
         self.__surface_radius = surface_radius
+        self.__clear_microphone_levels()
+
+    @property
+    def max_workers(self) -> int:
+        """Maximum number of microphone signals processed concurrently.
+
+        If ``None``, the default number of workers of
+        :class:`concurrent.futures.ThreadPoolExecutor` is used.
+        """
+        return self.__max_workers
+
+    @max_workers.setter
+    def max_workers(self, max_workers: int):
+        """Set the maximum number of workers."""
+        if max_workers is not None and max_workers < 1:
+            raise PyAnsysSoundException("Maximum number of workers must be greater than 0.")
+        self.__max_workers = max_workers
 
     @property
     def K1(self) -> float:
@@ -236,6 +268,7 @@ class SoundPowerLevelISO3744(SoundPowerParent):
             raise PyAnsysSoundException("Added signal must be provided as a DPF field.")
 
         self.__signals.append(signal)
+        self.__microphone_levels.append(None)
 
     def get_microphone_signal(self, index: int) -> Field:
         """Get microphone signal.
@@ -271,6 +304,7 @@ class SoundPowerLevelISO3744(SoundPowerParent):
             warnings.warn(PyAnsysSoundWarning("No microphone signal associated with this index."))
         else:
             self.__signals.pop(index)
+            self.__microphone_levels.pop(index)
 
     def get_all_signal_names(self) -> dict[int, str]:
         """Get all signal names.
@@ -400,11 +434,15 @@ class SoundPowerLevelISO3744(SoundPowerParent):
         self.__signals = []
         for isig in range(len(fc_signals)):
             self.__signals.append(fc_signals[isig])
+        self.__microphone_levels = [None] * len(self.__signals)
 
     def process(self):
         """Calculate the sound power level.
 
-        This method calls the appropriate DPF Sound operator to compute the sound power level.
+        This method calls the appropriate DPF Sound operator to compute the sound power level of
+        each microphone signal that was not processed yet, concurrently if there are several of
+        them. The cached microphone levels are then energetically averaged, and the K1, K2, C1,
+        and C2 corrections are applied.
         """
         # Check that at least one signal is defined.
         if len(self.__signals) < 1:
@@ -413,27 +451,41 @@ class SoundPowerLevelISO3744(SoundPowerParent):
                 "Use SoundPowerLevelISO3744.add_microphone_signal()."
             )
 
-        # Create a fields container containing all microphone signals.
-        fc_signals = fields_container_factory.over_time_freq_fields_container(self.__signals)
-
-        # Set operator inputs.
-        self.__operator_compute.connect(0, self.surface_shape)
-        self.__operator_compute.connect(1, self.surface_radius)
-        self.__operator_compute.connect(2, self.K1)
-        self.__operator_compute.connect(3, self.K2)
-        self.__operator_compute.connect(4, self.C1)
-        self.__operator_compute.connect(5, self.C2)
-        self.__operator_compute.connect(6, fc_signals)
+        # Compute the levels of the microphone signals that were not processed yet.
+        indexes = [i for i, levels in enumerate(self.__microphone_levels) if levels is None]
+        if len(indexes) == 1:
+            self.__microphone_levels[indexes[0]] = self.__compute_microphone_levels(
+                self.__signals[indexes[0]], self.__operator_compute
+            )
+        elif len(indexes) > 1:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                levels = executor.map(
+                    lambda index: self.__compute_microphone_levels(self.__signals[index]),
+                    indexes,
+                )
+                for index, microphone_levels in zip(indexes, levels):
+                    self.__microphone_levels[index] = microphone_levels
+
+        # Average the microphone levels energetically over the measurement surface (equation 15 of
+        # ISO 3744), and apply the corrections (equations 16 and 17 of ISO 3744).
+        correction = -self.K1 - self.K2 + self.C1 + self.C2
+        Lw, Lw_A, Lw_octave, Lw_thirdoctave = (
+            self.__average_levels(
+                np.array([microphone_levels[i] for microphone_levels in self.__microphone_levels])
+            )
+            + correction
+            for i in range(4)
+        )
 
-        # Run the operator.
-        self.__operator_compute.run()
+        # Build the output fields, using the band supports of the first microphone signal.
+        _, _, _, _, field_octave, field_thirdoctave = self.__microphone_levels[0]
 
         # Get the output.
         self._output = (
-            self.__operator_compute.get_output(0, "double"),
-            self.__operator_compute.get_output(1, "double"),
-            self.__operator_compute.get_output(2, "field"),
-            self.__operator_compute.get_output(3, "field"),
+            float(Lw),
+            float(Lw_A),
+            self.__create_band_field(Lw_octave, field_octave),
+            self.__create_band_field(Lw_thirdoctave, field_thirdoctave),
         )
 
     def get_output(self) -> tuple:
@@ -572,6 +624,8 @@ class SoundPowerLevelISO3744(SoundPowerParent):
         Creates a figure that displays the sound power level in each octave band in the upper graph,
         and in each 1/3-octave band in the lower graph.
         """
+        import matplotlib.pyplot as plt
+
         if self._output == None:
             raise PyAnsysSoundException(
                 "Output is not processed yet. Use the 'SoundPowerLevelISO3744.process()' method."
@@ -608,6 +662,111 @@ class SoundPowerLevelISO3744(SoundPowerParent):
         plt.tight_layout()
         plt.show()
 
+    def __clear_microphone_levels(self):
+        """Clear the cached microphone levels.
+
+        Microphone levels depend on the measurement surface, and must be recomputed when its shape
+        or radius changes.
+        """
+        self.__microphone_levels = [None] * len(self.__microphone_levels)
+
+    def __compute_microphone_levels(self, signal: Field, operator: Operator = None) -> tuple:
+        """Compute the sound power level corresponding to a single microphone signal.
+
+        The levels are computed without any correction, which is applied after averaging.
+
+        Parameters
+        ----------
+        signal : Field
+            Microphone signal in Pa.
+        operator : Operator, default: None
+            DPF Sound operator to use. If unspecified, an operator is taken from the operator pool
+            for the duration of the computation, which is required when several microphone signals
+            are computed concurrently.
+
+        Returns
+        -------
+        tuple
+            Unweighted level in dB, A-weighted level in dBA, octave-band levels in dB, and
+            one-third-octave-band levels in dB, the last two as NumPy arrays, followed by the DPF
+            fields of the octave-band and one-third-octave-band levels.
+        """
+        if operator is None:
+            operator, server_reference = _acquire_operator(
+                ID_COMPUTE_SOUND_POWER_LEVEL, server=self._server
+            )
+            try:
+                return self.__compute_microphone_levels(signal, operator)
+            finally:
+                _release_operator(ID_COMPUTE_SOUND_POWER_LEVEL, operator, server_reference)
+
+        # Set operator inputs.
+        operator.connect(0, self.surface_shape)
+        operator.connect(1, self.surface_radius)
+        operator.connect(2, 0.0)
+        operator.connect(3, 0.0)
+        operator.connect(4, 0.0)
+        operator.connect(5, 0.0)
+        operator.connect(
+            6,
+            fields_container_factory.over_time_freq_fields_container([signal], server=self._server),
+        )
+
+        # Run the operator.
+        operator.run()
+
+        field_octave = operator.get_output(2, "field")
+        field_thirdoctave = operator.get_output(3, "field")
+
+        return (
+            operator.get_output(0, "double"),
+            operator.get_output(1, "double"),
+            np.array(field_octave.data),
+            np.array(field_thirdoctave.data),
+            field_octave,
+            field_thirdoctave,
+        )
+
+    @staticmethod
+    def __average_levels(levels: np.ndarray) -> np.ndarray:
+        """Average levels energetically across microphones.
+
+        Parameters
+        ----------
+        levels : numpy.ndarray
+            Levels in dB, with microphones along the first axis.
+
+        Returns
+        -------
+        numpy.ndarray
+            Energetically averaged levels in dB.
+        """
+        return 10.0 * np.log10(np.mean(10.0 ** (levels / 10.0), axis=0))
+
+    def __create_band_field(self, levels: np.ndarray, band_field: Field) -> Field:
+        """Create a band level field with the same support and unit as another band level field.
+
+        Parameters
+        ----------
+        levels : numpy.ndarray
+            Band levels in dB.
+        band_field : Field
+            Band level field whose support (band center frequencies) and unit are used.
+
+        Returns
+        -------
+        Field
+            Band level field.
+        """
+        field = fields_factory.create_scalar_field(
+            num_entities=1, location=locations.time_freq, server=self._server
+        )
+        field.append(levels, 1)
+        field.unit = band_field.unit
+        field.time_freq_support = band_field.time_freq_support
+
+        return field
+
     def __get_surface_area(self) -> float:
         """Calculate measurement surface.
 
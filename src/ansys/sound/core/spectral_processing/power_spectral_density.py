@@ -24,8 +24,7 @@
 
 import warnings
 
-from ansys.dpf.core import Field, Operator, TimeFreqSupport, fields_factory, locations
-import matplotlib.pyplot as plt
+from ansys.dpf.core import Field, TimeFreqSupport, fields_factory, locations
 import numpy as np
 
 from . import SpectralProcessingParent
@@ -92,7 +91,7 @@ class PowerSpectralDensity(SpectralProcessingParent):
         # Define output field.
         self._output = None
 
-        self.__operator = Operator(ID_POWER_SPECTRAL_DENSITY)
+        self.__operator = self._get_pooled_operator(ID_POWER_SPECTRAL_DENSITY)
 
     @property
     def input_signal(self) -> Field:
@@ -276,12 +275,12 @@ class PowerSpectralDensity(SpectralProcessingParent):
 
         # Create output field with PSD dB level values and corresponding frequencies.
         psd_dB_field = fields_factory.create_scalar_field(
-            num_entities=1, location=locations.time_freq
+            num_entities=1, location=locations.time_freq, server=self._server
         )
         psd_dB_field.append(psd_dB_values, 1)
-        support = TimeFreqSupport()
+        support = TimeFreqSupport(server=self._server)
         frequencies_field = fields_factory.create_scalar_field(
-            num_entities=1, location=locations.time_freq
+            num_entities=1, location=locations.time_freq, server=self._server
         )
         frequencies_field.append(frequencies, 1)
         support.time_frequencies = frequencies_field
@@ -330,6 +329,8 @@ class PowerSpectralDensity(SpectralProcessingParent):
             The reference value for the dB level computation. For an input acoustic signal, in Pa,
             the reference value should be 2e-5 (Pa).
         """
+        import matplotlib.pyplot as plt
+
         if self._output is None:
             raise PyAnsysSoundException(
                 f"Output is not processed yet. Use the `{__class__.__name__}.process()` method."
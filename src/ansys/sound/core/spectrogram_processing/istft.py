@@ -24,12 +24,11 @@
 
 import warnings
 
-from ansys.dpf.core import Field, FieldsContainer, Operator
-import matplotlib.pyplot as plt
+from ansys.dpf.core import Field, FieldsContainer
 import numpy as np
 
 from . import SpectrogramProcessingParent
-from .._pyansys_sound import PyAnsysSoundException, PyAnsysSoundWarning
+from .._pyansys_sound import PyAnsysSoundException, PyAnsysSoundWarning, _convert_field_to_np_array
 
 
 class Istft(SpectrogramProcessingParent):
@@ -64,7 +63,7 @@ class Istft(SpectrogramProcessingParent):
         """
         super().__init__()
         self.stft = stft
-        self.__operator = Operator("compute_istft")
+        self.__operator = self._get_pooled_operator("compute_istft")
 
     @property
     def stft(self) -> FieldsContainer:
@@ -135,7 +134,7 @@ class Istft(SpectrogramProcessingParent):
             ISTFT resulting signal in a NumPy array.
         """
         output = self.get_output()
-        out_as_np_array = output.data
+        out_as_np_array = _convert_field_to_np_array(output)
 
         # return out_as_np_array
         return np.transpose(out_as_np_array)
@@ -145,6 +144,8 @@ class Istft(SpectrogramProcessingParent):
 
         Plot the signal resulting from the ISTFT.
         """
+        import matplotlib.pyplot as plt
+
         if self._output is None:
             raise PyAnsysSoundException(
                 f"Output is not processed yet. Use the `{__class__.__name__}.process()` method."
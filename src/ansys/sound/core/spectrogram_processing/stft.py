@@ -24,12 +24,15 @@
 
 import warnings
 
-from ansys.dpf.core import Field, FieldsContainer, Operator, types
-import matplotlib.pyplot as plt
+from ansys.dpf.core import Field, FieldsContainer, types
 import numpy as np
 
 from . import SpectrogramProcessingParent
-from .._pyansys_sound import PyAnsysSoundException, PyAnsysSoundWarning
+from .._pyansys_sound import (
+    PyAnsysSoundException,
+    PyAnsysSoundWarning,
+    _convert_complex_fields_container_to_np_array,
+)
 
 
 class Stft(SpectrogramProcessingParent):
@@ -82,7 +85,7 @@ class Stft(SpectrogramProcessingParent):
         self.fft_size = fft_size
         self.window_overlap = window_overlap
         self.window_type = window_type
-        self.__operator = Operator("compute_stft")
+        self.__operator = self._get_pooled_operator("compute_stft")
 
     @property
     def signal(self) -> Field:
@@ -195,17 +198,9 @@ class Stft(SpectrogramProcessingParent):
         """
         output = self.get_output()
 
-        time_indexes = output.get_available_ids_for_label("time")
-        Ntime = len(time_indexes)
-        Nfft = output.get_field({"complex": 0, "time": 0, "channel_number": 0}).data.shape[0]
-
-        # Pre-allocate memory for the output array.
-        out_as_np_array = np.empty((Ntime, Nfft), dtype=np.complex128)
-
-        for i in time_indexes:
-            f1 = output.get_field({"complex": 0, "time": i, "channel_number": 0})
-            f2 = output.get_field({"complex": 1, "time": i, "channel_number": 0})
-            out_as_np_array[i] = f1.data + 1j * f2.data
+        out_as_np_array = _convert_complex_fields_container_to_np_array(
+            output, {"channel_number": 0}
+        )
 
         return np.transpose(out_as_np_array)
 
@@ -242,6 +237,8 @@ class Stft(SpectrogramProcessingParent):
             Reference STFT amplitude value for dB conversion. For example, for an input sound
             pressure signal, the reference value is typically 2e-5 (Pa).
         """
+        import matplotlib.pyplot as plt
+
         if self._output is None:
             raise PyAnsysSoundException(
                 f"Output is not processed yet. Use the `{__class__.__name__}.process()` method."
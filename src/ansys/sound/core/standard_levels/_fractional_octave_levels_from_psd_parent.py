@@ -22,10 +22,11 @@
 
 """Fractional octave levels from a PSD input."""
 
-from ansys.dpf.core import Field, Operator, types
+from ansys.dpf.core import Field, types
 import numpy as np
 
 from .._pyansys_sound import PyAnsysSoundException
+from ..server_helpers._operator_pool import _acquire_operator, _release_operator
 from ._fractional_octave_levels_parent import FractionalOctaveLevelsParent
 
 
@@ -146,13 +147,17 @@ class FractionalOctaveLevelsFromPSDParent(
             raise PyAnsysSoundException(f"No input PSD is set. Use {self.__class__.__name__}.psd.")
 
         if self.use_ansi_s1_11_1986:
-            operator = Operator(self._operator_id_levels_computation_ansi)
+            operator_id = self._operator_id_levels_computation_ansi
         else:
-            operator = Operator(self._operator_id_levels_computation)
-
-        operator.connect(0, self.psd)
-        operator.run()
-        self._output = operator.get_output(0, types.field)
+            operator_id = self._operator_id_levels_computation
+
+        operator, server_reference = _acquire_operator(operator_id, server=self._server)
+        try:
+            operator.connect(0, self.psd)
+            operator.run()
+            self._output = operator.get_output(0, types.field)
+        finally:
+            _release_operator(operator_id, operator, server_reference)
 
         # Convert to dB
         self._output.data = 10.0 * np.log10(self._output.data / (self.reference_value**2) + 1e-12)
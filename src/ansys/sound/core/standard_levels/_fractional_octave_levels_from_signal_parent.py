@@ -22,10 +22,11 @@
 
 """Fractional octave levels from a time-domain signal input."""
 
-from ansys.dpf.core import Field, Operator, TimeFreqSupport, fields_factory, locations, types
+from ansys.dpf.core import Field, TimeFreqSupport, fields_factory, locations, types
 import numpy as np
 
 from .._pyansys_sound import PyAnsysSoundException
+from ..server_helpers._operator_pool import _acquire_operator, _release_operator
 from ._fractional_octave_levels_parent import FractionalOctaveLevelsParent
 
 
@@ -125,10 +126,15 @@ class FractionalOctaveLevelsFromSignalParent(
         numpy.ndarray
             The 1/3-octave-band center frequencies in Hz.
         """
-        operator = Operator(self._operator_id_levels_computation)
-        operator.connect(0, self.signal)
-        operator.run()
-        field_levels = operator.get_output(0, types.field)
+        operator, server_reference = _acquire_operator(
+            self._operator_id_levels_computation, server=self._server
+        )
+        try:
+            operator.connect(0, self.signal)
+            operator.run()
+            field_levels = operator.get_output(0, types.field)
+        finally:
+            _release_operator(self._operator_id_levels_computation, operator, server_reference)
 
         center_frequencies = np.array(field_levels.time_freq_support.time_frequencies.data)
         levels = np.array(field_levels.data)
@@ -161,14 +167,14 @@ class FractionalOctaveLevelsFromSignalParent(
 
         # Create output field.
         field_center_frequencies = fields_factory.create_scalar_field(
-            num_entities=1, location=locations.time_freq
+            num_entities=1, location=locations.time_freq, server=self._server
         )
         field_center_frequencies.append(center_frequencies, 1)
-        support = TimeFreqSupport()
+        support = TimeFreqSupport(server=self._server)
         support.time_frequencies = field_center_frequencies
 
         self._output = fields_factory.create_scalar_field(
-            num_entities=1, location=locations.time_freq
+            num_entities=1, location=locations.time_freq, server=self._server
         )
         self._output.append(octave_levels_dB, 1)
         self._output.time_freq_support = support
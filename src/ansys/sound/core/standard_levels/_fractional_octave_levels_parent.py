@@ -24,10 +24,11 @@
 
 import warnings
 
-from ansys.dpf.core import Field, Operator, types
+from ansys.dpf.core import Field, types
 import numpy as np
 
 from .._pyansys_sound import PyAnsysSoundException, PyAnsysSoundWarning
+from ..server_helpers._operator_pool import _acquire_operator, _release_operator
 from ._standard_levels_parent import DICT_FREQUENCY_WEIGHTING, StandardLevelsParent
 
 
@@ -173,11 +174,16 @@ class FractionalOctaveLevelsParent(StandardLevelsParent, min_sound_version="2026
             The frequency weighting gains in dB.
         """
         if len(self.frequency_weighting) > 0:
-            operator = Operator(self._operator_id_frequency_weighting)
-            operator.connect(0, list(map(float, frequencies)))
-            operator.connect(1, self.frequency_weighting)
-            operator.run()
-            weights_dB = np.array(operator.get_output(0, types.vec_double))
+            operator, server_reference = _acquire_operator(
+                self._operator_id_frequency_weighting, server=self._server
+            )
+            try:
+                operator.connect(0, list(map(float, frequencies)))
+                operator.connect(1, self.frequency_weighting)
+                operator.run()
+                weights_dB = np.array(operator.get_output(0, types.vec_double))
+            finally:
+                _release_operator(self._operator_id_frequency_weighting, operator, server_reference)
         else:
             weights_dB = np.zeros(len(frequencies))
 
@@ -24,11 +24,14 @@
 
 import warnings
 
-from ansys.dpf.core import Field, Operator, types
-import matplotlib.pyplot as plt
+from ansys.dpf.core import Field, types
 import numpy as np
 
-from .._pyansys_sound import PyAnsysSoundException, PyAnsysSoundWarning
+from .._pyansys_sound import (
+    PyAnsysSoundException,
+    PyAnsysSoundWarning,
+    _PipelineStage,
+)
 from ._standard_levels_parent import DICT_FREQUENCY_WEIGHTING, DICT_SCALE, StandardLevelsParent
 
 DICT_TIME_WEIGHTING = {"Fast": 1, "Slow": 0, "Impulse": 2, "Custom": 3}
@@ -106,7 +109,7 @@ class LevelOverTime(StandardLevelsParent):
         self.__time_step = 25.0
         self.__window_size = 1000.0
         self.__analysis_window = "RECTANGULAR"
-        self.__operator = Operator(ID_COMPUTE_LEVEL_OVER_TIME)
+        self.__operator = self._get_pooled_operator(ID_COMPUTE_LEVEL_OVER_TIME)
 
     def __str__(self) -> str:
         """Return the string representation of the object."""
@@ -270,6 +273,14 @@ class LevelOverTime(StandardLevelsParent):
             raise PyAnsysSoundException(f"No input signal is set. Use {__class__.__name__}.signal.")
 
         self.__operator.connect(0, self.signal)
+        self.__connect_parameters()
+
+        self.__operator.run()
+
+        self.__store_output()
+
+    def __connect_parameters(self):
+        """Connect the operator inputs, except the signal."""
         self.__operator.connect(1, DICT_SCALE[self.scale])
         self.__operator.connect(2, float(self.reference_value))
         self.__operator.connect(3, DICT_FREQUENCY_WEIGHTING[self.frequency_weighting])
@@ -278,13 +289,25 @@ class LevelOverTime(StandardLevelsParent):
         self.__operator.connect(6, self.__window_size / 1000.0)
         self.__operator.connect(7, self.__analysis_window)
 
-        self.__operator.run()
-
+    def __store_output(self):
+        """Store the operator outputs."""
         self._output = (
             self.__operator.get_output(0, types.double),
             self.__operator.get_output(1, types.field),
         )
 
+    def _get_pipeline_stage(self) -> _PipelineStage:
+        """Get the DPF operator of the instance, for use in a pipeline.
+
+        Returns
+        -------
+        _PipelineStage
+            DPF operator, with all inputs but the signal connected, signal input and output pins,
+            and function storing the operator outputs.
+        """
+        self.__connect_parameters()
+        return _PipelineStage(self.__operator, 0, 1, self.__store_output, outputs_signal=False)
+
     def get_output(self) -> tuple:
         """Return the maximum level and level over time.
 
@@ -361,6 +384,8 @@ class LevelOverTime(StandardLevelsParent):
 
     def plot(self):
         """Plot the level over time."""
+        import matplotlib.pyplot as plt
+
         if self._output is None:
             raise PyAnsysSoundException(
                 f"Output is not processed yet. Use the {__class__.__name__}.process() method."
@@ -22,7 +22,6 @@
 
 """Compute octave levels from a time-domain signal input."""
 
-import matplotlib.pyplot as plt
 import numpy as np
 
 from ansys.sound.core._pyansys_sound import PyAnsysSoundException
@@ -93,6 +92,8 @@ class OctaveLevelsFromSignal(FractionalOctaveLevelsFromSignalParent, min_sound_v
 
     def plot(self):
         """Plot the octave-band levels."""
+        import matplotlib.pyplot as plt
+
         if self._output is None:
             raise PyAnsysSoundException(
                 f"Output is not processed yet. Use the `{__class__.__name__}.process()` method."
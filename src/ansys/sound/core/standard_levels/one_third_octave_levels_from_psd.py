@@ -22,8 +22,6 @@
 
 """Compute 1/3-octave levels from a PSD input."""
 
-import matplotlib.pyplot as plt
-
 from ansys.sound.core._pyansys_sound import PyAnsysSoundException
 
 from ._fractional_octave_levels_from_psd_parent import FractionalOctaveLevelsFromPSDParent
@@ -66,6 +64,8 @@ class OneThirdOctaveLevelsFromPSD(
 
     def plot(self):
         """Plot the 1/3-octave-band levels."""
+        import matplotlib.pyplot as plt
+
         if self._output is None:
             raise PyAnsysSoundException(
                 f"Output is not processed yet. Use the `{__class__.__name__}.process()` method."
@@ -22,7 +22,7 @@
 
 """Compute the overall level."""
 
-from ansys.dpf.core import Field, Operator, types
+from ansys.dpf.core import Field, types
 
 from .._pyansys_sound import PyAnsysSoundException
 from ._overall_level_parent import OverallLevelParent
@@ -84,7 +84,7 @@ class OverallLevel(OverallLevelParent):
             frequency_weighting=frequency_weighting,
         )
         self.signal = signal
-        self.__operator = Operator(ID_COMPUTE_OVERALL_LEVEL)
+        self.__operator = self._get_pooled_operator(ID_COMPUTE_OVERALL_LEVEL)
 
     def __str__(self) -> str:
         """Return the string representation of the object."""
@@ -22,7 +22,7 @@
 
 """Compute the overall level from a PSD input."""
 
-from ansys.dpf.core import Field, Operator, types
+from ansys.dpf.core import Field, types
 
 from .._pyansys_sound import PyAnsysSoundException
 from ._overall_level_parent import OverallLevelParent
@@ -81,7 +81,7 @@ class OverallLevelFromPSD(OverallLevelParent, min_sound_version="2027.1.0"):
             frequency_weighting=frequency_weighting,
         )
         self.psd = psd
-        self.__operator = Operator(ID_COMPUTE_OVERALL_LEVEL_FROM_PSD)
+        self.__operator = self._get_pooled_operator(ID_COMPUTE_OVERALL_LEVEL_FROM_PSD)
 
     def __str__(self) -> str:
         """Return the string representation of the object."""
@@ -33,13 +33,17 @@ from .xtract_transient_parameters import XtractTransientParameters
 from .xtract_transient import XtractTransient  # isort:skip
 from .xtract_tonal import XtractTonal  # isort:skip
 from .xtract_denoiser import XtractDenoiser  # isort:skip
+from .xtract_denoiser_batch import XtractDenoiserBatch  # isort:skip
 from .xtract import Xtract  # isort:skip
+from .xtract_parameter_sweep import XtractParameterSweep  # isort:skip
 
 __all__ = (
     "XtractParent",
     "Xtract",
+    "XtractParameterSweep",
     "XtractTonal",
     "XtractDenoiser",
+    "XtractDenoiserBatch",
     "XtractTransient",
     "XtractTransientParameters",
     "XtractTonalParameters",
@@ -24,8 +24,7 @@
 
 import warnings
 
-from ansys.dpf.core import Field, Operator, types
-import matplotlib.pyplot as plt
+from ansys.dpf.core import Field, types
 import numpy as np
 
 from . import (
@@ -130,7 +129,7 @@ class Xtract(XtractParent):
             self.__output_remainder_signal,
         )
 
-        self.__operator = Operator("xtract")
+        self.__operator = self._get_pooled_operator("xtract")
 
     @property
     def input_signal(self) -> Field:
@@ -312,6 +311,8 @@ class Xtract(XtractParent):
 
     def plot(self):
         """Plot the Xtract algorithm results."""
+        import matplotlib.pyplot as plt
+
         (
             noise_signal,
             tonal_signal,
@@ -24,8 +24,7 @@
 
 import warnings
 
-from ansys.dpf.core import Field, Operator, types
-import matplotlib.pyplot as plt
+from ansys.dpf.core import Field, types
 import numpy as np
 
 from . import XtractDenoiserParameters, XtractParent
@@ -85,7 +84,7 @@ class XtractDenoiser(XtractParent):
 
         self._output = (self.__output_denoised_signals, self.__output_noise_signals)
 
-        self.__operator = Operator("xtract_denoiser")
+        self.__operator = self._get_pooled_operator("xtract_denoiser")
 
     @property
     def input_signal(self) -> Field:
@@ -182,6 +181,8 @@ class XtractDenoiser(XtractParent):
 
         This method plots both the denoised signal and the noise signal.
         """
+        import matplotlib.pyplot as plt
+
         # Plot the denoised signal.
         denoised, noise = self.get_output()
         unit = denoised.unit if isinstance(denoised.unit, str) else denoised.unit[1]
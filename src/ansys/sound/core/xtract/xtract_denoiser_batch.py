@@ -0,0 +1,223 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Xtract denoiser batch class."""
+
+import warnings
+
+from ansys.dpf.core import Field, FieldsContainer, types
+import numpy as np
+
+from . import XtractDenoiserParameters, XtractParent
+from .._pyansys_sound import PyAnsysSoundException, PyAnsysSoundWarning, _convert_field_to_np_array
+
+
+class XtractDenoiserBatch(XtractParent):
+    """Denoise several signals with the same noise profile using the Xtract algorithm.
+
+    This class applies the same denoiser parameters (that is, the same noise profile) to a list
+    of signals. The noise profile is connected to the DPF operator once, and only the input
+    signal is reconnected for each recording. This avoids paying the parameter setup cost for
+    each file when denoising a whole measurement campaign.
+
+    .. seealso::
+        :class:`XtractDenoiser`, :class:`XtractDenoiserParameters`
+
+    Examples
+    --------
+    Denoise a list of signals with the same noise profile.
+
+    >>> from ansys.sound.core.xtract import XtractDenoiserBatch
+    >>> denoiser_batch = XtractDenoiserBatch(
+    ...     input_signals=[my_signal_1, my_signal_2, my_signal_3],
+    ...     input_parameters=my_denoiser_parameters,
+    ... )
+    >>> denoiser_batch.process()
+    >>> denoised_signals, noise_signals = denoiser_batch.get_output()
+
+    .. seealso::
+        :ref:`xtract_feature_example`
+            Example demonstrating how to use Xtract to extract the various components of a signal.
+    """
+
+    def __init__(
+        self,
+        input_signals: list[Field] | FieldsContainer = None,
+        input_parameters: XtractDenoiserParameters = None,
+    ):
+        """Class instantiation takes the following parameters.
+
+        Parameters
+        ----------
+        input_signals : list[Field] | FieldsContainer, default: None
+            Input signals to denoise, as a list of DPF fields or as a DPF fields container.
+        input_parameters : XtractDenoiserParameters, default: None
+            Structure that contains the parameters of the algorithm:
+
+            - Noise PSD (Field): Power spectral density of the noise
+
+            This structure is of the ``XtractDenoiserParameters`` type. It is shared by all
+            input signals. For more information, see this class.
+        """
+        super().__init__()
+        self.input_signals = input_signals
+        self.input_parameters = input_parameters
+
+        # Define output fields
+        self.__output_denoised_signals = None
+        self.__output_noise_signals = None
+
+        self._output = (self.__output_denoised_signals, self.__output_noise_signals)
+
+        self.__operator = self._get_pooled_operator("xtract_denoiser")
+
+        # Parameters currently connected to the operator.
+        self.__connected_parameters = None
+
+    @property
+    def input_signals(self) -> list[Field]:
+        """Input signals to denoise, as a list of DPF fields."""
+        return self.__input_signals
+
+    @input_signals.setter
+    def input_signals(self, signals: list[Field] | FieldsContainer):
+        """Set input signals."""
+        if signals is not None:
+            if isinstance(signals, FieldsContainer):
+                signals = [signals[i] for i in range(len(signals))]
+            elif isinstance(signals, (list, tuple)):
+                if not all(isinstance(signal, Field) for signal in signals):
+                    raise PyAnsysSoundException(
+                        "Signals must be specified as a list of DPF fields or as a DPF fields "
+                        "container."
+                    )
+                signals = list(signals)
+            else:
+                raise PyAnsysSoundException(
+                    "Signals must be specified as a list of DPF fields or as a DPF fields "
+                    "container."
+                )
+
+        self.__input_signals = signals
+
+    @property
+    def input_parameters(self) -> XtractDenoiserParameters:
+        """Input parameters.
+
+        Structure that contains the parameters of the algorithm:
+
+        - Power spectral density of the noise, as a DPF field.
+
+        This structure is shared by all input signals.
+        """
+        return self.__input_parameters
+
+    @input_parameters.setter
+    def input_parameters(self, value: XtractDenoiserParameters):
+        """Input parameters."""
+        if not (value is None or isinstance(value, XtractDenoiserParameters)):
+            raise PyAnsysSoundException(
+                "Input parameters must be specified as an XtractDenoiserParameters object."
+            )
+
+        self.__input_parameters = value
+
+    @property
+    def output_denoised_signals(self) -> list[Field]:
+        """Output denoised signals, as a list of DPF fields."""
+        return self.__output_denoised_signals
+
+    @property
+    def output_noise_signals(self) -> list[Field]:
+        """Output noise signals, as a list of DPF fields."""
+        return self.__output_noise_signals
+
+    def process(self):
+        """Apply denoising to all input signals.
+
+        The noise profile is connected to the DPF operator only if it has changed since the
+        last call to this method. Then, for each input signal, only the signal is connected
+        before running the operator.
+        """
+        if self.input_signals is None or len(self.input_signals) == 0:
+            raise PyAnsysSoundException("Input signals are not set.")
+
+        if self.input_parameters is None:
+            raise PyAnsysSoundException("Input parameters are not set.")
+
+        if self.__connected_parameters is not self.input_parameters:
+            self.__operator.connect(
+                1, self.input_parameters.get_parameters_as_generic_data_container()
+            )
+            self.__connected_parameters = self.input_parameters
+
+        denoised_signals = []
+        noise_signals = []
+        for signal in self.input_signals:
+            self.__operator.connect(0, signal)
+
+            # Runs the operator
+            self.__operator.run()
+
+            denoised_signals.append(self.__operator.get_output(0, types.field))
+            noise_signals.append(self.__operator.get_output(1, types.field))
+
+        # Stores the outputs
+        self.__output_denoised_signals = denoised_signals
+        self.__output_noise_signals = noise_signals
+
+        self._output = (self.__output_denoised_signals, self.__output_noise_signals)
+
+    def get_output(self) -> tuple[list[Field], list[Field]]:
+        """Get the output of the denoising.
+
+        Returns
+        -------
+        list[Field]
+            Denoised signals as a list of DPF fields, in the order of the input signals.
+        list[Field]
+            Noise signals as a list of DPF fields, in the order of the input signals.
+        """
+        if None in self._output:
+            warnings.warn(PyAnsysSoundWarning("Output is not processed yet."))
+
+        return self._output
+
+    def get_output_as_nparray(self) -> tuple[list[np.ndarray], list[np.ndarray]]:
+        """Get the output of the denoising as NumPy arrays.
+
+        Returns
+        -------
+        list[numpy.ndarray]
+            Denoised signals as a list of NumPy arrays.
+        list[numpy.ndarray]
+            Noise signals as a list of NumPy arrays.
+        """
+        denoised_signals, noise_signals = self.get_output()
+
+        if denoised_signals is None or noise_signals is None:
+            return [], []
+
+        return (
+            [_convert_field_to_np_array(signal) for signal in denoised_signals],
+            [_convert_field_to_np_array(signal) for signal in noise_signals],
+        )
@@ -84,11 +84,12 @@ class XtractDenoiserParameters(XtractParent):
             - ``XtractDenoiserParameters.create_noise_psd_from_noise_samples()``
             - ``XtractDenoiserParameters.create_noise_psd_from_automatic_estimation()``
         """
-        self.__generic_data_container = GenericDataContainer()
+        super().__init__()
+        self.__generic_data_container = GenericDataContainer(server=self._server)
         self.__generic_data_container.set_property("class_name", ID_DENOISER_PARAMETERS_CLASS)
 
         if noise_psd is None:
-            noise_psd = Field()
+            noise_psd = Field(server=self._server)
 
         self.noise_psd = noise_psd
 
@@ -136,7 +137,7 @@ class XtractDenoiserParameters(XtractParent):
         Field
             PSD of noise in unit^2/Hz (Pa^2/Hz for example).
         """
-        op = Operator("create_noise_profile_from_white_noise_power")
+        op = Operator("create_noise_profile_from_white_noise_power", server=self._server)
         op.connect(0, white_noise_level)
         op.connect(1, sampling_frequency)
         op.connect(2, int(window_length))
@@ -166,7 +167,7 @@ class XtractDenoiserParameters(XtractParent):
         Field
             PSD of noise in unit^2/Hz (Pa^2/Hz for example).
         """
-        op = Operator("create_noise_profile_from_noise_samples")
+        op = Operator("create_noise_profile_from_noise_samples", server=self._server)
         op.connect(0, signal)
         op.connect(1, sampling_frequency)
         op.connect(2, window_length)
@@ -192,7 +193,7 @@ class XtractDenoiserParameters(XtractParent):
         Field
             PSD of noise in unit^2/Hz (Pa^2/Hz for example).
         """
-        op = Operator("create_noise_profile_from_automatic_estimation")
+        op = Operator("create_noise_profile_from_automatic_estimation", server=self._server)
         op.connect(0, signal)
         op.connect(1, window_length)
         op.run()
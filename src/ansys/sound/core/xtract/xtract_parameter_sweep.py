@@ -0,0 +1,534 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Xtract parameter sweep class."""
+
+from concurrent.futures import ThreadPoolExecutor
+import itertools
+import time
+from typing import Callable
+import warnings
+
+from ansys.dpf.core import Field
+import numpy as np
+
+from . import (
+    XtractDenoiser,
+    XtractDenoiserParameters,
+    XtractParent,
+    XtractTonal,
+    XtractTonalParameters,
+    XtractTransient,
+    XtractTransientParameters,
+)
+from .._pyansys_sound import PyAnsysSoundException, PyAnsysSoundWarning
+
+TONAL_PARAMETER_NAMES = (
+    "regularity",
+    "maximum_slope",
+    "minimum_duration",
+    "intertonal_gap",
+    "local_emergence",
+    "fft_size",
+)
+TRANSIENT_PARAMETER_NAMES = ("lower_threshold", "upper_threshold")
+ID_PROCESSING_TIME = "processing_time"
+SEARCH_GRID = "grid"
+SEARCH_RANDOM = "random"
+
+
+class XtractParameterSweep(XtractParent):
+    """Sweep Xtract tonal and transient parameters and rank the results.
+
+    This class evaluates the Xtract algorithm on a signal for a set of tonal and transient
+    parameter combinations, either on the full grid of specified values, or on a random subset
+    of this grid. Each result is scored with user-defined metrics, and the combinations are ranked
+    according to one of them.
+
+    Since only the tonal and transient parameters vary, the denoising step is computed once and
+    cached: each evaluation only runs the tonal and transient extraction steps. Evaluations can be
+    run concurrently.
+
+    .. seealso::
+        :class:`Xtract`, :class:`XtractTonalParameters`, :class:`XtractTransientParameters`
+
+    Examples
+    --------
+    Sweep the regularity and the local emergence, and rank the results according to the energy
+    of the tonal component.
+
+    >>> import numpy as np
+    >>> from ansys.sound.core.xtract import XtractParameterSweep
+    >>> sweep = XtractParameterSweep(
+    ...     input_signal=my_signal,
+    ...     parameters_denoiser=my_denoiser_params,
+    ...     tonal_parameter_grid={"regularity": [0.5, 1.0], "local_emergence": [5.0, 15.0]},
+    ...     metrics={"tonal_energy": lambda noise, tonal, transient, remainder: np.sum(tonal**2)},
+    ...     max_workers=4,
+    ... )
+    >>> sweep.process()
+    >>> ranked_results = sweep.get_output()
+    >>> best_tonal_parameters, best_transient_parameters = sweep.get_best_parameters()
+
+    .. seealso::
+        :ref:`xtract_feature_example`
+            Example demonstrating how to use Xtract to extract the various components of a signal.
+    """
+
+    def __init__(
+        self,
+        input_signal: Field = None,
+        parameters_denoiser: XtractDenoiserParameters = None,
+        tonal_parameter_grid: dict[str, list] = None,
+        transient_parameter_grid: dict[str, list] = None,
+        metrics: dict[str, Callable] = None,
+        ranking_metric: str = None,
+        higher_is_better: bool = True,
+        search: str = SEARCH_GRID,
+        number_of_samples: int = 10,
+        random_seed: int = None,
+        max_workers: int = 1,
+    ):
+        """Class instantiation takes the following parameters.
+
+        Parameters
+        ----------
+        input_signal : Field, default: None
+            Input signal on which to apply the Xtract processing as a DPF field.
+        parameters_denoiser : XtractDenoiserParameters, default: None
+            Parameters of the denoising step, which are the same for all evaluations. For more
+            information, see the ``XtractDenoiserParameters`` class.
+        tonal_parameter_grid : dict[str, list], default: None
+            Values to evaluate for each tonal extraction parameter. Keys are names of
+            ``XtractTonalParameters`` attributes (``"regularity"``, ``"maximum_slope"``,
+            ``"minimum_duration"``, ``"intertonal_gap"``, ``"local_emergence"``, and
+            ``"fft_size"``). Parameters that are not specified keep their default value.
+        transient_parameter_grid : dict[str, list], default: None
+            Values to evaluate for each transient extraction parameter. Keys are names of
+            ``XtractTransientParameters`` attributes (``"lower_threshold"`` and
+            ``"upper_threshold"``). Parameters that are not specified keep their default value.
+        metrics : dict[str, Callable], default: None
+            Metrics used to score each evaluation. Keys are metric names, and values are functions
+            that take the noise, tonal, transient, and remainder signals as NumPy arrays (in this
+            order) and return a float.
+        ranking_metric : str, default: None
+            Name of the metric used to rank the evaluations. If unspecified, the first metric
+            is used.
+        higher_is_better : bool, default: True
+            Whether a higher value of the ranking metric corresponds to a better result.
+        search : str, default: "grid"
+            Search strategy. Options are ``"grid"`` to evaluate all combinations of the specified
+            values and ``"random"`` to evaluate a random subset of these combinations.
+        number_of_samples : int, default: 10
+            Number of combinations to evaluate when ``search`` is ``"random"``. If greater than
+            the number of possible combinations, all combinations are evaluated.
+        random_seed : int, default: None
+            Seed of the random generator used when ``search`` is ``"random"``.
+        max_workers : int, default: 1
+            Maximum number of evaluations to run concurrently.
+        """
+        super().__init__()
+        self.input_signal = input_signal
+        self.parameters_denoiser = parameters_denoiser
+        self.tonal_parameter_grid = tonal_parameter_grid
+        self.transient_parameter_grid = transient_parameter_grid
+        self.metrics = metrics
+        self.ranking_metric = ranking_metric
+        self.higher_is_better = higher_is_better
+        self.search = search
+        self.number_of_samples = number_of_samples
+        self.random_seed = random_seed
+        self.max_workers = max_workers
+
+        self.__ranked_parameters = None
+
+    @property
+    def input_signal(self) -> Field:
+        """Input signal on which to apply the Xtract processing as a DPF field."""
+        return self.__input_signal
+
+    @input_signal.setter
+    def input_signal(self, signal: Field):
+        """Set input signal."""
+        if not (signal is None or isinstance(signal, Field)):
+            raise PyAnsysSoundException("Input signal must be specified as a DPF field.")
+
+        self.__input_signal = signal
+        self.__denoiser_cache = None
+
+    @property
+    def parameters_denoiser(self) -> XtractDenoiserParameters:
+        """Parameters of the denoising step.
+
+        Setting this property clears the cached denoising result. If the parameters object is
+        modified in place, set it again to force the denoising step to be recomputed.
+        """
+        return self.__parameters_denoiser
+
+    @parameters_denoiser.setter
+    def parameters_denoiser(self, value: XtractDenoiserParameters):
+        """Set parameters of the denoising step."""
+        self.__parameters_denoiser = value
+        self.__denoiser_cache = None
+
+    @property
+    def tonal_parameter_grid(self) -> dict[str, list]:
+        """Values to evaluate for each tonal extraction parameter."""
+        return self.__tonal_parameter_grid
+
+    @tonal_parameter_grid.setter
+    def tonal_parameter_grid(self, grid: dict[str, list]):
+        """Set tonal parameter grid."""
+        self.__tonal_parameter_grid = self.__check_grid(grid, TONAL_PARAMETER_NAMES, "tonal")
+
+    @property
+    def transient_parameter_grid(self) -> dict[str, list]:
+        """Values to evaluate for each transient extraction parameter."""
+        return self.__transient_parameter_grid
+
+    @transient_parameter_grid.setter
+    def transient_parameter_grid(self, grid: dict[str, list]):
+        """Set transient parameter grid."""
+        self.__transient_parameter_grid = self.__check_grid(
+            grid, TRANSIENT_PARAMETER_NAMES, "transient"
+        )
+
+    @property
+    def metrics(self) -> dict[str, Callable]:
+        """Metrics used to score each evaluation."""
+        return self.__metrics
+
+    @metrics.setter
+    def metrics(self, metrics: dict[str, Callable]):
+        """Set metrics."""
+        if metrics is None:
+            metrics = {}
+
+        if not isinstance(metrics, dict) or not all(
+            isinstance(name, str) and callable(metric) for name, metric in metrics.items()
+        ):
+            raise PyAnsysSoundException(
+                "Metrics must be specified as a dictionary of functions indexed by metric names."
+            )
+
+        self.__metrics = dict(metrics)
+
+    @property
+    def ranking_metric(self) -> str:
+        """Name of the metric used to rank the evaluations."""
+        return self.__ranking_metric
+
+    @ranking_metric.setter
+    def ranking_metric(self, name: str):
+        """Set ranking metric."""
+        self.__ranking_metric = name
+
+    @property
+    def higher_is_better(self) -> bool:
+        """Whether a higher value of the ranking metric corresponds to a better result."""
+        return self.__higher_is_better
+
+    @higher_is_better.setter
+    def higher_is_better(self, value: bool):
+        """Set higher_is_better."""
+        self.__higher_is_better = bool(value)
+
+    @property
+    def search(self) -> str:
+        """Search strategy, either ``"grid"`` or ``"random"``."""
+        return self.__search
+
+    @search.setter
+    def search(self, search: str):
+        """Set search strategy."""
+        if search not in (SEARCH_GRID, SEARCH_RANDOM):
+            raise PyAnsysSoundException(
+                f'Search strategy must be either "{SEARCH_GRID}" or "{SEARCH_RANDOM}".'
+            )
+
+        self.__search = search
+
+    @property
+    def number_of_samples(self) -> int:
+        """Number of combinations to evaluate when the search strategy is ``"random"``."""
+        return self.__number_of_samples
+
+    @number_of_samples.setter
+    def number_of_samples(self, number: int):
+        """Set number of samples."""
+        if number < 1:
+            raise PyAnsysSoundException("Number of samples must be greater than 0.")
+
+        self.__number_of_samples = int(number)
+
+    @property
+    def random_seed(self) -> int:
+        """Seed of the random generator used when the search strategy is ``"random"``."""
+        return self.__random_seed
+
+    @random_seed.setter
+    def random_seed(self, seed: int):
+        """Set random seed."""
+        self.__random_seed = seed
+
+    @property
+    def max_workers(self) -> int:
+        """Maximum number of evaluations to run concurrently."""
+        return self.__max_workers
+
+    @max_workers.setter
+    def max_workers(self, number: int):
+        """Set maximum number of workers."""
+        if number < 1:
+            raise PyAnsysSoundException("Maximum number of workers must be greater than 0.")
+
+        self.__max_workers = int(number)
+
+    def process(self):
+        """Evaluate all parameter combinations and rank the results.
+
+        The denoising step is computed only if it was not already computed with the current
+        input signal and denoiser parameters.
+        """
+        if self.input_signal is None:
+            raise PyAnsysSoundException("Input signal is not set.")
+
+        if self.parameters_denoiser is None:
+            raise PyAnsysSoundException("Input parameters for the denoiser extraction are not set.")
+
+        if len(self.metrics) == 0:
+            raise PyAnsysSoundException("At least one metric must be specified.")
+
+        ranking_metric = self.ranking_metric
+        if ranking_metric is None:
+            ranking_metric = next(iter(self.metrics))
+        elif ranking_metric not in self.metrics:
+            raise PyAnsysSoundException(
+                f'Ranking metric "{ranking_metric}" is not among the specified metrics.'
+            )
+
+        # Denoising step, shared by all evaluations.
+        if self.__denoiser_cache is None:
+            denoiser = XtractDenoiser(
+                self.input_signal, self.parameters_denoiser, server=self._server
+            )
+            denoiser.process()
+            self.__denoiser_cache = denoiser.get_output()
+        denoised_signal, noise_signal = self.__denoiser_cache
+        noise = np.array(noise_signal.data)
+
+        # Parameter structures are created beforehand, so that invalid values are reported
+        # before any evaluation starts.
+        combinations = [
+            (
+                tonal_values,
+                transient_values,
+                XtractTonalParameters(**tonal_values, server=self._server),
+                XtractTransientParameters(**transient_values, server=self._server),
+            )
+            for tonal_values, transient_values in self.__get_combinations()
+        ]
+
+        def evaluate(combination: tuple) -> tuple[dict, float]:
+            """Run the tonal and transient steps for one combination, and score the result."""
+            _, _, tonal_parameters, transient_parameters = combination
+            start_time = time.perf_counter()
+
+            tonal = XtractTonal(denoised_signal, tonal_parameters, server=self._server)
+            tonal.process()
+            tonal_signal, non_tonal_signal = tonal.get_output()
+
+            transient = XtractTransient(non_tonal_signal, transient_parameters, server=self._server)
+            transient.process()
+            transient_signal, remainder_signal = transient.get_output()
+
+            components = (
+                noise,
+                np.array(tonal_signal.data),
+                np.array(transient_signal.data),
+                np.array(remainder_signal.data),
+            )
+            elapsed_time = time.perf_counter() - start_time
+
+            scores = {name: float(metric(*components)) for name, metric in self.metrics.items()}
+            return scores, elapsed_time
+
+        if self.max_workers == 1:
+            results = [evaluate(combination) for combination in combinations]
+        else:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                results = list(executor.map(evaluate, combinations))
+
+        # Assemble the results table.
+        parameter_names = [
+            name
+            for name in TONAL_PARAMETER_NAMES + TRANSIENT_PARAMETER_NAMES
+            if name in self.tonal_parameter_grid or name in self.transient_parameter_grid
+        ]
+        dtype = [(name, np.int64 if name == "fft_size" else np.float64) for name in parameter_names]
+        dtype += [(name, np.float64) for name in self.metrics]
+        dtype += [(ID_PROCESSING_TIME, np.float64)]
+
+        table = np.empty(len(combinations), dtype=dtype)
+        for i, ((tonal_values, transient_values, _, _), (scores, elapsed_time)) in enumerate(
+            zip(combinations, results)
+        ):
+            values = {**tonal_values, **transient_values}
+            for name in parameter_names:
+                table[name][i] = values[name]
+            for name, score in scores.items():
+                table[name][i] = score
+            table[ID_PROCESSING_TIME][i] = elapsed_time
+
+        # Sort from best to worst, with NaN scores last, and tied scores in evaluation order.
+        scores = table[ranking_metric]
+        order = np.lexsort((-scores if self.higher_is_better else scores, np.isnan(scores)))
+
+        self._output = table[order]
+        self.__ranked_parameters = [combinations[i][2:] for i in order]
+
+    def get_output(self) -> np.ndarray:
+        """Get the ranked results of the parameter sweep.
+
+        Returns
+        -------
+        numpy.ndarray
+            Structured array with one row per evaluated combination, sorted from best to worst
+            according to the ranking metric. Columns are the swept parameters, the metrics, and
+            the processing time in seconds of each evaluation (``"processing_time"``).
+        """
+        if self._output is None:
+            warnings.warn(
+                PyAnsysSoundWarning(
+                    "Output is not processed yet. Use the 'XtractParameterSweep.process()' method."
+                )
+            )
+
+        return self._output
+
+    def get_output_as_nparray(self) -> np.ndarray:
+        """Get the ranked results of the parameter sweep as a NumPy structured array.
+
+        Returns
+        -------
+        numpy.ndarray
+            Structured array with one row per evaluated combination, sorted from best to worst
+            according to the ranking metric.
+        """
+        output = self.get_output()
+
+        if output is None:
+            return np.array([])
+
+        return output
+
+    def get_best_parameters(self) -> tuple[XtractTonalParameters, XtractTransientParameters]:
+        """Get the best parameters of the sweep.
+
+        Returns
+        -------
+        XtractTonalParameters
+            Tonal extraction parameters of the best-ranked combination.
+        XtractTransientParameters
+            Transient extraction parameters of the best-ranked combination.
+        """
+        if self.__ranked_parameters is None or len(self.__ranked_parameters) == 0:
+            raise PyAnsysSoundException(
+                "Output is not processed yet. Use the 'XtractParameterSweep.process()' method."
+            )
+
+        return self.__ranked_parameters[0]
+
+    def __get_combinations(self) -> list[tuple[dict, dict]]:
+        """Get the tonal and transient parameter combinations to evaluate.
+
+        Returns
+        -------
+        list[tuple[dict, dict]]
+            List of pairs of tonal and transient parameter values.
+        """
+        tonal_names = list(self.tonal_parameter_grid)
+        transient_names = list(self.transient_parameter_grid)
+        value_lists = [self.tonal_parameter_grid[name] for name in tonal_names] + [
+            self.transient_parameter_grid[name] for name in transient_names
+        ]
+
+        combinations = list(itertools.product(*value_lists))
+
+        if self.search == SEARCH_RANDOM and self.number_of_samples < len(combinations):
+            rng = np.random.default_rng(self.random_seed)
+            indexes = rng.choice(len(combinations), size=self.number_of_samples, replace=False)
+            combinations = [combinations[i] for i in sorted(indexes)]
+
+        return [
+            (
+                dict(zip(tonal_names, values[: len(tonal_names)])),
+                dict(zip(transient_names, values[len(tonal_names) :])),
+            )
+            for values in combinations
+        ]
+
+    @staticmethod
+    def __check_grid(grid: dict[str, list], allowed_names: tuple[str], step: str) -> dict:
+        """Check a parameter grid.
+
+        Parameters
+        ----------
+        grid : dict[str, list]
+            Parameter grid to check.
+        allowed_names : tuple[str]
+            Allowed parameter names.
+        step : str
+            Name of the Xtract step, for error messages.
+
+        Returns
+        -------
+        dict
+            Checked parameter grid, with values as lists.
+        """
+        if grid is None:
+            return {}
+
+        if not isinstance(grid, dict):
+            raise PyAnsysSoundException(
+                f"The {step} parameter grid must be specified as a dictionary of value lists "
+                "indexed by parameter names."
+            )
+
+        checked_grid = {}
+        for name, values in grid.items():
+            if name not in allowed_names:
+                raise PyAnsysSoundException(
+                    f'Unknown {step} parameter "{name}". Allowed parameters are: '
+                    f"{', '.join(allowed_names)}."
+                )
+
+            values = list(np.atleast_1d(values))
+            if len(values) == 0:
+                raise PyAnsysSoundException(
+                    f'At least one value must be specified for {step} parameter "{name}".'
+                )
+            checked_grid[name] = [
+                int(value) if name == "fft_size" else float(value) for value in values
+            ]
+
+        return checked_grid
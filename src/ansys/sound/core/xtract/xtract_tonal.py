@@ -24,8 +24,7 @@
 
 import warnings
 
-from ansys.dpf.core import Field, Operator, types
-import matplotlib.pyplot as plt
+from ansys.dpf.core import Field, types
 import numpy as np
 
 from . import XtractParent, XtractTonalParameters
@@ -87,7 +86,7 @@ class XtractTonal(XtractParent):
 
         self._output = (self.__output_tonal_signals, self.__output_non_tonal_signals)
 
-        self.__operator = Operator("xtract_tonal")
+        self.__operator = self._get_pooled_operator("xtract_tonal")
 
     @property
     def input_signal(self) -> Field:
@@ -189,6 +188,8 @@ class XtractTonal(XtractParent):
 
         This method plots both the tonal and non-tonal signals.
         """
+        import matplotlib.pyplot as plt
+
         tonal, non_tonal = self.get_output()
         unit = tonal.unit if isinstance(tonal.unit, str) else tonal.unit[1]
         unit_str = f" ({unit})" if len(unit) > 0 else ""
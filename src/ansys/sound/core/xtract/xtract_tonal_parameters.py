@@ -96,7 +96,8 @@ class XtractTonalParameters(XtractParent):
             Number of samples for the FFT computation. The value
             must be greater than 0.
         """
-        self.__generic_data_container = GenericDataContainer()
+        super().__init__()
+        self.__generic_data_container = GenericDataContainer(server=self._server)
         self.__generic_data_container.set_property("class_name", ID_TONAL_PARAMETERS_CLASS)
         self.regularity = regularity
         self.maximum_slope = maximum_slope
@@ -104,7 +105,6 @@ class XtractTonalParameters(XtractParent):
         self.intertonal_gap = intertonal_gap
         self.local_emergence = local_emergence
         self.fft_size = fft_size
-        super().__init__()
 
     @property
     def regularity(self) -> float:
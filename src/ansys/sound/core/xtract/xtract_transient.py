@@ -24,8 +24,7 @@
 
 import warnings
 
-from ansys.dpf.core import Field, Operator
-import matplotlib.pyplot as plt
+from ansys.dpf.core import Field
 import numpy as np
 
 from . import XtractParent, XtractTransientParameters
@@ -87,7 +86,7 @@ class XtractTransient(XtractParent):
 
         self._output = (self.__output_transient_signals, self.__output_non_transient_signals)
 
-        self.__operator = Operator("xtract_transient")
+        self.__operator = self._get_pooled_operator("xtract_transient")
 
     @property
     def input_signal(self) -> Field:
@@ -188,6 +187,8 @@ class XtractTransient(XtractParent):
 
         This method plots the transient signal and non-transient signal.
         """
+        import matplotlib.pyplot as plt
+
         transient, non_transient = self.get_output()
         unit = transient.unit if isinstance(transient.unit, str) else transient.unit[1]
         unit_str = f" ({unit})" if len(unit) > 0 else ""
@@ -64,7 +64,8 @@ class XtractTransientParameters(XtractParent):
             Values are between 0 and 100. You should set this parameter as low as possible provided
             that no transient element remains in the remainder (non-transient signal).
         """
-        self.__generic_data_container = GenericDataContainer()
+        super().__init__()
+        self.__generic_data_container = GenericDataContainer(server=self._server)
         self.__generic_data_container.set_property("class_name", ID_TRANSIENT_PARAMETERS_CLASS)
         self.lower_threshold = lower_threshold
         self.upper_threshold = upper_threshold
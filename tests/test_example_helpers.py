@@ -20,9 +20,16 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+from concurrent.futures import ThreadPoolExecutor
+import json
 import os
 import pathlib
+import time
+from unittest.mock import patch
 
+import pytest
+
+from ansys.sound.core._pyansys_sound import PyAnsysSoundException
 from ansys.sound.core.examples_helpers import (
     download_accel_with_rpm_2_wav,
     download_accel_with_rpm_3_wav,
@@ -46,7 +53,13 @@ from ansys.sound.core.examples_helpers import (
     download_xtract_demo_signal_1_wav,
     download_xtract_demo_signal_2_wav,
 )
-from ansys.sound.core.examples_helpers.download import EXAMPLES_PATH
+import ansys.sound.core.examples_helpers.download as download_module
+from ansys.sound.core.examples_helpers.download import (
+    EXAMPLES_PATH,
+    OFFLINE_MODE_ENVIRONMENT_VARIABLE,
+    _download_file_and_upload_to_server_tmp_folder,
+    _download_file_in_local_examples_folder,
+)
 
 
 def test_download_flute_psd():
@@ -193,3 +206,125 @@ def test_download_uff_sample_4_channels_type58b():
     p = str(EXAMPLES_PATH) + "/4_channels_type58b.uff"
     assert pathlib.Path(p).exists() == True
     assert os.path.getsize(p) == 10483384
+
+
+@pytest.fixture
+def local_examples_folder(monkeypatch, tmp_path):
+    """Use a temporary local examples folder, and a mocked download of the example files.
+
+    The mocked download writes the file name as the file content.
+    """
+    monkeypatch.setattr(download_module, "EXAMPLES_PATH", str(tmp_path))
+    monkeypatch.setattr(download_module, "CACHE_INDEX_PATH", str(tmp_path / "cache_index.json"))
+    monkeypatch.delenv(OFFLINE_MODE_ENVIRONMENT_VARIABLE, raising=False)
+
+    def download_file(filename, directory, destination, force, timeout):
+        path = os.path.join(destination, filename)
+        with open(path, "w") as file:
+            file.write(filename)
+        return path
+
+    with patch.object(
+        download_module.download_manager, "download_file", side_effect=download_file
+    ) as mock_download:
+        yield tmp_path, mock_download
+
+
+def test_download_uses_local_cache(local_examples_folder):
+    """Test that a verified local copy is reused without accessing the network."""
+    tmp_path, mock_download = local_examples_folder
+    p = _download_file_in_local_examples_folder("flute_psd.txt")
+    assert p == str(tmp_path / "flute_psd.txt")
+    assert mock_download.call_count == 1
+    with open(tmp_path / "cache_index.json", "r") as file:
+        assert "flute_psd.txt" in json.load(file)
+
+    assert _download_file_in_local_examples_folder("flute_psd.txt") == p
+    assert mock_download.call_count == 1
+
+
+def test_download_offline_mode(monkeypatch, local_examples_folder):
+    """Test the offline mode."""
+    _, mock_download = local_examples_folder
+    _download_file_in_local_examples_folder("flute_psd.txt")
+    mock_download.reset_mock()
+    monkeypatch.setenv(OFFLINE_MODE_ENVIRONMENT_VARIABLE, "1")
+
+    # Verified local copy: no network access.
+    p = _download_file_in_local_examples_folder("flute_psd.txt")
+    assert pathlib.Path(p).exists() == True
+    mock_download.assert_not_called()
+
+    # Missing file: exception, and no network access.
+    with pytest.raises(
+        PyAnsysSoundException,
+        match="Example file 'missing_file.txt' is not available in the local examples folder",
+    ):
+        _download_file_in_local_examples_folder("missing_file.txt")
+    mock_download.assert_not_called()
+
+    # File added manually: trusted, and recorded.
+    (local_examples_folder[0] / "manual_file.txt").write_text("manual")
+    _download_file_in_local_examples_folder("manual_file.txt")
+    with open(local_examples_folder[0] / "cache_index.json", "r") as file:
+        assert "manual_file.txt" in json.load(file)
+    mock_download.assert_not_called()
+
+
+def test_download_offline_mode_corrupted_file(monkeypatch, local_examples_folder):
+    """Test the offline mode with a corrupted local copy."""
+    _, mock_download = local_examples_folder
+    filename = "JLT_CE_data.csv"
+    p = _download_file_in_local_examples_folder(filename)
+    with open(p, "a") as file:
+        file.write("corrupted")
+
+    monkeypatch.setenv(OFFLINE_MODE_ENVIRONMENT_VARIABLE, "true")
+    with pytest.raises(
+        PyAnsysSoundException, match=f"Local copy of example file '{filename}' is corrupted"
+    ):
+        _download_file_in_local_examples_folder(filename)
+    assert mock_download.call_count == 1
+
+    # Back online, the corrupted file is downloaded again.
+    monkeypatch.delenv(OFFLINE_MODE_ENVIRONMENT_VARIABLE)
+    _download_file_in_local_examples_folder(filename)
+    assert mock_download.call_count == 2
+    with open(p, "r") as file:
+        assert file.read() == filename
+
+
+def test_download_file_and_upload_to_remote_server(local_examples_folder):
+    """Test that a file is uploaded only once to a given remote server."""
+
+    class RemoteServer:
+        def __init__(self, port):
+            self.info = {"server_ip": "127.0.0.1", "server_port": port, "server_process_id": 1}
+
+        def has_client(self):
+            return True
+
+    def upload_file_in_tmp_folder(file_path, server):
+        # Leave time for concurrent calls to check the registry.
+        time.sleep(0.05)
+        return f"/tmp/{server.info['server_port']}/{os.path.basename(file_path)}"
+
+    servers = [RemoteServer(50052), RemoteServer(50053)]
+    with (
+        patch.dict(download_module._upload_registry, clear=True),
+        patch.object(
+            download_module, "upload_file_in_tmp_folder", side_effect=upload_file_in_tmp_folder
+        ) as mock_upload,
+    ):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            paths = list(
+                executor.map(
+                    lambda server: _download_file_and_upload_to_server_tmp_folder(
+                        "flute.wav", server
+                    ),
+                    servers * 4,
+                )
+            )
+
+        assert paths == ["/tmp/50052/flute.wav", "/tmp/50053/flute.wav"] * 4
+        assert mock_upload.call_count == 2
@@ -0,0 +1,68 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import subprocess
+import sys
+
+import pytest
+
+import ansys.sound.core
+
+
+def _get_modules_loaded_by(statement: str) -> set[str]:
+    """Return the modules loaded by a statement, in a fresh interpreter."""
+    code = f"import sys; {statement}; print('\\n'.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return set(result.stdout.split())
+
+
+def test_import_package_is_lazy():
+    modules = _get_modules_loaded_by("import ansys.sound.core")
+    assert "ansys.sound.core" in modules
+    assert "matplotlib.pyplot" not in modules
+    assert "ansys.dpf.core" not in modules
+    for subpackage in ansys.sound.core._SUBPACKAGES:
+        assert f"ansys.sound.core.{subpackage}" not in modules
+
+
+def test_import_subpackage_does_not_load_pyplot():
+    modules = _get_modules_loaded_by(
+        "import ansys.sound.core.psychoacoustics, ansys.sound.core.sound_composer, "
+        "ansys.sound.core.xtract"
+    )
+    assert "ansys.sound.core.psychoacoustics" in modules
+    assert "matplotlib.pyplot" not in modules
+
+
+def test_lazy_attributes():
+    assert ansys.sound.core.REFERENCE_ACOUSTIC_PRESSURE_IN_AIR == 2e-5
+    assert ansys.sound.core.xtract.__name__ == "ansys.sound.core.xtract"
+    assert "xtract" in dir(ansys.sound.core)
+    for name in ansys.sound.core.__all__:
+        assert getattr(ansys.sound.core, name) is not None
+
+
+def test_lazy_attributes_exceptions():
+    with pytest.raises(AttributeError, match="has no attribute 'unknown_attribute'"):
+        ansys.sound.core.unknown_attribute
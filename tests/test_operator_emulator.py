@@ -0,0 +1,361 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+
+from ansys.dpf.core import DataSources, Operator
+import numpy as np
+import pytest
+
+from ansys.sound.core import OperatorEmulator, Profiler
+from ansys.sound.core._operator_emulator import (
+    _compute_band_powers,
+    _compute_exponential_average,
+    _compute_periodogram,
+    _compute_power_spectral_density,
+    _compute_stft,
+    _create_emulated_operator,
+    _EmulatedOperator,
+    _filter_signal,
+    _get_frequency_weighting,
+    _get_window,
+)
+from ansys.sound.core._pyansys_sound import PyAnsysSoundException, _create_signal_field
+from ansys.sound.core.pipeline import Pipeline
+from ansys.sound.core.server_helpers._operator_pool import _acquire_operator, _release_operator
+from ansys.sound.core.signal_processing import Filter
+from ansys.sound.core.signal_utilities import ApplyGain, LoadWav, WriteWav
+from ansys.sound.core.spectral_processing import PowerSpectralDensity
+from ansys.sound.core.spectrogram_processing import Stft
+from ansys.sound.core.standard_levels import LevelOverTime
+
+SAMPLING_FREQUENCY = 48000.0
+
+# Local path of the test WAV file: emulated operators read files on the client side.
+LOCAL_PATH_FLUTE = os.path.join(os.path.dirname(__file__), "data", "flute.wav")
+
+
+def get_sine(frequency: float = 1000.0, duration: float = 1.0) -> np.ndarray:
+    """Create a sine of amplitude 1 (mean square 0.5)."""
+    times = np.arange(int(duration * SAMPLING_FREQUENCY)) / SAMPLING_FREQUENCY
+    return np.sin(2.0 * np.pi * frequency * times)
+
+
+def test_operator_emulator_instantiation():
+    """Test OperatorEmulator instantiation."""
+    emulator = OperatorEmulator()
+    assert emulator.operators == frozenset(OperatorEmulator.get_supported_operators())
+    assert "compute_stft" in emulator.operators
+
+    emulator = OperatorEmulator(operators=["apply_gain"])
+    assert emulator.operators == frozenset(["apply_gain"])
+
+
+def test_operator_emulator_instantiation_exception():
+    """Test OperatorEmulator instantiation exception."""
+    with pytest.raises(
+        PyAnsysSoundException, match=r"Operators \['compute_roughness'\] cannot be emulated."
+    ):
+        OperatorEmulator(operators=["compute_roughness"])
+
+
+def test_operator_emulator___str__():
+    """Test OperatorEmulator __str__ method."""
+    emulator = OperatorEmulator(operators=["sum_signals", "apply_gain"])
+    assert str(emulator) == (
+        "OperatorEmulator object (inactive).\nEmulated operators:\n\tapply_gain\n\tsum_signals"
+    )
+    with emulator:
+        assert str(emulator).startswith("OperatorEmulator object (active).")
+
+
+def test_operator_emulator_activation():
+    """Test the operators created with and without an active OperatorEmulator."""
+    assert _create_emulated_operator("apply_gain") is None
+
+    with OperatorEmulator(operators=["apply_gain"]):
+        operator = _create_emulated_operator("apply_gain")
+        assert isinstance(operator, _EmulatedOperator)
+        assert operator.name == "apply_gain"
+        assert _create_emulated_operator("sum_signals") is None
+
+        # Emulated operators are not pooled.
+        operator, server_reference = _acquire_operator("apply_gain")
+        assert isinstance(operator, _EmulatedOperator)
+        assert server_reference is None
+        _release_operator("apply_gain", operator, server_reference)
+
+    assert _create_emulated_operator("apply_gain") is None
+
+
+def test_operator_emulator_activation_exception():
+    """Test OperatorEmulator activation exception."""
+    with OperatorEmulator():
+        with pytest.raises(
+            PyAnsysSoundException, match="Another operator emulator is already active."
+        ):
+            with OperatorEmulator():
+                pass
+
+    # The first emulator is deactivated on exit.
+    with OperatorEmulator():
+        pass
+
+
+def test_emulated_operator_exceptions():
+    """Test the exceptions of the emulated operators."""
+    with pytest.raises(TypeError, match="abstract method '?_compute"):
+        _EmulatedOperator("apply_gain")
+
+    with OperatorEmulator():
+        operator = _create_emulated_operator("apply_gain")
+
+    with pytest.raises(
+        PyAnsysSoundException,
+        match="Input pin 0 of emulated operator 'apply_gain' is not connected.",
+    ):
+        operator.run()
+
+    with pytest.raises(PyAnsysSoundException, match="cannot be connected to emulated operator"):
+        operator.connect(0, Operator("apply_gain"))
+
+
+def test_get_window():
+    """Test the analysis windows."""
+    for window_type in [
+        "RECTANGULAR",
+        "HANN",
+        "HAMMING",
+        "BLACKMAN",
+        "BLACKMANHARRIS",
+        "BLACKMAN-HARRIS",
+        "FLATTOP",
+        "TRIANGULAR",
+        "BARTLETT",
+        "GAUSS",
+    ]:
+        window = _get_window(window_type, 65)
+        assert window.shape == (65,)
+        # Symmetric windows, with their maximum at the center.
+        assert window == pytest.approx(window[::-1])
+        assert window[32] == pytest.approx(1.0, abs=1e-3)
+
+    with pytest.raises(PyAnsysSoundException, match="Window type 'KAISER' is not supported."):
+        _get_window("KAISER", 65)
+
+
+def test_get_frequency_weighting():
+    """Test the A, B, and C frequency weightings."""
+    for weighting in ["A", "B", "C"]:
+        assert _get_frequency_weighting(np.array([1000.0]), weighting)[0] == pytest.approx(
+            0.0, abs=0.01
+        )
+
+    # Reference values of IEC 61672-1, at 100 Hz and 10 kHz.
+    assert _get_frequency_weighting(np.array([100.0, 10000.0]), "A") == pytest.approx(
+        [-19.1, -2.5], abs=0.1
+    )
+    assert _get_frequency_weighting(np.array([100.0, 10000.0]), "C") == pytest.approx(
+        [-0.3, -4.4], abs=0.1
+    )
+
+    with pytest.raises(PyAnsysSoundException, match="Frequency weighting 'D' is not supported."):
+        _get_frequency_weighting(np.array([1000.0]), "D")
+
+
+def test_filter_signal():
+    """Test the fast-convolution filter against direct implementations."""
+    rng = np.random.default_rng(0)
+    data = rng.standard_normal(1000)
+
+    # FIR filter.
+    b = np.array([0.5, 0.3, 0.2])
+    assert _filter_signal(data, b, np.array([2.0])) == pytest.approx(
+        np.convolve(data, b)[:1000] / 2.0
+    )
+
+    # First-order recursive filter.
+    expected = np.zeros_like(data)
+    previous = 0.0
+    for i, value in enumerate(data):
+        previous = 0.1 * value + 0.9 * previous
+        expected[i] = previous
+    assert _filter_signal(data, np.array([0.1]), np.array([1.0, -0.9])) == pytest.approx(expected)
+
+    with pytest.raises(
+        PyAnsysSoundException, match="The first denominator coefficient must not be zero."
+    ):
+        _filter_signal(data, b, np.array([0.0, 1.0]))
+
+
+def test_compute_stft():
+    """Test the STFT computation."""
+    data = get_sine(duration=0.1)
+    spectra, frame_starts = _compute_stft(data, 1024, "RECTANGULAR", 0.5)
+    assert spectra.shape == (9, 1024)
+    assert frame_starts[:3] == pytest.approx([0, 512, 1024])
+    assert spectra[0] == pytest.approx(np.fft.fft(data[:1024]))
+
+
+def test_compute_power_spectral_density():
+    """Test the PSD computation."""
+    data = get_sine()
+    psd, frequencies = _compute_power_spectral_density(
+        data, SAMPLING_FREQUENCY, "HANN", 2048, 2048, 0.25
+    )
+    assert frequencies.shape == psd.shape == (1025,)
+    assert frequencies[-1] == pytest.approx(SAMPLING_FREQUENCY / 2.0)
+
+    # The PSD integrates to the mean square of the signal.
+    assert np.sum(psd) * (frequencies[1] - frequencies[0]) == pytest.approx(0.5, rel=0.01)
+    assert frequencies[np.argmax(psd)] == pytest.approx(1000.0, abs=SAMPLING_FREQUENCY / 2048)
+
+
+def test_compute_band_powers():
+    """Test the octave and one-third-octave band powers."""
+    data = get_sine()
+    bin_powers, frequencies = _compute_periodogram(data, SAMPLING_FREQUENCY)
+    assert np.sum(bin_powers) == pytest.approx(np.mean(data**2))
+
+    for use_filter_bank in [False, True]:
+        powers, center_frequencies = _compute_band_powers(
+            bin_powers, frequencies, 3, use_filter_bank
+        )
+        assert len(powers) == len(center_frequencies) == 29
+        assert center_frequencies[16] == 1000.0
+        assert powers[16] == pytest.approx(0.5, rel=0.01)
+        if not use_filter_bank:
+            # Without filter bank, the bands do not overlap.
+            assert np.sum(powers) == pytest.approx(0.5)
+
+        powers, center_frequencies = _compute_band_powers(
+            bin_powers, frequencies, 1, use_filter_bank
+        )
+        assert center_frequencies.tolist() == [
+            31.5, 63.0, 125.0, 250.0, 500.0, 1000.0, 2000.0, 4000.0, 8000.0, 16000.0
+        ]  # fmt: skip
+        assert powers[5] == pytest.approx(0.5, rel=0.01)
+
+    # Bands above the highest frequency are not computed.
+    powers, center_frequencies = _compute_band_powers(
+        bin_powers[:2001], frequencies[:2001], 3, False
+    )
+    assert center_frequencies[-1] == 1600.0
+
+
+def test_compute_exponential_average():
+    """Test the block-wise exponential average."""
+    squared_data = np.ones(48000)
+    averages = _compute_exponential_average(squared_data, SAMPLING_FREQUENCY, 0.125, 1200)
+    assert averages.shape == (40,)
+
+    # Step response of the exponential average, at the end of each block.
+    times = np.arange(1, 41) * 1200 / SAMPLING_FREQUENCY
+    assert averages == pytest.approx(1.0 - np.exp(-times / 0.125), rel=1e-3)
+
+
+def test_operator_emulator_processing_classes():
+    """Test processing classes with emulated operators."""
+    data = get_sine()
+    signal = _create_signal_field(data, SAMPLING_FREQUENCY)
+
+    with OperatorEmulator():
+        apply_gain = ApplyGain(signal=signal, gain=6.0, gain_in_db=True)
+        filter = Filter(
+            b_coefficients=[0.5, 0.5],
+            a_coefficients=[1.0],
+            sampling_frequency=SAMPLING_FREQUENCY,
+            signal=signal,
+        )
+        psd = PowerSpectralDensity(input_signal=signal)
+        stft = Stft(signal=signal, fft_size=1024)
+        level_over_time = LevelOverTime(signal=signal, scale="RMS")
+
+    apply_gain.process()
+    assert apply_gain.get_output_as_nparray() == pytest.approx(data * 10.0 ** (6.0 / 20.0))
+
+    filter.process()
+    assert filter.get_output_as_nparray() == pytest.approx(np.convolve(data, [0.5, 0.5])[:48000])
+
+    psd.process()
+    assert psd.get_output().unit == "Pa^2/Hz"
+    assert len(psd.get_frequencies()) == 1025
+
+    stft.process()
+    assert stft.get_output_as_nparray().shape[0] == 1024
+
+    level_over_time.process()
+    assert level_over_time.get_level_max() == pytest.approx(np.sqrt(0.5), rel=0.01)
+
+
+def test_operator_emulator_wav_files(tmp_path):
+    """Test loading and writing WAV files with emulated operators."""
+    path_to_write = str(tmp_path / "flute_emulated.wav")
+    with OperatorEmulator():
+        load_wav = LoadWav(LOCAL_PATH_FLUTE)
+        load_wav.process()
+        write_wav = WriteWav(
+            path_to_write=path_to_write, signal=load_wav.get_output(), bit_depth="int16"
+        )
+        write_wav.process()
+        load_written_wav = LoadWav(path_to_write)
+        load_written_wav.process()
+
+    assert load_written_wav.get_sampling_frequency() == load_wav.get_sampling_frequency()
+    assert load_written_wav.get_format() == "int16"
+    assert load_written_wav.get_output_as_nparray() == pytest.approx(
+        load_wav.get_output_as_nparray(), abs=1.0 / 32768.0
+    )
+
+    # Data sources not created by the PyAnsys Sound classes: their path is unknown.
+    with OperatorEmulator():
+        operator = _create_emulated_operator("load_wav_sas")
+    data_sources = DataSources()
+    data_sources.add_file_path(LOCAL_PATH_FLUTE, ".wav")
+    operator.connect(0, data_sources)
+    with pytest.raises(PyAnsysSoundException, match="Emulated operators only support data sources"):
+        operator.run()
+
+
+def test_operator_emulator_profiler():
+    """Test the profiling of emulated operators."""
+    signal = _create_signal_field(get_sine(), SAMPLING_FREQUENCY)
+    with OperatorEmulator():
+        apply_gain = ApplyGain(signal=signal, gain=2.0, gain_in_db=False)
+
+    with Profiler() as profiler:
+        apply_gain.process()
+
+    events = {(event["name"], event["operator"]) for event in profiler.get_table()}
+    assert ("EmulatedOperator.run", "apply_gain") in events
+    assert ("EmulatedOperator.connect[0]", "apply_gain") in events
+
+
+def test_operator_emulator_pipeline_exception():
+    """Test the exception when using emulated operators in a pipeline."""
+    signal = _create_signal_field(get_sine(), SAMPLING_FREQUENCY)
+    with OperatorEmulator():
+        apply_gain = ApplyGain(gain=2.0, gain_in_db=False)
+
+    pipeline = Pipeline(stages=[apply_gain], signal=signal)
+    with pytest.raises(PyAnsysSoundException, match="Stage ApplyGain uses an emulated operator"):
+        pipeline.process()
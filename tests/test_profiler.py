@@ -0,0 +1,202 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import json
+
+from ansys.dpf.core import Operator
+import numpy as np
+import pytest
+
+from ansys.sound.core import Profiler
+from ansys.sound.core._profiler import _OPERATOR_RUN, _get_payload_size
+from ansys.sound.core._pyansys_sound import (
+    PyAnsysSound,
+    PyAnsysSoundException,
+    _create_signal_field,
+)
+from ansys.sound.core.psychoacoustics import LoudnessISO532_1_Stationary
+from ansys.sound.core.signal_utilities import LoadWav
+
+
+class DummyProcessingClass(PyAnsysSound):
+    """Processing class without DPF operator, to test the profiler."""
+
+    def process(self):
+        self._output = np.ones(10)
+
+    def get_output_as_nparray(self):
+        return self._output
+
+
+def test_profiler_record():
+    """Test the calls recorded by Profiler."""
+    dummy = DummyProcessingClass()
+
+    # Calls outside the profiler => not recorded.
+    profiler = Profiler()
+    dummy.process()
+    assert profiler.get_table() == []
+
+    with profiler:
+        dummy.process()
+        dummy.get_output_as_nparray()
+    dummy.process()
+
+    table = profiler.get_table()
+    assert [event["name"] for event in table] == [
+        "DummyProcessingClass.process",
+        "DummyProcessingClass.get_output_as_nparray",
+    ]
+    assert [event["category"] for event in table] == ["process", "conversion"]
+    assert table[1]["bytes_out"] == 80
+    assert all(event["parent_id"] is None for event in table)
+    assert all(event["duration"] >= 0.0 for event in table)
+
+    summary = profiler.get_summary()
+    assert summary[("DummyProcessingClass.process", None)]["count"] == 1
+
+    # Operator methods restored when exiting the profiler.
+    assert Operator.run is _OPERATOR_RUN
+
+
+def test_profiler_record_operators():
+    """Test the operator calls recorded by Profiler."""
+    with Profiler() as profiler:
+        wav_loader = LoadWav(pytest.data_path_flute)
+        wav_loader.process()
+        loudness = LoudnessISO532_1_Stationary(signal=wav_loader.get_output()[0])
+        loudness.process()
+
+    table = profiler.get_table()
+    process_events = [event for event in table if event["category"] == "process"]
+    assert [event["name"] for event in process_events] == [
+        "LoadWav.process",
+        "LoudnessISO532_1_Stationary.process",
+    ]
+
+    # Operator calls are children of the process calls.
+    run_events = [
+        event
+        for event in table
+        if event["category"] == "run"
+        and event["operator"] in ("load_wav_sas", "compute_loudness_iso532_1")
+    ]
+    assert [event["operator"] for event in run_events] == [
+        "load_wav_sas",
+        "compute_loudness_iso532_1",
+    ]
+    assert [event["parent_id"] for event in run_events] == [
+        event["span_id"] for event in process_events
+    ]
+
+    # Signal already on the server, passed to the loudness operator as a handle => no bytes.
+    connect_events = [
+        event
+        for event in table
+        if event["category"] == "connect" and event["operator"] == "compute_loudness_iso532_1"
+    ]
+    assert connect_events[0]["bytes_in"] == 0
+    assert all(event["bytes_out"] == 0 for event in table if event["category"] == "get_output")
+
+    summary = profiler.get_summary()
+    assert summary[("Operator.run", "load_wav_sas")]["count"] == 1
+
+
+def test_profiler_record_transfers():
+    """Test that Profiler counts each transferred payload once."""
+    with Profiler() as profiler:
+        wav_loader = LoadWav(pytest.data_path_flute)
+        wav_loader.process()
+        signal = wav_loader.get_output_as_nparray()
+        _create_signal_field(signal, 44100.0)
+
+    table = profiler.get_table()
+    signal_size = signal.size * 8
+
+    # Data read by LoadWav.get_output_as_nparray, not again by the nested conversion.
+    conversion_events = [event for event in table if event["category"] == "conversion"]
+    assert [event["name"] for event in conversion_events] == [
+        "LoadWav.get_output_as_nparray",
+        "convert_fields_container_to_np_array",
+        "_create_signal_field",
+    ]
+    assert [event["bytes_out"] for event in conversion_events] == [signal_size, 0, 0]
+
+    # Data sent when creating the field.
+    assert conversion_events[2]["bytes_in"] == signal_size
+
+    assert sum(event["bytes_out"] for event in table) == signal_size
+
+
+def test_profiler_exports(tmp_path):
+    """Test the Profiler exports."""
+    with Profiler() as profiler:
+        DummyProcessingClass().process()
+
+    spans = profiler.get_spans()
+    assert len(spans) == 1
+    assert spans[0]["name"] == "DummyProcessingClass.process"
+    assert spans[0]["parent_span_id"] is None
+    assert spans[0]["end_time_unix_nano"] >= spans[0]["start_time_unix_nano"]
+    assert spans[0]["status"]["status_code"] == "OK"
+    assert spans[0]["attributes"]["pyansys_sound.category"] == "process"
+
+    trace = profiler.get_chrome_trace()
+    assert trace["traceEvents"][0]["ph"] == "X"
+    assert trace["traceEvents"][0]["name"] == "DummyProcessingClass.process"
+
+    path = tmp_path / "trace.json"
+    profiler.export_chrome_trace(path)
+    with open(path) as file:
+        assert json.load(file) == json.loads(json.dumps(trace))
+
+
+def test_profiler_exceptions():
+    """Test Profiler exceptions."""
+
+    class FailingProcessingClass(PyAnsysSound):
+        def process(self):
+            raise ValueError("Processing failed.")
+
+    # Failing call => recorded with its error.
+    with Profiler() as profiler:
+        with pytest.raises(ValueError, match="Processing failed."):
+            FailingProcessingClass().process()
+    assert "Processing failed." in profiler.get_table()[0]["error"]
+    assert profiler.get_spans()[0]["status"]["status_code"] == "ERROR"
+
+    # Nested profilers => error.
+    with Profiler():
+        with pytest.raises(PyAnsysSoundException, match="Another profiler is already recording."):
+            with Profiler():
+                pass
+
+
+def test__get_payload_size():
+    """Test the _get_payload_size function."""
+    assert _get_payload_size(None) == 0
+    assert _get_payload_size(1.0) == 8
+    assert _get_payload_size([1.0, 2.0]) == 16
+    # Transferred in double precision, whatever the NumPy precision.
+    assert _get_payload_size(np.zeros(3, dtype=np.float32)) == 24
+    assert _get_payload_size(np.zeros(3, dtype=np.complex64)) == 48
+    assert _get_payload_size("abc") == 3
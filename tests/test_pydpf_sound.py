@@ -20,9 +20,18 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import asyncio
+import inspect
+import threading
+import time
 from unittest import mock
 
-from ansys.dpf.core import FieldsContainer, field_from_array, fields_container_factory
+from ansys.dpf.core import (
+    FieldsContainer,
+    _global_server,
+    field_from_array,
+    fields_container_factory,
+)
 from ansys.tools.common.exceptions import VersionError, VersionSyntaxError
 import numpy as np
 import pytest
@@ -32,8 +41,11 @@ from ansys.sound.core._pyansys_sound import (
     PyAnsysSoundException,
     PyAnsysSoundWarning,
     convert_fields_container_to_np_array,
+    get_numpy_precision,
     scipy_required,
+    set_numpy_precision,
 )
+from ansys.sound.core.server_helpers import set_server_concurrency_limit
 
 
 def test_pyansys_sound_init_subclass():
@@ -85,6 +97,31 @@ def test_pyansys_sound_instantiate():
     assert pyansys_sound != None
 
 
+def test_pyansys_sound_instantiate_with_server():
+    """Test instantiation of a PyAnsysSound subclass bound to an explicit server."""
+
+    class TestClass(PyAnsysSound):
+        def __init__(self, value: int = 0):
+            """Initialize the class.
+
+            Parameters
+            ----------
+            value : int, default: 0
+                Some value.
+            """
+            super().__init__()
+            self.value = value
+
+    assert list(inspect.signature(TestClass.__init__).parameters) == ["self", "value", "server"]
+    assert "server : BaseServer, default: None" in TestClass.__init__.__doc__
+
+    server = _global_server()
+    instance = TestClass(1, server=server)
+    assert instance.value == 1
+    assert instance._server is server
+    assert TestClass(2)._server is None
+
+
 def test_pyansys_sound_process():
     """Test the process method of PyAnsysSound class."""
     pyansys_sound = PyAnsysSound()
@@ -130,6 +167,43 @@ def test_pyansys_sound_get_output_as_nparray():
     assert np.shape(out) == (0,)
 
 
+def test_pyansys_sound_process_async():
+    """Test the process_async and get_output_async methods of PyAnsysSound class."""
+
+    class TestClass(PyAnsysSound):
+        active_calls = 0
+        max_active_calls = 0
+        lock = threading.Lock()
+
+        def process(self):
+            with TestClass.lock:
+                TestClass.active_calls += 1
+                TestClass.max_active_calls = max(TestClass.max_active_calls, TestClass.active_calls)
+            time.sleep(0.1)
+            with TestClass.lock:
+                TestClass.active_calls -= 1
+            self._output = "Processed"
+
+        def get_output(self):
+            return self._output
+
+    async def process_all(instances):
+        await asyncio.gather(*(instance.process_async() for instance in instances))
+        return await asyncio.gather(*(instance.get_output_async() for instance in instances))
+
+    set_server_concurrency_limit(2)
+    try:
+        outputs = asyncio.run(process_all([TestClass() for _ in range(5)]))
+        assert outputs == ["Processed"] * 5
+        assert TestClass.max_active_calls == 2
+    finally:
+        set_server_concurrency_limit(4)
+
+    # Timeout => exception.
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(TestClass().process_async(timeout=0.01))
+
+
 def test_convert_fields_container_to_np_array():
     """Test conversion of DPF fields container to NumPy array."""
 
@@ -163,6 +237,30 @@ def test_convert_fields_container_to_np_array():
     assert np_array[1].tolist() == [12.0, 34.0, 49.0]
 
 
+def test_numpy_precision():
+    """Test set_numpy_precision and get_numpy_precision, and their effect on conversions."""
+    assert get_numpy_precision() == "float64"
+
+    f1 = field_from_array([5.0, 48.0, 27.0])
+    f2 = field_from_array([12.0, 34.0, 49.0])
+    fc = fields_container_factory.over_time_freq_fields_container([f1, f2])
+    assert convert_fields_container_to_np_array(fc).dtype == np.float64
+
+    set_numpy_precision("float32")
+    try:
+        assert get_numpy_precision() == "float32"
+        np_array = convert_fields_container_to_np_array(fc)
+        assert np_array.dtype == np.float32
+        assert np_array.tolist() == [[5.0, 48.0, 27.0], [12.0, 34.0, 49.0]]
+    finally:
+        set_numpy_precision("float64")
+
+    with pytest.raises(
+        PyAnsysSoundException, match="Precision must be one of 'float64', 'float32'."
+    ):
+        set_numpy_precision("float16")
+
+
 def test_pyansys_sound_scipy_required():
     """Test the scipy_required decorator."""
 
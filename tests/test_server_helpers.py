@@ -20,17 +20,41 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import ast
+import asyncio
+import os
+import pathlib
+import threading
+import time
+from unittest.mock import patch
+
 from ansys.tools.common.exceptions import VersionError, VersionSyntaxError
 import pytest
 
+import ansys.sound.core
+from ansys.sound.core._pyansys_sound import PyAnsysSound, PyAnsysSoundException
+from ansys.sound.core.psychoacoustics import LoudnessISO532_1_Stationary
 from ansys.sound.core.server_helpers import (
+    ServerPool,
     _check_sound_version,
     _check_sound_version_and_raise,
+    clear_operator_pool,
     connect_to_or_start_server,
+    get_operator_pool_statistics,
+    get_server_concurrency_limit,
     requires_sound_version,
+    set_operator_pool_size,
+    set_server_concurrency_limit,
+    start_warm_server,
+    start_warm_server_in_background,
     validate_dpf_sound_connection,
+    warm_up_server,
 )
 from ansys.sound.core.server_helpers._check_version import get_sound_version
+from ansys.sound.core.server_helpers._server_executor import _run_in_server_executor
+from ansys.sound.core.server_helpers._server_pool import HEALTH_CHECK_OPERATOR
+from ansys.sound.core.server_helpers._warm_start import DEFAULT_PRELOADED_OPERATORS
+from ansys.sound.core.signal_utilities import LoadWav
 
 
 def test_validate_dpf_sound_connection():
@@ -152,3 +176,378 @@ def test_get_sound_version():
         version = get_sound_version()
         assert isinstance(version, str)
         assert len(version.split(".")) == 3
+
+
+def test_operator_pool():
+    """Test the operator pool, through a PyAnsys Sound class."""
+    operator_name = "compute_loudness_iso532_1"
+    clear_operator_pool()
+    assert get_operator_pool_statistics() == {}
+
+    # First instance => new operator.
+    loudness = LoudnessISO532_1_Stationary()
+    statistics = get_operator_pool_statistics()[operator_name]
+    assert statistics == {"created": 1, "reused": 0, "released": 0, "discarded": 0, "idle": 0}
+
+    # Instance closed => operator back in the pool (closing twice has no effect).
+    loudness.close()
+    loudness.close()
+    statistics = get_operator_pool_statistics()[operator_name]
+    assert statistics == {"created": 1, "reused": 0, "released": 1, "discarded": 0, "idle": 1}
+
+    # Operator of the closed instance reused, and given back when the instance is deleted.
+    loudness = LoudnessISO532_1_Stationary()
+    assert get_operator_pool_statistics()[operator_name]["reused"] == 1
+    del loudness
+    statistics = get_operator_pool_statistics()[operator_name]
+    assert statistics == {"created": 1, "reused": 1, "released": 2, "discarded": 0, "idle": 1}
+
+    # Context manager => instance closed at exit.
+    with LoudnessISO532_1_Stationary() as loudness:
+        assert get_operator_pool_statistics()[operator_name]["idle"] == 0
+    assert get_operator_pool_statistics()[operator_name]["idle"] == 1
+
+    # Pool disabled => operators discarded.
+    set_operator_pool_size(0)
+    try:
+        assert get_operator_pool_statistics()[operator_name]["idle"] == 0
+        loudness = LoudnessISO532_1_Stationary()
+        loudness.close()
+        statistics = get_operator_pool_statistics()[operator_name]
+        assert statistics["created"] == 2
+        assert statistics["discarded"] == 1
+        assert statistics["idle"] == 0
+    finally:
+        set_operator_pool_size(8)
+
+    clear_operator_pool()
+    assert get_operator_pool_statistics() == {}
+
+
+def test_operator_pool_reused_operator():
+    """Test that a reused operator gives the same results as a new one."""
+    clear_operator_pool()
+    wav_loader = LoadWav(pytest.data_path_flute)
+    wav_loader.process()
+    signal = wav_loader.get_output()[0]
+
+    loudness = LoudnessISO532_1_Stationary(signal=signal)
+    loudness.process()
+    loudness_reference = loudness.get_loudness_sone()
+    loudness.close()
+
+    loudness = LoudnessISO532_1_Stationary(signal=signal)
+    assert get_operator_pool_statistics()["compute_loudness_iso532_1"]["reused"] == 1
+    loudness.process()
+    assert loudness.get_loudness_sone() == pytest.approx(loudness_reference)
+
+
+def test_operator_pool_optional_inputs():
+    """Test that classes with optional operator inputs get new operators, outside of the pool."""
+    clear_operator_pool()
+    instance = PyAnsysSound()
+    operator = instance._get_pooled_operator("compute_PR", has_optional_inputs=True)
+    assert operator.name == "compute_PR"
+    assert instance._get_pooled_operator("compute_PR", has_optional_inputs=True) is not operator
+    instance.close()
+    assert get_operator_pool_statistics() == {}
+
+
+def test_set_operator_pool_size_exceptions():
+    """Test set_operator_pool_size exceptions."""
+    with pytest.raises(
+        PyAnsysSoundException, match="Maximum number of idle operators must be positive or zero."
+    ):
+        set_operator_pool_size(-1)
+
+
+def test_server_concurrency_limit():
+    """Test set_server_concurrency_limit and get_server_concurrency_limit."""
+    assert get_server_concurrency_limit() == 4
+
+    set_server_concurrency_limit(2)
+    assert get_server_concurrency_limit() == 2
+
+    set_server_concurrency_limit(4)
+    assert get_server_concurrency_limit() == 4
+
+    with pytest.raises(
+        PyAnsysSoundException, match="Maximum number of concurrent calls must be at least 1."
+    ):
+        set_server_concurrency_limit(0)
+
+
+def test_server_concurrency_limit_change_while_running():
+    """Test that a changed concurrency limit applies to the calls already queued."""
+
+    class IdleServer:
+        """Stand-in for a DPF server: the executor only keeps a weak reference to it."""
+
+    server = IdleServer()
+    lock = threading.Lock()
+    active_calls = 0
+    calls = []
+
+    def call():
+        nonlocal active_calls
+        with lock:
+            active_calls += 1
+            calls.append((get_server_concurrency_limit(server), active_calls))
+        time.sleep(0.1)
+        with lock:
+            active_calls -= 1
+
+    async def run_calls(new_limit):
+        # Three calls are submitted before the limit changes, and three after.
+        tasks = [
+            asyncio.ensure_future(_run_in_server_executor(call, server=server)) for _ in range(3)
+        ]
+        await asyncio.sleep(0.05)
+        set_server_concurrency_limit(new_limit, server=server)
+        tasks += [
+            asyncio.ensure_future(_run_in_server_executor(call, server=server)) for _ in range(3)
+        ]
+        await asyncio.gather(*tasks)
+
+    # Lowered limit: once it is set, no call starts while another one runs.
+    set_server_concurrency_limit(3, server=server)
+    asyncio.run(run_calls(1))
+    assert len(calls) == 6
+    assert max(active for limit, active in calls if limit == 3) == 3
+    assert all(active == 1 for limit, active in calls if limit == 1)
+
+    # Raised limit: the new calls run concurrently with the former ones, within the limit.
+    calls.clear()
+    asyncio.run(run_calls(3))
+    assert len(calls) == 6
+    assert max(active for limit, active in calls if limit == 3) == 3
+
+
+class FakeServer:
+    """Stand-in for a gRPC DPF server, to test the server pool without starting servers."""
+
+    ansys_path = ""
+    version = "11.0"
+
+    def __init__(self, port: int):
+        """Initialize the fake server."""
+        self.ip = "127.0.0.1"
+        self.port = port
+
+    def check_version(self, *args):
+        """Accept any required version."""
+
+
+@pytest.fixture
+def fake_servers():
+    """Replace the start of and the connection to DPF servers with fake servers.
+
+    Each local start gets a new port. Connections get a server at the requested port.
+    """
+    local_ports = iter(range(50054, 50064))
+    with (
+        patch(
+            "ansys.sound.core.server_helpers._connect_to_or_start_server.start_local_server",
+            side_effect=lambda **kwargs: FakeServer(next(local_ports)),
+        ) as start_local_server,
+        patch(
+            "ansys.sound.core.server_helpers._connect_to_or_start_server.connect_to_server",
+            side_effect=lambda port, **kwargs: FakeServer(port),
+        ) as connect_to_server,
+        patch("ansys.sound.core.server_helpers._connect_to_or_start_server.load_library"),
+        patch(
+            "ansys.sound.core.server_helpers._server_pool.available_operator_names",
+            return_value=[HEALTH_CHECK_OPERATOR],
+        ),
+    ):
+        yield start_local_server, connect_to_server
+
+
+def get_pool_ports() -> list[int] | None:
+    """Get the port of the test server, if it is remote, to pool it."""
+    port = os.environ.get("ANSRV_DPF_SOUND_PORT")
+    return None if port is None else [int(port)]
+
+
+def test_server_pool(fake_servers):
+    """Test the ServerPool class."""
+    with ServerPool(server_count=2, max_leases_per_server=1) as pool:
+        assert len(pool) == 2
+        assert pool.max_leases_per_server == 1
+        assert str(pool) == "ServerPool with 2 server(s), 2 healthy, 0 active lease(s)"
+
+        # Least-loaded scheduling: both servers are leased before waiting.
+        server_1 = pool.acquire()
+        server_2 = pool.acquire()
+        assert server_1 is not server_2
+        assert [statistics["active_leases"] for statistics in pool.get_statistics()] == [1, 1]
+
+        with pytest.raises(
+            PyAnsysSoundException, match="No server of the pool became available within 0.1 s."
+        ):
+            pool.acquire(timeout=0.1)
+
+        pool.release(server_1)
+        with pool.lease() as server:
+            assert server is server_1
+        pool.release(server_2)
+
+        with pytest.raises(PyAnsysSoundException, match="Server is not leased from this pool."):
+            pool.release(server_2)
+
+        # A server reported unhealthy is no longer leased, until the health check.
+        pool.release(pool.acquire(), healthy=False)
+        assert [statistics["healthy"] for statistics in pool.get_statistics()].count(False) == 1
+        assert pool.check_health() == [True, True]
+
+    assert len(pool) == 0
+
+
+def test_server_pool_port_in_environment(fake_servers, monkeypatch):
+    """Test that a ServerPool starts distinct servers, whatever the port in the environment."""
+    start_local_server, connect_to_server = fake_servers
+    monkeypatch.setenv("ANSRV_DPF_SOUND_PORT", "6780")
+
+    with ServerPool(server_count=3) as pool:
+        assert [server.port for server in pool.servers] == [50054, 50055, 50056]
+    assert start_local_server.call_count == 3
+    connect_to_server.assert_not_called()
+
+    # Explicit ports are still connected to.
+    with ServerPool(ports=[6780, 6781]) as pool:
+        assert [server.port for server in pool.servers] == [6780, 6781]
+
+
+def test_server_pool_bound_instances():
+    """Test processing classes bound to a server leased from a ServerPool."""
+    wav_loader = LoadWav(pytest.data_path_flute)
+    wav_loader.process()
+    loudness = LoudnessISO532_1_Stationary(signal=wav_loader.get_output()[0])
+    loudness.process()
+    loudness_reference = loudness.get_loudness_sone()
+
+    with ServerPool(ports=get_pool_ports()) as pool:
+        with pool.lease() as server:
+            wav_loader = LoadWav(pytest.data_path_flute, server=server)
+            wav_loader.process()
+            loudness = LoudnessISO532_1_Stationary(signal=wav_loader.get_output()[0], server=server)
+            loudness.process()
+            assert loudness.get_loudness_sone() == pytest.approx(loudness_reference)
+            assert loudness._server is server
+
+
+def test_server_pool_exceptions():
+    """Test ServerPool exceptions."""
+    with pytest.raises(PyAnsysSoundException, match="Number of servers must be at least 1."):
+        ServerPool(server_count=0)
+
+    with pytest.raises(
+        PyAnsysSoundException, match="Maximum number of leases per server must be at least 1."
+    ):
+        ServerPool(max_leases_per_server=0)
+
+
+def test_server_pool_same_server_exceptions(fake_servers):
+    """Test ServerPool exceptions when several servers of the pool are the same server."""
+    start_local_server, _ = fake_servers
+
+    with pytest.raises(
+        PyAnsysSoundException,
+        match="Several servers of the pool are the same server \\(127.0.0.1:6780\\).",
+    ):
+        ServerPool(ports=[6780, 6780])
+
+    start_local_server.side_effect = lambda **kwargs: FakeServer(50054)
+    with pytest.raises(
+        PyAnsysSoundException,
+        match="Several servers of the pool are the same server \\(127.0.0.1:50054\\).",
+    ):
+        ServerPool(server_count=2)
+
+
+def test_warm_up_server():
+    """Test the warm_up_server function."""
+    clear_operator_pool()
+    set_operator_pool_size(2)
+    try:
+        timings = warm_up_server(
+            operators=["compute_loudness_iso532_1", "unknown"], operator_count=2
+        )
+        assert set(timings) == {"operator_preload", "probe"}
+        assert get_operator_pool_statistics()["compute_loudness_iso532_1"]["released"] == 2
+        assert "unknown" not in get_operator_pool_statistics()
+
+        timings = warm_up_server(operators=[], run_probe=False)
+        assert set(timings) == {"operator_preload"}
+    finally:
+        set_operator_pool_size(8)
+
+
+def test_warm_up_server_exceptions():
+    """Test warm_up_server exceptions."""
+    with pytest.raises(
+        PyAnsysSoundException, match="Number of preloaded operators must be at least 1."
+    ):
+        warm_up_server(operator_count=0)
+
+
+def test_warm_up_server_default_operators_are_pooled():
+    """Test that the operators preloaded by default are taken from the pool by their classes."""
+    pooled_operators = set()
+    for path in pathlib.Path(ansys.sound.core.__path__[0]).rglob("*.py"):
+        tree = ast.parse(path.read_text(encoding="utf-8"))
+        constants = {
+            node.targets[0].id: node.value.value
+            for node in tree.body
+            if isinstance(node, ast.Assign)
+            and isinstance(node.targets[0], ast.Name)
+            and isinstance(node.value, ast.Constant)
+        }
+        for node in ast.walk(tree):
+            if (
+                isinstance(node, ast.Call)
+                and isinstance(node.func, ast.Attribute)
+                and node.func.attr == "_get_pooled_operator"
+            ):
+                argument = node.args[0]
+                if isinstance(argument, ast.Constant):
+                    pooled_operators.add(argument.value)
+                elif isinstance(argument, ast.Name) and argument.id in constants:
+                    pooled_operators.add(constants[argument.id])
+
+    assert set(DEFAULT_PRELOADED_OPERATORS) <= pooled_operators
+
+
+def test_start_warm_server():
+    """Test the start_warm_server and start_warm_server_in_background functions."""
+    server, license_context, timings = start_warm_server(use_license_context=True)
+    assert server is not None
+    assert license_context is not None
+    assert list(timings) == [
+        "server_start",
+        "version_check",
+        "plugin_load",
+        "license_checkout",
+        "operator_preload",
+        "probe",
+        "total",
+    ]
+    assert timings["total"] >= sum(
+        duration for name, duration in timings.items() if name != "total"
+    )
+
+    server, license_context, timings = start_warm_server_in_background(run_probe=False).result()
+    assert server is not None
+    assert license_context is None
+    assert "probe" not in timings
+
+
+def test_server_pool_warm_up():
+    """Test the warm-up of the servers of a ServerPool."""
+    with ServerPool(ports=get_pool_ports(), warm_up=True) as pool:
+        timings = pool.get_startup_timings()
+        assert len(timings) == 1
+        assert "probe" in timings[0]
+
+    with ServerPool(ports=get_pool_ports()) as pool:
+        assert "probe" not in pool.get_startup_timings()[0]
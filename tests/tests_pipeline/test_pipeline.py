@@ -0,0 +1,195 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from ansys.dpf.core import Field, Workflow
+import numpy as np
+import pytest
+
+from ansys.sound.core._pyansys_sound import PyAnsysSoundException, PyAnsysSoundWarning
+from ansys.sound.core.pipeline import Pipeline
+from ansys.sound.core.psychoacoustics import (
+    LoudnessISO532_1_Stationary,
+    LoudnessISO532_1_TimeVarying,
+)
+from ansys.sound.core.signal_processing import Filter
+from ansys.sound.core.signal_utilities import ApplyGain, LoadWav, Resample
+from ansys.sound.core.standard_levels import LevelOverTime
+
+
+def test_pipeline_instantiation():
+    """Test Pipeline instantiation."""
+    pipeline = Pipeline()
+    assert pipeline.stages == []
+    assert pipeline.signal is None
+    assert pipeline.channel_index == 0
+    assert pipeline.get_workflow() is None
+    assert pipeline.get_stage_timings() == []
+
+    pipeline = Pipeline(stages=[ApplyGain(), Resample()], signal=Field(), channel_index=1)
+    assert len(pipeline.stages) == 2
+    assert isinstance(pipeline.signal, Field)
+    assert pipeline.channel_index == 1
+
+
+def test_pipeline___str__():
+    """Test Pipeline __str__ method."""
+    pipeline = Pipeline()
+    assert str(pipeline) == "Pipeline object.\nStages: Not set"
+
+    pipeline.stages = [LoadWav(), ApplyGain(), LevelOverTime()]
+    assert str(pipeline) == "Pipeline object.\nStages: LoadWav -> ApplyGain -> LevelOverTime"
+
+
+def test_pipeline_setters_exceptions():
+    """Test Pipeline setters exceptions."""
+    pipeline = Pipeline()
+    with pytest.raises(
+        PyAnsysSoundException,
+        match="Stages must be specified as a list of PyAnsys Sound class instances.",
+    ):
+        pipeline.stages = [ApplyGain(), "InvalidStage"]
+
+    with pytest.raises(PyAnsysSoundException, match="Signal must be specified as a DPF field."):
+        pipeline.signal = "InvalidSignal"
+
+    with pytest.raises(PyAnsysSoundException, match="Channel index must be positive or zero."):
+        pipeline.channel_index = -1
+
+
+def test_pipeline_process():
+    """Test Pipeline process method, against the stages processed one by one."""
+    # Pipeline, starting from a WAV file.
+    pipeline = Pipeline(
+        stages=[
+            LoadWav(pytest.data_path_flute),
+            Resample(new_sampling_frequency=48000.0),
+            ApplyGain(gain=6.0),
+            LoudnessISO532_1_TimeVarying(),
+        ]
+    )
+    pipeline.process()
+    assert isinstance(pipeline.get_workflow(), Workflow)
+    timings = pipeline.get_stage_timings()
+    assert [name for name, _ in timings] == [
+        "LoadWav",
+        "Resample",
+        "ApplyGain",
+        "LoudnessISO532_1_TimeVarying",
+    ]
+    assert all(duration >= 0.0 for _, duration in timings)
+
+    # Intermediate stages have no output, only the last one.
+    assert pipeline.stages[1]._output is None
+    assert pipeline.get_output() is pipeline.stages[-1].get_output()
+
+    # Same stages, processed one by one.
+    wav_loader = LoadWav(pytest.data_path_flute)
+    wav_loader.process()
+    resampler = Resample(wav_loader.get_output()[0], new_sampling_frequency=48000.0)
+    resampler.process()
+    gain = ApplyGain(resampler.get_output(), gain=6.0)
+    gain.process()
+    loudness = LoudnessISO532_1_TimeVarying(gain.get_output())
+    loudness.process()
+
+    assert pipeline.stages[-1].get_N5_sone() == pytest.approx(loudness.get_N5_sone())
+    assert np.allclose(
+        pipeline.stages[-1].get_loudness_sone_vs_time(), loudness.get_loudness_sone_vs_time()
+    )
+
+    # Pipeline, starting from a signal.
+    level = LevelOverTime(scale="dB", reference_value=2e-5)
+    pipeline = Pipeline(
+        stages=[
+            Filter(b_coefficients=[0.5, 0.5], a_coefficients=[1.0]),
+            level,
+        ],
+        signal=wav_loader.get_output()[0],
+    )
+    pipeline.process()
+    assert [name for name, _ in pipeline.get_stage_timings()] == ["Filter", "LevelOverTime"]
+    assert pipeline.get_output()[0] == level.get_level_max()
+    assert len(pipeline.get_output_as_nparray()) == 3
+
+
+def test_pipeline_process_exceptions():
+    """Test Pipeline process method exceptions."""
+    pipeline = Pipeline()
+    with pytest.raises(PyAnsysSoundException, match="No stage is defined. Use `Pipeline.stages`."):
+        pipeline.process()
+
+    pipeline.stages = [ApplyGain()]
+    with pytest.raises(
+        PyAnsysSoundException,
+        match=(
+            "No input signal is set. Use `Pipeline.signal`, or use a `LoadWav` instance as first "
+            "stage."
+        ),
+    ):
+        pipeline.process()
+
+    pipeline.stages = [ApplyGain(), LoadWav(pytest.data_path_flute)]
+    pipeline.signal = Field()
+    with pytest.raises(
+        PyAnsysSoundException,
+        match=r"Stage 1 \(LoadWav\) has no input signal, and can only be the first stage.",
+    ):
+        pipeline.process()
+
+    pipeline.stages = [ApplyGain(), LevelOverTime(), Resample()]
+    with pytest.raises(
+        PyAnsysSoundException,
+        match=r"Stage 1 \(LevelOverTime\) has no output signal, and can only be the last stage.",
+    ):
+        pipeline.process()
+
+    pipeline.stages = [ApplyGain(), LoudnessISO532_1_TimeVarying(), ApplyGain()]
+    with pytest.raises(
+        PyAnsysSoundException,
+        match=(
+            r"Stage 1 \(LoudnessISO532_1_TimeVarying\) has no output signal, and can only be the "
+            "last stage."
+        ),
+    ):
+        pipeline.process()
+
+    pipeline.stages = [LoudnessISO532_1_Stationary()]
+    with pytest.raises(
+        PyAnsysSoundException,
+        match="Class LoudnessISO532_1_Stationary cannot be used as a pipeline stage.",
+    ):
+        pipeline.process()
+
+
+def test_pipeline_get_output_warning():
+    """Test Pipeline get_output method warning."""
+    pipeline = Pipeline(stages=[ApplyGain()])
+    with pytest.warns(
+        PyAnsysSoundWarning,
+        match="Output is not processed yet. Use the `Pipeline.process\\(\\)` method.",
+    ):
+        output = pipeline.get_output()
+    assert output is None
+
+    with pytest.warns(PyAnsysSoundWarning, match="Output is not processed yet."):
+        output = pipeline.get_output_as_nparray()
+    assert len(output) == 0
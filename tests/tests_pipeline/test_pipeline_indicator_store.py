@@ -0,0 +1,359 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from ansys.sound.core._pyansys_sound import PyAnsysSoundException, PyAnsysSoundWarning
+from ansys.sound.core.pipeline import IndicatorStore
+from ansys.sound.core.psychoacoustics import LoudnessISO532_1_Stationary
+
+DATA_DIRECTORY = os.path.join(os.path.dirname(__file__), "..", "data")
+LOCAL_PATH_FLUTE = os.path.join(DATA_DIRECTORY, "flute.wav")
+LOCAL_PATH_WHITE_NOISE = os.path.join(DATA_DIRECTORY, "white_noise.wav")
+
+EXP_LOUDNESS_LEVEL_FREE = 93.0669937133789
+EXP_LOUDNESS_LEVEL_DIFFUSE = 93.93004
+EXP_STR_DEFAULT = (
+    "IndicatorStore object\n"
+    "Data:\n"
+    "\tPath: Not set\n"
+    "\tNumber of sounds: 0\n"
+    "\tIndicators: None\n"
+    "Number of stored sounds: Not processed"
+)
+
+
+def add_loudness_indicators(store: IndicatorStore):
+    """Add the free-field and diffuse-field loudness levels to an indicator store."""
+    store.add_indicator("LN_free", LoudnessISO532_1_Stationary, "get_loudness_level_phon")
+    store.add_indicator(
+        "LN_diffuse",
+        LoudnessISO532_1_Stationary,
+        "get_loudness_level_phon",
+        parameters={"field_type": "Diffuse"},
+    )
+
+
+def test_indicator_store_instantiation():
+    """Test IndicatorStore instantiation."""
+    store = IndicatorStore()
+    assert store.path is None
+    assert store.sound_paths == []
+    assert store.channel_index == 0
+    assert store.max_workers is None
+    assert store.server_pool is None
+    assert store.get_indicator_names() == []
+
+
+def test_indicator_store___str__(tmp_path):
+    """Test IndicatorStore __str__ method."""
+    store = IndicatorStore()
+    assert str(store) == EXP_STR_DEFAULT
+
+    store.path = str(tmp_path / "store.parquet")
+    store.sound_paths = [LOCAL_PATH_FLUTE]
+    add_loudness_indicators(store)
+    store.process()
+    assert f"Path: {store.path}" in str(store)
+    assert "Number of sounds: 1" in str(store)
+    assert "Indicators: LN_free, LN_diffuse" in str(store)
+    assert "Number of stored sounds: 1" in str(store)
+
+
+def test_indicator_store_setters_exceptions():
+    """Test IndicatorStore setters' exceptions."""
+    with pytest.raises(PyAnsysSoundException, match="Path must be specified as a string."):
+        IndicatorStore(path=1)
+
+    with pytest.raises(
+        PyAnsysSoundException, match="Sound paths must be specified as a list of strings."
+    ):
+        IndicatorStore(sound_paths="path/to/file.wav")
+
+    with pytest.raises(PyAnsysSoundException, match="Channel index must be positive or zero."):
+        IndicatorStore(channel_index=-1)
+
+    with pytest.raises(
+        PyAnsysSoundException, match="Maximum number of workers must be greater than 0."
+    ):
+        IndicatorStore(max_workers=0)
+
+    with pytest.raises(
+        PyAnsysSoundException, match="Server pool must be specified as a ServerPool object."
+    ):
+        IndicatorStore(server_pool="WrongType")
+
+
+def test_indicator_store_add_indicator():
+    """Test IndicatorStore add_indicator and delete_indicator methods."""
+    store = IndicatorStore()
+    add_loudness_indicators(store)
+    assert store.get_indicator_names() == ["LN_free", "LN_diffuse"]
+
+    store.delete_indicator("LN_free")
+    assert store.get_indicator_names() == ["LN_diffuse"]
+
+    with pytest.raises(PyAnsysSoundException, match="No indicator named 'LN_free'."):
+        store.delete_indicator("LN_free")
+
+    with pytest.raises(
+        PyAnsysSoundException,
+        match="Indicator name must be a string, other than 'sound_hash' and 'sound_name'.",
+    ):
+        store.add_indicator("sound_hash", LoudnessISO532_1_Stationary, "get_loudness_sone")
+
+    with pytest.raises(
+        PyAnsysSoundException, match="Indicator class must be a PyAnsys Sound processing class."
+    ):
+        store.add_indicator("N", dict, "get_loudness_sone")
+
+    with pytest.raises(
+        PyAnsysSoundException,
+        match="Class LoudnessISO532_1_Stationary has no method named 'get_sharpness'.",
+    ):
+        store.add_indicator("N", LoudnessISO532_1_Stationary, "get_sharpness")
+
+    with pytest.raises(
+        PyAnsysSoundException,
+        match=("Parameters must only contain numbers, strings, Booleans, None, or lists of these."),
+    ):
+        store.add_indicator(
+            "N", LoudnessISO532_1_Stationary, "get_loudness_sone", parameters={"x": object()}
+        )
+
+
+def test_indicator_store_process(tmp_path):
+    """Test IndicatorStore process method."""
+    store = IndicatorStore()
+    with pytest.raises(
+        PyAnsysSoundException,
+        match="No indicator is defined. Use `IndicatorStore.add_indicator\\(\\)`.",
+    ):
+        store.process()
+
+    path = str(tmp_path / "store.parquet")
+    store = IndicatorStore(path=path, sound_paths=[LOCAL_PATH_FLUTE], max_workers=2)
+    add_loudness_indicators(store)
+    store.process()
+    assert os.path.isfile(path)
+
+    # Already stored values are not computed again, including in a new store instance: only the
+    # new sound is computed, once per indicator.
+    store = IndicatorStore(path=path, sound_paths=[LOCAL_PATH_WHITE_NOISE, LOCAL_PATH_FLUTE])
+    add_loudness_indicators(store)
+    with mock.patch.object(
+        LoudnessISO532_1_Stationary,
+        "process",
+        autospec=True,
+        side_effect=LoudnessISO532_1_Stationary.process,
+    ) as mock_process:
+        store.process()
+        assert mock_process.call_count == 2
+        assert store.get_output().num_rows == 2
+
+        store.process()
+        assert mock_process.call_count == 2
+
+    # Same indicator name, different definition -> error.
+    store = IndicatorStore(path=path, sound_paths=[LOCAL_PATH_FLUTE])
+    store.add_indicator("LN_free", LoudnessISO532_1_Stationary, "get_loudness_sone")
+    with pytest.raises(
+        PyAnsysSoundException,
+        match="Indicator 'LN_free' is stored with a different definition. Use another indicator "
+        "name.",
+    ):
+        store.process()
+
+    # Values stored for another channel -> error.
+    store = IndicatorStore(path=path, sound_paths=[LOCAL_PATH_FLUTE], channel_index=1)
+    add_loudness_indicators(store)
+    with pytest.raises(
+        PyAnsysSoundException,
+        match="The store contains values computed on channel 0, not on channel 1. Use another "
+        "store path, or set the channel index to 0.",
+    ):
+        store.process()
+
+
+def test_indicator_store_process_errors(tmp_path):
+    """Test IndicatorStore process method, when the processing of a sound fails."""
+    invalid_path = str(tmp_path / "invalid.wav")
+    with open(invalid_path, "w") as file:
+        file.write("Not a WAV file.")
+
+    path = str(tmp_path / "store.parquet")
+    store = IndicatorStore(path=path, sound_paths=[LOCAL_PATH_FLUTE, invalid_path])
+    add_loudness_indicators(store)
+    with pytest.raises(
+        PyAnsysSoundException,
+        match="Indicators could not be computed for 1 sound\\(s\\), whose values are left missing.",
+    ):
+        store.process()
+    assert list(store.get_processing_errors()) == [invalid_path]
+
+    # The values of the other sound are stored and saved, those of the failed one are missing.
+    features = store.get_feature_matrix()
+    assert features[0] == pytest.approx([EXP_LOUDNESS_LEVEL_FREE, EXP_LOUDNESS_LEVEL_DIFFUSE])
+    assert np.all(np.isnan(features[1]))
+
+    store = IndicatorStore(path=path, sound_paths=[LOCAL_PATH_FLUTE])
+    add_loudness_indicators(store)
+    with mock.patch.object(LoudnessISO532_1_Stationary, "process") as mock_process:
+        store.process()
+        mock_process.assert_not_called()
+    assert store.get_processing_errors() == {}
+
+
+def test_indicator_store_process_exceptions():
+    """Test IndicatorStore process method's exceptions."""
+    store = IndicatorStore(sound_paths=[LOCAL_PATH_FLUTE], channel_index=1)
+    add_loudness_indicators(store)
+    with pytest.raises(
+        PyAnsysSoundException,
+        match="Channel index \\(1\\) is out of range for file .*, which has 1 channel\\(s\\).",
+    ):
+        store.process()
+
+    store = IndicatorStore(sound_paths=[LOCAL_PATH_FLUTE])
+    store.add_indicator("N_specific", LoudnessISO532_1_Stationary, "get_specific_loudness")
+    with pytest.raises(
+        PyAnsysSoundException,
+        match="Indicator 'N_specific' must be a single number, but method "
+        "'get_specific_loudness' returned",
+    ):
+        store.process()
+
+    # PyArrow not installed -> error.
+    with mock.patch.dict("sys.modules", {"pyarrow": None}):
+        with pytest.raises(
+            PyAnsysSoundException,
+            match="The function or method `process\\(\\)` requires the PyArrow Python library",
+        ):
+            store.process()
+
+
+def test_indicator_store_get_output():
+    """Test IndicatorStore get_output method."""
+    store = IndicatorStore(sound_paths=[LOCAL_PATH_FLUTE])
+    add_loudness_indicators(store)
+    with pytest.warns(
+        PyAnsysSoundWarning,
+        match="Output is not processed yet. Use the `IndicatorStore.process\\(\\)` method.",
+    ):
+        output = store.get_output()
+    assert output is None
+
+    store.process()
+    output = store.get_output()
+    assert output.column_names == ["sound_hash", "sound_name", "LN_free", "LN_diffuse"]
+    assert output.column("sound_name").to_pylist() == ["flute.wav"]
+    assert output.column("LN_free").to_pylist()[0] == pytest.approx(EXP_LOUDNESS_LEVEL_FREE)
+
+
+def test_indicator_store_get_output_as_nparray():
+    """Test IndicatorStore get_output_as_nparray method."""
+    store = IndicatorStore(sound_paths=[LOCAL_PATH_FLUTE])
+    add_loudness_indicators(store)
+    with pytest.warns(
+        PyAnsysSoundWarning,
+        match="Output is not processed yet. Use the `IndicatorStore.process\\(\\)` method.",
+    ):
+        output = store.get_output_as_nparray()
+    assert len(output) == 0
+
+    store.process()
+    output = store.get_output_as_nparray()
+    assert output.shape == (1, 2)
+
+
+def test_indicator_store_get_feature_matrix():
+    """Test IndicatorStore get_feature_matrix and get_feature_columns methods."""
+    store = IndicatorStore(sound_paths=[LOCAL_PATH_FLUTE])
+    add_loudness_indicators(store)
+    with pytest.raises(
+        PyAnsysSoundException,
+        match="Output is not processed yet. Use the `IndicatorStore.process\\(\\)` method.",
+    ):
+        store.get_feature_matrix()
+    with pytest.raises(
+        PyAnsysSoundException,
+        match="Output is not processed yet. Use the `IndicatorStore.process\\(\\)` method.",
+    ):
+        store.get_feature_columns()
+
+    # Same sound listed twice: computed once, and output twice.
+    store.sound_paths = [LOCAL_PATH_FLUTE, LOCAL_PATH_FLUTE]
+    store.process()
+    assert store.get_output().num_rows == 1
+
+    features = store.get_feature_matrix()
+    assert features.shape == (2, 2)
+    assert features[:, 0] == pytest.approx(EXP_LOUDNESS_LEVEL_FREE)
+    assert features[:, 1] == pytest.approx(EXP_LOUDNESS_LEVEL_DIFFUSE)
+
+    features = store.get_feature_matrix(["LN_diffuse"])
+    assert features.shape == (2, 1)
+
+    columns = store.get_feature_columns()
+    assert list(columns) == ["LN_free", "LN_diffuse"]
+    assert isinstance(columns["LN_free"], np.ndarray)
+    assert columns["LN_free"][0] == pytest.approx(EXP_LOUDNESS_LEVEL_FREE)
+
+    with pytest.raises(PyAnsysSoundException, match="No indicator named 'N' in the store."):
+        store.get_feature_matrix(["N"])
+
+
+def test_indicator_store_get_sound_hashes():
+    """Test IndicatorStore get_sound_hashes method."""
+    store = IndicatorStore(sound_paths=[LOCAL_PATH_FLUTE, LOCAL_PATH_WHITE_NOISE])
+    add_loudness_indicators(store)
+    with pytest.raises(
+        PyAnsysSoundException,
+        match="Output is not processed yet. Use the `IndicatorStore.process\\(\\)` method.",
+    ):
+        store.get_sound_hashes()
+
+    store.process()
+    sound_hashes = store.get_sound_hashes()
+    assert len(sound_hashes) == 2
+    assert all(len(sound_hash) == 64 for sound_hash in sound_hashes)
+    assert sound_hashes[0] != sound_hashes[1]
+
+
+def test_indicator_store_get_data_frame():
+    """Test IndicatorStore get_data_frame method."""
+    store = IndicatorStore(sound_paths=[LOCAL_PATH_FLUTE])
+    add_loudness_indicators(store)
+    with pytest.raises(
+        PyAnsysSoundException,
+        match="Output is not processed yet. Use the `IndicatorStore.process\\(\\)` method.",
+    ):
+        store.get_data_frame()
+
+    store.process()
+    data_frame = store.get_data_frame()
+    assert list(data_frame.columns) == ["sound_name", "LN_free", "LN_diffuse"]
+    assert data_frame["LN_free"].iloc[0] == pytest.approx(EXP_LOUDNESS_LEVEL_FREE)
@@ -0,0 +1,248 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from ansys.sound.core._pyansys_sound import PyAnsysSoundException, PyAnsysSoundWarning
+from ansys.sound.core.psychoacoustics import (
+    IndicatorBundle,
+    LoudnessISO532_1_Stationary,
+    LoudnessISO532_1_TimeVarying,
+)
+from ansys.sound.core.psychoacoustics.indicator_bundle import _compute_sharpness
+from ansys.sound.core.signal_utilities import LoadWav
+
+EXP_STR_DEFAULT = (
+    "IndicatorBundle object\n"
+    "Data:\n"
+    "\tSignal name: Not set\n"
+    "\tField type: Free\n"
+    "\tCompute over time: False\n"
+    "Indicators: Not processed"
+)
+
+
+def test_indicator_bundle_instantiation():
+    """Test the instantiation of the IndicatorBundle class."""
+    indicators = IndicatorBundle()
+    assert indicators.signal is None
+    assert indicators.field_type == "Free"
+    assert indicators.compute_over_time is False
+
+
+def test_indicator_bundle___str__():
+    """Test the __str__ method of the IndicatorBundle class."""
+    indicators = IndicatorBundle()
+    assert str(indicators) == EXP_STR_DEFAULT
+
+    wav_loader = LoadWav(pytest.data_path_sharp_noise)
+    wav_loader.process()
+    indicators.signal = wav_loader.get_output()[0]
+    indicators.process()
+    assert "Sharpness: " in str(indicators)
+
+
+def test_indicator_bundle_setters_exceptions():
+    """Test the exceptions of the IndicatorBundle setters."""
+    with pytest.raises(PyAnsysSoundException, match="Signal must be specified as a DPF field."):
+        IndicatorBundle(signal="WrongType")
+
+    with pytest.raises(
+        PyAnsysSoundException,
+        match='Invalid field type "Invalid". Available options are "Free" and "Diffuse".',
+    ):
+        IndicatorBundle(field_type="Invalid")
+
+
+def test_indicator_bundle_process():
+    """Test the process method of the IndicatorBundle class."""
+    indicators = IndicatorBundle()
+    with pytest.raises(
+        PyAnsysSoundException,
+        match="No signal found for indicator computation. Use `IndicatorBundle.signal`.",
+    ):
+        indicators.process()
+
+    wav_loader = LoadWav(pytest.data_path_sharp_noise)
+    wav_loader.process()
+    indicators.signal = wav_loader.get_output()[0]
+    indicators.process()
+    assert indicators._output is not None
+    assert indicators.get_output()[1] is None
+
+
+def test_indicator_bundle_get_output():
+    """Test the get_output and get_output_as_nparray methods of the IndicatorBundle class."""
+    wav_loader = LoadWav(pytest.data_path_sharp_noise)
+    wav_loader.process()
+    signal = wav_loader.get_output()[0]
+    indicators = IndicatorBundle(signal=signal)
+    with pytest.warns(
+        PyAnsysSoundWarning,
+        match="Output is not processed yet. Use the `IndicatorBundle.process\\(\\)` method.",
+    ):
+        output = indicators.get_output()
+    assert output is None
+
+    output = indicators.get_output_as_nparray()
+    assert np.isnan(output[0])
+    assert len(output[2]) == 0
+
+    indicators.process()
+    output = indicators.get_output_as_nparray()
+    assert len(output) == 6
+    assert len(output[2]) == len(output[3])
+    assert len(output[4]) == 0
+
+
+@pytest.mark.parametrize("field_type", ["Free", "Diffuse"])
+def test_indicator_bundle_matches_individual_classes(field_type):
+    """Test that the loudness indicators match those of the individual classes."""
+    wav_loader = LoadWav(pytest.data_path_sharp_noise)
+    wav_loader.process()
+    signal = wav_loader.get_output()[0]
+    indicators = IndicatorBundle(signal=signal, field_type=field_type, compute_over_time=True)
+    indicators.process()
+
+    loudness = LoudnessISO532_1_Stationary(signal=signal, field_type=field_type)
+    loudness.process()
+    assert indicators.get_loudness_sone() == pytest.approx(loudness.get_loudness_sone())
+    assert indicators.get_loudness_level_phon() == pytest.approx(loudness.get_loudness_level_phon())
+    assert np.allclose(indicators.get_specific_loudness(), loudness.get_specific_loudness())
+    assert np.allclose(indicators.get_bark_band_frequencies(), loudness.get_bark_band_frequencies())
+
+    # The sharpness is derived from the same specific loudness.
+    assert indicators.get_sharpness() == pytest.approx(
+        _compute_sharpness(
+            loudness.get_specific_loudness(),
+            loudness.get_bark_band_indexes(),
+            loudness.get_loudness_sone(),
+        )
+    )
+
+    loudness = LoudnessISO532_1_TimeVarying(signal=signal, field_type=field_type)
+    loudness.process()
+    assert np.allclose(indicators.get_loudness_sone_vs_time(), loudness.get_loudness_sone_vs_time())
+    assert np.allclose(indicators.get_time_scale(), loudness.get_time_scale())
+    N5, N10 = indicators.get_loudness_percentiles_sone([5, 10])
+    assert N5 == pytest.approx(loudness.get_N5_sone(), rel=1e-2)
+    assert N10 == pytest.approx(loudness.get_N10_sone(), rel=1e-2)
+
+
+def test_indicator_bundle_spectral_summaries():
+    """Test the spectral summaries of the specific loudness."""
+    wav_loader = LoadWav(pytest.data_path_sharp_noise)
+    wav_loader.process()
+    signal = wav_loader.get_output()[0]
+    indicators = IndicatorBundle(signal=signal)
+    indicators.process()
+
+    specific_loudness = indicators.get_specific_loudness()
+    bark_band_indexes = indicators.get_bark_band_indexes()
+
+    centroid = indicators.get_specific_loudness_centroid()
+    assert centroid == pytest.approx(
+        np.sum(bark_band_indexes * specific_loudness) / np.sum(specific_loudness)
+    )
+    assert 0.0 < indicators.get_specific_loudness_spread() < 24.0
+    assert indicators.get_peak_bark_band_index() == pytest.approx(
+        bark_band_indexes[np.argmax(specific_loudness)]
+    )
+    assert indicators.get_sharpness(weighting="Aures") > 0.0
+
+
+def test_indicator_bundle_exceptions():
+    """Test the exceptions of the IndicatorBundle getters."""
+    wav_loader = LoadWav(pytest.data_path_sharp_noise)
+    wav_loader.process()
+    signal = wav_loader.get_output()[0]
+    indicators = IndicatorBundle(signal=signal)
+    indicators.process()
+
+    with pytest.raises(
+        PyAnsysSoundException,
+        match="Loudness over time is not computed. Set `IndicatorBundle.compute_over_time` to",
+    ):
+        indicators.get_loudness_percentiles_sone([5])
+
+    with pytest.raises(PyAnsysSoundException, match='Invalid sharpness weighting "Invalid".'):
+        indicators.get_sharpness(weighting="Invalid")
+
+    indicators.compute_over_time = True
+    indicators.process()
+    with pytest.raises(PyAnsysSoundException, match="Percentages must be between 0 and 100."):
+        indicators.get_loudness_percentiles_sone([110])
+
+
+@patch("matplotlib.pyplot.show")
+def test_indicator_bundle_plot(mock_show):
+    """Test the plot method of the IndicatorBundle class."""
+    wav_loader = LoadWav(pytest.data_path_sharp_noise)
+    wav_loader.process()
+    signal = wav_loader.get_output()[0]
+    indicators = IndicatorBundle(signal=signal, compute_over_time=True)
+    with pytest.raises(
+        PyAnsysSoundException,
+        match="Output is not processed yet. Use the `IndicatorBundle.process\\(\\)` method.",
+    ):
+        indicators.plot()
+
+    indicators.process()
+    indicators.plot()
+
+
+def test__compute_sharpness():
+    """Test the sharpness computation from a specific loudness."""
+    bark_band_indexes = np.arange(1, 241) * 0.1
+    # Uniform specific loudness over 1 Bark, centered on 1 kHz (8.5 Bark): about 1 acum.
+    specific_loudness = np.where(np.abs(bark_band_indexes - 8.5) <= 0.5, 1.0, 0.0)
+    loudness = np.sum(specific_loudness) * 0.1
+
+    assert _compute_sharpness(specific_loudness, bark_band_indexes, loudness) == pytest.approx(
+        0.935
+    )
+    assert _compute_sharpness(
+        specific_loudness, bark_band_indexes, loudness, "DIN45692"
+    ) == pytest.approx(0.935)
+
+    # Several spectra at once, including a silent one.
+    sharpness = _compute_sharpness(
+        np.vstack([specific_loudness, np.zeros_like(specific_loudness)]),
+        bark_band_indexes,
+        [loudness, 0.0],
+    )
+    assert sharpness == pytest.approx([0.935, 0.0])
+
+    # Single band at 20 Bark, where the weighting functions differ.
+    specific_loudness = np.where(np.abs(bark_band_indexes - 20.0) < 0.05, 1.0, 0.0)
+    assert _compute_sharpness(specific_loudness, bark_band_indexes, 0.1) == pytest.approx(
+        0.11 * 0.066 * np.exp(0.171 * 20.0) * 20.0
+    )
+    assert _compute_sharpness(
+        specific_loudness, bark_band_indexes, 0.1, "DIN45692"
+    ) == pytest.approx(0.11 * (0.15 * np.exp(0.42 * 4.2) + 0.85) * 20.0)
+    assert _compute_sharpness(specific_loudness, bark_band_indexes, 0.1, "Aures") == pytest.approx(
+        0.11 * 0.1 * 0.078 * np.exp(0.171 * 20.0) / np.log(0.05 * 0.1 + 1.0)
+    )
@@ -0,0 +1,267 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from ansys.sound.core._pyansys_sound import PyAnsysSoundException, PyAnsysSoundWarning
+from ansys.sound.core.psychoacoustics import (
+    IndicatorOverTime,
+    LoudnessANSI_S3_4,
+    LoudnessISO532_1_Stationary,
+    SpectralCentroid,
+)
+from ansys.sound.core.signal_utilities import CropSignal, LoadWav
+
+EXP_STR_DEFAULT = (
+    "IndicatorOverTime object\n"
+    "Data:\n"
+    "\tSignal name: Not set\n"
+    "\tIndicator: Not set\n"
+    "\tGetter: Not set\n"
+    "\tParameters: None\n"
+    "\tWindow length: 1.0 s\n"
+    "\tOverlap: 50.0 %\n"
+    "Number of windows: Not processed"
+)
+
+
+def test_indicator_over_time_instantiation():
+    """Test IndicatorOverTime instantiation."""
+    indicator = IndicatorOverTime()
+    assert indicator.signal is None
+    assert indicator.indicator_class is None
+    assert indicator.getter is None
+    assert indicator.parameters is None
+    assert indicator.getter_parameters is None
+    assert indicator.window_length == 1.0
+    assert indicator.overlap == 50.0
+    assert indicator.max_workers is None
+
+
+def test_indicator_over_time___str__():
+    """Test IndicatorOverTime __str__ method."""
+    indicator = IndicatorOverTime()
+    assert str(indicator) == EXP_STR_DEFAULT
+
+    wav_loader = LoadWav(pytest.data_path_flute_nonUnitaryCalib)
+    wav_loader.process()
+    indicator.signal = wav_loader.get_output()[0]
+    indicator.indicator_class = SpectralCentroid
+    indicator.process()
+    assert "Indicator: SpectralCentroid" in str(indicator)
+    assert "Getter: get_spectral_centroid" in str(indicator)
+    assert f"Number of windows: {indicator.get_window_count()}" in str(indicator)
+
+
+def test_indicator_over_time_setters_exceptions():
+    """Test IndicatorOverTime setters' exceptions."""
+    with pytest.raises(PyAnsysSoundException, match="Signal must be specified as a DPF field."):
+        IndicatorOverTime(signal="WrongType")
+
+    with pytest.raises(
+        PyAnsysSoundException, match="Indicator class must be a PyAnsys Sound processing class."
+    ):
+        IndicatorOverTime(indicator_class=dict)
+
+    with pytest.raises(PyAnsysSoundException, match="Getter must be specified as a method name."):
+        IndicatorOverTime(getter=1)
+
+    with pytest.raises(
+        PyAnsysSoundException, match="Parameters must be specified as a dictionary."
+    ):
+        IndicatorOverTime(parameters=["Free"])
+
+    with pytest.raises(
+        PyAnsysSoundException, match="Getter parameters must be specified as a dictionary."
+    ):
+        IndicatorOverTime(getter_parameters=["Free"])
+
+    with pytest.raises(PyAnsysSoundException, match="Window length must be strictly positive."):
+        IndicatorOverTime(window_length=0.0)
+
+    with pytest.raises(
+        PyAnsysSoundException, match="Overlap must be positive and strictly smaller than 100.0 %."
+    ):
+        IndicatorOverTime(overlap=100.0)
+
+    with pytest.raises(
+        PyAnsysSoundException, match="Maximum number of workers must be greater than 0."
+    ):
+        IndicatorOverTime(max_workers=0)
+
+
+def test_indicator_over_time_process():
+    """Test IndicatorOverTime process method."""
+    indicator = IndicatorOverTime()
+    with pytest.raises(
+        PyAnsysSoundException,
+        match="No input signal defined. Use `IndicatorOverTime.signal`.",
+    ):
+        indicator.process()
+
+    wav_loader = LoadWav(pytest.data_path_flute_nonUnitaryCalib)
+    wav_loader.process()
+    indicator.signal = wav_loader.get_output()[0]
+    with pytest.raises(
+        PyAnsysSoundException,
+        match="No indicator class defined. Use `IndicatorOverTime.indicator_class`.",
+    ):
+        indicator.process()
+
+    indicator.indicator_class = LoudnessISO532_1_Stationary
+    with pytest.raises(
+        PyAnsysSoundException,
+        match="Class LoudnessISO532_1_Stationary has no default getter. Use "
+        "`IndicatorOverTime.getter`.",
+    ):
+        indicator.process()
+
+    indicator.getter = "get_sharpness"
+    with pytest.raises(
+        PyAnsysSoundException,
+        match="Class LoudnessISO532_1_Stationary has no method named 'get_sharpness'.",
+    ):
+        indicator.process()
+
+    indicator.getter = "get_specific_loudness"
+    with pytest.raises(
+        PyAnsysSoundException,
+        match="The indicator must be a single number, but method 'get_specific_loudness' "
+        "returned",
+    ):
+        indicator.process()
+
+    indicator.getter = "get_loudness_sone"
+    indicator.window_length = 100.0
+    with pytest.raises(
+        PyAnsysSoundException,
+        match="Signal duration must be greater than or equal to the window length \\(100.0 s\\).",
+    ):
+        indicator.process()
+
+    indicator.window_length = 1.0
+    indicator.process()
+    assert indicator.get_output() is not None
+
+
+def test_indicator_over_time_get_output():
+    """Test IndicatorOverTime get_output method."""
+    wav_loader = LoadWav(pytest.data_path_flute_nonUnitaryCalib)
+    wav_loader.process()
+    signal = wav_loader.get_output()[0]
+    indicator = IndicatorOverTime(
+        signal=signal,
+        indicator_class=LoudnessANSI_S3_4,
+        getter="get_loudness_level_phon",
+        parameters={"field_type": "Diffuse"},
+        window_length=1.0,
+        overlap=50.0,
+        max_workers=2,
+    )
+    with pytest.warns(
+        PyAnsysSoundWarning,
+        match="Output is not processed yet. Use the `IndicatorOverTime.process\\(\\)` method.",
+    ):
+        output = indicator.get_output()
+    assert output is None
+
+    indicator.process()
+    values, time = indicator.get_output()
+
+    time_data = signal.time_freq_support.time_frequencies.data
+    sampling_frequency = 1 / (time_data[1] - time_data[0])
+    window_size = round(sampling_frequency)
+    hop_size = round(window_size / 2)
+    exp_window_count = 1 + (len(time_data) - window_size) // hop_size
+    assert len(values) == exp_window_count
+    assert time == pytest.approx(
+        (np.arange(exp_window_count) * hop_size + window_size / 2) / sampling_frequency
+    )
+
+    # The value of each window is that of the indicator on the cropped window.
+    crop_signal = CropSignal(
+        signal=signal,
+        start_time=hop_size / sampling_frequency,
+        end_time=(hop_size + window_size) / sampling_frequency,
+    )
+    crop_signal.process()
+    loudness = LoudnessANSI_S3_4(signal=crop_signal.get_output(), field_type="Diffuse")
+    loudness.process()
+    assert values[1] == pytest.approx(loudness.get_loudness_level_phon())
+
+
+def test_indicator_over_time_get_output_as_nparray():
+    """Test IndicatorOverTime get_output_as_nparray method."""
+    wav_loader = LoadWav(pytest.data_path_flute_nonUnitaryCalib)
+    wav_loader.process()
+    signal = wav_loader.get_output()[0]
+    indicator = IndicatorOverTime(signal=signal, indicator_class=SpectralCentroid)
+    with pytest.warns(
+        PyAnsysSoundWarning,
+        match="Output is not processed yet. Use the `IndicatorOverTime.process\\(\\)` method.",
+    ):
+        values, time = indicator.get_output_as_nparray()
+    assert len(values) == 0
+    assert len(time) == 0
+
+    indicator.process()
+    values, time = indicator.get_output_as_nparray()
+    assert isinstance(values, np.ndarray)
+    assert isinstance(time, np.ndarray)
+    assert len(values) == len(time)
+
+
+def test_indicator_over_time_getters():
+    """Test IndicatorOverTime getters."""
+    wav_loader = LoadWav(pytest.data_path_flute_nonUnitaryCalib)
+    wav_loader.process()
+    signal = wav_loader.get_output()[0]
+    indicator = IndicatorOverTime(
+        signal=signal, indicator_class=SpectralCentroid, window_length=0.5, overlap=0.0
+    )
+    indicator.process()
+
+    values = indicator.get_indicator_over_time()
+    time = indicator.get_time_scale()
+    assert len(values) == len(time) == indicator.get_window_count()
+    assert np.all(values > 0.0)
+    assert np.diff(time) == pytest.approx(0.5, abs=1e-3)
+
+
+@patch("matplotlib.pyplot.show")
+def test_indicator_over_time_plot(mock_show):
+    """Test IndicatorOverTime plot method."""
+    wav_loader = LoadWav(pytest.data_path_flute_nonUnitaryCalib)
+    wav_loader.process()
+    signal = wav_loader.get_output()[0]
+    indicator = IndicatorOverTime(signal=signal, indicator_class=SpectralCentroid)
+    with pytest.raises(
+        PyAnsysSoundException,
+        match="Output is not processed yet. Use the `IndicatorOverTime.process\\(\\)` method.",
+    ):
+        indicator.plot()
+
+    indicator.process()
+    indicator.plot()
@@ -0,0 +1,272 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from unittest.mock import patch
+
+from ansys.dpf.core import Field
+import numpy as np
+import pytest
+
+from ansys.sound.core._pyansys_sound import (
+    PyAnsysSoundException,
+    PyAnsysSoundWarning,
+    _create_signal_field,
+)
+from ansys.sound.core.psychoacoustics import (
+    LoudnessISO532_1_Streaming,
+    LoudnessISO532_1_TimeVarying,
+)
+from ansys.sound.core.psychoacoustics.loudness_iso_532_1_streaming import (
+    LOUDNESS_LEVEL_HISTOGRAM_EDGES,
+    _RunningHistogram,
+)
+from ansys.sound.core.signal_utilities import LoadWav
+
+BLOCK_DURATION = 1.0
+EXP_STR_DEFAULT = (
+    "LoudnessISO532_1_Streaming object\n"
+    "Data:\n"
+    "\tField type: Free\n"
+    "\tWarm-up duration: 0.5 s\n"
+    "\tProcessed frames: 0\n"
+    "Indicators: Not processed"
+)
+
+
+def get_blocks(signal: Field) -> list[Field]:
+    """Split the test signal into blocks."""
+    time = signal.time_freq_support.time_frequencies.data
+    sampling_frequency = 1 / (time[1] - time[0])
+    block_size = int(BLOCK_DURATION * sampling_frequency)
+    data = np.array(signal.data)
+    return [
+        _create_signal_field(data[start : start + block_size], sampling_frequency)
+        for start in range(0, len(data), block_size)
+    ]
+
+
+def test_loudness_iso_532_1_streaming_instantiation():
+    """Test the instantiation of the LoudnessISO532_1_Streaming class."""
+    loudness = LoudnessISO532_1_Streaming()
+    assert loudness.signal is None
+    assert loudness.field_type == "Free"
+    assert loudness.warm_up_duration == 0.5
+    assert loudness.get_frame_count() == 0
+
+
+def test_loudness_iso_532_1_streaming___str__():
+    """Test the __str__ method of the LoudnessISO532_1_Streaming class."""
+    loudness = LoudnessISO532_1_Streaming()
+    assert str(loudness) == EXP_STR_DEFAULT
+
+    wav_loader = LoadWav(pytest.data_path_flute)
+    wav_loader.process()
+    loudness.push(wav_loader.get_output()[0])
+    assert "N5: " in str(loudness)
+
+
+def test_loudness_iso_532_1_streaming_setters_exceptions():
+    """Test the exceptions of the LoudnessISO532_1_Streaming setters."""
+    with pytest.raises(PyAnsysSoundException, match="Signal must be specified as a DPF field."):
+        LoudnessISO532_1_Streaming(signal="WrongType")
+
+    with pytest.raises(
+        PyAnsysSoundException,
+        match='Invalid field type "Invalid". Available options are "Free" and "Diffuse".',
+    ):
+        LoudnessISO532_1_Streaming(field_type="Invalid")
+
+    with pytest.raises(
+        PyAnsysSoundException, match="Warm-up duration must be greater than or equal to 0 s."
+    ):
+        LoudnessISO532_1_Streaming(warm_up_duration=-1.0)
+
+
+def test_loudness_iso_532_1_streaming_process():
+    """Test the process method of the LoudnessISO532_1_Streaming class."""
+    loudness = LoudnessISO532_1_Streaming()
+
+    with pytest.raises(
+        PyAnsysSoundException,
+        match=(
+            "No signal found for loudness versus time computation. "
+            "Use `LoudnessISO532_1_Streaming.signal`."
+        ),
+    ):
+        loudness.process()
+
+    wav_loader = LoadWav(pytest.data_path_flute)
+    wav_loader.process()
+    loudness.signal = wav_loader.get_output()[0]
+    loudness.process()
+    assert loudness.get_frame_count() == len(loudness.get_time_scale())
+
+
+def test_loudness_iso_532_1_streaming_process_exception():
+    """Test the exception of the process method, when the sampling frequency changes."""
+    loudness = LoudnessISO532_1_Streaming()
+    loudness.push(_create_signal_field(np.zeros(4800), 48000.0))
+
+    with pytest.raises(
+        PyAnsysSoundException,
+        match=(
+            "Specified signal's sampling frequency \\(44100.0 Hz\\) must match the sampling "
+            "frequency of the previous blocks \\(48000.0 Hz\\)."
+        ),
+    ):
+        loudness.push(_create_signal_field(np.zeros(4410), 44100.0))
+
+    loudness.reset()
+    loudness.push(_create_signal_field(np.zeros(4410), 44100.0))
+
+
+def test_loudness_iso_532_1_streaming_push():
+    """Test that pushing blocks gives the same results as the whole signal."""
+    wav_loader = LoadWav(pytest.data_path_flute)
+    wav_loader.process()
+    signal = wav_loader.get_output()[0]
+    reference = LoudnessISO532_1_TimeVarying(signal=signal)
+    reference.process()
+
+    loudness = LoudnessISO532_1_Streaming()
+    loudness_blocks = []
+    time_blocks = []
+    for block in get_blocks(signal):
+        block_loudness, block_loudness_level, block_time = loudness.push(block)
+        assert len(block_loudness) == len(block_loudness_level) == len(block_time)
+        loudness_blocks.append(block_loudness)
+        time_blocks.append(block_time)
+
+    # Frames are output once each, in order.
+    time = np.concatenate(time_blocks)
+    assert np.all(np.diff(time) > 0.0)
+    assert loudness.get_frame_count() == len(time)
+
+    # The loudness of the frames after the first block matches that of the whole signal.
+    reference_time = reference.get_time_scale()
+    reference_loudness = reference.get_loudness_sone_vs_time()
+    frame_count = min(len(time), len(reference_time))
+    assert time[:frame_count] == pytest.approx(reference_time[:frame_count], abs=1e-6)
+    assert np.concatenate(loudness_blocks)[:frame_count] == pytest.approx(
+        reference_loudness[:frame_count], rel=1e-2, abs=1e-2
+    )
+
+    assert loudness.get_Nmax_sone() == pytest.approx(reference.get_Nmax_sone(), rel=1e-2)
+    assert loudness.get_N5_sone() == pytest.approx(reference.get_N5_sone(), rel=2e-2)
+    assert loudness.get_N10_sone() == pytest.approx(reference.get_N10_sone(), rel=2e-2)
+    assert loudness.get_Lmax_phon() == pytest.approx(reference.get_Lmax_phon(), abs=0.1)
+    assert loudness.get_L5_phon() == pytest.approx(reference.get_L5_phon(), abs=0.3)
+    assert loudness.get_L10_phon() == pytest.approx(reference.get_L10_phon(), abs=0.3)
+
+
+def test_loudness_iso_532_1_streaming_reset():
+    """Test the reset method of the LoudnessISO532_1_Streaming class."""
+    loudness = LoudnessISO532_1_Streaming()
+    wav_loader = LoadWav(pytest.data_path_flute)
+    wav_loader.process()
+    loudness.push(wav_loader.get_output()[0])
+    assert loudness.get_frame_count() > 0
+
+    loudness.reset()
+    assert loudness.get_frame_count() == 0
+    assert np.isnan(loudness.get_N5_sone())
+    assert np.isnan(loudness.get_Lmax_phon())
+
+
+def test_loudness_iso_532_1_streaming_get_output():
+    """Test the get_output and get_output_as_nparray methods."""
+    loudness = LoudnessISO532_1_Streaming()
+
+    with pytest.warns(
+        PyAnsysSoundWarning,
+        match=(
+            "Output is not processed yet. "
+            "Use the `LoudnessISO532_1_Streaming.process\\(\\)` method."
+        ),
+    ):
+        output = loudness.get_output()
+    assert output is None
+
+    with pytest.warns(PyAnsysSoundWarning):
+        loudness_sone, loudness_level, time = loudness.get_output_as_nparray()
+    assert len(loudness_sone) == len(loudness_level) == len(time) == 0
+    assert np.isnan(loudness.get_Nmax_sone())
+
+    wav_loader = LoadWav(pytest.data_path_flute)
+    wav_loader.process()
+    loudness.push(wav_loader.get_output()[0])
+    loudness_sone, loudness_level, time = loudness.get_output()
+    assert isinstance(loudness_sone, np.ndarray)
+    assert isinstance(loudness_level, np.ndarray)
+    assert isinstance(time, np.ndarray)
+    assert loudness.get_loudness_sone_vs_time() is loudness_sone
+    assert loudness.get_loudness_level_phon_vs_time() is loudness_level
+    assert loudness.get_time_scale() is time
+
+
+@patch("matplotlib.pyplot.show")
+def test_loudness_iso_532_1_streaming_plot(mock_show):
+    """Test the plot method of the LoudnessISO532_1_Streaming class."""
+    loudness = LoudnessISO532_1_Streaming()
+
+    with pytest.raises(
+        PyAnsysSoundException,
+        match=(
+            "Output is not processed yet. "
+            "Use the `LoudnessISO532_1_Streaming.process\\(\\)` method."
+        ),
+    ):
+        loudness.plot()
+
+    wav_loader = LoadWav(pytest.data_path_flute)
+    wav_loader.process()
+    loudness.push(wav_loader.get_output()[0])
+    loudness.plot()
+
+
+def test__running_histogram():
+    """Test the _RunningHistogram class."""
+    histogram = _RunningHistogram(LOUDNESS_LEVEL_HISTOGRAM_EDGES)
+    assert histogram.count == 0
+    assert np.isnan(histogram.max)
+    assert np.isnan(histogram.get_exceeded_value(5.0))
+
+    rng = np.random.default_rng(0)
+    values = rng.uniform(20.0, 100.0, 10000)
+    for block in np.array_split(values, 7):
+        histogram.add(block)
+    histogram.add(np.array([]))
+
+    assert histogram.count == len(values)
+    assert histogram.max == values.max()
+    for percentage in (5.0, 10.0, 50.0):
+        assert histogram.get_exceeded_value(percentage) == pytest.approx(
+            np.percentile(values, 100.0 - percentage), abs=0.02
+        )
+    assert histogram.get_exceeded_value(0.0) == values.max()
+    assert histogram.get_exceeded_value(100.0) == values.min()
+
+    # Values out of the bin edges are counted in the first or last bin.
+    histogram.reset()
+    histogram.add(np.array([-10.0, 200.0]))
+    assert histogram.count == 2
+    assert histogram.get_exceeded_value(0.0) == 200.0
@@ -0,0 +1,253 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from unittest.mock import patch
+
+from ansys.dpf.core import Field
+import numpy as np
+import pytest
+
+from ansys.sound.core._pyansys_sound import PyAnsysSoundException, PyAnsysSoundWarning
+from ansys.sound.core.psychoacoustics import LoudnessISO532_2_Batch
+from ansys.sound.core.signal_utilities import LoadWav
+
+# Expected values for Acceleration_stereo_nonUnitaryCalib (dichotic), in Free/Mic conditions
+EXP_BIN_LOUDNESS_DICHOTIC = 18.90975
+EXP_BIN_LOUDNESS_LEVEL_DICHOTIC = 82.25344
+EXP_MON_LOUDNESS_DICHOTIC = (9.673014, 14.93052)
+EXP_MON_LOUDNESS_LEVEL_DICHOTIC = (72.58388, 79.05491)
+EXP_BIN_SPECIFIC_LOUDNESS_DICHOTIC_45 = 1.656872
+EXP_MON_SPECIFIC_LOUDNESS_DICHOTIC_45 = (0.8625394, 1.298307)
+
+# Expected values for flute_nonUnitaryCalib (diotic), in Free/Mic conditions
+EXP_BIN_LOUDNESS_DIOTIC = 58.42287
+EXP_BIN_LOUDNESS_LEVEL_DIOTIC = 97.44814
+EXP_MON_LOUDNESS_DIOTIC = 38.94790
+EXP_MON_LOUDNESS_LEVEL_DIOTIC = 92.04321
+EXP_BIN_SPECIFIC_LOUDNESS_DIOTIC_45 = 1.477295
+EXP_MON_SPECIFIC_LOUDNESS_DIOTIC_45 = 0.9848462
+
+# Expected fc/ERBn values
+EXP_ERB_LEN = 372
+EXP_ERB_45 = 6.3
+EXP_FREQ_45 = 222.4797
+
+EXP_STR_DEFAULT = (
+    "LoudnessISO532_2_Batch object.\nData\n\tNumber of recordings: Not set\n"
+    "\tField type: Free\n\tRecording type: Mic (Single microphone)\n"
+    "Binaural loudness: Not processed"
+)
+EXP_STR_ALLSET = (
+    "LoudnessISO532_2_Batch object.\nData\n\tNumber of recordings: 2 (1 diotic, 1 dichotic)\n"
+    "\tField type: Free\n\tRecording type: Mic (Single microphone)\n"
+    "Binaural loudness: 18.9 to 58.4 sones"
+)
+
+
+def get_recordings() -> list[Field | list[Field]]:
+    """Load a diotic recording (flute) and a dichotic recording (stereo acceleration)."""
+    wav_loader = LoadWav(pytest.data_path_flute_nonUnitaryCalib)
+    wav_loader.process()
+    flute = wav_loader.get_output()[0]
+
+    wav_loader = LoadWav(pytest.data_path_Acceleration_stereo_nonUnitaryCalib)
+    wav_loader.process()
+    acceleration = wav_loader.get_output()
+
+    return [flute, [acceleration[0], acceleration[1]]]
+
+
+def test_loudness_iso_532_2_batch_instantiation():
+    """Test LoudnessISO532_2_Batch instantiation."""
+    loudness = LoudnessISO532_2_Batch()
+    assert loudness.signals is None
+    assert loudness.field_type == "Free"
+    assert loudness.recording_type == "Mic"
+    assert loudness.max_workers is None
+    assert loudness.server_pool is None
+
+
+def test_loudness_iso_532_2_batch___str__():
+    """Test LoudnessISO532_2_Batch __str__ method."""
+    loudness = LoudnessISO532_2_Batch()
+    assert str(loudness) == EXP_STR_DEFAULT
+
+    loudness.signals = get_recordings()
+    loudness.process()
+    assert str(loudness) == EXP_STR_ALLSET
+
+
+def test_loudness_iso_532_2_batch_properties_exceptions():
+    """Test LoudnessISO532_2_Batch setters' exceptions."""
+    with pytest.raises(
+        PyAnsysSoundException, match="Signals must be specified as a non-empty list of recordings."
+    ):
+        LoudnessISO532_2_Batch(signals=[])
+
+    with pytest.raises(
+        PyAnsysSoundException,
+        match="Each dichotic recording must be a list of exactly 2 fields corresponding to the "
+        "signals presented at the two ears.",
+    ):
+        LoudnessISO532_2_Batch(signals=[[Field()]])
+
+    with pytest.raises(
+        PyAnsysSoundException,
+        match="Each recording must be specified as a DPF field or a list of exactly 2 DPF fields.",
+    ):
+        LoudnessISO532_2_Batch(signals=["WrongType"])
+
+    with pytest.raises(
+        PyAnsysSoundException,
+        match='Invalid field type "Invalid". Available options are "Free" and "Diffuse".',
+    ):
+        LoudnessISO532_2_Batch(field_type="Invalid")
+
+    with pytest.raises(
+        PyAnsysSoundException,
+        match='Invalid recording type "Invalid". Available options are "Mic" and "Head".',
+    ):
+        LoudnessISO532_2_Batch(recording_type="Invalid")
+
+    with pytest.raises(
+        PyAnsysSoundException, match="Maximum number of workers must be greater than 0."
+    ):
+        LoudnessISO532_2_Batch(max_workers=0)
+
+    with pytest.raises(
+        PyAnsysSoundException, match="Server pool must be specified as a ServerPool object."
+    ):
+        LoudnessISO532_2_Batch(server_pool="WrongType")
+
+
+def test_loudness_iso_532_2_batch_process():
+    """Test LoudnessISO532_2_Batch process method."""
+    loudness = LoudnessISO532_2_Batch()
+    with pytest.raises(
+        PyAnsysSoundException,
+        match="No input signals set. Use `LoudnessISO532_2_Batch.signals`.",
+    ):
+        loudness.process()
+
+    loudness.signals = get_recordings()
+    loudness.max_workers = 2
+    loudness.process()
+    assert loudness.get_output() is not None
+
+
+def test_loudness_iso_532_2_batch_get_output():
+    """Test LoudnessISO532_2_Batch get_output method."""
+    loudness = LoudnessISO532_2_Batch(signals=get_recordings())
+    with pytest.warns(
+        PyAnsysSoundWarning,
+        match="Output is not processed yet. Use the `LoudnessISO532_2_Batch.process\\(\\)` "
+        "method.",
+    ):
+        output = loudness.get_output()
+    assert output is None
+
+    loudness.process()
+    N_bin, LN_bin, N_mon, LN_mon, Nprime_bin, Nprime_mon, erbn = loudness.get_output()
+    assert N_bin.shape == (2,)
+    assert LN_bin.shape == (2,)
+    assert N_mon.shape == (2, 2)
+    assert LN_mon.shape == (2, 2)
+    assert Nprime_bin.shape == (2, EXP_ERB_LEN)
+    assert Nprime_mon.shape == (2, 2, EXP_ERB_LEN)
+    assert erbn.shape == (EXP_ERB_LEN,)
+
+    # Diotic recording: same monaural values at both ears.
+    assert N_bin[0] == pytest.approx(EXP_BIN_LOUDNESS_DIOTIC)
+    assert LN_bin[0] == pytest.approx(EXP_BIN_LOUDNESS_LEVEL_DIOTIC)
+    assert N_mon[0] == pytest.approx([EXP_MON_LOUDNESS_DIOTIC] * 2)
+    assert LN_mon[0] == pytest.approx([EXP_MON_LOUDNESS_LEVEL_DIOTIC] * 2)
+    assert Nprime_bin[0, 45] == pytest.approx(EXP_BIN_SPECIFIC_LOUDNESS_DIOTIC_45)
+    assert Nprime_mon[0, :, 45] == pytest.approx([EXP_MON_SPECIFIC_LOUDNESS_DIOTIC_45] * 2)
+
+    # Dichotic recording.
+    assert N_bin[1] == pytest.approx(EXP_BIN_LOUDNESS_DICHOTIC)
+    assert LN_bin[1] == pytest.approx(EXP_BIN_LOUDNESS_LEVEL_DICHOTIC)
+    assert N_mon[1] == pytest.approx(EXP_MON_LOUDNESS_DICHOTIC)
+    assert LN_mon[1] == pytest.approx(EXP_MON_LOUDNESS_LEVEL_DICHOTIC)
+    assert Nprime_bin[1, 45] == pytest.approx(EXP_BIN_SPECIFIC_LOUDNESS_DICHOTIC_45)
+    assert Nprime_mon[1, :, 45] == pytest.approx(EXP_MON_SPECIFIC_LOUDNESS_DICHOTIC_45)
+
+    assert erbn[45] == pytest.approx(EXP_ERB_45)
+
+
+def test_loudness_iso_532_2_batch_get_output_as_nparray():
+    """Test LoudnessISO532_2_Batch get_output_as_nparray method."""
+    loudness = LoudnessISO532_2_Batch(signals=get_recordings())
+    with pytest.warns(
+        PyAnsysSoundWarning,
+        match="Output is not processed yet. Use the `LoudnessISO532_2_Batch.process\\(\\)` "
+        "method.",
+    ):
+        output = loudness.get_output_as_nparray()
+    assert len(output) == 7
+    for values in output:
+        assert len(values) == 0
+
+    loudness.process()
+    output = loudness.get_output_as_nparray()
+    for values in output:
+        assert isinstance(values, np.ndarray)
+
+
+def test_loudness_iso_532_2_batch_getters():
+    """Test LoudnessISO532_2_Batch getters."""
+    loudness = LoudnessISO532_2_Batch(signals=get_recordings())
+    loudness.process()
+
+    assert loudness.get_binaural_loudness_sone() == pytest.approx(
+        [EXP_BIN_LOUDNESS_DIOTIC, EXP_BIN_LOUDNESS_DICHOTIC]
+    )
+    assert loudness.get_binaural_loudness_level_phon() == pytest.approx(
+        [EXP_BIN_LOUDNESS_LEVEL_DIOTIC, EXP_BIN_LOUDNESS_LEVEL_DICHOTIC]
+    )
+    assert loudness.get_monaural_loudness_sone()[1] == pytest.approx(EXP_MON_LOUDNESS_DICHOTIC)
+    assert loudness.get_monaural_loudness_level_phon()[1] == pytest.approx(
+        EXP_MON_LOUDNESS_LEVEL_DICHOTIC
+    )
+    assert loudness.get_binaural_specific_loudness()[:, 45] == pytest.approx(
+        [EXP_BIN_SPECIFIC_LOUDNESS_DIOTIC_45, EXP_BIN_SPECIFIC_LOUDNESS_DICHOTIC_45]
+    )
+    assert loudness.get_monaural_specific_loudness()[1, :, 45] == pytest.approx(
+        EXP_MON_SPECIFIC_LOUDNESS_DICHOTIC_45
+    )
+    assert loudness.get_erbn_numbers()[45] == pytest.approx(EXP_ERB_45)
+    assert loudness.get_erb_center_frequencies()[45] == pytest.approx(EXP_FREQ_45)
+
+
+@patch("matplotlib.pyplot.show")
+def test_loudness_iso_532_2_batch_plot(mock_show):
+    """Test LoudnessISO532_2_Batch plot method."""
+    loudness = LoudnessISO532_2_Batch(signals=get_recordings())
+    with pytest.raises(
+        PyAnsysSoundException,
+        match="Output is not processed yet. Use the `LoudnessISO532_2_Batch.process\\(\\)` "
+        "method.",
+    ):
+        loudness.plot()
+
+    loudness.process()
+    loudness.plot()
@@ -312,6 +312,48 @@ def test_prominence_ratio_get_all_tone_infos(create_psd_from_txt_data):
     assert str(excinfo.value) == "No peak is detected."
 
 
+def test_prominence_ratio_get_peaks_table(create_psd_from_txt_data):
+    """Test getting the peaks table from ProminenceRatio computation."""
+    pr = ProminenceRatio()
+
+    psd = create_psd_from_txt_data
+    pr.psd = psd
+
+    # no compute: return empty table
+    peaks = pr.get_peaks_table()
+    assert peaks.size == 0
+    assert peaks.dtype.names == (
+        "frequency",
+        "value",
+        "level",
+        "low_frequency",
+        "high_frequency",
+        "is_prominent",
+    )
+
+    pr.process()
+    peaks = pr.get_peaks_table()
+
+    assert peaks.size == pr.get_nb_tones()
+    assert peaks["frequency"] == pytest.approx(pr.get_peaks_frequencies())
+    assert peaks["value"] == pytest.approx(pr.get_PR_values())
+    assert peaks["level"] == pytest.approx(pr.get_peaks_levels())
+    assert peaks["low_frequency"] == pytest.approx(pr.get_peaks_low_frequencies())
+    assert peaks["high_frequency"] == pytest.approx(pr.get_peaks_high_frequencies())
+    assert tuple(peaks[6])[:5] == pytest.approx(pr.get_single_tone_info(6))
+
+    # A tone is prominent if its PR is higher than the reference curve at its frequency.
+    all_frequencies = psd.time_freq_support.time_frequencies.data
+    tone_indexes = np.argmin(np.abs(all_frequencies[:, None] - peaks["frequency"]), axis=0)
+    np.testing.assert_array_equal(
+        peaks["is_prominent"], peaks["value"] > pr.get_reference_curve()[tone_indexes]
+    )
+
+    # Modifying the returned table does not modify the stored one.
+    peaks["value"] = 0.0
+    assert pr.get_PR_values()[0] != 0.0
+
+
 def test_prominence_ratio_get_reference_curve(create_psd_from_txt_data):
     """Test getting the reference curve from ProminenceRatio computation."""
     pr = ProminenceRatio()
@@ -337,6 +379,10 @@ def test_prominence_ratio_get_reference_curve(create_psd_from_txt_data):
     assert ref_curve[4169] == 0
     assert ref_curve[5896] == 0
 
+    # The reference curve is cached per frequency grid, but returned as a copy.
+    ref_curve[:] = -1.0
+    assert pr.get_reference_curve()[372] == pytest.approx(9.0)
+
 
 @patch("matplotlib.pyplot.show")
 def test_prominence_ratio_plot(mock_show, create_psd_from_txt_data):
@@ -0,0 +1,329 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from unittest.mock import patch
+
+from ansys.dpf.core import Field
+import numpy as np
+import pytest
+
+from ansys.sound.core._pyansys_sound import (
+    PyAnsysSoundException,
+    PyAnsysSoundWarning,
+    _create_signal_field,
+)
+from ansys.sound.core.psychoacoustics import SpectralDescriptorsOverTime
+from ansys.sound.core.psychoacoustics.spectral_descriptors_over_time import (
+    _compute_spectral_descriptors,
+)
+
+SAMPLING_FREQUENCY = 48000.0
+TONE_FREQUENCY = 1500.0
+SIGNAL_LENGTH = 48000
+EXP_STR_DEFAULT = (
+    "SpectralDescriptorsOverTime object\n"
+    "Data:\n"
+    "\tSignal name: Not set\n"
+    "\tFFT size: 2048\n"
+    "\tWindow type: HANN\n"
+    "\tWindow overlap: 0.5\n"
+    "\tRoll-off percentage: 85.0 %"
+)
+
+
+@pytest.fixture
+def signals() -> list[Field]:
+    """Create two 1-s test signals: a 1.5-kHz tone, and white noise."""
+    time = np.arange(SIGNAL_LENGTH) / SAMPLING_FREQUENCY
+    rng = np.random.default_rng(0)
+    return [
+        _create_signal_field(
+            np.sin(2 * np.pi * TONE_FREQUENCY * time), SAMPLING_FREQUENCY, name="Tone"
+        ),
+        _create_signal_field(rng.normal(size=SIGNAL_LENGTH), SAMPLING_FREQUENCY, name="Noise"),
+    ]
+
+
+def test_compute_spectral_descriptors():
+    """Test the computation of the spectral descriptors from magnitude spectra."""
+    frequencies = np.arange(5) * 100.0
+    magnitudes = np.array(
+        [
+            [0.0, 0.0, 0.0, 0.0, 0.0],
+            [0.0, 0.0, 2.0, 0.0, 0.0],
+            [1.0, 1.0, 1.0, 1.0, 1.0],
+        ]
+    )
+
+    centroid, spread, flatness, roll_off, flux = _compute_spectral_descriptors(
+        magnitudes, frequencies, 85.0
+    )
+
+    # Silent frame: all descriptors are 0.
+    assert centroid[0] == spread[0] == flatness[0] == roll_off[0] == flux[0] == 0.0
+    # Single peak: centroid and roll-off at the peak, no spread, flatness close to 0.
+    assert centroid[1] == pytest.approx(200.0)
+    assert spread[1] == pytest.approx(0.0)
+    assert flatness[1] == pytest.approx(0.0)
+    assert roll_off[1] == pytest.approx(200.0)
+    assert flux[1] == pytest.approx(2.0)
+    # Flat spectrum: centroid at the middle, flatness 1, 85 % of the energy below 400 Hz.
+    assert centroid[2] == pytest.approx(200.0)
+    assert spread[2] == pytest.approx(np.sqrt(20000.0))
+    assert flatness[2] == pytest.approx(1.0)
+    assert roll_off[2] == pytest.approx(400.0)
+    assert flux[2] == pytest.approx(np.sqrt(5.0))
+
+    # The flux of the first frame is computed against the previous magnitude, if specified.
+    *_, flux = _compute_spectral_descriptors(
+        magnitudes[1:], frequencies, 85.0, previous_magnitude=np.zeros(5)
+    )
+    assert flux[0] == pytest.approx(2.0)
+
+
+def test_spectral_descriptors_over_time_instantiation():
+    """Test SpectralDescriptorsOverTime instantiation."""
+    descriptors = SpectralDescriptorsOverTime()
+    assert descriptors.signal is None
+    assert descriptors.fft_size == 2048
+    assert descriptors.window_type == "HANN"
+    assert descriptors.window_overlap == 0.5
+    assert descriptors.roll_off_percentage == 85.0
+
+
+def test_spectral_descriptors_over_time___str__(signals):
+    """Test SpectralDescriptorsOverTime __str__ method."""
+    descriptors = SpectralDescriptorsOverTime()
+    assert str(descriptors) == EXP_STR_DEFAULT
+
+    descriptors.signal = signals
+    assert 'Signal name: "Tone", "Noise"' in str(descriptors)
+
+
+def test_spectral_descriptors_over_time_setters_exceptions():
+    """Test SpectralDescriptorsOverTime setters' exceptions."""
+    with pytest.raises(
+        PyAnsysSoundException,
+        match="Signal must be specified as a DPF field or a list of DPF fields.",
+    ):
+        SpectralDescriptorsOverTime(signal="WrongType")
+
+    with pytest.raises(
+        PyAnsysSoundException, match="The input signal list must contain at least one DPF field."
+    ):
+        SpectralDescriptorsOverTime(signal=[])
+
+    with pytest.raises(PyAnsysSoundException, match="FFT size must be greater than 0.0."):
+        SpectralDescriptorsOverTime(fft_size=0)
+
+    with pytest.raises(PyAnsysSoundException, match="Window type is invalid."):
+        SpectralDescriptorsOverTime(window_type="InvalidWindow")
+
+    with pytest.raises(PyAnsysSoundException, match="Window overlap must be between 0.0 and 1.0."):
+        SpectralDescriptorsOverTime(window_overlap=1.5)
+
+    with pytest.raises(
+        PyAnsysSoundException,
+        match=("Roll-off percentage must be strictly positive and smaller than or equal to 100 %."),
+    ):
+        SpectralDescriptorsOverTime(roll_off_percentage=0.0)
+
+
+def test_spectral_descriptors_over_time_process(signals):
+    """Test SpectralDescriptorsOverTime process method."""
+    descriptors = SpectralDescriptorsOverTime()
+
+    with pytest.raises(
+        PyAnsysSoundException,
+        match=(
+            "No signal found for spectral descriptors computation. "
+            "Use `SpectralDescriptorsOverTime.signal`."
+        ),
+    ):
+        descriptors.process()
+
+    descriptors.signal = signals[0]
+    descriptors.process()
+    assert descriptors.get_output() is not None
+
+
+def test_spectral_descriptors_over_time_get_output(signals):
+    """Test SpectralDescriptorsOverTime get_output method."""
+    descriptors = SpectralDescriptorsOverTime(signal=signals)
+
+    with pytest.warns(
+        PyAnsysSoundWarning,
+        match="Output is not processed yet. Use the `SpectralDescriptorsOverTime.process\\(\\)` "
+        "method.",
+    ):
+        output = descriptors.get_output()
+    assert output is None
+
+    descriptors.process()
+    output = descriptors.get_output()
+    assert len(output) == 6
+    frame_count = len(output[5])
+    assert frame_count > 0
+    for values in output[:5]:
+        assert values.shape == (2, frame_count)
+
+
+def test_spectral_descriptors_over_time_get_output_as_nparray(signals):
+    """Test SpectralDescriptorsOverTime get_output_as_nparray method."""
+    descriptors = SpectralDescriptorsOverTime(signal=signals)
+
+    with pytest.warns(
+        PyAnsysSoundWarning,
+        match="Output is not processed yet. Use the `SpectralDescriptorsOverTime.process\\(\\)` "
+        "method.",
+    ):
+        output = descriptors.get_output_as_nparray()
+    assert len(output) == 6
+    for values in output:
+        assert len(values) == 0
+
+    descriptors.process()
+    output = descriptors.get_output_as_nparray()
+    for values in output:
+        assert isinstance(values, np.ndarray)
+
+
+def test_spectral_descriptors_over_time_getters(signals):
+    """Test SpectralDescriptorsOverTime getters."""
+    descriptors = SpectralDescriptorsOverTime(signal=signals)
+    descriptors.process()
+
+    # Exclude the last frame, which is zero-padded.
+    centroid = descriptors.get_spectral_centroid_over_time()[:, :-1]
+    spread = descriptors.get_spectral_spread_over_time()[:, :-1]
+    flatness = descriptors.get_spectral_flatness_over_time()[:, :-1]
+    roll_off = descriptors.get_spectral_roll_off_over_time()[:, :-1]
+    flux = descriptors.get_spectral_flux_over_time()[:, :-1]
+    time = descriptors.get_time_scale()
+
+    # Tone: descriptors concentrated at the tone frequency, stationary spectrum.
+    assert np.all(np.abs(centroid[0] - TONE_FREQUENCY) < 100.0)
+    assert np.all(np.abs(roll_off[0] - TONE_FREQUENCY) < 100.0)
+    assert np.all(flatness[0] < 0.01)
+    assert np.all(flux[0, 1:] < 0.01 * flux[1, 1:])
+    assert flux[0, 0] == 0.0
+    # White noise: descriptors spread over the whole frequency range.
+    assert np.all(np.abs(centroid[1] - SAMPLING_FREQUENCY / 4) < 1000.0)
+    assert np.all(spread[1] > spread[0])
+    assert np.all(flatness[1] > 0.4)
+    assert np.all(roll_off[1] > 0.8 * SAMPLING_FREQUENCY / 2)
+
+    assert time[0] == pytest.approx(0.0)
+    assert time[1] == pytest.approx(1024 / SAMPLING_FREQUENCY)
+
+
+@pytest.mark.parametrize("window_overlap", [0.5, 0.3, 0.9])
+def test_spectral_descriptors_over_time_push(signals, window_overlap):
+    """Test SpectralDescriptorsOverTime push method."""
+    # With overlaps of 0.3 and 0.9, the hop size (1433.6 and 204.8 samples) is rounded: the frames
+    # output block by block must still be those of the STFT of the whole signal.
+    descriptors = SpectralDescriptorsOverTime(signal=signals, window_overlap=window_overlap)
+    descriptors.process()
+    exp_output = descriptors.get_output()
+
+    descriptors.reset()
+    block_length = 3000
+    outputs = []
+    for start in range(0, SIGNAL_LENGTH, block_length):
+        blocks = [
+            _create_signal_field(
+                np.array(signal.data[start : start + block_length]), SAMPLING_FREQUENCY
+            )
+            for signal in signals
+        ]
+        outputs.append(descriptors.push(blocks))
+
+    # The frames output block by block are those of the whole signal, except the last
+    # (incomplete) one.
+    time = np.concatenate([output[5] for output in outputs])
+    frame_count = len(time)
+    assert frame_count == len(exp_output[5]) - 1
+    assert time == pytest.approx(exp_output[5][:frame_count])
+    for i in range(5):
+        values = np.concatenate([output[i] for output in outputs], axis=1)
+        assert values == pytest.approx(exp_output[i][:, :frame_count], rel=1e-4, abs=1e-6)
+
+    # Block shorter than a frame: no frame.
+    descriptors.reset()
+    output = descriptors.push(_create_signal_field(np.ones(100), SAMPLING_FREQUENCY))
+    assert output[0].shape == (1, 0)
+    assert len(output[5]) == 0
+
+
+def test_spectral_descriptors_over_time_push_exceptions(signals):
+    """Test SpectralDescriptorsOverTime push method's exceptions."""
+    descriptors = SpectralDescriptorsOverTime()
+
+    with pytest.raises(
+        PyAnsysSoundException,
+        match="Block must be specified as a DPF field or a list of DPF fields.",
+    ):
+        descriptors.push("WrongType")
+
+    with pytest.raises(
+        PyAnsysSoundException, match="Specified block must have at least two samples."
+    ):
+        descriptors.push(_create_signal_field(np.ones(1), SAMPLING_FREQUENCY))
+
+    descriptors.push(signals)
+    with pytest.raises(
+        PyAnsysSoundException,
+        match="Specified block's sampling frequency \\(44100.0 Hz\\) must match",
+    ):
+        descriptors.push(_create_signal_field(np.ones(100), 44100.0))
+
+    with pytest.raises(
+        PyAnsysSoundException,
+        match="Specified block's number of channels \\(1\\) must match the number of channels",
+    ):
+        descriptors.push(_create_signal_field(np.ones(100), SAMPLING_FREQUENCY))
+
+    with pytest.raises(
+        PyAnsysSoundException, match="All channels of a block must have the same length."
+    ):
+        descriptors.push(
+            [
+                _create_signal_field(np.ones(100), SAMPLING_FREQUENCY),
+                _create_signal_field(np.ones(200), SAMPLING_FREQUENCY),
+            ]
+        )
+
+
+@patch("matplotlib.pyplot.show")
+def test_spectral_descriptors_over_time_plot(mock_show, signals):
+    """Test SpectralDescriptorsOverTime plot method."""
+    descriptors = SpectralDescriptorsOverTime(signal=signals)
+
+    with pytest.raises(
+        PyAnsysSoundException,
+        match="Output is not processed yet. Use the `SpectralDescriptorsOverTime.process\\(\\)` "
+        "method.",
+    ):
+        descriptors.plot()
+
+    descriptors.process()
+    descriptors.plot()
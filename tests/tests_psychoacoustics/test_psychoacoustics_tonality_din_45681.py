@@ -366,11 +366,46 @@ def test_tonality_din45681_get_tone_details_exception():
 
     with pytest.raises(
         PyAnsysSoundException,
-        match="Tone index 10 is out of bounds \\(total tone count in specified spectrum is 6\\).",
+        match="Tone index 10 is out of bounds \\(total tone count in specified spectrum is 4\\).",
     ):
         tonality.get_tone_details(spectrum_index=1, tone_index=10)
 
 
+def test_tonality_din45681_get_all_tone_details():
+    """Test get_all_tone_details method."""
+    wav_loader = LoadWav(pytest.data_path_accel_with_rpm)
+    wav_loader.process()
+    fc = wav_loader.get_output()
+
+    tonality = TonalityDIN45681(signal=fc[0])
+
+    with pytest.warns(
+        PyAnsysSoundWarning,
+        match="Output is not processed yet. Use the `TonalityDIN45681.process\\(\\)` method.",
+    ):
+        details = tonality.get_all_tone_details()
+    assert len(details) == 0
+
+    tonality.process()
+
+    details = tonality.get_all_tone_details()
+    assert len(details) == sum(
+        tonality.get_tone_number(spectrum_index) for spectrum_index in range(EXP_SPECTRUM_NUMBER)
+    )
+
+    spectrum1_details = details[details["spectrum_index"] == 1]
+    assert len(spectrum1_details) == EXP_SPECTRUM1_TONE_NUMBER
+    assert spectrum1_details["time"][0] == pytest.approx(tonality.get_time_scale()[1])
+
+    tone3_details = spectrum1_details[3]
+    assert tone3_details["decisive_difference"] == pytest.approx(EXP_SPECTRUM1_TONE3_DIFFERENCE)
+    assert tone3_details["tone_type"] == EXP_SPECTRUM1_TONE3_TYPE
+    assert tone3_details["tone_level"] == pytest.approx(EXP_SPECTRUM1_TONE3_MASKING_NOISE_LEVEL)
+    assert tone3_details["masking_index"] == pytest.approx(
+        tonality.get_tone_details(spectrum_index=1, tone_index=3)[9]
+    )
+
+
 @patch("matplotlib.pyplot.show")
 def test_tonality_din45681_plot(mock_show):
     """Test plot method."""
@@ -335,6 +335,37 @@ def test_tonality_iso_1996_2_over_time_get_segment_details_exceptions():
         tonality.get_segment_details(segment_index=96)
 
 
+def test_tonality_iso_1996_2_over_time_get_all_segment_details():
+    """Test get_all_segment_details method."""
+    wav_loader = LoadWav(pytest.data_path_aircraft_nonUnitaryCalib)
+    wav_loader.process()
+    fc = wav_loader.get_output()
+
+    tonality = TonalityISO1996_2_OverTime(signal=fc[0])
+
+    with pytest.warns(
+        PyAnsysSoundWarning,
+        match=(
+            "Output is not processed yet. Use the ``TonalityISO1996_2_OverTime.process\\(\\)`` "
+            "method."
+        ),
+    ):
+        details = tonality.get_all_segment_details()
+    assert len(details) == 0
+
+    tonality.process()
+
+    details = tonality.get_all_segment_details()
+    assert len(details) == EXP_SEGMENT_COUNT
+    assert np.array_equal(details["segment_index"], np.arange(EXP_SEGMENT_COUNT))
+    assert details["segment_start_time_s"][3] == pytest.approx(EXP_SEGMENT3_START)
+    assert details["segment_end_time_s"][3] == pytest.approx(EXP_SEGMENT3_END)
+    assert details["lower_critical_band_limit_Hz"][3] == pytest.approx(EXP_SEGMENT3_CB_L)
+    assert details["higher_critical_band_limit_Hz"][3] == pytest.approx(EXP_SEGMENT3_CB_U)
+    assert details["total_tonal_level_dBA"][3] == pytest.approx(EXP_SEGMENT3_LPT)
+    assert details["total_noise_level_dBA"][3] == pytest.approx(EXP_SEGMENT3_LPN)
+
+
 @patch("matplotlib.pyplot.show")
 def test_tonality_iso_1996_2_over_time_plot(mock_show):
     """Test plot method."""
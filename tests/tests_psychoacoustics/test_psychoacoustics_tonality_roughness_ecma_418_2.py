@@ -0,0 +1,176 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from ansys.sound.core._pyansys_sound import PyAnsysSoundException, PyAnsysSoundWarning
+from ansys.sound.core.psychoacoustics import (
+    RoughnessECMA418_2,
+    TonalityECMA418_2,
+    TonalityRoughnessECMA418_2,
+)
+from ansys.sound.core.signal_utilities import LoadWav
+
+# Skip entire test module if Sound version < 2027.1.0
+if not pytest.SOUND_VERSION_GREATER_THAN_OR_EQUAL_TO_2027R1:
+    pytest.skip("Requires Sound version >= 2027.1.0", allow_module_level=True)
+
+EXP_STR_DEFAULT = (
+    "TonalityRoughnessECMA418_2 object\n"
+    "Data:\n"
+    "\tSignal name: Not set\n"
+    "\tField type: Free\n"
+    "\tEdition of the standard (tonality): 3rd\n"
+    "Indicators: Not processed"
+)
+
+
+def test_tonality_roughness_ecma_418_2_instantiation():
+    """Test the instantiation of the TonalityRoughnessECMA418_2 class."""
+    analyzer = TonalityRoughnessECMA418_2()
+    assert analyzer.signal is None
+    assert analyzer.field_type == "Free"
+    assert analyzer.edition == "3rd"
+
+
+def test_tonality_roughness_ecma_418_2___str__():
+    """Test the __str__ method of the TonalityRoughnessECMA418_2 class."""
+    analyzer = TonalityRoughnessECMA418_2()
+    assert str(analyzer) == EXP_STR_DEFAULT
+
+    wav_loader = LoadWav(pytest.data_path_rough_noise)
+    wav_loader.process()
+    analyzer.signal = wav_loader.get_output()[0]
+    analyzer.process()
+    assert "Tonality: " in str(analyzer)
+    assert "Roughness: " in str(analyzer)
+
+
+def test_tonality_roughness_ecma_418_2_setters_exceptions():
+    """Test the exceptions of the TonalityRoughnessECMA418_2 setters."""
+    with pytest.raises(PyAnsysSoundException, match="Signal must be specified as a DPF field."):
+        TonalityRoughnessECMA418_2(signal="WrongType")
+
+    with pytest.raises(PyAnsysSoundException, match='Invalid field type "Invalid".'):
+        TonalityRoughnessECMA418_2(field_type="Invalid")
+
+    with pytest.raises(PyAnsysSoundException, match='Invalid edition "2nd".'):
+        TonalityRoughnessECMA418_2(edition="2nd")
+
+    with pytest.raises(PyAnsysSoundException, match="No edition of the standard specified."):
+        TonalityRoughnessECMA418_2(edition=None)
+
+
+def test_tonality_roughness_ecma_418_2_process():
+    """Test the process method of the TonalityRoughnessECMA418_2 class."""
+    analyzer = TonalityRoughnessECMA418_2()
+    with pytest.raises(
+        PyAnsysSoundException,
+        match="No input signal set. Use `TonalityRoughnessECMA418_2.signal`.",
+    ):
+        analyzer.process()
+
+    wav_loader = LoadWav(pytest.data_path_rough_noise)
+    wav_loader.process()
+    analyzer.signal = wav_loader.get_output()[0]
+    analyzer.process()
+    assert analyzer._output is not None
+    assert len(analyzer.get_output()) == 6
+
+
+def test_tonality_roughness_ecma_418_2_get_output():
+    """Test the get_output and get_output_as_nparray methods."""
+    wav_loader = LoadWav(pytest.data_path_rough_noise)
+    wav_loader.process()
+    signal = wav_loader.get_output()[0]
+    analyzer = TonalityRoughnessECMA418_2(signal=signal)
+    with pytest.warns(
+        PyAnsysSoundWarning,
+        match="Output is not processed yet. Use the `TonalityRoughnessECMA418_2.process\\(\\)`",
+    ):
+        output = analyzer.get_output_as_nparray()
+    assert len(output) == 10
+    assert np.isnan(output[0])
+    assert np.isnan(output[5])
+
+    analyzer.process()
+    output = analyzer.get_output_as_nparray()
+    assert len(output) == 10
+    assert len(output[1]) == len(output[3])
+    assert len(output[6]) == len(output[7])
+    assert len(output[8]) == len(output[9])
+
+    # Scalar getters only convert the data of the relevant calculation.
+    with patch.object(TonalityECMA418_2, "get_output_as_nparray", side_effect=AssertionError):
+        assert analyzer.get_roughness() == pytest.approx(output[5])
+    with patch.object(RoughnessECMA418_2, "get_output_as_nparray", side_effect=AssertionError):
+        assert analyzer.get_tonality() == pytest.approx(output[0])
+
+
+@pytest.mark.parametrize("field_type", ["Free", "Diffuse"])
+def test_tonality_roughness_ecma_418_2_matches_individual_classes(field_type):
+    """Test that the results match those of the individual classes."""
+    wav_loader = LoadWav(pytest.data_path_rough_noise)
+    wav_loader.process()
+    signal = wav_loader.get_output()[0]
+    analyzer = TonalityRoughnessECMA418_2(signal=signal, field_type=field_type)
+    analyzer.process()
+
+    tonality = TonalityECMA418_2(signal=signal, field_type=field_type, edition="3rd")
+    tonality.process()
+    assert analyzer.get_tonality() == pytest.approx(tonality.get_tonality())
+    assert np.allclose(analyzer.get_tonality_over_time(), tonality.get_tonality_over_time())
+    assert np.allclose(
+        analyzer.get_tone_frequency_over_time(), tonality.get_tone_frequency_over_time()
+    )
+    assert np.allclose(analyzer.get_tonality_time_scale(), tonality.get_tonality_time_scale())
+    assert np.allclose(
+        analyzer.get_tone_frequency_time_scale(), tonality.get_tone_frequency_time_scale()
+    )
+
+    roughness = RoughnessECMA418_2(signal=signal, field_type=field_type)
+    roughness.process()
+    assert analyzer.get_roughness() == pytest.approx(roughness.get_roughness())
+    assert np.allclose(analyzer.get_specific_roughness(), roughness.get_specific_roughness())
+    assert np.allclose(analyzer.get_bark_band_indexes(), roughness.get_bark_band_indexes())
+    assert np.allclose(analyzer.get_roughness_over_time(), roughness.get_roughness_over_time())
+    assert np.allclose(analyzer.get_roughness_time_scale(), roughness.get_time_scale())
+
+
+@patch("matplotlib.pyplot.show")
+def test_tonality_roughness_ecma_418_2_plot(mock_show):
+    """Test the plot method of the TonalityRoughnessECMA418_2 class."""
+    wav_loader = LoadWav(pytest.data_path_rough_noise)
+    wav_loader.process()
+    signal = wav_loader.get_output()[0]
+    analyzer = TonalityRoughnessECMA418_2(signal=signal)
+    with pytest.raises(
+        PyAnsysSoundException,
+        match="Output is not processed yet. Use the `TonalityRoughnessECMA418_2.process\\(\\)`",
+    ):
+        analyzer.plot()
+
+    analyzer.process()
+    analyzer.plot()
@@ -0,0 +1,335 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from unittest.mock import patch
+
+from ansys.dpf.core import Field
+import numpy as np
+import pytest
+
+from ansys.sound.core._pyansys_sound import (
+    PyAnsysSoundException,
+    PyAnsysSoundWarning,
+    _create_signal_field,
+)
+from ansys.sound.core.psychoacoustics import (
+    ProminenceRatio,
+    ProminenceRatioOverTime,
+    ToneToNoiseRatio,
+    ToneToNoiseRatioOverTime,
+)
+from ansys.sound.core.spectral_processing import PowerSpectralDensity
+
+SAMPLING_FREQUENCY = 48000.0
+TONE_FREQUENCY = 1000.0
+EXP_FRAME_COUNT = 7
+EXP_TIME_SCALE = np.array([0.5, 1.0, 1.5, 2.0, 2.5, 3.0, 3.5])
+EXP_STR_DEFAULT = (
+    "{} object\n"
+    "Data:\n"
+    "\tSignal name: Not set\n"
+    "\tWindow length: 1.0 s\n"
+    "\tOverlap: 50.0 %\n"
+    "\tFFT size: 8192\n"
+    "\tWindow type: HANN\n"
+    "\tFrequency list: None\n"
+    "Number of frames: Not processed"
+)
+
+# Classes computing the ratio over time, corresponding single-PSD classes, and ratio names.
+RATIO_CLASSES = pytest.mark.parametrize(
+    "ratio_class, single_ratio_class, ratio_name",
+    [
+        (ProminenceRatioOverTime, ProminenceRatio, "PR"),
+        (ToneToNoiseRatioOverTime, ToneToNoiseRatio, "TNR"),
+    ],
+)
+
+
+@pytest.fixture
+def create_tone_in_noise_signal() -> Field:
+    """Create a 4-s test signal: a 1-kHz tone, whose level increases over time, in white noise."""
+    time = np.arange(int(4.0 * SAMPLING_FREQUENCY)) / SAMPLING_FREQUENCY
+    rng = np.random.default_rng(0)
+    data = 0.02 * time * np.sin(2 * np.pi * TONE_FREQUENCY * time) + 0.002 * rng.normal(
+        size=len(time)
+    )
+    yield _create_signal_field(data, SAMPLING_FREQUENCY, name="Tone in noise")
+
+
+def compute_first_frame_ratio(signal: Field, single_ratio_class: type, **kwargs):
+    """Compute the ratio on the PSD of the first 1-s frame of a signal, with default settings."""
+    frame = _create_signal_field(
+        np.array(signal.data)[: int(SAMPLING_FREQUENCY)], SAMPLING_FREQUENCY
+    )
+    psd = PowerSpectralDensity(
+        frame, fft_size=8192, window_type="HANN", window_length=8192, overlap=0.5
+    )
+    psd.process()
+    ratio = single_ratio_class(psd=psd.get_output(), **kwargs)
+    ratio.process()
+    return ratio
+
+
+@RATIO_CLASSES
+def test_tone_ratio_over_time_instantiation(ratio_class, single_ratio_class, ratio_name):
+    """Test ProminenceRatioOverTime and ToneToNoiseRatioOverTime instantiation."""
+    ratio = ratio_class()
+    assert ratio.signal is None
+    assert ratio.window_length == 1.0
+    assert ratio.overlap == 50.0
+    assert ratio.fft_size == 8192
+    assert ratio.window_type == "HANN"
+    assert ratio.frequency_list is None
+    assert ratio.max_workers is None
+
+
+@RATIO_CLASSES
+def test_tone_ratio_over_time___str__(
+    ratio_class, single_ratio_class, ratio_name, create_tone_in_noise_signal
+):
+    """Test ProminenceRatioOverTime and ToneToNoiseRatioOverTime __str__ method."""
+    ratio = ratio_class()
+    assert str(ratio) == EXP_STR_DEFAULT.format(ratio_class.__name__)
+
+    ratio.signal = create_tone_in_noise_signal
+    ratio.process()
+    assert f"Number of frames: {EXP_FRAME_COUNT}" in str(ratio)
+
+
+@RATIO_CLASSES
+def test_tone_ratio_over_time_setters_exceptions(ratio_class, single_ratio_class, ratio_name):
+    """Test ProminenceRatioOverTime and ToneToNoiseRatioOverTime setters' exceptions."""
+    with pytest.raises(PyAnsysSoundException, match="Signal must be specified as a DPF field."):
+        ratio_class(signal="WrongType")
+
+    with pytest.raises(PyAnsysSoundException, match="Window length must be strictly positive."):
+        ratio_class(window_length=0.0)
+
+    with pytest.raises(
+        PyAnsysSoundException, match="Overlap must be positive and strictly smaller than 100.0 %."
+    ):
+        ratio_class(overlap=100.0)
+
+    with pytest.raises(
+        PyAnsysSoundException, match="FFT size must be a power of 2, greater than 1."
+    ):
+        ratio_class(fft_size=1000)
+
+    with pytest.raises(PyAnsysSoundException, match="Window type is invalid."):
+        ratio_class(window_type="InvalidWindow")
+
+    with pytest.raises(
+        PyAnsysSoundException, match="Frequency list must contain at least one frequency."
+    ):
+        ratio_class(frequency_list=[])
+
+    with pytest.raises(
+        PyAnsysSoundException, match="Maximum number of workers must be greater than 0."
+    ):
+        ratio_class(max_workers=0)
+
+
+@RATIO_CLASSES
+def test_tone_ratio_over_time_process(
+    ratio_class, single_ratio_class, ratio_name, create_tone_in_noise_signal
+):
+    """Test ProminenceRatioOverTime and ToneToNoiseRatioOverTime process method."""
+    ratio = ratio_class()
+
+    with pytest.raises(
+        PyAnsysSoundException,
+        match=f"No input signal defined. Use `{ratio_class.__name__}.signal`.",
+    ):
+        ratio.process()
+
+    ratio.signal = create_tone_in_noise_signal
+    ratio.process()
+    assert ratio._output is not None
+
+
+@RATIO_CLASSES
+def test_tone_ratio_over_time_process_exceptions(
+    ratio_class, single_ratio_class, ratio_name, create_tone_in_noise_signal
+):
+    """Test ProminenceRatioOverTime and ToneToNoiseRatioOverTime process method's exceptions."""
+    ratio = ratio_class(signal=create_tone_in_noise_signal, window_length=0.1)
+    with pytest.raises(
+        PyAnsysSoundException,
+        match=(
+            "Window length \\(0.1 s, that is, 4800 samples\\) must be greater than or equal to "
+            "the FFT size \\(8192 points\\)."
+        ),
+    ):
+        ratio.process()
+
+    ratio = ratio_class(signal=create_tone_in_noise_signal, window_length=5.0)
+    with pytest.raises(
+        PyAnsysSoundException,
+        match="Signal duration must be greater than or equal to the window length \\(5.0 s\\).",
+    ):
+        ratio.process()
+
+
+@RATIO_CLASSES
+def test_tone_ratio_over_time_process_matches_single_psd(
+    ratio_class, single_ratio_class, ratio_name, create_tone_in_noise_signal
+):
+    """Test that the ratios of a frame match those computed on the PSD of the same segment."""
+    ratio = ratio_class(signal=create_tone_in_noise_signal)
+    ratio.process()
+    frequencies, values, levels, _, _, max_values, _ = ratio.get_output()
+
+    single_ratio = compute_first_frame_ratio(create_tone_in_noise_signal, single_ratio_class)
+    tone_count = single_ratio.get_nb_tones()
+    assert np.count_nonzero(~np.isnan(frequencies[0])) == tone_count
+    assert frequencies[0, :tone_count] == pytest.approx(single_ratio.get_peaks_frequencies())
+    assert values[0, :tone_count] == pytest.approx(
+        getattr(single_ratio, f"get_{ratio_name}_values")()
+    )
+    assert levels[0, :tone_count] == pytest.approx(single_ratio.get_peaks_levels())
+    assert max_values[0] == pytest.approx(getattr(single_ratio, f"get_max_{ratio_name}_value")())
+
+
+@RATIO_CLASSES
+def test_tone_ratio_over_time_process_frequency_list_change(
+    ratio_class, single_ratio_class, ratio_name, create_tone_in_noise_signal
+):
+    """Test processing again after changing or removing the frequency list."""
+    ratio = ratio_class(signal=create_tone_in_noise_signal, frequency_list=[TONE_FREQUENCY])
+    ratio.process()
+    assert ratio.get_peaks_frequencies_over_time().shape == (EXP_FRAME_COUNT, 1)
+
+    ratio.frequency_list = [500.0, 2000.0]
+    ratio.process()
+    frequencies = ratio.get_peaks_frequencies_over_time()
+    assert frequencies.shape == (EXP_FRAME_COUNT, 2)
+    assert frequencies[:, 0] == pytest.approx(500.0, abs=SAMPLING_FREQUENCY / 8192)
+    assert frequencies[:, 1] == pytest.approx(2000.0, abs=SAMPLING_FREQUENCY / 8192)
+
+    # Without a frequency list, the tones are detected again in each frame, rather than computed
+    # at the frequencies of the previous list.
+    ratio.frequency_list = None
+    ratio.process()
+    single_ratio = compute_first_frame_ratio(create_tone_in_noise_signal, single_ratio_class)
+    frequencies = ratio.get_peaks_frequencies_over_time()[0]
+    assert frequencies[~np.isnan(frequencies)] == pytest.approx(
+        single_ratio.get_peaks_frequencies()
+    )
+
+
+@RATIO_CLASSES
+def test_tone_ratio_over_time_get_output(
+    ratio_class, single_ratio_class, ratio_name, create_tone_in_noise_signal
+):
+    """Test ProminenceRatioOverTime and ToneToNoiseRatioOverTime get_output methods."""
+    ratio = ratio_class(signal=create_tone_in_noise_signal)
+
+    with pytest.warns(
+        PyAnsysSoundWarning,
+        match=(
+            "Output is not processed yet. "
+            f"Use the `{ratio_class.__name__}.process\\(\\)` method."
+        ),
+    ):
+        output = ratio.get_output()
+    assert output is None
+
+    with pytest.warns(PyAnsysSoundWarning):
+        output = ratio.get_output_as_nparray()
+    assert len(output) == 7
+    assert all(len(array) == 0 for array in output)
+
+    ratio.process()
+    frequencies, values, levels, low_frequencies, high_frequencies, max_values, time = (
+        ratio.get_output()
+    )
+    assert values.shape == frequencies.shape == levels.shape
+    assert low_frequencies.shape == high_frequencies.shape == values.shape
+    assert values.shape[0] == len(max_values) == len(time) == EXP_FRAME_COUNT
+
+
+@RATIO_CLASSES
+def test_tone_ratio_over_time_get_values_over_time(
+    ratio_class, single_ratio_class, ratio_name, create_tone_in_noise_signal
+):
+    """Test getting the ratios over time, with a frequency list."""
+    ratio = ratio_class(signal=create_tone_in_noise_signal, frequency_list=[TONE_FREQUENCY])
+    ratio.process()
+
+    values = getattr(ratio, f"get_{ratio_name}_values_over_time")()
+    assert values.shape == (EXP_FRAME_COUNT, 1)
+    # The tone level increases over time, and so does its ratio.
+    assert np.all(np.diff(values[:, 0]) > 0.0)
+
+    frequencies = ratio.get_peaks_frequencies_over_time()
+    assert frequencies[:, 0] == pytest.approx(TONE_FREQUENCY, abs=SAMPLING_FREQUENCY / 8192)
+    assert np.all(ratio.get_peaks_low_frequencies_over_time() < frequencies)
+    assert np.all(ratio.get_peaks_high_frequencies_over_time() > frequencies)
+    assert np.all(np.diff(ratio.get_peaks_levels_over_time()[:, 0]) > 0.0)
+
+
+@RATIO_CLASSES
+def test_tone_ratio_over_time_get_max_over_time(
+    ratio_class, single_ratio_class, ratio_name, create_tone_in_noise_signal
+):
+    """Test getting the maximum ratio over time."""
+    ratio = ratio_class(signal=create_tone_in_noise_signal, max_workers=2)
+    ratio.process()
+
+    max_values = getattr(ratio, f"get_max_{ratio_name}_over_time")()
+    values = getattr(ratio, f"get_{ratio_name}_values_over_time")()
+    assert len(max_values) == EXP_FRAME_COUNT
+    assert np.all(max_values >= np.nanmax(values, axis=1) - 1e-6)
+
+
+@RATIO_CLASSES
+def test_tone_ratio_over_time_get_time_scale(
+    ratio_class, single_ratio_class, ratio_name, create_tone_in_noise_signal
+):
+    """Test getting the time scale and the number of frames."""
+    ratio = ratio_class(signal=create_tone_in_noise_signal)
+    ratio.process()
+
+    assert ratio.get_frame_count() == EXP_FRAME_COUNT
+    assert ratio.get_time_scale() == pytest.approx(EXP_TIME_SCALE, abs=1e-4)
+
+
+@RATIO_CLASSES
+@patch("matplotlib.pyplot.show")
+def test_tone_ratio_over_time_plot(
+    mock_show, ratio_class, single_ratio_class, ratio_name, create_tone_in_noise_signal
+):
+    """Test ProminenceRatioOverTime and ToneToNoiseRatioOverTime plot method."""
+    ratio = ratio_class(signal=create_tone_in_noise_signal, frequency_list=[TONE_FREQUENCY])
+
+    with pytest.raises(
+        PyAnsysSoundException,
+        match=(
+            "Output is not processed yet. "
+            f"Use the `{ratio_class.__name__}.process\\(\\)` method."
+        ),
+    ):
+        ratio.plot()
+
+    ratio.process()
+    ratio.plot()
@@ -316,6 +316,48 @@ def test_tone_to_noise_ratio_get_all_tone_infos(create_psd_from_txt_data):
     assert str(excinfo.value) == "No peak is detected."
 
 
+def test_tone_to_noise_ratio_get_peaks_table(create_psd_from_txt_data):
+    """Test getting the peaks table from ToneToNoiseRatio computation."""
+    tnr = ToneToNoiseRatio()
+
+    psd = create_psd_from_txt_data
+    tnr.psd = psd
+
+    # no compute: return empty table
+    peaks = tnr.get_peaks_table()
+    assert peaks.size == 0
+    assert peaks.dtype.names == (
+        "frequency",
+        "value",
+        "level",
+        "low_frequency",
+        "high_frequency",
+        "is_prominent",
+    )
+
+    tnr.process()
+    peaks = tnr.get_peaks_table()
+
+    assert peaks.size == tnr.get_nb_tones()
+    assert peaks["frequency"] == pytest.approx(tnr.get_peaks_frequencies())
+    assert peaks["value"] == pytest.approx(tnr.get_TNR_values())
+    assert peaks["level"] == pytest.approx(tnr.get_peaks_levels())
+    assert peaks["low_frequency"] == pytest.approx(tnr.get_peaks_low_frequencies())
+    assert peaks["high_frequency"] == pytest.approx(tnr.get_peaks_high_frequencies())
+    assert tuple(peaks[6])[:5] == pytest.approx(tnr.get_single_tone_info(6))
+
+    # A tone is prominent if its TNR is higher than the reference curve at its frequency.
+    all_frequencies = psd.time_freq_support.time_frequencies.data
+    tone_indexes = np.argmin(np.abs(all_frequencies[:, None] - peaks["frequency"]), axis=0)
+    np.testing.assert_array_equal(
+        peaks["is_prominent"], peaks["value"] > tnr.get_reference_curve()[tone_indexes]
+    )
+
+    # Modifying the returned table does not modify the stored one.
+    peaks["value"] = 0.0
+    assert tnr.get_TNR_values()[0] != 0.0
+
+
 def test_tone_to_noise_ratio_get_reference_curve(create_psd_from_txt_data):
     """Test getting the reference curve from ToneToNoiseRatio computation."""
     tnr = ToneToNoiseRatio()
@@ -341,6 +383,10 @@ def test_tone_to_noise_ratio_get_reference_curve(create_psd_from_txt_data):
     assert ref_curve[4169] == 0
     assert ref_curve[5896] == 0
 
+    # The reference curve is cached per frequency grid, but returned as a copy.
+    ref_curve[:] = -1.0
+    assert tnr.get_reference_curve()[372] == pytest.approx(8.0)
+
 
 @patch("matplotlib.pyplot.show")
 def test_tone_to_noise_ratio_plot(mock_show, create_psd_from_txt_data):
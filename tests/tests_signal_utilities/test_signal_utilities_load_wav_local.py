@@ -0,0 +1,161 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+
+from ansys.dpf.core import Field
+import numpy as np
+import pytest
+
+from ansys.sound.core import set_numpy_precision
+from ansys.sound.core._pyansys_sound import PyAnsysSoundException, PyAnsysSoundWarning
+from ansys.sound.core.signal_utilities import LoadWav, LoadWavLocal
+
+# LoadWavLocal reads files on the client side: use local paths of the test files.
+DATA_DIRECTORY = os.path.join(os.path.dirname(__file__), "..", "data")
+LOCAL_PATH_FLUTE = os.path.join(DATA_DIRECTORY, "flute.wav")
+LOCAL_PATH_FLUTE_FLOAT32 = os.path.join(DATA_DIRECTORY, "flute_float32.wav")
+LOCAL_PATH_FLUTE_INT8 = os.path.join(DATA_DIRECTORY, "flute_int8.wav")
+LOCAL_PATH_FLUTE_INT24 = os.path.join(DATA_DIRECTORY, "flute_int24.wav")
+LOCAL_PATH_FLUTE_INT32 = os.path.join(DATA_DIRECTORY, "flute_int32.wav")
+LOCAL_PATH_STEREO = os.path.join(DATA_DIRECTORY, "Acceleration_stereo_nonUnitaryCalib.wav")
+LOCAL_PATH_PSD = os.path.join(DATA_DIRECTORY, "flute_psd.txt")
+
+
+def test_load_wav_local_instantiation():
+    """Test LoadWavLocal instantiation."""
+    wav_loader = LoadWavLocal()
+    assert wav_loader.path_to_wav == ""
+
+    wav_loader = LoadWavLocal(LOCAL_PATH_FLUTE)
+    assert wav_loader.path_to_wav == LOCAL_PATH_FLUTE
+
+
+def test_load_wav_local_process():
+    """Test LoadWavLocal process method."""
+    wav_loader = LoadWavLocal(LOCAL_PATH_FLUTE_FLOAT32)
+    wav_loader.process()
+
+    output = wav_loader.get_output()
+    assert len(output) == 1
+    assert type(output[0]) == Field
+    assert len(output[0].data) == 156048
+    assert output[0].time_freq_support.time_frequencies.data[1] == pytest.approx(1.0 / 44100.0)
+
+    # Compare with the signal decoded on the server side.
+    wav_loader_server = LoadWav(pytest.data_path_flute)
+    wav_loader_server.process()
+    assert output[0].data == pytest.approx(wav_loader_server.get_output()[0].data)
+
+
+def test_load_wav_local_process_multichannel():
+    """Test LoadWavLocal process method with a stereo file."""
+    wav_loader = LoadWavLocal(LOCAL_PATH_STEREO)
+    with pytest.warns(PyAnsysSoundWarning, match="contains Ansys Sound calibration data"):
+        wav_loader.process()
+
+    assert len(wav_loader.get_output()) == 2
+    assert wav_loader.get_output_as_nparray().shape == (2, 415308)
+
+
+def test_load_wav_local_process_exceptions():
+    """Test LoadWavLocal process method's exceptions."""
+    wav_loader = LoadWavLocal()
+    with pytest.raises(
+        PyAnsysSoundException,
+        match="Path for loading WAV file is not specified. Use `LoadWavLocal.path_to_wav`.",
+    ):
+        wav_loader.process()
+
+    wav_loader.path_to_wav = "missing_file.wav"
+    with pytest.raises(PyAnsysSoundException, match="WAV file 'missing_file.wav' does not exist."):
+        wav_loader.process()
+
+    wav_loader.path_to_wav = LOCAL_PATH_PSD
+    with pytest.raises(PyAnsysSoundException, match="is not a valid RIFF or RF64 WAV file."):
+        wav_loader.process()
+
+
+def test_load_wav_local_get_output_warns():
+    """Test LoadWavLocal getters' warnings."""
+    wav_loader = LoadWavLocal(LOCAL_PATH_FLUTE)
+    with pytest.warns(PyAnsysSoundWarning, match="Output is not processed yet."):
+        assert wav_loader.get_output() is None
+    with pytest.warns(PyAnsysSoundWarning, match="Output is not processed yet."):
+        assert len(wav_loader.get_output_as_nparray()) == 0
+    with pytest.warns(PyAnsysSoundWarning, match="Output is not processed yet."):
+        assert wav_loader.get_sampling_frequency() is None
+    with pytest.warns(PyAnsysSoundWarning, match="Output is not processed yet."):
+        assert wav_loader.get_format() is None
+
+
+def test_load_wav_local_get_output_as_nparray():
+    """Test LoadWavLocal get_output_as_nparray method for all sample formats."""
+    wav_loader = LoadWavLocal(LOCAL_PATH_FLUTE_FLOAT32)
+    wav_loader.process()
+    reference = wav_loader.get_output_as_nparray()
+    assert reference.shape == (156048,)
+    assert np.max(reference) == pytest.approx(0.877197265625)
+
+    # 16- and 24-bit files contain the same samples as the 32-bit floating-point file.
+    for path in (LOCAL_PATH_FLUTE, LOCAL_PATH_FLUTE_INT24):
+        wav_loader.path_to_wav = path
+        wav_loader.process()
+        assert wav_loader.get_output_as_nparray() == pytest.approx(reference)
+
+    # 8-bit file is quantized with a step of 1/128.
+    wav_loader.path_to_wav = LOCAL_PATH_FLUTE_INT8
+    wav_loader.process()
+    assert wav_loader.get_output_as_nparray() == pytest.approx(reference, abs=1.0 / 128.0)
+
+
+def test_load_wav_local_get_output_as_nparray_float32():
+    """Test LoadWavLocal get_output_as_nparray method in single precision."""
+    wav_loader = LoadWavLocal(LOCAL_PATH_STEREO)
+    with pytest.warns(PyAnsysSoundWarning, match="contains Ansys Sound calibration data"):
+        wav_loader.process()
+    reference = wav_loader.get_output_as_nparray()
+
+    set_numpy_precision("float32")
+    try:
+        output = wav_loader.get_output_as_nparray()
+    finally:
+        set_numpy_precision("float64")
+
+    assert reference.dtype == np.float64
+    assert output.dtype == np.float32
+    assert output == pytest.approx(reference, abs=1e-6)
+
+
+def test_load_wav_local_get_sampling_frequency_and_format():
+    """Test LoadWavLocal get_sampling_frequency and get_format methods."""
+    wav_loader = LoadWavLocal()
+    for path, format in (
+        (LOCAL_PATH_FLUTE_INT8, "int8"),
+        (LOCAL_PATH_FLUTE_INT24, "int24"),
+        (LOCAL_PATH_FLUTE_INT32, "int32"),
+        (LOCAL_PATH_FLUTE_FLOAT32, "float32"),
+    ):
+        wav_loader.path_to_wav = path
+        wav_loader.process()
+        assert wav_loader.get_sampling_frequency() == 44100.0
+        assert wav_loader.get_format() == format
@@ -22,12 +22,14 @@
 
 from unittest.mock import patch
 
-from ansys.dpf.core import Field
+from ansys.dpf.core import Field, Operator, fields_container_factory
 import numpy as np
 import pytest
 
 from ansys.sound.core._pyansys_sound import PyAnsysSoundException, PyAnsysSoundWarning
+from ansys.sound.core.signal_utilities import ApplyGain
 from ansys.sound.core.sound_power import SoundPowerLevelISO3744
+from ansys.sound.core.sound_power.sound_power_level_iso_3744 import ID_COMPUTE_SOUND_POWER_LEVEL
 
 if pytest.SOUND_VERSION_GREATER_THAN_OR_EQUAL_TO_2026R1:
     # bug fix in DPF Sound 2026 R1 ID#1325159
@@ -87,6 +89,7 @@ def test_sound_power_level_iso_3744_instantiation():
     assert swl.K2 == 0.0
     assert swl.C1 == 0.0
     assert swl.C2 == 0.0
+    assert swl.max_workers is None
 
 
 def test_sound_power_level_iso_3744_setters():
@@ -111,6 +114,9 @@ def test_sound_power_level_iso_3744_setters():
     swl.C2 = 1.5
     assert swl.C2 == 1.5
 
+    swl.max_workers = 2
+    assert swl.max_workers == 2
+
 
 def test_sound_power_level_iso_3744_setters_exceptions():
     """Test SoundPowerLevelISO3744 setters' exceptions."""
@@ -127,6 +133,11 @@ def test_sound_power_level_iso_3744_setters_exceptions():
     ):
         swl.surface_radius = -2.0
 
+    with pytest.raises(
+        PyAnsysSoundException, match="Maximum number of workers must be greater than 0."
+    ):
+        swl.max_workers = 0
+
 
 def test_sound_power_level_iso_3744_add_microphone_signal():
     """Test add_microphone_signal method."""
@@ -279,6 +290,81 @@ def test_sound_power_level_iso_3744_process():
     swl.process()
 
 
+def test_sound_power_level_iso_3744_process_incremental():
+    """Test process method after adding or deleting microphone signals."""
+    swl = SoundPowerLevelISO3744(max_workers=2)
+    swl.load_project(pytest.data_path_swl_project_file)
+    swl.process()
+    Lw_ref, LwA_ref, Lw_oct_ref, _, Lw_3_ref, _ = swl.get_output_as_nparray()
+    assert Lw_ref == pytest.approx(EXP_LW)
+
+    # Delete a microphone signal, and compare with a computation from scratch.
+    signal = swl.get_microphone_signal(1)
+    swl.delete_microphone_signal(1)
+    swl.process()
+
+    swl_single = SoundPowerLevelISO3744(
+        surface_shape=swl.surface_shape,
+        surface_radius=swl.surface_radius,
+        K1=swl.K1,
+        K2=swl.K2,
+        C1=swl.C1,
+        C2=swl.C2,
+    )
+    swl_single.add_microphone_signal(swl.get_microphone_signal(0))
+    swl_single.process()
+    assert swl.get_Lw() == pytest.approx(swl_single.get_Lw())
+    assert swl.get_Lw_A() == pytest.approx(swl_single.get_Lw_A())
+    assert swl.get_Lw_octave() == pytest.approx(swl_single.get_Lw_octave())
+
+    # Add the microphone signal back: results are the same as initially.
+    swl.add_microphone_signal(signal)
+    swl.process()
+    Lw, LwA, Lw_oct, _, Lw_3, _ = swl.get_output_as_nparray()
+    assert Lw == pytest.approx(Lw_ref)
+    assert LwA == pytest.approx(LwA_ref)
+    assert Lw_oct == pytest.approx(Lw_oct_ref)
+    assert Lw_3 == pytest.approx(Lw_3_ref)
+
+    # Change corrections: only the final levels are shifted.
+    swl.K1 = swl.K1 + 1.0
+    swl.process()
+    assert swl.get_Lw() == pytest.approx(Lw_ref - 1.0)
+
+    # Change the surface radius: levels are recomputed.
+    swl.surface_radius = 2.0 * swl.surface_radius
+    swl.process()
+    assert swl.get_Lw() == pytest.approx(Lw_ref - 1.0 + 10.0 * np.log10(4.0))
+
+
+def test_sound_power_level_iso_3744_process_matches_operator():
+    """Test that process matches the DPF Sound operator run on all signals with corrections."""
+    swl = SoundPowerLevelISO3744()
+    swl.load_project(pytest.data_path_swl_project_file)
+    assert swl.K1 != 0.0 and swl.K2 != 0.0 and swl.C1 != 0.0 and swl.C2 != 0.0
+    # Add a louder signal, so that the microphone levels differ.
+    apply_gain = ApplyGain(signal=swl.get_microphone_signal(0), gain=6.0, gain_in_db=True)
+    apply_gain.process()
+    swl.add_microphone_signal(apply_gain.get_output())
+    swl.process()
+
+    signals = [swl.get_microphone_signal(i) for i in range(len(swl.get_all_signal_names()))]
+    operator = Operator(ID_COMPUTE_SOUND_POWER_LEVEL)
+    operator.connect(0, swl.surface_shape)
+    operator.connect(1, swl.surface_radius)
+    operator.connect(2, swl.K1)
+    operator.connect(3, swl.K2)
+    operator.connect(4, swl.C1)
+    operator.connect(5, swl.C2)
+    operator.connect(6, fields_container_factory.over_time_freq_fields_container(signals))
+    operator.run()
+
+    assert swl.get_Lw() == pytest.approx(operator.get_output(0, "double"))
+    assert swl.get_Lw_A() == pytest.approx(operator.get_output(1, "double"))
+    assert swl.get_Lw_octave() == pytest.approx(np.array(operator.get_output(2, "field").data))
+    assert swl.get_Lw_thirdoctave() == pytest.approx(np.array(operator.get_output(3, "field").data))
+
+
 def test_sound_power_level_iso_3744_process_exception():
     """Test process method's exception."""
     swl = SoundPowerLevelISO3744()
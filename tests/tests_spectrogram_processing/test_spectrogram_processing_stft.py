@@ -26,6 +26,7 @@ from ansys.dpf.core import Field, locations, natures
 import numpy as np
 import pytest
 
+from ansys.sound.core import set_numpy_precision
 from ansys.sound.core._pyansys_sound import PyAnsysSoundException, PyAnsysSoundWarning
 from ansys.sound.core.signal_utilities import LoadWav
 from ansys.sound.core.spectrogram_processing import Stft
@@ -122,6 +123,27 @@ def test_stft_get_output_as_np_array():
     assert arr[300, TESTED_IDX] == EXP_STFT_300_IDX
 
 
+def test_stft_get_output_as_np_array_float32():
+    """Test the get_output_as_nparray method of Stft class in single precision."""
+    wav_loader = LoadWav(pytest.data_path_flute)
+    wav_loader.process()
+    stft = Stft(signal=wav_loader.get_output()[0])
+    stft.process()
+
+    set_numpy_precision("float32")
+    try:
+        arr = stft.get_output_as_nparray()
+        magnitude = stft.get_stft_magnitude_as_nparray()
+    finally:
+        set_numpy_precision("float64")
+
+    assert np.shape(arr) == (stft.fft_size, EXP_STFT_SIZE)
+    assert arr.dtype == np.complex64
+    assert magnitude.dtype == np.float32
+    assert arr[100, TESTED_IDX] == pytest.approx(EXP_STFT_100_IDX, rel=1e-6)
+    assert arr[300, TESTED_IDX] == pytest.approx(EXP_STFT_300_IDX, rel=1e-6)
+
+
 def test_stft_set_get_signal():
     """Test the signal setter and getter of Stft class."""
     stft = Stft()
@@ -0,0 +1,190 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from ansys.dpf.core import Field, FieldsContainer
+import numpy as np
+import pytest
+
+from ansys.sound.core import set_numpy_precision
+from ansys.sound.core._pyansys_sound import PyAnsysSoundException, PyAnsysSoundWarning
+from ansys.sound.core.signal_utilities import LoadWav
+from ansys.sound.core.xtract.xtract_denoiser import XtractDenoiser
+from ansys.sound.core.xtract.xtract_denoiser_batch import XtractDenoiserBatch
+from ansys.sound.core.xtract.xtract_denoiser_parameters import XtractDenoiserParameters
+
+
+def test_xtract_denoiser_batch_instantiation():
+    """Test XtractDenoiserBatch instantiation."""
+    # Test initialization with default values
+    denoiser_batch = XtractDenoiserBatch()
+    assert denoiser_batch.input_signals is None
+    assert denoiser_batch.input_parameters is None
+    assert denoiser_batch.output_denoised_signals is None
+    assert denoiser_batch.output_noise_signals is None
+
+    # Test initialization with custom values
+    input_signals = [Field(), Field()]
+    input_parameters = XtractDenoiserParameters()
+    denoiser_batch = XtractDenoiserBatch(
+        input_signals=input_signals,
+        input_parameters=input_parameters,
+    )
+    assert denoiser_batch.input_signals == input_signals
+    assert denoiser_batch.input_parameters == input_parameters
+
+
+def test_xtract_denoiser_batch_setters():
+    """Test XtractDenoiserBatch setters."""
+    denoiser_batch = XtractDenoiserBatch()
+
+    # Fields container is converted into a list of fields.
+    fc = FieldsContainer()
+    fc.labels = ["channel"]
+    fc.add_field({"channel": 0}, Field())
+    fc.add_field({"channel": 1}, Field())
+    denoiser_batch.input_signals = fc
+    assert type(denoiser_batch.input_signals) == list
+    assert len(denoiser_batch.input_signals) == 2
+
+
+def test_xtract_denoiser_batch_setters_exceptions():
+    """Test XtractDenoiserBatch setters' exceptions."""
+    denoiser_batch = XtractDenoiserBatch()
+
+    with pytest.raises(
+        PyAnsysSoundException,
+        match="Signals must be specified as a list of DPF fields or as a DPF fields container.",
+    ):
+        denoiser_batch.input_signals = Field()
+
+    with pytest.raises(
+        PyAnsysSoundException,
+        match="Signals must be specified as a list of DPF fields or as a DPF fields container.",
+    ):
+        denoiser_batch.input_signals = [Field(), "WrongType"]
+
+    with pytest.raises(
+        PyAnsysSoundException,
+        match="Input parameters must be specified as an XtractDenoiserParameters object.",
+    ):
+        denoiser_batch.input_parameters = "WrongType"
+
+
+def test_xtract_denoiser_batch_process_exceptions():
+    """Test XtractDenoiserBatch process method's exceptions."""
+    denoiser_batch = XtractDenoiserBatch(None, XtractDenoiserParameters())
+    with pytest.raises(PyAnsysSoundException, match="Input signals are not set."):
+        denoiser_batch.process()
+
+    denoiser_batch = XtractDenoiserBatch([], XtractDenoiserParameters())
+    with pytest.raises(PyAnsysSoundException, match="Input signals are not set."):
+        denoiser_batch.process()
+
+    denoiser_batch = XtractDenoiserBatch([Field()], None)
+    with pytest.raises(PyAnsysSoundException, match="Input parameters are not set."):
+        denoiser_batch.process()
+
+
+def test_xtract_denoiser_batch_process():
+    """Test XtractDenoiserBatch process method."""
+    wav_loader = LoadWav(pytest.data_path_flute)
+    wav_loader.process()
+    signal_flute = wav_loader.get_output()[0]
+
+    wav_loader = LoadWav(pytest.data_path_accel_with_rpm)
+    wav_loader.process()
+    signal_accel = wav_loader.get_output()[0]
+
+    params_denoiser = XtractDenoiserParameters()
+    params_denoiser.noise_psd = params_denoiser.create_noise_psd_from_white_noise_level(
+        -6.0 + 94.0, 44100.0, 50
+    )
+
+    denoiser_batch = XtractDenoiserBatch([signal_flute, signal_accel], params_denoiser)
+    denoiser_batch.process()
+
+    assert len(denoiser_batch.output_denoised_signals) == 2
+    assert len(denoiser_batch.output_noise_signals) == 2
+    assert type(denoiser_batch.output_denoised_signals[0]) == Field
+    assert type(denoiser_batch.output_noise_signals[0]) == Field
+
+    # Results must match those of the single-signal class, for each signal, in order.
+    denoised, noise = denoiser_batch.get_output_as_nparray()
+    for i, signal in enumerate([signal_flute, signal_accel]):
+        denoiser = XtractDenoiser(signal, params_denoiser)
+        denoiser.process()
+        denoised_ref, noise_ref = denoiser.get_output_as_nparray()
+        assert denoised[i] == pytest.approx(denoised_ref)
+        assert noise[i] == pytest.approx(noise_ref)
+
+    # Process again with other signals, the parameters are not reconnected.
+    denoiser_batch.input_signals = [signal_accel]
+    denoiser_batch.process()
+    assert len(denoiser_batch.output_denoised_signals) == 1
+    denoised, noise = denoiser_batch.get_output_as_nparray()
+    assert denoised[0] == pytest.approx(denoised_ref)
+    assert noise[0] == pytest.approx(noise_ref)
+
+
+def test_xtract_denoiser_batch_get_output_warns():
+    """Test XtractDenoiserBatch get_output method's warning."""
+    denoiser_batch = XtractDenoiserBatch()
+
+    with pytest.warns(PyAnsysSoundWarning, match="Output is not processed yet."):
+        output = denoiser_batch.get_output()
+    assert output == (None, None)
+
+
+def test_xtract_denoiser_batch_get_output_as_nparray():
+    """Test XtractDenoiserBatch get_output_as_nparray method."""
+    denoiser_batch = XtractDenoiserBatch()
+
+    with pytest.warns(PyAnsysSoundWarning, match="Output is not processed yet."):
+        denoised, noise = denoiser_batch.get_output_as_nparray()
+    assert denoised == []
+    assert noise == []
+
+    wav_loader = LoadWav(pytest.data_path_flute)
+    wav_loader.process()
+    signal = wav_loader.get_output()[0]
+
+    params_denoiser = XtractDenoiserParameters()
+    params_denoiser.noise_psd = params_denoiser.create_noise_psd_from_white_noise_level(
+        -6.0 + 94.0, 44100.0, 50
+    )
+
+    denoiser_batch = XtractDenoiserBatch([signal], params_denoiser)
+    denoiser_batch.process()
+    denoised, noise = denoiser_batch.get_output_as_nparray()
+
+    assert type(denoised[0]) == np.ndarray
+    assert type(noise[0]) == np.ndarray
+    assert denoised[0].shape == (156048,)
+
+    set_numpy_precision("float32")
+    try:
+        denoised, noise = denoiser_batch.get_output_as_nparray()
+    finally:
+        set_numpy_precision("float64")
+
+    assert denoised[0].dtype == np.float32
+    assert noise[0].dtype == np.float32
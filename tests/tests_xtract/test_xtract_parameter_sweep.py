@@ -0,0 +1,296 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from unittest.mock import patch
+
+from ansys.dpf.core import Field, _global_server
+import numpy as np
+import pytest
+
+from ansys.sound.core._pyansys_sound import PyAnsysSoundException, PyAnsysSoundWarning
+from ansys.sound.core.signal_utilities import LoadWav
+from ansys.sound.core.xtract import (
+    XtractDenoiser,
+    XtractTonal,
+    XtractTransient,
+    xtract_parameter_sweep,
+)
+from ansys.sound.core.xtract.xtract_denoiser_parameters import XtractDenoiserParameters
+from ansys.sound.core.xtract.xtract_parameter_sweep import XtractParameterSweep
+from ansys.sound.core.xtract.xtract_tonal_parameters import XtractTonalParameters
+from ansys.sound.core.xtract.xtract_transient_parameters import XtractTransientParameters
+
+
+def tonal_energy(noise, tonal, transient, remainder):
+    """Compute the energy of the tonal component."""
+    return np.sum(tonal**2)
+
+
+def remainder_energy(noise, tonal, transient, remainder):
+    """Compute the energy of the remainder component."""
+    return np.sum(remainder**2)
+
+
+def get_sweep_inputs() -> tuple[Field, XtractDenoiserParameters]:
+    """Load the test signal and create denoiser parameters."""
+    wav_loader = LoadWav(pytest.data_path_flute)
+    wav_loader.process()
+    signal = wav_loader.get_output()[0]
+
+    params_denoiser = XtractDenoiserParameters()
+    params_denoiser.noise_psd = params_denoiser.create_noise_psd_from_white_noise_level(
+        -6.0 + 94.0, 44100.0, 50
+    )
+
+    return signal, params_denoiser
+
+
+def test_xtract_parameter_sweep_instantiation():
+    """Test XtractParameterSweep instantiation."""
+    sweep = XtractParameterSweep()
+    assert sweep.input_signal is None
+    assert sweep.parameters_denoiser is None
+    assert sweep.tonal_parameter_grid == {}
+    assert sweep.transient_parameter_grid == {}
+    assert sweep.metrics == {}
+    assert sweep.ranking_metric is None
+    assert sweep.higher_is_better is True
+    assert sweep.search == "grid"
+    assert sweep.number_of_samples == 10
+    assert sweep.random_seed is None
+    assert sweep.max_workers == 1
+
+
+def test_xtract_parameter_sweep_setters():
+    """Test XtractParameterSweep setters."""
+    sweep = XtractParameterSweep()
+
+    sweep.tonal_parameter_grid = {"regularity": 0.5, "fft_size": [1024.0, 2048.0]}
+    assert sweep.tonal_parameter_grid == {"regularity": [0.5], "fft_size": [1024, 2048]}
+
+    sweep.transient_parameter_grid = {"lower_threshold": [10, 20]}
+    assert sweep.transient_parameter_grid == {"lower_threshold": [10.0, 20.0]}
+
+    sweep.metrics = {"tonal_energy": tonal_energy}
+    assert sweep.metrics == {"tonal_energy": tonal_energy}
+
+    sweep.search = "random"
+    assert sweep.search == "random"
+
+
+def test_xtract_parameter_sweep_setters_exceptions():
+    """Test XtractParameterSweep setters' exceptions."""
+    sweep = XtractParameterSweep()
+
+    with pytest.raises(
+        PyAnsysSoundException, match="Input signal must be specified as a DPF field."
+    ):
+        sweep.input_signal = "WrongType"
+
+    with pytest.raises(
+        PyAnsysSoundException,
+        match="The tonal parameter grid must be specified as a dictionary of value lists",
+    ):
+        sweep.tonal_parameter_grid = [0.5, 1.0]
+
+    with pytest.raises(PyAnsysSoundException, match='Unknown tonal parameter "lower_threshold".'):
+        sweep.tonal_parameter_grid = {"lower_threshold": [10.0]}
+
+    with pytest.raises(PyAnsysSoundException, match='Unknown transient parameter "regularity".'):
+        sweep.transient_parameter_grid = {"regularity": [1.0]}
+
+    with pytest.raises(
+        PyAnsysSoundException,
+        match='At least one value must be specified for transient parameter "lower_threshold".',
+    ):
+        sweep.transient_parameter_grid = {"lower_threshold": []}
+
+    with pytest.raises(
+        PyAnsysSoundException,
+        match="Metrics must be specified as a dictionary of functions indexed by metric names.",
+    ):
+        sweep.metrics = {"tonal_energy": 1.0}
+
+    with pytest.raises(
+        PyAnsysSoundException, match='Search strategy must be either "grid" or "random".'
+    ):
+        sweep.search = "exhaustive"
+
+    with pytest.raises(PyAnsysSoundException, match="Number of samples must be greater than 0."):
+        sweep.number_of_samples = 0
+
+    with pytest.raises(
+        PyAnsysSoundException, match="Maximum number of workers must be greater than 0."
+    ):
+        sweep.max_workers = 0
+
+
+def test_xtract_parameter_sweep_process_exceptions():
+    """Test XtractParameterSweep process method's exceptions."""
+    sweep = XtractParameterSweep()
+    with pytest.raises(PyAnsysSoundException, match="Input signal is not set."):
+        sweep.process()
+
+    sweep.input_signal = Field()
+    with pytest.raises(
+        PyAnsysSoundException, match="Input parameters for the denoiser extraction are not set."
+    ):
+        sweep.process()
+
+    sweep.parameters_denoiser = XtractDenoiserParameters()
+    with pytest.raises(PyAnsysSoundException, match="At least one metric must be specified."):
+        sweep.process()
+
+    sweep.metrics = {"tonal_energy": tonal_energy}
+    sweep.ranking_metric = "remainder_energy"
+    with pytest.raises(
+        PyAnsysSoundException,
+        match='Ranking metric "remainder_energy" is not among the specified metrics.',
+    ):
+        sweep.process()
+
+
+def test_xtract_parameter_sweep_process():
+    """Test XtractParameterSweep process method with a grid search."""
+    signal, params_denoiser = get_sweep_inputs()
+
+    sweep = XtractParameterSweep(
+        input_signal=signal,
+        parameters_denoiser=params_denoiser,
+        tonal_parameter_grid={"local_emergence": [5.0, 15.0]},
+        transient_parameter_grid={"lower_threshold": [0.0, 50.0]},
+        metrics={"tonal_energy": tonal_energy, "remainder_energy": remainder_energy},
+        max_workers=2,
+    )
+    sweep.process()
+    results = sweep.get_output()
+
+    assert len(results) == 4
+    assert results.dtype.names == (
+        "local_emergence",
+        "lower_threshold",
+        "tonal_energy",
+        "remainder_energy",
+        "processing_time",
+    )
+    assert np.all(np.diff(results["tonal_energy"]) <= 0.0)
+    assert np.all(results["processing_time"] > 0.0)
+
+    # Rank according to the second metric, in ascending order.
+    sweep.ranking_metric = "remainder_energy"
+    sweep.higher_is_better = False
+    sweep.process()
+    results = sweep.get_output()
+    assert np.all(np.diff(results["remainder_energy"]) >= 0.0)
+
+    tonal_parameters, transient_parameters = sweep.get_best_parameters()
+    assert type(tonal_parameters) == XtractTonalParameters
+    assert type(transient_parameters) == XtractTransientParameters
+    assert tonal_parameters.local_emergence == results["local_emergence"][0]
+    assert transient_parameters.lower_threshold == results["lower_threshold"][0]
+
+
+def test_xtract_parameter_sweep_process_ranking_nan_and_ties():
+    """Test XtractParameterSweep ranking with NaN and tied scores."""
+    signal, params_denoiser = get_sweep_inputs()
+
+    def score(noise, tonal, transient, remainder):
+        """Score 1 for every combination, except NaN when the tonal energy is the highest."""
+        return np.nan if np.sum(tonal**2) == max_tonal_energy else 1.0
+
+    sweep = XtractParameterSweep(
+        input_signal=signal,
+        parameters_denoiser=params_denoiser,
+        tonal_parameter_grid={"local_emergence": [5.0, 15.0, 25.0]},
+        metrics={"tonal_energy": tonal_energy},
+    )
+    sweep.process()
+    max_tonal_energy = sweep.get_output()["tonal_energy"][0]
+
+    sweep.metrics = {"tonal_energy": tonal_energy, "score": score}
+    sweep.ranking_metric = "score"
+    for higher_is_better in (True, False):
+        sweep.higher_is_better = higher_is_better
+        sweep.process()
+        results = sweep.get_output()
+        assert np.isnan(results["score"][-1])
+        assert np.all(results["score"][:-1] == 1.0)
+        # Tied combinations are kept in evaluation order.
+        assert np.all(np.diff(results["local_emergence"][:-1]) > 0.0)
+
+
+def test_xtract_parameter_sweep_process_random():
+    """Test XtractParameterSweep process method with a random search."""
+    signal, params_denoiser = get_sweep_inputs()
+
+    sweep = XtractParameterSweep(
+        input_signal=signal,
+        parameters_denoiser=params_denoiser,
+        tonal_parameter_grid={"regularity": [0.5, 1.0], "local_emergence": [5.0, 10.0, 15.0]},
+        metrics={"tonal_energy": tonal_energy},
+        search="random",
+        number_of_samples=3,
+        random_seed=0,
+    )
+    sweep.process()
+    assert len(sweep.get_output()) == 3
+
+
+def test_xtract_parameter_sweep_process_server():
+    """Test that XtractParameterSweep runs all steps on the server it is bound to."""
+    signal, params_denoiser = get_sweep_inputs()
+    server = _global_server()
+
+    sweep = XtractParameterSweep(
+        input_signal=signal,
+        parameters_denoiser=params_denoiser,
+        tonal_parameter_grid={"local_emergence": [5.0, 15.0]},
+        metrics={"tonal_energy": tonal_energy},
+        server=server,
+    )
+    with (
+        patch.object(xtract_parameter_sweep, "XtractDenoiser", wraps=XtractDenoiser) as denoiser,
+        patch.object(xtract_parameter_sweep, "XtractTonal", wraps=XtractTonal) as tonal,
+        patch.object(xtract_parameter_sweep, "XtractTransient", wraps=XtractTransient) as transient,
+    ):
+        sweep.process()
+
+    assert len(sweep.get_output()) == 2
+    for step in (denoiser, tonal, transient):
+        assert step.call_count > 0
+        assert all(call.kwargs["server"] is server for call in step.call_args_list)
+
+
+def test_xtract_parameter_sweep_get_output_warns():
+    """Test XtractParameterSweep get_output and get_output_as_nparray methods' warning."""
+    sweep = XtractParameterSweep()
+
+    with pytest.warns(PyAnsysSoundWarning, match="Output is not processed yet."):
+        output = sweep.get_output()
+    assert output is None
+
+    with pytest.warns(PyAnsysSoundWarning, match="Output is not processed yet."):
+        output = sweep.get_output_as_nparray()
+    assert len(output) == 0
+
+    with pytest.raises(PyAnsysSoundException, match="Output is not processed yet."):
+        sweep.get_best_parameters()